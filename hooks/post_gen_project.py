@@ -3,6 +3,7 @@
 Post-generation hook for {{cookiecutter.project_name}}.
 """
 
+import os
 import shutil
 import sys
 from pathlib import Path
@@ -12,31 +13,17 @@ def main():
     project_dir = Path.cwd()
     project_slug = project_dir.name
     framework_file = project_dir / "framework_selection.txt"
-    if framework_file.exists():
-        framework = framework_file.read_text().strip()
-        print(f"Framework selection from file: {framework}")
-    else:
-        # Try to get framework from cookiecutter context
-        import os
-
-        framework = os.environ.get("COOKIECUTTER_FRAMEWORK")
-        if not framework:
-            # Try to get from cookiecutter context
-            framework = "{{ cookiecutter.framework }}"
-        print(f"Using framework: {framework}")
+    # The rendered context is authoritative; environment variables and stale
+    # selection files from earlier runs must not pick a different tree.
+    framework = "{{ cookiecutter.framework }}"
+    print(f"Using framework: {framework}")
 
     print(f"Setting up {framework} project...")
 
-    template_dir = project_dir.parent / "{{cookiecutter.project_slug}}"
-
     if framework == "fastapi":
-        source_dir = template_dir / "fastapi_template"
-        remove_dir = template_dir / "drf_template"
-        print(f"Removing {remove_dir} directory...")
+        source_dir = project_dir / "fastapi_template"
     elif framework == "drf":
-        source_dir = template_dir / "drf_template"
-        remove_dir = template_dir / "fastapi_template"
-        print(f"Removing {remove_dir} directory...")
+        source_dir = project_dir / "drf_template"
     else:
         print(f"Unknown framework: {framework}")
         sys.exit(1)
@@ -51,14 +38,12 @@ def main():
         handle_database_config(project_dir, db_type)
 
     if source_dir.exists():
-        print(f"Copying {framework} files to project...")
-        for item in source_dir.iterdir():
-            if item.is_dir():
-                if (project_dir / item.name).exists():
-                    shutil.rmtree(project_dir / item.name)
-                shutil.copytree(str(item), str(project_dir / item.name))
-            else:
-                shutil.copy2(str(item), str(project_dir / item.name))
+        print(f"Moving {framework} files into project...")
+        move_tree_contents(source_dir, project_dir)
+
+        performance_profile = "{{ cookiecutter.performance_profile }}"
+        if performance_profile != "high_throughput":
+            remove_high_throughput_files(project_dir, project_slug)
 
         # Handle docker-compose.yml based on database type
         docker_compose_file = project_dir / "docker-compose.yml"
@@ -101,6 +86,34 @@ def main():
         print("5. Visit http://localhost:8000 for your DRF application")
 
 
+def move_tree_contents(source_dir: Path, target_dir: Path):
+    """Move every entry of ``source_dir`` into ``target_dir`` by renaming it.
+
+    Both directories live on the same filesystem, so this rewrites directory
+    entries instead of copying file contents. Existing shared placeholders in
+    ``target_dir`` are replaced.
+    """
+    for item in source_dir.iterdir():
+        target = target_dir / item.name
+        if target.is_dir():
+            shutil.rmtree(target)
+        elif target.exists():
+            target.unlink()
+        os.replace(item, target)
+
+
+def remove_high_throughput_files(project_dir: Path, project_slug: str):
+    """Drop the runner and metrics modules only the high-throughput stack uses."""
+    package_dir = project_dir / "src" / project_slug
+    for path in [
+        project_dir / "gunicorn.conf.py",
+        package_dir / "adapters" / "driving" / "metrics.py",
+        package_dir / "adapters" / "driving" / "middleware" / "metrics.py",
+    ]:
+        if path.exists():
+            path.unlink()
+
+
 def handle_database_config(project_dir: Path, db_type: str):
     print(f"Configuring database for {db_type}...")
 
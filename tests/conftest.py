@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for the template test suite.
+
+Every test runs in its own temporary directory, so generated projects never
+collide and the suite can run under ``pytest -n auto`` (pytest-xdist). All
+``uv`` invocations share one persistent cache, so dependencies are resolved
+and downloaded once rather than once per generated project.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+TEMPLATE_ROOT = Path(__file__).resolve().parent.parent
+
+# ``generate`` is a whole cookiecutter CLI run, for tests that cannot split it
+STAGES = ("generate", "render", "hook", "sync", "import", "first_request")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def uv_cache_dir(request, tmp_path_factory):
+    """Point every ``uv`` subprocess at one shared cache.
+
+    An explicit ``UV_CACHE_DIR`` wins. Otherwise the cache lives in pytest's
+    cache directory, which persists between runs and is shared by all xdist
+    workers; uv locks the cache, so concurrent syncs are safe.
+    """
+    cache_dir = os.environ.get("UV_CACHE_DIR")
+    if not cache_dir:
+        cache = getattr(request.config, "cache", None)
+        if cache is not None:
+            cache_dir = str(cache.mkdir("uv"))
+        else:
+            cache_dir = str(tmp_path_factory.getbasetemp().parent / "uv-cache")
+        os.environ["UV_CACHE_DIR"] = cache_dir
+    return Path(cache_dir)
+
+
+@pytest.fixture(autouse=True)
+def isolated_workdir(tmp_path, monkeypatch):
+    """Run each test from its own temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class StageTimer:
+    """Collect wall-clock durations of the stages of one generated project."""
+
+    def __init__(self):
+        self.timings = {}
+
+    def record(self, stage, seconds):
+        self.timings[stage] = self.timings.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, name):
+        """Time the body of a ``with`` block as stage ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+
+@pytest.fixture
+def stage_timer(request):
+    """Per-test stage timer; its timings are reported at the end of the run."""
+    timer = StageTimer()
+    yield timer
+    if timer.timings:
+        # user_properties travel from xdist workers back to the controller
+        request.node.user_properties.append(
+            ("stage_timings", json.dumps(timer.timings))
+        )
+
+
+_collected_timings = []
+
+
+def pytest_runtest_logreport(report):
+    # The stage_timer fixture records its timings during teardown
+    if report.when != "teardown":
+        return
+    for name, value in report.user_properties:
+        if name == "stage_timings":
+            _collected_timings.append((report.nodeid, json.loads(value)))
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _collected_timings:
+        return
+    terminalreporter.section("generation stage timings (s)")
+    rows = sorted(
+        (nodeid.split("::")[-1], timings) for nodeid, timings in _collected_timings
+    )
+    width = max(len(name) for name, _ in rows) + 2
+    terminalreporter.write_line(
+        f"{'test':<{width}}" + "".join(f"{s:>14}" for s in STAGES)
+    )
+    for name, timings in rows:
+        cells = "".join(
+            f"{timings[stage]:>14.2f}" if stage in timings else f"{'-':>14}"
+            for stage in STAGES
+        )
+        terminalreporter.write_line(f"{name:<{width}}{cells}")
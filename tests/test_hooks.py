@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 
 import os
-import shutil
 import subprocess
+from pathlib import Path
 
-import pytest
+from tests.conftest import TEMPLATE_ROOT
+
+TEMPLATE_DIR = TEMPLATE_ROOT / "{{cookiecutter.project_slug}}"
 
 
 def run_command(cmd, cwd=None):
@@ -25,29 +27,9 @@ def run_command(cmd, cwd=None):
         return e.returncode, e.stdout, e.stderr
 
 
-@pytest.fixture(autouse=True)
-def cleanup_after_test():
-    """Clean up test projects after each test."""
-    yield
-    test_projects = [
-        "hook-fastapi",
-        "hook-drf",
-        "hook-sqlite",
-        "hook-postgresql",
-        "hook-steps-fastapi",
-        "hook-steps-drf",
-    ]
-    for project in test_projects:
-        if os.path.exists(project):
-            shutil.rmtree(project)
-
-
 def test_hook_fastapi_cleanup():
     """Test that hook properly cleans up FastAPI project."""
-    if os.path.exists("test-hook-fastapi"):
-        shutil.rmtree("test-hook-fastapi")
-
-    cmd = """cookiecutter . --no-input \
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
         project_name="Hook FastAPI" \
         framework="fastapi" \
         author_name="Test User" \
@@ -88,10 +70,7 @@ def test_hook_fastapi_cleanup():
 
 def test_hook_drf_cleanup():
     """Test that hook properly cleans up DRF project."""
-    if os.path.exists("test-hook-drf"):
-        shutil.rmtree("test-hook-drf")
-
-    cmd = """cookiecutter . --no-input \
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
         project_name="Hook DRF" \
         framework="drf" \
         author_name="Test User" \
@@ -134,10 +113,7 @@ def test_hook_drf_cleanup():
 
 def test_hook_database_config():
     """Test database configuration in .env files."""
-    if os.path.exists("test-hook-sqlite"):
-        shutil.rmtree("test-hook-sqlite")
-
-    cmd = """cookiecutter . --no-input \
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
         project_name="Hook SQLite" \
         framework="fastapi" \
         author_name="Test User" \
@@ -156,10 +132,7 @@ def test_hook_database_config():
                 "DATABASE_URL=sqlite:///./hook-sqlite.db" in content
             ), "SQLite .env file should contain correct database URL"
 
-    if os.path.exists("test-hook-postgresql"):
-        shutil.rmtree("test-hook-postgresql")
-
-    cmd = """cookiecutter . --no-input \
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
         project_name="Hook PostgreSQL" \
         framework="drf" \
         author_name="Test User" \
@@ -181,12 +154,8 @@ def test_hook_database_config():
 
 def test_hook_next_steps():
     """Test that next steps are printed correctly."""
-    if os.path.exists("test-hook-steps-fastapi"):
-        shutil.rmtree("test-hook-steps-fastapi")
 
-    os.environ["COOKIECUTTER_FRAMEWORK"] = "fastapi"
-
-    cmd = """cookiecutter . --no-input \
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
         project_name="Hook Steps FastAPI" \
         framework="fastapi" \
         author_name="Test User" \
@@ -206,12 +175,7 @@ def test_hook_next_steps():
     for file_path in expected_files:
         assert os.path.exists(file_path), f"Missing FastAPI file: {file_path}"
 
-    if os.path.exists("test-hook-steps-drf"):
-        shutil.rmtree("test-hook-steps-drf")
-
-    os.environ["COOKIECUTTER_FRAMEWORK"] = "drf"
-
-    cmd = """cookiecutter . --no-input \
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
         project_name="Hook Steps DRF" \
         framework="drf" \
         author_name="Test User" \
@@ -232,3 +196,86 @@ def test_hook_next_steps():
 
     for file_path in expected_files:
         assert os.path.exists(file_path), f"Missing DRF file: {file_path}"
+
+
+# Files the post-generation hook removes unless performance_profile=high_throughput
+HIGH_THROUGHPUT_ONLY = {
+    "gunicorn.conf.py",
+    "src/{slug}/adapters/driving/metrics.py",
+    "src/{slug}/adapters/driving/middleware/metrics.py",
+}
+
+
+def expected_project_files(framework, project_slug, performance_profile="default"):
+    """Relative paths of every file a generated project should contain."""
+    tree = TEMPLATE_DIR / f"{framework}_template"
+    tree_entries = {item.name for item in tree.iterdir()}
+
+    # .env is written by the post-generation hook
+    files = {".env"}
+    for path in tree.rglob("*"):
+        if path.is_file():
+            files.add(
+                str(path.relative_to(tree)).replace(TEMPLATE_DIR.name, project_slug)
+            )
+
+    # Shared files survive unless the framework tree ships its own version
+    for item in TEMPLATE_DIR.iterdir():
+        if (
+            item.name in tree_entries
+            or item.name.endswith("_template")
+            or item.name.startswith("PLACEHOLDER_")
+        ):
+            continue
+        paths = (
+            [item] if item.is_file() else [p for p in item.rglob("*") if p.is_file()]
+        )
+        files.update(str(path.relative_to(TEMPLATE_DIR)) for path in paths)
+
+    if performance_profile != "high_throughput":
+        files -= {path.format(slug=project_slug) for path in HIGH_THROUGHPUT_ONLY}
+    return files
+
+
+def generate_and_time(framework, project_name, project_slug, stage_timer):
+    """Generate a project, timing it as stage ``generate``; return the written files.
+
+    The time is reported, not asserted: under ``pytest -n auto`` it depends on
+    everything else the machine is running.
+    """
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+        project_name="{project_name}" \
+        framework="{framework}" \
+        author_name="Test User" \
+        email="test@example.com" \
+        description="Hook timing test" \
+        db_type="sqlite" """
+
+    with stage_timer.stage("generate"):
+        returncode, stdout, stderr = run_command(cmd)
+    assert returncode == 0, f"{framework} generation failed: {stderr}"
+
+    written = {
+        str(path.relative_to(project_slug))
+        for path in Path(project_slug).rglob("*")
+        if path.is_file()
+    }
+    return written
+
+
+def test_hook_generation_time_fastapi(stage_timer):
+    """Test FastAPI generation writes only the project files, and time it."""
+    written = generate_and_time(
+        "fastapi", "Hook Timing FastAPI", "hook-timing-fastapi", stage_timer
+    )
+
+    assert written == expected_project_files("fastapi", "hook-timing-fastapi")
+
+
+def test_hook_generation_time_drf(stage_timer):
+    """Test DRF generation writes only the project files, and time it."""
+    written = generate_and_time(
+        "drf", "Hook Timing DRF", "hook-timing-drf", stage_timer
+    )
+
+    assert written == expected_project_files("drf", "hook-timing-drf")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Generation matrix: every framework/database combination is generated into its
+own temporary directory, installed from the shared uv cache, imported and
+served one request. Each stage is timed and reported at the end of the run.
+
+Run it in parallel with::
+
+    uv run pytest tests/test_matrix.py -n auto
+"""
+
+import json
+import subprocess
+
+import pytest
+from cookiecutter import generate
+from cookiecutter.main import cookiecutter
+
+from tests.conftest import TEMPLATE_ROOT
+
+FRAMEWORKS = ["fastapi", "drf"]
+DB_TYPES = ["sqlite", "postgresql"]
+
+# Imports the app and serves one health check, timing both in-process so the
+# numbers exclude interpreter and ``uv run`` start-up.
+PROBES = {
+    "fastapi": """
+import json, time
+start = time.perf_counter()
+from {slug}.main import app
+from fastapi.testclient import TestClient
+imported = time.perf_counter()
+response = TestClient(app).get("/health")
+done = time.perf_counter()
+print(json.dumps({{"import": imported - start, "first_request": done - imported,
+                  "status": response.status_code}}))
+""",
+    "drf": """
+import json, os, time
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "{slug}.config.settings")
+start = time.perf_counter()
+import django
+django.setup()
+from django.test import Client
+imported = time.perf_counter()
+response = Client(HTTP_HOST="localhost").get("/health/")
+done = time.perf_counter()
+print(json.dumps({{"import": imported - start, "first_request": done - imported,
+                  "status": response.status_code}}))
+""",
+}
+
+
+def run(cmd, cwd):
+    """Run a command, failing the test with its output if it does not succeed."""
+    result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+    assert (
+        result.returncode == 0
+    ), f"{' '.join(cmd)} failed:\n{result.stdout}\n{result.stderr}"
+    return result.stdout
+
+
+def generate_timed(framework, db_type, output_dir, stage_timer, monkeypatch):
+    """Generate a project, splitting cookiecutter's time into render and hook."""
+    run_hook = generate.run_hook_from_repo_dir
+
+    def timed_hook(*args, **kwargs):
+        with stage_timer.stage("hook"):
+            return run_hook(*args, **kwargs)
+
+    monkeypatch.setattr(generate, "run_hook_from_repo_dir", timed_hook)
+
+    with stage_timer.stage("render"):
+        project_dir = cookiecutter(
+            str(TEMPLATE_ROOT),
+            no_input=True,
+            output_dir=str(output_dir),
+            extra_context={
+                "project_name": f"Matrix{framework}{db_type}",
+                "framework": framework,
+                "db_type": db_type,
+            },
+        )
+    # Report rendering on its own; hook time is already recorded separately
+    stage_timer.record("render", -stage_timer.timings.get("hook", 0.0))
+    return project_dir
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+@pytest.mark.parametrize("db_type", DB_TYPES)
+@pytest.mark.parametrize("framework", FRAMEWORKS)
+def test_generated_project_serves_requests(
+    framework, db_type, tmp_path, stage_timer, monkeypatch
+):
+    """Generate, install, import and serve one request for each combination."""
+    project_dir = generate_timed(framework, db_type, tmp_path, stage_timer, monkeypatch)
+    slug = f"matrix{framework}{db_type}"
+
+    with stage_timer.stage("sync"):
+        run(["uv", "sync", "--extra", "dev"], cwd=project_dir)
+
+    probe = PROBES[framework].format(slug=slug)
+    output = run(
+        ["uv", "run", "--extra", "dev", "python", "-c", probe], cwd=project_dir
+    )
+    # The app logs JSON to stdout too, on start-up and when it drains at exit
+    result = next(
+        json.loads(line)
+        for line in reversed(output.splitlines())
+        if line.startswith('{"import":')
+    )
+    stage_timer.record("import", result["import"])
+    stage_timer.record("first_request", result["first_request"])
+
+    assert result["status"] == 200
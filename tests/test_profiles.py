@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Load test of the ``default`` and ``high_throughput`` performance profiles.
+
+Both profiles of the FastAPI template are generated with SQLite, installed with
+``uv`` and driven by the generated ``benchmarks/bench_load.py``. Both must serve
+load; their throughput is recorded with ``record_property`` rather than
+compared, since a shared CI machine makes any ordering between them flaky.
+
+``uv sync`` needs network access; deselect with ``-m "not slow"``.
+"""
+
+import json
+import subprocess
+
+import pytest
+from cookiecutter.main import cookiecutter
+
+from tests.conftest import TEMPLATE_ROOT
+
+PROFILES = ["default", "high_throughput"]
+
+
+def run(cmd, cwd):
+    """Run a command, failing the test with its output if it does not succeed."""
+    result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+    assert (
+        result.returncode == 0
+    ), f"{' '.join(cmd)} failed:\n{result.stdout}\n{result.stderr}"
+    return result.stdout
+
+
+def bench_profile(profile, output_dir):
+    """Generate, install and load-test one profile; return the benchmark results."""
+    project_dir = cookiecutter(
+        str(TEMPLATE_ROOT),
+        no_input=True,
+        output_dir=str(output_dir),
+        extra_context={
+            "project_name": f"Profile{profile.replace('_', '')}",
+            "framework": "fastapi",
+            "db_type": "sqlite",
+            "performance_profile": profile,
+        },
+    )
+    run(["uv", "sync", "--extra", "dev"], cwd=project_dir)
+    output = run(
+        ["uv", "run", "--extra", "dev", "python", "benchmarks/bench_load.py", "--json"],
+        cwd=project_dir,
+    )
+    # The app logs JSON to stdout too, on start-up and when it drains at exit
+    return next(
+        json.loads(line)
+        for line in reversed(output.splitlines())
+        if line.startswith('{"health":')
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+def test_both_profiles_serve_load(tmp_path, record_property):
+    """Both profiles serve health checks and repository reads under load."""
+    results = {
+        profile: bench_profile(profile, tmp_path / profile) for profile in PROFILES
+    }
+
+    for profile in PROFILES:
+        for case in ["health", "user"]:
+            requests_per_s = results[profile][case]["requests_per_s"]
+            record_property(f"{profile}_{case}_requests_per_s", round(requests_per_s))
+            assert requests_per_s > 0
@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 
+import json
 import os
-import shutil
+import re
 import subprocess
 
-import pytest
+from tests.conftest import TEMPLATE_ROOT
 
 
 def run_command(cmd, cwd=None):
@@ -18,33 +19,10 @@ def run_command(cmd, cwd=None):
         return e.returncode, e.stdout, e.stderr
 
 
-@pytest.fixture(autouse=True)
-def cleanup_after_test():
-    """Clean up test projects after each test."""
-    yield
-    test_projects = [
-        "test-fastapi-sqlite",
-        "test-fastapi-postgresql",
-        "test-drf-sqlite",
-        "test-drf-postgresql",
-        "docker-build",
-        "drffunc",
-        "debug-drf",
-        "debug-test",
-    ]
-    for project in test_projects:
-        if os.path.exists(project):
-            shutil.rmtree(project)
-
-
 def test_fastapi_sqlite():
     """Test FastAPI project generation with SQLite."""
-    if os.path.exists("test-fastapi-sqlite"):
-        shutil.rmtree("test-fastapi-sqlite")
 
-    os.environ["COOKIECUTTER_FRAMEWORK"] = "fastapi"
-
-    cmd = """cookiecutter . --no-input \
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
         project_name="Test FastAPI SQLite" \
         framework="fastapi" \
         author_name="Test User" \
@@ -83,12 +61,8 @@ def test_fastapi_sqlite():
 
 def test_fastapi_postgresql():
     """Test FastAPI project generation with PostgreSQL."""
-    if os.path.exists("test-fastapi-postgresql"):
-        shutil.rmtree("test-fastapi-postgresql")
-
-    os.environ["COOKIECUTTER_FRAMEWORK"] = "fastapi"
 
-    cmd = """cookiecutter . --no-input \
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
         project_name="Test FastAPI PostgreSQL" \
         framework="fastapi" \
         author_name="Test User" \
@@ -124,12 +98,8 @@ def test_fastapi_postgresql():
 
 def test_drf_sqlite():
     """Test DRF project generation with SQLite."""
-    if os.path.exists("test-drf-sqlite"):
-        shutil.rmtree("test-drf-sqlite")
-
-    os.environ["COOKIECUTTER_FRAMEWORK"] = "drf"
 
-    cmd = """cookiecutter . --no-input \
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
         project_name="Test DRF SQLite" \
         framework="drf" \
         author_name="Test User" \
@@ -168,12 +138,8 @@ def test_drf_sqlite():
 
 def test_drf_postgresql():
     """Test DRF project generation with PostgreSQL."""
-    if os.path.exists("test-drf-postgresql"):
-        shutil.rmtree("test-drf-postgresql")
 
-    os.environ["COOKIECUTTER_FRAMEWORK"] = "drf"
-
-    cmd = """cookiecutter . --no-input \
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
         project_name="Test DRF PostgreSQL" \
         framework="drf" \
         author_name="Test User" \
@@ -209,12 +175,8 @@ def test_drf_postgresql():
 
 def test_docker_build():
     """Test Docker build configuration."""
-    if os.path.exists("test-docker-build"):
-        shutil.rmtree("test-docker-build")
-
-    os.environ["COOKIECUTTER_FRAMEWORK"] = "fastapi"
 
-    cmd = """cookiecutter . --no-input \
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
         project_name="Docker Build" \
         framework="fastapi" \
         author_name="Test User" \
@@ -238,12 +200,8 @@ def test_docker_build():
 
 def test_drf_functionality():
     """Test DRF functionality and Django check."""
-    if os.path.exists("test-drf-func"):
-        shutil.rmtree("test-drf-func")
-
-    os.environ["COOKIECUTTER_FRAMEWORK"] = "drf"
 
-    cmd = """cookiecutter . --no-input \
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
         project_name="DRFFunc" \
         framework="drf" \
         author_name="Test User" \
@@ -263,3 +221,797 @@ def test_drf_functionality():
         cwd="drffunc",
     )
     assert returncode == 0, f"DRF check failed: {stderr}"
+
+
+def test_fastapi_functionality():
+    """Test the generated FastAPI project's own test suite passes in each profile."""
+
+    for profile, project_slug in [
+        ("default", "fastapifunc"),
+        ("high_throughput", "fastapifast"),
+    ]:
+        cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+            project_name="{project_slug}" \
+            framework="fastapi" \
+            db_type="sqlite" \
+            performance_profile="{profile}" """
+
+        returncode, stdout, stderr = run_command(cmd)
+        assert returncode == 0, f"FastAPI {profile} generation failed: {stderr}"
+        assert os.path.exists(project_slug), f"{project_slug} directory not created"
+
+        # Includes starting the server as deployed and draining it on SIGTERM
+        returncode, stdout, stderr = run_command(
+            "uv run --extra dev pytest", cwd=project_slug
+        )
+        assert returncode == 0, f"FastAPI {profile} project tests failed: {stdout}"
+
+
+def test_drf_api_only():
+    """Test DRF API-only generation drops stateful apps and middleware."""
+
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+        project_name="API Only" \
+        framework="drf" \
+        author_name="Test User" \
+        email="test@example.com" \
+        description="DRF API-only test" \
+        db_type="sqlite" \
+        api_only="y" """
+
+    returncode, stdout, stderr = run_command(cmd)
+    assert returncode == 0, f"DRF API-only generation failed: {stderr}"
+
+    with open("api-only/src/api-only/config/settings.py", "r") as f:
+        content = f.read()
+        for removed in [
+            "django.contrib.admin",
+            "django.contrib.sessions",
+            "django.contrib.messages",
+            "CsrfViewMiddleware",
+            "SessionAuthentication",
+        ]:
+            assert (
+                removed not in content
+            ), f"{removed} should not be in API-only settings"
+        assert (
+            "SignedTokenAuthentication" in content
+        ), "Token authentication not configured"
+
+    with open("api-only/src/api-only/config/urls.py", "r") as f:
+        assert (
+            "admin" not in f.read()
+        ), "Admin URLs should not be routed in API-only mode"
+
+    with open("api-only/Dockerfile", "r") as f:
+        assert "collectstatic" not in f.read(), "API-only image has no static files"
+
+    expected_files = [
+        "api-only/src/api-only/adapters/driving/api/authentication.py",
+        "api-only/benchmarks/bench_request_overhead.py",
+    ]
+    for file_path in expected_files:
+        assert os.path.exists(file_path), f"Missing file: {file_path}"
+
+
+def test_drf_fast_json():
+    """Test DRF projects render and parse JSON with orjson."""
+
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+        project_name="Fast JSON" \
+        framework="drf" \
+        author_name="Test User" \
+        email="test@example.com" \
+        description="DRF fast JSON test" \
+        db_type="sqlite" """
+
+    returncode, stdout, stderr = run_command(cmd)
+    assert returncode == 0, f"DRF generation failed: {stderr}"
+
+    with open("fast-json/src/fast-json/config/settings.py", "r") as f:
+        content = f.read()
+        assert "ORJSONRenderer" in content, "orjson renderer not configured"
+        assert "ORJSONParser" in content, "orjson parser not configured"
+
+    with open("fast-json/pyproject.toml", "r") as f:
+        assert "orjson" in f.read(), "orjson not found in pyproject.toml"
+
+    expected_files = [
+        "fast-json/src/fast-json/adapters/driving/api/renderers.py",
+        "fast-json/src/fast-json/adapters/driving/api/serializers.py",
+        "fast-json/benchmarks/bench_serialization.py",
+    ]
+    for file_path in expected_files:
+        assert os.path.exists(file_path), f"Missing file: {file_path}"
+
+
+def test_drf_query_instrumentation():
+    """Test DRF projects ship query-count middleware and a query budget suite."""
+
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+        project_name="QueryBudget" \
+        framework="drf" \
+        author_name="Test User" \
+        email="test@example.com" \
+        description="DRF query budget test" \
+        db_type="sqlite" """
+
+    returncode, stdout, stderr = run_command(cmd)
+    assert returncode == 0, f"DRF generation failed: {stderr}"
+
+    with open("querybudget/src/querybudget/config/settings.py", "r") as f:
+        content = f.read()
+        assert "QueryCountMiddleware" in content, "Query count middleware not installed"
+        assert "django.db.backends.sqlite3" in content, "SQLite database not configured"
+
+    expected_files = [
+        "querybudget/src/querybudget/adapters/driving/middleware/query_count.py",
+        "querybudget/src/querybudget/testing.py",
+        "querybudget/src/querybudget/migrations/0001_initial.py",
+        "querybudget/tests/conftest.py",
+        "querybudget/tests/test_query_budget.py",
+    ]
+    for file_path in expected_files:
+        assert os.path.exists(file_path), f"Missing file: {file_path}"
+
+    returncode, stdout, stderr = run_command("uv sync --extra dev", cwd="querybudget")
+    assert returncode == 0, f"uv sync failed: {stderr}"
+
+    returncode, stdout, stderr = run_command("uv run pytest", cwd="querybudget")
+    assert returncode == 0, f"Query budget tests failed: {stdout}"
+
+
+STATIC_PROBE = """
+import json, os
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "staticassets.config.settings")
+import django
+django.setup()
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.test import Client
+url = staticfiles_storage.url("admin/css/base.css")
+response = Client(HTTP_HOST="localhost").get(url, HTTP_ACCEPT_ENCODING="br, gzip")
+print(json.dumps({"url": url, "status": response.status_code,
+                  "cache_control": response.get("Cache-Control", ""),
+                  "content_encoding": response.get("Content-Encoding", "")}))
+"""
+
+
+def test_drf_static_files():
+    """Test DRF projects serve hashed, precompressed static files via WhiteNoise."""
+
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+        project_name="StaticAssets" \
+        framework="drf" \
+        author_name="Test User" \
+        email="test@example.com" \
+        description="DRF static files test" \
+        db_type="sqlite" \
+        api_only="n" """
+
+    returncode, stdout, stderr = run_command(cmd)
+    assert returncode == 0, f"DRF generation failed: {stderr}"
+
+    with open("staticassets/Dockerfile", "r") as f:
+        content = f.read()
+        assert "collectstatic" in content, "Dockerfile doesn't collect static files"
+        assert "runserver" not in content, "Dockerfile should not use runserver"
+
+    returncode, stdout, stderr = run_command("uv sync", cwd="staticassets")
+    assert returncode == 0, f"uv sync failed: {stderr}"
+
+    # As deployed: hashed names are only used with DEBUG off
+    returncode, stdout, stderr = run_command(
+        "DEBUG=False uv run python src/staticassets/manage.py collectstatic --noinput",
+        cwd="staticassets",
+    )
+    assert returncode == 0, f"collectstatic failed: {stderr}"
+
+    css = os.path.join("staticassets", "staticfiles", "admin", "css")
+    written = [name for name in os.listdir(css) if name.startswith("base.")]
+    hashed = [
+        name for name in written if re.fullmatch(r"base\.[0-9a-f]{12}\.css", name)
+    ]
+    assert len(hashed) == 1, f"No content-hashed base.css in {written}"
+    assert f"{hashed[0]}.gz" in written, "No gzip variant of the hashed file"
+    assert f"{hashed[0]}.br" in written, "No brotli variant of the hashed file"
+
+    returncode, stdout, stderr = run_command(
+        f"DEBUG=False uv run python -c '{STATIC_PROBE}'", cwd="staticassets"
+    )
+    assert returncode == 0, f"Static file request failed: {stderr}"
+    # The app logs JSON to stdout too, on start-up and when it drains at exit
+    result = next(
+        json.loads(line)
+        for line in reversed(stdout.splitlines())
+        if line.startswith('{"url":')
+    )
+    assert result["url"] == f"/static/admin/css/{hashed[0]}"
+    assert result["status"] == 200
+    assert result["content_encoding"] == "br"
+    cache_control = result["cache_control"]
+    assert "immutable" in cache_control, f"Not immutable: {cache_control}"
+    max_age = int(cache_control.split("max-age=")[1].split(",")[0])
+    assert max_age >= 365 * 24 * 3600, f"Not cached for a year: {cache_control}"
+
+
+def test_drf_async_views():
+    """Test DRF projects ship async user views, a sync facade and an ASGI entry point."""
+
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+        project_name="Async Views" \
+        framework="drf" \
+        author_name="Test User" \
+        email="test@example.com" \
+        description="DRF async views test" \
+        db_type="sqlite" """
+
+    returncode, stdout, stderr = run_command(cmd)
+    assert returncode == 0, f"DRF generation failed: {stderr}"
+
+    expected_files = [
+        "async-views/src/async-views/asgi.py",
+        "async-views/src/async-views/adapters/driving/api/async_views.py",
+        "async-views/src/async-views/adapters/driving/api/views.py",
+        "async-views/src/async-views/adapters/driving/api/sync_views.py",
+        "async-views/tests/test_user_api.py",
+        "async-views/benchmarks/bench_async_views.py",
+    ]
+    for file_path in expected_files:
+        assert os.path.exists(file_path), f"Missing file: {file_path}"
+
+    with open("async-views/src/async-views/config/settings.py", "r") as f:
+        content = f.read()
+        assert "ASGI_APPLICATION" in content, "ASGI application not configured"
+        assert "API_ASYNC_VIEWS" in content, "Async view switch not configured"
+
+
+def test_drf_create_ddd_app():
+    """Test create_ddd_app scaffolds working, batched and paginated stubs."""
+
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+        project_name="DDDApp" \
+        framework="drf" \
+        author_name="Test User" \
+        email="test@example.com" \
+        description="DRF DDD app test" \
+        db_type="sqlite" """
+
+    returncode, stdout, stderr = run_command(cmd)
+    assert returncode == 0, f"DRF generation failed: {stderr}"
+
+    returncode, stdout, stderr = run_command("uv sync --extra dev", cwd="dddapp")
+    assert returncode == 0, f"uv sync failed: {stderr}"
+
+    returncode, stdout, stderr = run_command(
+        "uv run python src/dddapp/manage.py create_ddd_app product "
+        "--service-name catalog --settings=dddapp.config.settings",
+        cwd="dddapp",
+    )
+    assert returncode == 0, f"create_ddd_app failed: {stderr}"
+
+    expected_files = [
+        "dddapp/src/catalog_service/domain/repositories/product_repository.py",
+        "dddapp/src/catalog_service/infrastructure/repositories/product_repository.py",
+        "dddapp/src/catalog_service/infrastructure/product/migrations/0001_initial.py",
+        "dddapp/src/catalog_service/presentation/api/product_views.py",
+        "dddapp/tests/test_product.py",
+        "dddapp/benchmarks/bench_product.py",
+    ]
+    for file_path in expected_files:
+        assert os.path.exists(file_path), f"Missing file: {file_path}"
+
+    with open(
+        "dddapp/src/catalog_service/infrastructure/repositories/product_repository.py"
+    ) as f:
+        content = f.read()
+        for method in ("get_many", "save_many", "iter_page"):
+            assert f"def {method}" in content, f"Repository is missing {method}"
+
+    with open("dddapp/src/dddapp/config/settings.py", "r") as f:
+        assert (
+            '"catalog_service.infrastructure.product"' in f.read()
+        ), "App not registered"
+
+    returncode, stdout, stderr = run_command(
+        "uv run pytest tests/test_product.py", cwd="dddapp"
+    )
+    assert returncode == 0, f"Scaffolded app tests failed: {stdout}"
+
+
+def test_fastapi_performance_profile():
+    """Test the high-throughput profile wires the fast stack and default does not."""
+
+    for profile, name in [
+        ("high_throughput", "fast-profile"),
+        ("default", "default-profile"),
+    ]:
+        cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+            project_name="{name}" \
+            framework="fastapi" \
+            db_type="sqlite" \
+            performance_profile="{profile}" """
+
+        returncode, stdout, stderr = run_command(cmd)
+        assert returncode == 0, f"FastAPI {profile} generation failed: {stderr}"
+
+    with open("fast-profile/pyproject.toml", "r") as f:
+        content = f.read()
+        for dependency in [
+            "aiosqlite",
+            "uvloop",
+            "httptools",
+            "uvicorn-worker",
+            "prometheus-client",
+        ]:
+            assert dependency in content, f"{dependency} not found in pyproject.toml"
+
+    with open("fast-profile/src/fast-profile/dependencies/container.py", "r") as f:
+        content = f.read()
+        assert "CachedUserRepository" in content, "Cache layer not wired"
+        assert "SharedMemoryCache" in content, "Shared cache backend not selectable"
+
+    with open("fast-profile/Dockerfile", "r") as f:
+        assert "gunicorn.conf.py" in f.read(), "Multi-worker runner not used"
+
+    for file_path in [
+        "fast-profile/gunicorn.conf.py",
+        "fast-profile/src/fast-profile/adapters/driving/metrics.py",
+        "fast-profile/benchmarks/bench_load.py",
+        "fast-profile/benchmarks/bench_cache.py",
+    ]:
+        assert os.path.exists(file_path), f"Missing file: {file_path}"
+
+    with open("default-profile/pyproject.toml", "r") as f:
+        content = f.read()
+        assert "uvloop" not in content, "Default profile should not pin uvloop"
+        assert (
+            "prometheus-client" not in content
+        ), "Default profile should not ship metrics"
+
+    for file_path in [
+        "default-profile/gunicorn.conf.py",
+        "default-profile/src/default-profile/adapters/driving/metrics.py",
+    ]:
+        assert not os.path.exists(file_path), f"Unexpected file: {file_path}"
+
+
+def test_drf_performance_profile():
+    """Test the high-throughput DRF profile pools connections and exports metrics."""
+
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+        project_name="DRF Fast Profile" \
+        framework="drf" \
+        db_type="postgresql" \
+        performance_profile="high_throughput" """
+
+    returncode, stdout, stderr = run_command(cmd)
+    assert returncode == 0, f"DRF high-throughput generation failed: {stderr}"
+
+    with open("drf-fast-profile/src/drf-fast-profile/config/settings.py", "r") as f:
+        content = f.read()
+        assert '"pool"' in content, "psycopg connection pool not configured"
+        assert "PrometheusMiddleware" in content, "Metrics middleware not installed"
+
+    with open("drf-fast-profile/pyproject.toml", "r") as f:
+        content = f.read()
+        assert (
+            "psycopg[binary,pool]" in content
+        ), "psycopg pool not found in pyproject.toml"
+        assert (
+            "psycopg2-binary" not in content
+        ), "psycopg2 should be replaced by psycopg 3"
+
+    for file_path in [
+        "drf-fast-profile/gunicorn.conf.py",
+        "drf-fast-profile/src/drf-fast-profile/adapters/driving/middleware/metrics.py",
+        "drf-fast-profile/src/drf-fast-profile/adapters/driven/cache/ttl_cache.py",
+    ]:
+        assert os.path.exists(file_path), f"Missing file: {file_path}"
+
+
+def test_fastapi_job_scheduler():
+    """Test FastAPI projects ship a background job scheduler and its tests."""
+
+    cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+        project_name="jobsvc" \
+        framework="fastapi" \
+        db_type="sqlite" """
+
+    returncode, stdout, stderr = run_command(cmd)
+    assert returncode == 0, f"FastAPI generation failed: {stderr}"
+
+    # Retries, concurrency limits, shutdown and durable polling are covered by
+    # the project's own tests/test_jobs.py, run by test_fastapi_functionality
+    expected_files = [
+        "jobsvc/src/jobsvc/adapters/driving/jobs/scheduler.py",
+        "jobsvc/src/jobsvc/adapters/driving/jobs/tasks.py",
+        "jobsvc/src/jobsvc/adapters/driven/persistence/job_store.py",
+        "jobsvc/tests/test_jobs.py",
+    ]
+    for file_path in expected_files:
+        assert os.path.exists(file_path), f"Missing file: {file_path}"
+
+
+def test_domain_events():
+    """Test both frameworks publish User domain events through the event bus."""
+
+    for framework in ("fastapi", "drf"):
+        project_slug = f"events-{framework}"
+        cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+            project_name="Events {framework}" \
+            framework="{framework}" \
+            db_type="sqlite" """
+
+        returncode, stdout, stderr = run_command(cmd)
+        assert returncode == 0, f"{framework} generation failed: {stderr}"
+
+        package = f"{project_slug}/src/{project_slug}"
+        expected_files = [
+            f"{package}/domain/events/base.py",
+            f"{package}/domain/events/user_events.py",
+            f"{package}/adapters/driven/events/event_bus.py",
+            f"{package}/adapters/driving/events/subscribers.py",
+            # Publishing and delivery are covered there, run by test_*_functionality
+            f"{project_slug}/tests/test_domain_events.py",
+        ]
+        for file_path in expected_files:
+            assert os.path.exists(file_path), f"Missing file: {file_path}"
+
+
+def test_read_replicas():
+    """Test both frameworks route user reads to replicas and writes to the primary."""
+
+    for framework in ("fastapi", "drf"):
+        project_slug = f"replicas-{framework}"
+        cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+            project_name="Replicas {framework}" \
+            framework="{framework}" \
+            db_type="postgresql" """
+
+        returncode, stdout, stderr = run_command(cmd)
+        assert returncode == 0, f"{framework} generation failed: {stderr}"
+
+        # Routing, pinning and health checks are covered by the projects' own
+        # tests, run by test_fastapi_functionality and test_drf_functionality
+        package = f"{project_slug}/src/{project_slug}"
+        if framework == "fastapi":
+            router_file = f"{package}/adapters/driven/persistence/replicas.py"
+            assert os.path.exists(f"{project_slug}/tests/test_replicas.py")
+        else:
+            router_file = f"{package}/adapters/driven/persistence/db_router.py"
+            assert os.path.exists(f"{project_slug}/tests/test_db_router.py")
+            with open(f"{package}/config/settings.py", "r") as f:
+                content = f.read()
+                assert "DATABASE_ROUTERS" in content
+                assert "PrimaryPinningMiddleware" in content
+
+        with open(router_file, "r") as f:
+            assert "pg_last_xact_replay_timestamp" in f.read()
+
+
+def test_structured_logging():
+    """Test both frameworks log through the queue with request ids."""
+
+    for framework in ("fastapi", "drf"):
+        project_slug = f"logging-{framework}"
+        cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+            project_name="Logging {framework}" \
+            framework="{framework}" """
+
+        returncode, stdout, stderr = run_command(cmd)
+        assert returncode == 0, f"{framework} generation failed: {stderr}"
+
+        # The queue, sampling and request ids are covered by the projects' own
+        # tests/test_logging.py, run by test_*_functionality
+        package = f"{project_slug}/src/{project_slug}"
+        assert os.path.exists(f"{project_slug}/benchmarks/bench_logging.py")
+        assert os.path.exists(f"{project_slug}/tests/test_logging.py")
+        with open(f"{package}/adapters/driven/external/email_adapter.py", "r") as f:
+            assert "print(" not in f.read()
+        if framework == "drf":
+            with open(f"{package}/config/settings.py", "r") as f:
+                content = f.read()
+                assert "RequestIdMiddleware" in content
+                assert "LOGGING_CONFIG" in content
+
+
+def test_tracing():
+    """Test both frameworks trace routes, services and repositories when sampled."""
+
+    for framework in ("fastapi", "drf"):
+        project_slug = f"tracing-{framework}"
+        cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+            project_name="Tracing {framework}" \
+            framework="{framework}" """
+
+        returncode, stdout, stderr = run_command(cmd)
+        assert returncode == 0, f"{framework} generation failed: {stderr}"
+
+        package = f"{project_slug}/src/{project_slug}"
+        for module in ("__init__", "tracer", "exporters"):
+            assert os.path.exists(f"{package}/adapters/driven/tracing/{module}.py")
+        assert os.path.exists(f"{project_slug}/benchmarks/bench_tracing.py")
+        with open(f"{package}/dependencies/container.py", "r") as f:
+            content = f.read()
+            assert 'instrument(self.user_service, "UserService")' in content
+            assert 'instrument(self.user_repository, "UserRepository")' in content
+        assert os.path.exists(f"{project_slug}/tests/test_tracing.py")
+        if framework == "fastapi":
+            assert os.path.exists(f"{package}/adapters/driving/tracing.py")
+        else:
+            with open(f"{package}/config/settings.py", "r") as f:
+                assert "TracingMiddleware" in f.read()
+
+
+def test_bulk_status_changes():
+    """Test both frameworks expose set-based bulk activation for each database."""
+
+    for framework in ("fastapi", "drf"):
+        for db_type in ("sqlite", "postgresql"):
+            project_slug = f"bulk-{framework}-{db_type}"
+            cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+                project_name="Bulk {framework} {db_type}" \
+                framework="{framework}" \
+                db_type="{db_type}" """
+
+            returncode, stdout, stderr = run_command(cmd)
+            assert returncode == 0, f"{framework} generation failed: {stderr}"
+
+            package = f"{project_slug}/src/{project_slug}"
+            assert os.path.exists(f"{project_slug}/benchmarks/bench_bulk_status.py")
+            with open(f"{package}/domain/services/user_service.py", "r") as f:
+                content = f.read()
+                assert "async def deactivate_users" in content
+                assert "async def activate_users" in content
+            with open(
+                f"{package}/adapters/driven/persistence/user_repository.py", "r"
+            ) as f:
+                assert "RETURNING id" in f.read()
+            assert os.path.exists(f"{project_slug}/tests/test_user_api.py")
+            if framework == "drf":
+                with open(f"{package}/adapters/driving/api/urls.py", "r") as f:
+                    assert "users/batch/deactivate/" in f.read()
+
+
+def test_bulk_transfer():
+    """Test both frameworks stream resumable CSV/NDJSON exports and imports."""
+
+    for framework in ("fastapi", "drf"):
+        for db_type in ("sqlite", "postgresql"):
+            project_slug = f"transfer-{framework}-{db_type}"
+            cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+                project_name="Transfer {framework} {db_type}" \
+                framework="{framework}" \
+                db_type="{db_type}" """
+
+            returncode, stdout, stderr = run_command(cmd)
+            assert returncode == 0, f"{framework} generation failed: {stderr}"
+
+            package = f"{project_slug}/src/{project_slug}"
+            assert os.path.exists(f"{project_slug}/benchmarks/bench_transfer.py")
+            with open(
+                f"{package}/adapters/driven/persistence/user_transfer.py", "r"
+            ) as f:
+                content = f.read()
+                assert "class RecordReader" in content
+                if db_type == "postgresql":
+                    assert "COPY" in content or "copy_in" in content
+            assert os.path.exists(f"{project_slug}/tests/test_user_transfer.py")
+            if framework == "fastapi":
+                assert os.path.exists(f"{package}/adapters/driving/cli/transfer.py")
+                with open(f"{project_slug}/pyproject.toml", "r") as f:
+                    assert "transfer-users" in f.read()
+            else:
+                for command in ("export_users", "import_users"):
+                    assert os.path.exists(f"{package}/management/commands/{command}.py")
+                with open(f"{package}/adapters/driving/api/urls.py", "r") as f:
+                    content = f.read()
+                    assert "users/export/" in content
+                    assert "users/import/" in content
+
+
+def test_time_ordered_ids():
+    """Test both frameworks create UUIDv7 ids and store them compactly on SQLite."""
+
+    for framework in ("fastapi", "drf"):
+        project_slug = f"ids-{framework}"
+        cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+            project_name="Ids {framework}" \
+            framework="{framework}" \
+            db_type="sqlite" """
+
+        returncode, stdout, stderr = run_command(cmd)
+        assert returncode == 0, f"{framework} generation failed: {stderr}"
+
+        package = f"{project_slug}/src/{project_slug}"
+        assert os.path.exists(f"{package}/domain/entities/ids.py")
+        assert os.path.exists(f"{project_slug}/benchmarks/bench_uuid.py")
+        with open(f"{package}/domain/entities/user.py", "r") as f:
+            assert "id=uuid7()" in f.read()
+        assert os.path.exists(f"{project_slug}/tests/test_user_ids.py")
+        if framework == "drf":
+            assert os.path.exists(f"{package}/migrations/0002_compact_uuid_ids.py")
+            with open(f"{package}/adapters/driven/persistence/models.py", "r") as f:
+                assert "id = CompactUUIDField(primary_key=True)" in f.read()
+
+
+def test_conditional_requests():
+    """Test both frameworks answer conditional GETs from a timestamp-only query."""
+
+    for framework in ("fastapi", "drf"):
+        project_slug = f"conditional-{framework}"
+        cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+            project_name="Conditional {framework}" \
+            framework="{framework}" \
+            performance_profile="high_throughput" """
+
+        returncode, stdout, stderr = run_command(cmd)
+        assert returncode == 0, f"{framework} generation failed: {stderr}"
+
+        package = f"{project_slug}/src/{project_slug}"
+        assert os.path.exists(f"{package}/adapters/driving/api/conditional.py")
+        with open(
+            f"{package}/adapters/driven/persistence/user_repository.py", "r"
+        ) as f:
+            content = f.read()
+            assert "async def get_updated_at" in content
+            assert "async def get_all_updated_at" in content
+        with open(
+            f"{package}/adapters/driven/cache/cached_user_repository.py", "r"
+        ) as f:
+            assert "async def get_updated_at" in f.read()
+        assert os.path.exists(f"{project_slug}/tests/test_conditional_get.py")
+        if framework == "drf":
+            with open(f"{package}/adapters/driving/api/views.py", "r") as f:
+                assert "not_modified(request" in f.read()
+
+
+def test_response_compression():
+    """Test both frameworks compress responses, streaming ones chunk by chunk."""
+
+    for framework in ("fastapi", "drf"):
+        project_slug = f"compression-{framework}"
+        cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+            project_name="Compression {framework}" \
+            framework="{framework}" """
+
+        returncode, stdout, stderr = run_command(cmd)
+        assert returncode == 0, f"{framework} generation failed: {stderr}"
+
+        package = f"{project_slug}/src/{project_slug}"
+        assert os.path.exists(f"{project_slug}/benchmarks/bench_compression.py")
+        with open(f"{project_slug}/pyproject.toml", "r") as f:
+            content = f.read()
+            assert '"brotli"' in content
+            assert '"zstandard"' in content
+        assert os.path.exists(f"{project_slug}/tests/test_compression.py")
+        if framework == "fastapi":
+            assert os.path.exists(f"{package}/adapters/driving/compression.py")
+        else:
+            assert os.path.exists(
+                f"{package}/adapters/driving/middleware/compression.py"
+            )
+            with open(f"{package}/config/settings.py", "r") as f:
+                assert "middleware.compression.CompressionMiddleware" in f.read()
+
+
+def test_admission_control():
+    """Test both frameworks shed load past an adaptive limit, health checks exempt."""
+
+    for framework in ("fastapi", "drf"):
+        project_slug = f"admission-{framework}"
+        cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+            project_name="Admission {framework}" \
+            framework="{framework}" """
+
+        returncode, stdout, stderr = run_command(cmd)
+        assert returncode == 0, f"{framework} generation failed: {stderr}"
+
+        package = f"{project_slug}/src/{project_slug}"
+        with open(f"{package}/config/settings.py", "r") as f:
+            assert "ADMISSION_EXEMPT_PATHS" in f.read()
+        assert os.path.exists(f"{project_slug}/tests/test_admission.py")
+        if framework == "fastapi":
+            assert os.path.exists(f"{package}/adapters/driving/admission.py")
+        else:
+            assert os.path.exists(f"{package}/adapters/driving/middleware/admission.py")
+            with open(f"{package}/config/settings.py", "r") as f:
+                assert "middleware.admission.AdmissionControlMiddleware" in f.read()
+
+
+def test_readiness_endpoint():
+    """Test both frameworks serve readiness from background dependency probes."""
+
+    for framework in ("fastapi", "drf"):
+        project_slug = f"readiness-{framework}"
+        cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+            project_name="Readiness {framework}" \
+            framework="{framework}" """
+
+        returncode, stdout, stderr = run_command(cmd)
+        assert returncode == 0, f"{framework} generation failed: {stderr}"
+
+        package = f"{project_slug}/src/{project_slug}"
+        assert os.path.exists(f"{package}/adapters/driving/readiness.py")
+        with open(f"{package}/config/settings.py", "r") as f:
+            assert "READY_CHECK_INTERVAL" in f.read()
+        assert os.path.exists(f"{project_slug}/tests/test_readiness.py")
+        if framework == "drf":
+            with open(f"{package}/config/urls.py", "r") as f:
+                assert 'path("ready/"' in f.read()
+
+
+def test_graceful_shutdown():
+    """Test both frameworks drain on SIGTERM through a container-owned coordinator."""
+
+    for framework in ("fastapi", "drf"):
+        project_slug = f"shutdown-{framework}"
+        cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+            project_name="Shutdown {framework}" \
+            framework="{framework}" """
+
+        returncode, stdout, stderr = run_command(cmd)
+        assert returncode == 0, f"{framework} generation failed: {stderr}"
+
+        package = f"{project_slug}/src/{project_slug}"
+        assert os.path.exists(f"{package}/adapters/driving/shutdown.py")
+        with open(f"{package}/config/settings.py", "r") as f:
+            assert "SHUTDOWN_DRAIN_DELAY" in f.read()
+        with open(f"{package}/dependencies/container.py", "r") as f:
+            assert "ShutdownCoordinator" in f.read()
+        assert os.path.exists(f"{project_slug}/tests/test_shutdown.py")
+        if framework == "drf":
+            assert os.path.exists(f"{package}/adapters/driving/middleware/drain.py")
+            with open(f"{package}/asgi.py", "r") as f:
+                assert "Lifespan" in f.read()
+
+
+def test_multi_stage_dockerfile():
+    """Test both frameworks build slim runtime images with precompiled bytecode."""
+
+    for framework in ("fastapi", "drf"):
+        project_slug = f"docker-{framework}"
+        cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+            project_name="Docker {framework}" \
+            framework="{framework}" \
+            db_type="postgresql" """
+
+        returncode, stdout, stderr = run_command(cmd)
+        assert returncode == 0, f"{framework} generation failed: {stderr}"
+
+        with open(f"{project_slug}/Dockerfile", "r") as f:
+            dockerfile = f.read()
+        builder, runtime = dockerfile.split("AS builder", 1)[1].split("\nFROM ", 1)
+        assert "libpq-dev" in builder and "UV_COMPILE_BYTECODE=1" in builder
+        assert "libpq-dev" not in runtime and "uv " not in runtime
+        assert "COPY --from=builder /opt/venv /opt/venv" in runtime
+        assert "compileall" in runtime
+        assert os.path.exists(f"{project_slug}/.dockerignore")
+        assert os.path.exists(f"{project_slug}/benchmarks/bench_startup.py")
+
+
+def test_msgpack_encoding():
+    """Test both frameworks exchange users in MessagePack, next to JSON."""
+
+    for framework in ("fastapi", "drf"):
+        project_slug = f"msgpack-{framework}"
+        cmd = f"""cookiecutter {TEMPLATE_ROOT} --no-input \
+            project_name="Msgpack {framework}" \
+            framework="{framework}" """
+
+        returncode, stdout, stderr = run_command(cmd)
+        assert returncode == 0, f"{framework} generation failed: {stderr}"
+
+        package = f"{project_slug}/src/{project_slug}"
+        assert os.path.exists(f"{project_slug}/benchmarks/bench_msgpack.py")
+        with open(f"{project_slug}/pyproject.toml", "r") as f:
+            assert '"msgpack"' in f.read()
+        assert os.path.exists(f"{project_slug}/tests/test_msgpack.py")
+        if framework == "fastapi":
+            assert os.path.exists(f"{package}/adapters/driving/msgpack/user_routes.py")
+        else:
+            assert os.path.exists(f"{package}/adapters/driving/msgpack/renderers.py")
+            with open(f"{package}/config/settings.py", "r") as f:
+                content = f.read()
+                assert "msgpack.renderers.MessagePackRenderer" in content
+                assert "msgpack.renderers.MessagePackParser" in content
@@ -0,0 +1,123 @@
+"""
+Overhead of serving the async UserService from native async views (ASGI)
+versus the sync facade (WSGI), which bridges every call with ``async_to_sync``.
+
+Two levels are measured:
+
+* bridge: awaiting a no-op service coroutine directly versus through
+  ``async_to_sync`` - the fixed cost the facade adds per call;
+* request: a full ``GET /users/`` through the ASGI handler with async views and
+  through the WSGI handler with the sync facade.
+
+Run with::
+
+    uv run python benchmarks/bench_async_views.py [--requests 1000]
+"""
+
+import argparse
+import asyncio
+import tempfile
+from pathlib import Path
+
+import django
+from django.conf import settings
+
+_db_dir = tempfile.TemporaryDirectory()
+
+settings.configure(
+    DEBUG=False,
+    SECRET_KEY="benchmark",
+    ALLOWED_HOSTS=["testserver"],
+    ROOT_URLCONF=__name__,
+    INSTALLED_APPS=["rest_framework", "{{cookiecutter.project_slug}}"],
+    MIDDLEWARE=["django.middleware.common.CommonMiddleware"],
+    # A file database: async views query from a worker thread, and every thread
+    # would get its own private ":memory:" database
+    DATABASES={
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": str(Path(_db_dir.name) / "bench.db"),
+        }
+    },
+    REST_FRAMEWORK={
+        "DEFAULT_AUTHENTICATION_CLASSES": [
+            "{{cookiecutter.project_slug}}.adapters.driving.api.authentication.SignedTokenAuthentication",
+        ],
+        "DEFAULT_RENDERER_CLASSES": [
+            "{{cookiecutter.project_slug}}.adapters.driving.api.renderers.ORJSONRenderer",
+        ],
+        "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+        "PAGE_SIZE": 20,
+        "UNAUTHENTICATED_USER": None,
+    },
+    API_TOKEN_MAX_AGE=3600,
+    USE_TZ=True,
+    # Read by the container
+    EVENT_QUEUE_SIZE=10_000,
+    EVENT_BATCH_SIZE=100,
+    EVENT_SHUTDOWN_TIMEOUT=5.0,
+    TRACE_SAMPLE_RATE=0.0,
+    TRACE_EXPORTER="memory",
+    TRACE_FILE="",
+    TRACE_OTLP_ENDPOINT="",
+)
+django.setup()
+
+from asgiref.sync import async_to_sync  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.test import AsyncClient, Client  # noqa: E402
+from django.urls import path  # noqa: E402
+from timing import measure, measure_async, report  # noqa: E402
+
+from {{cookiecutter.project_slug}}.adapters.driving.api import sync_views, views  # type: ignore # noqa: E402
+from {{cookiecutter.project_slug}}.adapters.driving.api.authentication import issue_token  # type: ignore # noqa: E402
+from {{cookiecutter.project_slug}}.dependencies.container import get_container  # type: ignore # noqa: E402
+
+urlpatterns = [
+    path("async/users/", views.UserListView.as_view()),
+    path("sync/users/", sync_views.UserListView.as_view()),
+]
+
+
+async def noop_service_call():
+    return None
+
+
+async def bench_async(requests: int, headers: dict) -> dict:
+    client = AsyncClient()
+    return {
+        "bridge: direct await": await measure_async(noop_service_call, requests * 10),
+        "request: async view (ASGI)": await measure_async(
+            lambda: client.get("/async/users/", headers=headers), requests
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--users", type=int, default=20)
+    args = parser.parse_args()
+
+    call_command("migrate", verbosity=0)
+    service = get_container().get_user_service()
+    for i in range(args.users):
+        async_to_sync(service.create_user)(f"user{i}@example.com", f"User {i}")
+
+    headers = {"authorization": f"Bearer {issue_token('bench')}"}
+    client = Client()
+
+    async_results = asyncio.run(bench_async(args.requests, headers))
+    results = {
+        "bridge: direct await": async_results["bridge: direct await"],
+        "bridge: async_to_sync": measure(async_to_sync(noop_service_call), args.requests * 10),
+        "request: async view (ASGI)": async_results["request: async view (ASGI)"],
+        "request: sync facade (WSGI)": measure(
+            lambda: client.get("/sync/users/", headers=headers), args.requests
+        ),
+    }
+    report(f"Async views vs sync facade ({args.users} users per page)", results)
+
+
+if __name__ == "__main__":
+    main()
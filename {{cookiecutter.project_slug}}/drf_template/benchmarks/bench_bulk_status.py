@@ -0,0 +1,92 @@
+"""
+Deactivating many users: one ``deactivate_user`` call per id versus one
+``deactivate_users`` call for all of them.
+
+The per-user loop reads and writes every user through the ORM (two statements
+each); the bulk call runs one set-based ``UPDATE ... RETURNING id``, in chunks
+on SQLite. Both go through ``UserService`` and ``DjangoUserRepository``
+against a scratch SQLite database.
+
+Run with::
+
+    uv run python benchmarks/bench_bulk_status.py [--users 2000]
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import uuid4
+
+import django
+from django.conf import settings
+
+_db_dir = tempfile.TemporaryDirectory()
+
+settings.configure(
+    INSTALLED_APPS=["{{cookiecutter.project_slug}}"],
+    DATABASES={
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": str(Path(_db_dir.name) / "bench.db"),
+        }
+    },
+    USE_TZ=True,
+)
+django.setup()
+
+from asgiref.sync import async_to_sync  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.models import UserModel  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_repository import DjangoUserRepository  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.domain.services.user_service import UserService  # type: ignore # noqa: E402,E501
+
+
+async def deactivate_one_by_one(service: UserService, ids) -> None:
+    for user_id in ids:
+        await service.deactivate_user(user_id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=2_000)
+    args = parser.parse_args()
+
+    call_command("migrate", verbosity=0)
+    now = datetime.now(timezone.utc)
+    rows = UserModel.objects.bulk_create(
+        UserModel(
+            id=uuid4(),
+            email=f"bench-{index}@example.com",
+            name="Bench",
+            is_active=True,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(args.users)
+    )
+    ids = [row.id for row in rows]
+    service = UserService(DjangoUserRepository())
+
+    start = time.perf_counter()
+    async_to_sync(deactivate_one_by_one)(service, ids)
+    loop_seconds = time.perf_counter() - start
+
+    async_to_sync(service.activate_users)(ids)
+
+    start = time.perf_counter()
+    changed = async_to_sync(service.deactivate_users)(ids)
+    bulk_seconds = time.perf_counter() - start
+    assert len(changed) == args.users
+
+    print(f"\nDeactivating {args.users} users")
+    print(f"{'case':<12}{'seconds':>10}{'users/s':>12}")
+    for case, seconds in (("per-user", loop_seconds), ("bulk", bulk_seconds)):
+        print(f"{case:<12}{seconds:>10.3f}{args.users / seconds:>12.0f}")
+    print(f"bulk is {loop_seconds / bulk_seconds:.0f}x faster")
+
+
+if __name__ == "__main__":
+    main()
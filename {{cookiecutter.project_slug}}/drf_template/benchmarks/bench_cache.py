@@ -0,0 +1,137 @@
+"""
+Hit ratio and lookup latency of the user cache backends across worker processes.
+
+Every worker process performs ``CachedUserRepository.get_by_id`` lookups with a
+skewed (Zipf-like) key popularity. Its repository stands in for the database
+and blocks for ``--miss-ms`` on every load. Backends:
+
+* memory: one ``TTLCache`` per process, so every worker warms its own copy;
+* shared: one ``SharedMemoryCache`` for all workers.
+
+Run with::
+
+    uv run python benchmarks/bench_cache.py [--workers 4] [--lookups 20000] [--users 5000]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+from uuid import UUID
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from {{cookiecutter.project_slug}}.adapters.driven.cache.cached_user_repository import CachedUserRepository  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.adapters.driven.cache.shared_cache import SharedMemoryCache  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.adapters.driven.cache.ttl_cache import TTLCache  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.adapters.driven.cache.user_codec import UserCacheCodec  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore # noqa: E402,E501
+
+CREATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class SlowRepository:
+    """Read-only user repository that costs ``miss_seconds`` per load."""
+
+    def __init__(self, users: int, miss_seconds: float):
+        self.miss_seconds = miss_seconds
+        self.loads = 0
+        self.users = {
+            UUID(int=i + 1): User(
+                id=UUID(int=i + 1),
+                email=f"user{i}@example.com",
+                name=f"User {i}",
+                created_at=CREATED_AT,
+                updated_at=CREATED_AT,
+            )
+            for i in range(users)
+        }
+
+    async def get_by_id(self, user_id: UUID):
+        self.loads += 1
+        time.sleep(self.miss_seconds)
+        return self.users.get(user_id)
+
+
+async def lookups(repository: CachedUserRepository, keys: List[UUID]) -> List[float]:
+    samples = []
+    for key in keys:
+        start = time.perf_counter()
+        await repository.get_by_id(key)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def run_worker(backend: str, path: str, args: argparse.Namespace, seed: int) -> Dict[str, object]:
+    """Run one worker's lookups and return its load count and latency samples."""
+    if backend == "shared":
+        cache = SharedMemoryCache(
+            path, ttl=300, max_entries=args.cache_entries, codec=UserCacheCodec()
+        )
+    else:
+        cache = TTLCache(ttl=300, max_entries=args.cache_entries)
+    source = SlowRepository(args.users, args.miss_ms / 1000)
+    repository = CachedUserRepository(source, cache)
+
+    ids = list(source.users)
+    weights = [1 / rank ** 1.1 for rank in range(1, len(ids) + 1)]
+    keys = random.Random(seed).choices(ids, weights, k=args.lookups)
+    samples = asyncio.run(lookups(repository, keys))
+    return {"loads": source.loads, "samples": samples}
+
+
+def run_backend(backend: str, args: argparse.Namespace) -> Dict[str, float]:
+    """Run all workers against one backend and aggregate their results."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / "users")
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(args.workers) as pool:
+            results = pool.starmap(
+                run_worker, [(backend, path, args, seed) for seed in range(args.workers)]
+            )
+
+    samples = sorted(sample for result in results for sample in result["samples"])
+    loads = sum(result["loads"] for result in results)
+    return {
+        "hit_ratio": 1 - loads / len(samples),
+        "loads": loads,
+        "mean_us": statistics.fmean(samples),
+        "p50_us": samples[len(samples) // 2],
+        "p99_us": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--lookups", type=int, default=20_000, help="per worker")
+    parser.add_argument("--users", type=int, default=5_000)
+    parser.add_argument("--cache-entries", type=int, default=10_000)
+    parser.add_argument("--miss-ms", type=float, default=0.5, help="simulated query time")
+    args = parser.parse_args()
+
+    print(
+        f"\n{args.workers} workers x {args.lookups} lookups over {args.users} users, "
+        f"{args.miss_ms} ms per miss"
+    )
+    print(
+        f"{'backend':<10}{'hit ratio':>12}{'loads':>10}"
+        f"{'mean us':>12}{'p50 us':>12}{'p99 us':>12}"
+    )
+    for backend in ("memory", "shared"):
+        stats = run_backend(backend, args)
+        print(
+            f"{backend:<10}{stats['hit_ratio']:>12.3f}{stats['loads']:>10}"
+            f"{stats['mean_us']:>12.1f}{stats['p50_us']:>12.1f}{stats['p99_us']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
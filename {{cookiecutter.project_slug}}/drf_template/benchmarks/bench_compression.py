@@ -0,0 +1,108 @@
+"""
+CPU cost against bytes saved of the response compression codings.
+
+Compresses user-list JSON payloads of several sizes with each coding this
+install can produce, at the latency-tuned default of ``COMPRESSION_LEVELS`` and
+at the coding's maximum, and reports time per response, compressed size
+and bytes saved per millisecond of CPU. Below a few hundred bytes the saving
+rarely pays for the work and the extra framing, which is what
+``COMPRESSION_MIN_SIZE`` is for.
+
+``--chunk-size`` compresses each payload as a stream of flushed chunks, as
+exports are sent, to show what flushing every chunk costs in ratio.
+
+Run with::
+
+    uv run python benchmarks/bench_compression.py [--sizes 256 1024 16384 1048576]
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from {{cookiecutter.project_slug}}.adapters.driving.middleware.compression import ENCODERS  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.domain.entities.ids import uuid7  # type: ignore # noqa: E402,E501
+
+# Defaults of COMPRESSION_LEVELS
+TUNED_LEVELS = {"zstd": 3, "br": 4, "gzip": 5}
+MAX_LEVELS = {"zstd": 19, "br": 11, "gzip": 9}
+UPDATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc).isoformat()
+
+
+def make_payload(size: int) -> bytes:
+    """A ``GET /users`` body of about ``size`` bytes."""
+    users = []
+    length = 0
+    while length < size:
+        user = {
+            "id": str(uuid7()),
+            "email": f"user{len(users)}@example.com",
+            "name": f"User {len(users)}",
+            "is_active": True,
+            "created_at": UPDATED_AT,
+            "updated_at": UPDATED_AT,
+        }
+        users.append(user)
+        length += len(json.dumps(user)) + 2
+    return json.dumps({"users": users, "count": len(users)}).encode()[:size]
+
+
+def compress(encoding: str, level: int, payload: bytes, chunk_size: int) -> bytes:
+    encoder = ENCODERS[encoding](level)
+    if not chunk_size:
+        return encoder.compress(payload) + encoder.finish()
+    parts = [
+        encoder.compress(payload[offset:offset + chunk_size]) + encoder.flush()
+        for offset in range(0, len(payload), chunk_size)
+    ]
+    return b"".join(parts) + encoder.finish()
+
+
+def run_case(
+    encoding: str, level: int, payload: bytes, chunk_size: int, seconds: float
+) -> Tuple[float, int]:
+    """Compress for about ``seconds``; return microseconds per payload and compressed size."""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        compressed = compress(encoding, level, payload, chunk_size)
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds and calls >= 3:
+            return elapsed / calls * 1_000_000, len(compressed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[256, 1024, 4096, 16384, 65536, 1048576]
+    )
+    parser.add_argument("--chunk-size", type=int, default=0)
+    parser.add_argument("--seconds", type=float, default=0.2, help="time per case")
+    args = parser.parse_args()
+
+    print(f"codings: {', '.join(ENCODERS)}")
+    for size in args.sizes:
+        payload = make_payload(size)
+        print(f"\n{len(payload)} byte payload")
+        print(f"{'coding':<12}{'us':>10}{'bytes':>10}{'ratio':>8}{'saved/ms':>12}")
+        for encoding in ENCODERS:
+            for level in (TUNED_LEVELS[encoding], MAX_LEVELS[encoding]):
+                micros, compressed = run_case(
+                    encoding, level, payload, args.chunk_size, args.seconds
+                )
+                saved_per_ms = (len(payload) - compressed) / micros * 1000
+                print(
+                    f"{f'{encoding}-{level}':<12}{micros:>10.1f}{compressed:>10}"
+                    f"{len(payload) / compressed:>8.2f}{saved_per_ms:>12.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Request latency with heavy logging, written synchronously or through the queue.
+
+Concurrent clients run simulated requests on one event loop. Each request
+awaits a few times, as handlers do around I/O, and logs ``--logs`` records.
+The log sink is a stream that takes ``--write-us`` per write, like a congested
+pipe or a log collector applying back-pressure. Cases:
+
+* off: logging disabled, the baseline;
+* sync: a ``StreamHandler`` on the root logger, writing on the event loop;
+* queue: ``configure_logging``, writing from its writer thread.
+
+Run with::
+
+    uv run python benchmarks/bench_logging.py [--requests 5000] [--concurrency 32] [--logs 5]
+"""
+
+import argparse
+import asyncio
+import io
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from {{cookiecutter.project_slug}}.config.logging_config import JsonFormatter, configure_logging, stop_logging  # type: ignore # noqa: E402,E501
+
+logger = logging.getLogger("bench")
+
+
+class SlowStream(io.TextIOBase):
+    """Text sink that blocks for ``delay`` seconds on every write."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        time.sleep(self.delay)
+        self.writes += 1
+        return len(text)
+
+
+async def handle_request(number: int, logs: int) -> None:
+    """Stand-in for a request handler that logs while it works."""
+    for index in range(logs):
+        await asyncio.sleep(0)
+        logger.info("Handled step", extra={"request": number, "step": index})
+
+
+async def run_case(requests: int, concurrency: int, logs: int) -> Dict[str, float]:
+    """Run ``requests`` requests from ``concurrency`` clients; return throughput and latency."""
+    samples: List[float] = []
+    remaining = iter(range(requests))
+
+    async def client() -> None:
+        for number in remaining:
+            start = time.perf_counter()
+            await handle_request(number, logs)
+            samples.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    samples.sort()
+    return {
+        "requests_per_s": requests / elapsed,
+        "mean_ms": statistics.fmean(samples),
+        "p99_ms": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+    }
+
+
+def setup(case: str, stream: SlowStream, queue_size: int) -> None:
+    """Point the root logger at ``stream`` the way ``case`` does."""
+    stop_logging()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.setLevel(logging.INFO)
+    logger.disabled = case == "off"
+    if case == "sync":
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(JsonFormatter())
+        root.addHandler(handler)
+    elif case == "queue":
+        configure_logging(queue_size=queue_size, stream=stream)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--logs", type=int, default=5, help="records per request")
+    parser.add_argument("--write-us", type=float, default=50, help="sink time per write")
+    parser.add_argument("--queue-size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(
+        f"\n{args.requests} requests x {args.logs} records, {args.concurrency} clients, "
+        f"{args.write_us} us per write"
+    )
+    print(f"{'case':<8}{'req/s':>12}{'mean ms':>12}{'p99 ms':>12}{'written':>10}")
+    for case in ("off", "sync", "queue"):
+        stream = SlowStream(args.write_us / 1_000_000)
+        setup(case, stream, args.queue_size)
+        stats = asyncio.run(run_case(args.requests, args.concurrency, args.logs))
+        # The queue case finishes writing in the background; wait for it to count
+        stop_logging()
+        print(
+            f"{case:<8}{stats['requests_per_s']:>12.0f}{stats['mean_ms']:>12.3f}"
+            f"{stats['p99_ms']:>12.3f}{stream.writes:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Payload size and encode/decode time of users in JSON versus MessagePack.
+
+For ``--users`` users, times what the server does with each format:
+
+- a user list response: ``UserSerializer`` and ``ORJSONRenderer`` or
+  ``MessagePackRenderer``, and how long the matching parser takes to read it
+  back;
+- a batch request naming the users: parsing the body and validating it with
+  ``UserIdsSerializer``, which turns ids into ``UUID`` objects.
+
+Run with::
+
+    uv run python benchmarks/bench_msgpack.py [--users 1 100 1000 10000]
+"""
+
+import argparse
+import io
+
+import django
+from django.conf import settings
+
+settings.configure(
+    INSTALLED_APPS=["rest_framework"],
+    USE_TZ=True,
+)
+django.setup()
+
+from timing import measure, report  # noqa: E402
+
+from {{cookiecutter.project_slug}}.adapters.driving.api.renderers import ORJSONParser, ORJSONRenderer  # type: ignore # noqa: E402
+from {{cookiecutter.project_slug}}.adapters.driving.api.serializers import UserIdsSerializer, UserSerializer  # type: ignore # noqa: E402
+from {{cookiecutter.project_slug}}.adapters.driving.msgpack.renderers import MessagePackParser, MessagePackRenderer  # type: ignore # noqa: E402
+from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore # noqa: E402
+
+FORMATS = {
+    "json": (ORJSONRenderer(), ORJSONParser()),
+    "msgpack": (MessagePackRenderer(), MessagePackParser()),
+}
+
+
+def make_users(count: int):
+    return [User.create(email=f"user{i}@example.com", name=f"User {i}") for i in range(count)]
+
+
+def validate_ids(body_parser, body: bytes):
+    serializer = UserIdsSerializer(data=body_parser.parse(io.BytesIO(body)))
+    serializer.is_valid(raise_exception=True)
+    return serializer.validated_data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, nargs="+", default=[1, 100, 1_000, 10_000])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    for count in args.users:
+        users = make_users(count)
+        ids = {"ids": [user.id for user in users]}
+        results = {}
+        sizes = []
+        for name, (renderer, body_parser) in FORMATS.items():
+            body = renderer.render(UserSerializer(users, many=True).data)
+            request_body = renderer.render(ids)
+            sizes.append(f"{name} {len(body)}/{len(request_body)} bytes")
+            results[f"{name} list encode"] = measure(
+                lambda: renderer.render(UserSerializer(users, many=True).data),
+                args.iterations,
+                warmup=2,
+            )
+            results[f"{name} list decode"] = measure(
+                lambda: body_parser.parse(io.BytesIO(body)), args.iterations, warmup=2
+            )
+            results[f"{name} ids decode"] = measure(
+                lambda: validate_ids(body_parser, request_body), args.iterations, warmup=2
+            )
+        report(f"{count} users (list/ids {', '.join(sizes)})", results)
+
+
+if __name__ == "__main__":
+    main()
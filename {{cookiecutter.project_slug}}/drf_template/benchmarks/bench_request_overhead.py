@@ -0,0 +1,140 @@
+"""
+Per-request overhead of the full Django stack versus the API-only stack.
+
+The full stack is the default template configuration: session, CSRF, auth and
+message middleware with ``SessionAuthentication``. The lean stack is what
+``api_only=y`` generates: two middleware and ``SignedTokenAuthentication``.
+
+Run with::
+
+    uv run python benchmarks/bench_request_overhead.py [--requests 2000]
+"""
+
+import argparse
+
+import django
+from django.conf import settings
+
+FULL_MIDDLEWARE = [
+    "django.middleware.security.SecurityMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+]
+
+LEAN_MIDDLEWARE = [
+    "django.middleware.security.SecurityMiddleware",
+    "django.middleware.common.CommonMiddleware",
+]
+
+
+def configure() -> None:
+    """Configure a throwaway in-memory Django project with both stacks installed."""
+    settings.configure(
+        DEBUG=False,
+        SECRET_KEY="benchmark",
+        ALLOWED_HOSTS=["testserver"],
+        ROOT_URLCONF=__name__,
+        INSTALLED_APPS=[
+            "django.contrib.auth",
+            "django.contrib.contenttypes",
+            "django.contrib.sessions",
+            "django.contrib.messages",
+            "rest_framework",
+        ],
+        MIDDLEWARE=FULL_MIDDLEWARE,
+        DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+        REST_FRAMEWORK={"DEFAULT_RENDERER_CLASSES": ["rest_framework.renderers.JSONRenderer"]},
+        API_TOKEN_MAX_AGE=3600,
+        USE_TZ=True,
+    )
+    django.setup()
+
+
+configure()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test import Client, override_settings  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from django.urls import path  # noqa: E402
+from rest_framework.authentication import SessionAuthentication  # noqa: E402
+from rest_framework.permissions import IsAuthenticated  # noqa: E402
+from rest_framework.response import Response  # noqa: E402
+from rest_framework.views import APIView  # noqa: E402
+from timing import measure, report  # noqa: E402
+
+from {{cookiecutter.project_slug}}.adapters.driving.api.authentication import (  # type: ignore # noqa: E402
+    SignedTokenAuthentication,
+    issue_token,
+)
+
+
+class FullStackView(APIView):
+    authentication_classes = [SessionAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response({"status": "ok"})
+
+
+class LeanStackView(APIView):
+    authentication_classes = [SignedTokenAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response({"status": "ok"})
+
+
+urlpatterns = [
+    path("full/", FullStackView.as_view()),
+    path("lean/", LeanStackView.as_view()),
+]
+
+
+def build_clients():
+    """Create one warmed-up client per stack."""
+    call_command("migrate", verbosity=0)
+    user = get_user_model().objects.create_user("bench", password="bench")
+
+    with override_settings(MIDDLEWARE=FULL_MIDDLEWARE):
+        full_client = Client()
+        full_client.force_login(user)
+        assert full_client.get("/full/").status_code == 200
+
+    with override_settings(MIDDLEWARE=LEAN_MIDDLEWARE):
+        lean_client = Client(HTTP_AUTHORIZATION=f"Bearer {issue_token('bench')}")
+        assert lean_client.get("/lean/").status_code == 200
+
+    return full_client, lean_client
+
+
+def count_queries(client: Client, url: str) -> int:
+    """Number of SQL queries a single request runs."""
+    with CaptureQueriesContext(connection) as captured:
+        client.get(url)
+    return len(captured)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    full_client, lean_client = build_clients()
+
+    results = {
+        "full stack (session)": measure(lambda: full_client.get("/full/"), args.requests),
+        "api-only (signed token)": measure(lambda: lean_client.get("/lean/"), args.requests),
+    }
+    report(f"Per-request overhead over {args.requests} requests", results)
+    print(f"\nSQL queries per request: full={count_queries(full_client, '/full/')}"
+          f" api-only={count_queries(lean_client, '/lean/')}")
+
+
+if __name__ == "__main__":
+    main()
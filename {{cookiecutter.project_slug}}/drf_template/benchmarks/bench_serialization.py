@@ -0,0 +1,72 @@
+"""
+List serialization cost: stock DRF serializer + JSONRenderer versus
+``UserSerializer`` + ``ORJSONRenderer``.
+
+Run with::
+
+    uv run python benchmarks/bench_serialization.py [--rows 1000 10000]
+"""
+
+import argparse
+
+import django
+from django.conf import settings
+
+settings.configure(
+    INSTALLED_APPS=["rest_framework"],
+    USE_TZ=True,
+)
+django.setup()
+
+from rest_framework import serializers  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+from timing import measure, report  # noqa: E402
+
+from {{cookiecutter.project_slug}}.adapters.driving.api.renderers import ORJSONRenderer  # type: ignore # noqa: E402
+from {{cookiecutter.project_slug}}.adapters.driving.api.serializers import UserSerializer  # type: ignore # noqa: E402
+from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore # noqa: E402
+
+
+class StockUserSerializer(serializers.Serializer):
+    """What a hand-written or ModelSerializer-derived DRF serializer does per row."""
+
+    id = serializers.UUIDField()
+    email = serializers.EmailField()
+    name = serializers.CharField()
+    is_active = serializers.BooleanField()
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
+
+
+def make_users(count: int):
+    return [User.create(email=f"user{i}@example.com", name=f"User {i}") for i in range(count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    stock_renderer = JSONRenderer()
+    fast_renderer = ORJSONRenderer()
+
+    for rows in args.rows:
+        users = make_users(rows)
+        results = {
+            "stock serializer+renderer": measure(
+                lambda: stock_renderer.render(StockUserSerializer(users, many=True).data),
+                args.iterations,
+                warmup=2,
+            ),
+            "fast serializer+renderer": measure(
+                lambda: fast_renderer.render(UserSerializer(users, many=True).data),
+                args.iterations,
+                warmup=2,
+            ),
+        }
+        report(f"Serializing {rows} users ({args.iterations} iterations)", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Cost of tracing on a service call that reaches the repository.
+
+``UserService.get_user`` runs against an in-memory repository, so the
+numbers are the tracing overhead alone. Cases:
+
+* off: sampling off (``TRACE_SAMPLE_RATE=0``), service and repository unwrapped;
+* unsampled: wrapped, in a request the sampler skipped;
+* sampled: wrapped, in a sampled request, spans kept in memory.
+
+Run with::
+
+    uv run python benchmarks/bench_tracing.py [--calls 100000]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from {{cookiecutter.project_slug}}.adapters.driven.tracing.exporters import InMemoryExporter  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.adapters.driven.tracing.tracer import Tracer  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore # noqa: E402
+from {{cookiecutter.project_slug}}.domain.services.user_service import UserService  # type: ignore # noqa: E402,E501
+
+
+class InMemoryUserRepository:
+    """Repository holding one user, so calls cost no I/O."""
+
+    def __init__(self, user: User):
+        self.user = user
+
+    async def get_by_id(self, user_id):
+        return self.user
+
+
+async def run_case(case: str, calls: int) -> float:
+    """Time ``calls`` service calls; return microseconds per call."""
+    user = User.create(email="bench@example.com", name="Bench")
+    exporter = InMemoryExporter(max_spans=1_000)
+    tracer = Tracer(exporter, sample_rate=0.0 if case == "unsampled" else 1.0)
+    repository = InMemoryUserRepository(user)
+    service = UserService(repository)
+    if case != "off":
+        repository = tracer.instrument(repository, "UserRepository")
+        service = tracer.instrument(UserService(repository), "UserService")
+
+    with tracer.trace("GET api/users/<uuid:user_id>/"):
+        start = time.perf_counter()
+        for _ in range(calls):
+            await service.get_user(user.id)
+        elapsed = time.perf_counter() - start
+    return elapsed / calls * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"\n{args.calls} calls of UserService.get_user")
+    print(f"{'case':<12}{'us/call':>10}")
+    for case in ("off", "unsampled", "sampled"):
+        print(f"{case:<12}{asyncio.run(run_case(case, args.calls)):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Bulk export and import throughput of ``UserTransfer``.
+
+Seeds ``--users`` users into a scratch SQLite database, exports them to CSV
+and NDJSON files, then imports each file into the emptied table. Memory stays
+flat because only ``--batch-size`` rows are held at a time.
+
+Run with::
+
+    uv run python benchmarks/bench_transfer.py [--users 200000] [--batch-size 10000]
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import uuid4
+
+import django
+from django.conf import settings
+
+_db_dir = tempfile.TemporaryDirectory()
+
+settings.configure(
+    INSTALLED_APPS=["{{cookiecutter.project_slug}}"],
+    DATABASES={
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": str(Path(_db_dir.name) / "bench.db"),
+        }
+    },
+    USE_TZ=True,
+)
+django.setup()
+
+from django.core.management import call_command  # noqa: E402
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.models import UserModel  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_transfer import FORMATS, UserTransfer, header  # type: ignore # noqa: E402,E501
+
+
+def read_chunks(path: Path):
+    with open(path, "rb") as source:
+        while chunk := source.read(64 * 1024):
+            yield chunk
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    call_command("migrate", verbosity=0)
+    now = datetime.now(timezone.utc)
+    UserModel.objects.bulk_create(
+        (
+            UserModel(
+                id=uuid4(),
+                email=f"bench-{index}@example.com",
+                name=f"Bench {index}",
+                is_active=True,
+                created_at=now,
+                updated_at=now,
+            )
+            for index in range(args.users)
+        ),
+        batch_size=5_000,
+    )
+    transfer = UserTransfer(args.batch_size)
+    workdir = Path(_db_dir.name)
+
+    results = []
+    for fmt in FORMATS:
+        start = time.perf_counter()
+        with open(workdir / f"users.{fmt}", "wb") as output:
+            output.write(header(fmt))
+            for data, _, _ in transfer.export(fmt):
+                output.write(data)
+        results.append((f"export {fmt}", time.perf_counter() - start))
+
+    for fmt in FORMATS:
+        UserModel.objects.all().delete()
+        start = time.perf_counter()
+        imported = transfer.import_stream(fmt, read_chunks(workdir / f"users.{fmt}"))
+        results.append((f"import {fmt}", time.perf_counter() - start))
+        assert imported == args.users
+
+    print(f"\nTransferring {args.users:,} users in batches of {args.batch_size:,}")
+    print(f"{'case':<16}{'seconds':>10}{'rows/s':>12}{'rows/min':>14}")
+    for case, seconds in results:
+        rate = args.users / seconds
+        print(f"{case:<16}{seconds:>10.2f}{rate:>12,.0f}{rate * 60:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
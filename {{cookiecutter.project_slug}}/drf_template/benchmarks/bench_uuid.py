@@ -0,0 +1,108 @@
+"""
+Primary key locality of random (version 4) versus time-ordered (version 7) ids.
+
+Inserts ``--rows`` users with ``bulk_create``, with ids from ``uuid4`` or the
+entity's ``uuid7``, into scratch SQLite databases (ids stored as 16-byte
+BLOBs), then reports insert throughput and the size of the primary key index.
+Random ids land on random index pages: once the index outgrows the cache,
+every batch reads pages from all over it. Time-ordered ids append to the last
+page.
+
+Run with::
+
+    uv run python benchmarks/bench_uuid.py [--rows 10000000] [--batch-size 10000]
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import uuid4
+
+import django
+from django.conf import settings
+
+_db_dir = tempfile.TemporaryDirectory()
+
+settings.configure(
+    INSTALLED_APPS=["{{cookiecutter.project_slug}}"],
+    DATABASES={
+        alias: {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": str(Path(_db_dir.name) / f"{alias}.db"),
+        }
+        for alias in ("default", "uuid4", "uuid7")
+    },
+    USE_TZ=True,
+)
+django.setup()
+
+from django.core.management import call_command  # noqa: E402
+from django.db import connections  # noqa: E402
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.models import UserModel  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.domain.entities.ids import uuid7  # type: ignore # noqa: E402,E501
+
+GENERATORS = {"uuid4": uuid4, "uuid7": uuid7}
+
+# dbstat reports every page of the implicit index behind the primary key
+INDEX_SIZE = "SELECT sum(pgsize) FROM dbstat WHERE name = 'sqlite_autoindex_users_1'"
+
+
+def insert_users(alias: str, generate, rows: int, batch_size: int):
+    """Insert ``rows`` users with ids from ``generate`` into database ``alias``.
+
+    Returns the seconds spent inserting, the rows per second of the last batch
+    and the size of the primary key index in bytes.
+    """
+    call_command("migrate", database=alias, verbosity=0)
+    now = datetime.now(timezone.utc)
+    seconds = last_rate = 0.0
+    for start in range(0, rows, batch_size):
+        batch = [
+            UserModel(
+                id=generate(),
+                email=f"bench-{index}@example.com",
+                name="Bench",
+                is_active=True,
+                created_at=now,
+                updated_at=now,
+            )
+            for index in range(start, min(start + batch_size, rows))
+        ]
+        started = time.perf_counter()
+        UserModel.objects.using(alias).bulk_create(batch)
+        elapsed = time.perf_counter() - started
+        seconds += elapsed
+        last_rate = len(batch) / elapsed
+    with connections[alias].cursor() as cursor:
+        cursor.execute(INDEX_SIZE)
+        index_size = cursor.fetchone()[0]
+    return seconds, last_rate, index_size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    results = [
+        (name, *insert_users(name, generate, args.rows, args.batch_size))
+        for name, generate in GENERATORS.items()
+    ]
+
+    print(f"\nInserting {args.rows:,} users in batches of {args.batch_size:,}")
+    print(
+        f"{'ids':<8}{'seconds':>10}{'rows/s':>12}{'last batch/s':>14}{'index MB':>10}{'B/row':>7}"
+    )
+    for name, seconds, last_rate, index_size in results:
+        print(
+            f"{name:<8}{seconds:>10.1f}{args.rows / seconds:>12,.0f}{last_rate:>14,.0f}"
+            f"{index_size / 2**20:>10.1f}{index_size / args.rows:>7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Timing helpers shared by the {{cookiecutter.project_name}} benchmarks.
+"""
+
+import statistics
+import time
+from typing import Awaitable, Callable, Dict, List
+
+
+def measure(func: Callable[[], object], iterations: int, warmup: int = 50) -> Dict[str, float]:
+    """Call ``func`` repeatedly and return per-call latency statistics in microseconds."""
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+
+    return summarize(samples)
+
+
+async def measure_async(
+    func: Callable[[], Awaitable[object]], iterations: int, warmup: int = 50
+) -> Dict[str, float]:
+    """Await ``func()`` repeatedly on the running loop and return latency statistics."""
+    for _ in range(warmup):
+        await func()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+
+    return summarize(samples)
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Mean, median and p99 of latency samples in microseconds."""
+    samples = sorted(samples)
+    return {
+        "mean_us": statistics.fmean(samples),
+        "p50_us": samples[len(samples) // 2],
+        "p99_us": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+    }
+
+
+def report(title: str, results: Dict[str, Dict[str, float]]) -> None:
+    """Print a small comparison table."""
+    print(f"\n{title}")
+    print(f"{'case':<28}{'mean us':>12}{'p50 us':>12}{'p99 us':>12}")
+    for name, stats in results.items():
+        print(
+            f"{name:<28}{stats['mean_us']:>12.1f}{stats['p50_us']:>12.1f}{stats['p99_us']:>12.1f}"
+        )
@@ -0,0 +1,41 @@
+"""
+Gunicorn configuration for {{cookiecutter.project_name}}.
+
+Serves ``asgi.py`` (native async API views) with one uvicorn event loop
+(uvloop + httptools) per worker process, and ``WEB_CONCURRENCY`` workers
+(default: one per CPU). Prometheus samples from every worker are aggregated
+through ``PROMETHEUS_MULTIPROC_DIR``.
+"""
+import math
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+wsgi_app = "{{cookiecutter.project_slug}}.asgi:application"
+pythonpath = "src"
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn_worker.UvicornWorker"
+keepalive = 5
+# Workers drain on SIGTERM within SHUTDOWN_TIMEOUT; past this, in whole seconds, they are killed
+graceful_timeout = math.ceil(float(os.environ.get("SHUTDOWN_TIMEOUT", "25"))) + 5
+
+# Must be set before the workers import prometheus_client
+os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "{{cookiecutter.project_slug}}-metrics")
+)
+
+
+def on_starting(server):
+    """Start every run with an empty metrics directory."""
+    metrics_dir = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir)
+
+
+def child_exit(server, worker):
+    """Drop the live gauges of a worker that exited."""
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,3 @@
+"""
+Cache adapters for {{cookiecutter.project_name}}.
+"""
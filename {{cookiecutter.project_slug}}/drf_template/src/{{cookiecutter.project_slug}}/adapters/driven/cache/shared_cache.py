@@ -0,0 +1,308 @@
+"""
+Cross-process cache for {{cookiecutter.project_name}}.
+
+``SharedMemoryCache`` keeps its entries in a memory-mapped file, by default
+under ``/dev/shm``, so every worker process on a host reads and writes one
+table. A worker therefore warms the cache for all of them, and a write or
+delete in one worker is seen by the others on their next read: invalidation
+needs no messages between processes.
+
+The file is a set-associative hash table. A key hashes to one bucket of
+``ways`` fixed-size slots, and a full bucket evicts its least recently used
+slot, so every operation touches one bucket.
+
+Writers take a POSIX record lock on their bucket, so workers writing different
+buckets do not wait for each other. Readers take no lock. Each bucket carries
+a sequence number that writers make odd while they change it, and each slot a
+CRC of its contents. A reader retries when the sequence moved or the CRC does
+not match, and falls back to the lock if that keeps happening.
+
+Keys and values are stored as bytes; a codec such as ``UserCacheCodec``
+converts them. Entries larger than a slot are not cached. The table layout is
+part of the file name, so processes configured with a different size never
+share a file. Entries outlive restarts until they expire.
+"""
+import fcntl
+import hashlib
+import math
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+MAGIC = b"HXC2"
+HEADER = struct.Struct("<4sIII")
+HEADER_SIZE = 64
+SEQUENCE = struct.Struct("<Q")
+SLOT_HASH = struct.Struct("<Q")
+# expires_at, used_at, key length, value length, CRC of key + value
+META = struct.Struct("<ddHHI")
+USED_AT = struct.Struct("<d")
+USED_AT_OFFSET = 8
+
+# Lock-free read attempts before a reader takes the bucket lock
+READ_ATTEMPTS = 3
+# Readers refresh a slot's LRU time at most this often, to keep hits read-only
+LRU_RESOLUTION = 1.0
+
+# POSIX record locks do not exclude threads of the same process
+_thread_lock = threading.Lock()
+
+
+def default_path(name: str, scope: str = "") -> str:
+    """Where to keep the cache file of ``name``: on tmpfs if available.
+
+    ``scope`` (typically the database location) is hashed into the file name,
+    so services on one host that use different databases never share entries.
+    """
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    suffix = hashlib.blake2b(scope.encode(), digest_size=4).hexdigest()
+    return os.path.join(directory, f"{name}-{suffix}-cache")
+
+
+class _RawCodec:
+    """Keys and values that already are bytes."""
+
+    def key(self, key: Hashable) -> bytes:
+        return key
+
+    def dumps(self, value: Any) -> bytes:
+        return value
+
+    def loads(self, data: bytes) -> Any:
+        return data
+
+
+class SharedMemoryCache:
+    """Bounded mapping shared by every process that opens the same ``path``.
+
+    Entries expire ``ttl`` seconds after being set. ``hits`` and ``misses``
+    count this process's lookups only.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float,
+        max_entries: int = 10_000,
+        codec: Any = None,
+        ways: int = 8,
+        slot_size: int = 256,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Open the table at ``path``, creating it if needed."""
+        self.ttl = ttl
+        self.codec = codec or _RawCodec()
+        self.ways = ways
+        # Multiples of 8 keep every counter and timestamp 8-byte aligned
+        self.slot_size = -(-slot_size // 8) * 8
+        self.buckets = max(1, math.ceil(max_entries / ways))
+        self.max_entries = self.buckets * ways
+        self._clock = clock
+        self._hashes = struct.Struct(f"<{ways}Q")
+        self._hash_offset = SEQUENCE.size
+        self._meta_offset = self._hash_offset + self._hashes.size
+        self._data_offset = self._meta_offset + ways * META.size
+        self._bucket_size = self._data_offset + ways * self.slot_size
+        self.hits = 0
+        self.misses = 0
+
+        self.path = f"{path}.{self.buckets}x{ways}x{self.slot_size}"
+        size = HEADER_SIZE + self.buckets * self._bucket_size
+        header = HEADER.pack(MAGIC, self.buckets, ways, self.slot_size)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.lockf(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+            if os.pread(self._fd, HEADER.size, 0) != header:
+                # New or damaged file: start from an empty table. Written in
+                # place, since other processes may already have it mapped.
+                os.pwrite(self._fd, header + bytes(size - HEADER.size), 0)
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN)
+        self._map = mmap.mmap(self._fd, size)
+
+    def _bucket(self, raw_key: bytes) -> Tuple[int, int]:
+        digest = hashlib.blake2b(raw_key, digest_size=8).digest()
+        # Zero marks an empty slot, so stored hashes are always odd
+        key_hash = int.from_bytes(digest, "little") | 1
+        return key_hash, HEADER_SIZE + (key_hash >> 1) % self.buckets * self._bucket_size
+
+    def _lock(self, bucket: int) -> None:
+        _thread_lock.acquire()
+        try:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, bucket)
+        except BaseException:
+            _thread_lock.release()
+            raise
+        # Odd while the bucket changes; also repairs a writer that died mid-write
+        sequence = SEQUENCE.unpack_from(self._map, bucket)[0]
+        SEQUENCE.pack_into(self._map, bucket, (sequence + 1) | 1)
+
+    def _unlock(self, bucket: int) -> None:
+        try:
+            sequence = SEQUENCE.unpack_from(self._map, bucket)[0]
+            SEQUENCE.pack_into(self._map, bucket, sequence + 1)
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, bucket)
+        finally:
+            _thread_lock.release()
+
+    def _read(self, bucket: int, key_hash: int, raw_key: bytes, now: float) -> Optional[bytes]:
+        """Return the live value stored for ``raw_key``, or ``None``.
+
+        Raises ``ValueError`` when the slot changed while it was being read.
+        """
+        way = self._find(bucket, key_hash, raw_key)
+        if way < 0:
+            return None
+        meta = bucket + self._meta_offset + way * META.size
+        expires_at, used_at, key_len, value_len, crc = META.unpack_from(self._map, meta)
+        data = bucket + self._data_offset + way * self.slot_size
+        entry = self._map[data:data + key_len + value_len]
+        if zlib.crc32(entry) != crc or entry[:key_len] != raw_key:
+            raise ValueError("Slot changed while it was read")
+        if expires_at <= now:
+            return None
+        if now - used_at >= LRU_RESOLUTION:
+            USED_AT.pack_into(self._map, meta + USED_AT_OFFSET, now)
+        return entry[key_len:]
+
+    def _find(self, bucket: int, key_hash: int, raw_key: bytes) -> int:
+        """Return the slot holding ``raw_key`` in ``bucket``, or -1."""
+        hashes = self._hashes.unpack_from(self._map, bucket + self._hash_offset)
+        for way, slot_hash in enumerate(hashes):
+            if slot_hash != key_hash:
+                continue
+            meta = bucket + self._meta_offset + way * META.size
+            key_len = META.unpack_from(self._map, meta)[2]
+            data = bucket + self._data_offset + way * self.slot_size
+            if key_len == len(raw_key) and self._map[data:data + key_len] == raw_key:
+                return way
+        return -1
+
+    def _set_hash(self, bucket: int, way: int, key_hash: int) -> None:
+        offset = bucket + self._hash_offset + way * SLOT_HASH.size
+        SLOT_HASH.pack_into(self._map, offset, key_hash)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or ``default`` if absent or expired."""
+        raw_key = self.codec.key(key)
+        key_hash, bucket = self._bucket(raw_key)
+        now = self._clock()
+        for _ in range(READ_ATTEMPTS):
+            sequence = SEQUENCE.unpack_from(self._map, bucket)[0]
+            if sequence & 1:
+                continue
+            try:
+                value = self._read(bucket, key_hash, raw_key, now)
+            except ValueError:
+                continue
+            if SEQUENCE.unpack_from(self._map, bucket)[0] == sequence:
+                break
+        else:
+            self._lock(bucket)
+            try:
+                value = self._read(bucket, key_hash, raw_key, now)
+            except ValueError:
+                # Left half-written by a process that died; the next set replaces it
+                value = None
+            finally:
+                self._unlock(bucket)
+
+        if value is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return self.codec.loads(value)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the bucket's least recently used entry if full."""
+        raw_key = self.codec.key(key)
+        entry = raw_key + self.codec.dumps(value)
+        if len(entry) > self.slot_size:
+            # Too large to cache; make sure an older value is not served instead
+            self.delete(key)
+            return
+
+        key_hash, bucket = self._bucket(raw_key)
+        now = self._clock()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        self._lock(bucket)
+        try:
+            way = self._find(bucket, key_hash, raw_key)
+            if way < 0:
+                way = self._victim(bucket, now)
+            data = bucket + self._data_offset + way * self.slot_size
+            self._map[data:data + len(entry)] = entry
+            META.pack_into(
+                self._map,
+                bucket + self._meta_offset + way * META.size,
+                expires_at,
+                now,
+                len(raw_key),
+                len(entry) - len(raw_key),
+                zlib.crc32(entry),
+            )
+            self._set_hash(bucket, way, key_hash)
+        finally:
+            self._unlock(bucket)
+
+    def _victim(self, bucket: int, now: float) -> int:
+        """Pick the slot to overwrite: empty, else expired, else least recently used."""
+        lru_way, lru_used = 0, math.inf
+        hashes = self._hashes.unpack_from(self._map, bucket + self._hash_offset)
+        for way, slot_hash in enumerate(hashes):
+            if slot_hash == 0:
+                return way
+            expires_at, used_at = META.unpack_from(
+                self._map, bucket + self._meta_offset + way * META.size
+            )[:2]
+            if expires_at <= now:
+                return way
+            if used_at < lru_used:
+                lru_way, lru_used = way, used_at
+        return lru_way
+
+    def delete(self, key: Hashable) -> None:
+        """Drop a key if present, in every process."""
+        raw_key = self.codec.key(key)
+        key_hash, bucket = self._bucket(raw_key)
+        self._lock(bucket)
+        try:
+            way = self._find(bucket, key_hash, raw_key)
+            if way >= 0:
+                self._set_hash(bucket, way, 0)
+        finally:
+            self._unlock(bucket)
+
+    def clear(self) -> None:
+        """Drop every entry, in every process."""
+        empty = bytes(self._hashes.size)
+        for index in range(self.buckets):
+            bucket = HEADER_SIZE + index * self._bucket_size
+            self._lock(bucket)
+            try:
+                start = bucket + self._hash_offset
+                self._map[start:start + len(empty)] = empty
+            finally:
+                self._unlock(bucket)
+
+    def close(self) -> None:
+        """Unmap the table; the file and its entries stay for other processes."""
+        self._map.close()
+        os.close(self._fd)
+
+    def __len__(self) -> int:
+        """Number of occupied slots, including expired entries not yet reused."""
+        return sum(
+            slot_hash != 0
+            for index in range(self.buckets)
+            for slot_hash in self._hashes.unpack_from(
+                self._map, HEADER_SIZE + index * self._bucket_size + self._hash_offset
+            )
+        )
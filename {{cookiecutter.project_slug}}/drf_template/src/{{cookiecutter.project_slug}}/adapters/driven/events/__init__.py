@@ -0,0 +1,3 @@
+"""
+Event publishing adapters for {{cookiecutter.project_name}}.
+"""
@@ -0,0 +1,188 @@
+"""
+In-process event bus for {{cookiecutter.project_name}}.
+
+Subscribers are coroutines that receive a list of events, so a handler can act
+on a whole batch at once (one query or one job instead of one per event).
+Each subscription picks its delivery mode:
+
+* awaited: called during ``publish``, so the caller waits until it has run;
+* fire-and-forget (default): events go to a bounded queue and a dispatcher
+  delivers them in batches of up to ``batch_size``. ``publish`` only appends
+  to the queue, so it adds no I/O to the write path. When the queue is full,
+  new events are dropped and counted in ``dropped``. ``queued`` and ``lag()``
+  tell how far delivery is behind.
+
+Under an ASGI server the dispatcher runs on the application's event loop
+(``start``/``stop``); sync deployments run it on a loop in a background thread
+(``start_in_thread``/``stop_thread``).
+"""
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from {{cookiecutter.project_slug}}.domain.events.base import DomainEvent, EventPublisher  # type: ignore # noqa: E501
+
+logger = logging.getLogger(__name__)
+
+Subscriber = Callable[[List[DomainEvent]], Awaitable[None]]
+
+
+class InProcessEventBus(EventPublisher):
+    """Publish domain events to in-process subscribers."""
+
+    def __init__(self, max_queue_size: int = 10_000, batch_size: int = 100):
+        """Configure the bus; fire-and-forget delivery starts with ``start``."""
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.dropped = 0
+        self._subscribers: Dict[Type[DomainEvent], List[Tuple[Subscriber, bool]]] = (
+            defaultdict(list)
+        )
+        self._routes: Dict[Tuple[type, bool], List[Subscriber]] = {}
+        self._queue: Optional["asyncio.Queue[DomainEvent]"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._delivering_since: Optional[datetime] = None
+
+    def subscribe(
+        self, event_type: Type[DomainEvent], handler: Subscriber, *, awaited: bool = False
+    ) -> None:
+        """Deliver events of ``event_type`` (and its subclasses) to ``handler``."""
+        self._subscribers[event_type].append((handler, awaited))
+        self._routes.clear()
+
+    def _handlers(self, event: DomainEvent, awaited: bool) -> List[Subscriber]:
+        key = (type(event), awaited)
+        handlers = self._routes.get(key)
+        if handlers is None:
+            handlers = self._routes[key] = [
+                handler
+                for event_type in type(event).__mro__
+                for handler, is_awaited in self._subscribers.get(event_type, ())
+                if is_awaited is awaited
+            ]
+        return handlers
+
+    async def publish(self, events: Sequence[DomainEvent]) -> None:
+        """Deliver to awaited subscribers now and queue the rest."""
+        await self._deliver(events, awaited=True)
+        queued = [event for event in events if self._handlers(event, awaited=False)]
+        if not queued:
+            return
+        if self._loop is None:
+            logger.warning("Event bus is not running; dropping %d events", len(queued))
+            self.dropped += len(queued)
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._enqueue(queued)
+        else:
+            self._loop.call_soon_threadsafe(self._enqueue, queued)
+
+    @property
+    def queued(self) -> int:
+        """Events waiting for fire-and-forget delivery."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def lag(self) -> float:
+        """Seconds since the oldest undelivered event occurred; 0 when all are delivered."""
+        since = self._delivering_since
+        if since is None:
+            return 0.0
+        return (datetime.now(timezone.utc) - since).total_seconds()
+
+    def _enqueue(self, events: List[DomainEvent]) -> None:
+        for event in events:
+            try:
+                self._queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self.dropped += 1
+                logger.warning("Event queue full; dropped %s", type(event).__name__)
+
+    async def _deliver(self, events: Sequence[DomainEvent], awaited: bool) -> None:
+        """Call each subscriber once with the events it subscribed to, in order."""
+        batches: Dict[Subscriber, List[DomainEvent]] = {}
+        for event in events:
+            for handler in self._handlers(event, awaited):
+                batches.setdefault(handler, []).append(event)
+        if not batches:
+            return
+
+        results = await asyncio.gather(
+            *(handler(batch) for handler, batch in batches.items()), return_exceptions=True
+        )
+        for handler, result in zip(batches, results):
+            if isinstance(result, Exception):
+                if awaited:
+                    raise result
+                logger.error(
+                    "Event subscriber %s failed", getattr(handler, "__qualname__", handler),
+                    exc_info=result,
+                )
+
+    async def _dispatch(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            # Events are queued in order, so the batch's first is the oldest undelivered
+            self._delivering_since = batch[0].occurred_at
+            try:
+                await self._deliver(batch, awaited=False)
+            finally:
+                self._delivering_since = None
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def start(self) -> None:
+        """Start fire-and-forget delivery on the running event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(self.max_queue_size)
+        self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Deliver what is queued, waiting at most ``timeout`` seconds, then stop."""
+        if self._dispatcher is None:
+            return
+        try:
+            async with asyncio.timeout(timeout):
+                await self._queue.join()
+        except TimeoutError:
+            logger.warning("Stopping event bus with %d undelivered events", self._queue.qsize())
+        self._dispatcher.cancel()
+        await asyncio.gather(self._dispatcher, return_exceptions=True)
+        self._dispatcher = None
+        self._loop = None
+
+    def start_in_thread(self) -> None:
+        """Run fire-and-forget delivery on a loop in a daemon thread."""
+        started = threading.Event()
+        loop = asyncio.new_event_loop()
+
+        def run() -> None:
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start())
+            started.set()
+            loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="event-bus", daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop_thread(self, timeout: float = 5.0) -> None:
+        """Stop the background thread started by ``start_in_thread``."""
+        if self._thread is None:
+            return
+        loop = self._loop
+        asyncio.run_coroutine_threadsafe(self.stop(timeout), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+        self._thread = None
+        loop.close()
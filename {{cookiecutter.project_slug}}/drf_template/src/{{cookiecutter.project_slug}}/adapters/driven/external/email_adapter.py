@@ -1,7 +1,9 @@
 """
 Email adapter for {{cookiecutter.project_name}}.
 """
+import logging
 
+logger = logging.getLogger(__name__)
 
 
 class EmailAdapter:
@@ -11,13 +13,14 @@ class EmailAdapter:
         """Send welcome email to new user."""
         # TODO: Implement email sending logic
         # For now, just log the action
-        print(f"Sending welcome email to {name} ({email})")
+        logger.info("Sending welcome email", extra={"email": email, "user_name": name})
         return True
 
     async def send_password_reset_email(self, email: str, reset_token: str) -> bool:
         """Send password reset email."""
         # TODO: Implement password reset email logic
-        print(f"Sending password reset email to {email} with token {reset_token}")
+        # The token grants access to the account, so it is never logged
+        logger.info("Sending password reset email", extra={"email": email})
         return True
 
     async def send_notification_email(
@@ -25,5 +28,5 @@ class EmailAdapter:
     ) -> bool:
         """Send notification email."""
         # TODO: Implement notification email logic
-        print(f"Sending notification email to {email}: {subject}")
+        logger.info("Sending notification email", extra={"email": email, "subject": subject})
         return True
@@ -0,0 +1,154 @@
+"""
+Primary/replica database routing for {{cookiecutter.project_name}}.
+
+``PrimaryReplicaRouter`` sends ORM reads to the aliases in
+``DATABASE_REPLICAS``, round-robin, and everything else to ``default``:
+
+* read-your-writes: once a request has written, its later reads use
+  ``default``, so it never reads a replica that has not caught up with it.
+  ``PrimaryPinningMiddleware`` goes further: requests with a method other than
+  GET, HEAD or OPTIONS use ``default`` from the start, so the reads behind a
+  write (a uniqueness check, the row being updated) are never stale;
+* every ``DB_REPLICA_CHECK_INTERVAL`` seconds, on the next read, each replica
+  is checked. One that fails the check, or lags more than
+  ``DB_REPLICA_MAX_LAG_SECONDS`` seconds, gets no reads until it passes again;
+* migrations only run on ``default``; replicas receive its schema through
+  replication.
+
+With no replicas configured, every query goes to ``default``.
+"""
+import itertools
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, Optional, Sequence
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+PRIMARY = "default"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+{% if cookiecutter.db_type == "postgresql" %}
+# Seconds since the replica last replayed a transaction; 0 on a primary
+LAG_QUERY = """
+    SELECT CASE WHEN pg_is_in_recovery()
+        THEN COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+        ELSE 0 END
+"""
+{%- else %}
+# SQLite has no replication to measure; a replica is healthy when its schema reads
+LAG_QUERY = "SELECT count(*) * 0 FROM sqlite_master"
+{%- endif %}
+
+# Set for the rest of a request once it writes. Async views run their queries
+# in sync_to_async threads, which share the request's context.
+_wrote: ContextVar[bool] = ContextVar("wrote_to_primary", default=False)
+
+
+def measure_lag(alias: str) -> float:
+    """Return how many seconds the replica ``alias`` is behind the primary."""
+    with connections[alias].cursor() as cursor:
+        cursor.execute(LAG_QUERY)
+        return float(cursor.fetchone()[0])
+
+
+def pin_to_primary() -> None:
+    """Send the rest of the current request's reads to ``default``."""
+    _wrote.set(True)
+
+
+def start_request(method: str = "GET") -> None:
+    """Start a request on replicas, or on ``default`` if ``method`` may write.
+
+    Needed on every request, since a WSGI thread serves many in one context.
+    """
+    _wrote.set(method not in SAFE_METHODS)
+
+
+class PrimaryReplicaRouter:
+    """Send writes to ``default`` and reads to healthy replicas."""
+
+    def __init__(
+        self,
+        replicas: Optional[Sequence[str]] = None,
+        max_lag: Optional[float] = None,
+        check_interval: Optional[float] = None,
+        check: Callable[[str], float] = measure_lag,
+    ):
+        """Read the replica settings; arguments override them, e.g. in tests."""
+        if replicas is None:
+            replicas = getattr(settings, "DATABASE_REPLICAS", [])
+        self.replicas = list(replicas)
+        self.max_lag = (
+            getattr(settings, "DB_REPLICA_MAX_LAG_SECONDS", 5.0) if max_lag is None else max_lag
+        )
+        self.check_interval = (
+            getattr(settings, "DB_REPLICA_CHECK_INTERVAL", 5.0)
+            if check_interval is None
+            else check_interval
+        )
+        self.check = check
+        self.healthy: Dict[str, bool] = {alias: True for alias in self.replicas}
+        self._checked_at = -float("inf")
+        self._check_lock = threading.Lock()
+        self._turn = itertools.count()
+
+    def check_replicas(self) -> None:
+        """Measure every replica's health and lag once; log only changes."""
+        for alias in self.replicas:
+            try:
+                lag = self.check(alias)
+            except DatabaseError:
+                if self.healthy[alias]:
+                    logger.warning("Replica %s failed its health check", alias, exc_info=True)
+                self.healthy[alias] = False
+                continue
+            healthy = lag <= self.max_lag
+            if healthy != self.healthy[alias]:
+                logger.warning(
+                    "Replica %s is now %s (lag %.1fs)",
+                    alias,
+                    "healthy" if healthy else "lagging",
+                    lag,
+                )
+            self.healthy[alias] = healthy
+
+    def _refresh(self) -> None:
+        """Re-check the replicas when the last check is older than ``check_interval``."""
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return
+        # One thread checks; the others keep using the previous result
+        if not self._check_lock.acquire(blocking=False):
+            return
+        try:
+            self.check_replicas()
+            self._checked_at = time.monotonic()
+        finally:
+            self._check_lock.release()
+
+    def db_for_read(self, model, **hints) -> str:
+        """A healthy replica, or ``default`` after a write or when none is healthy."""
+        if not self.replicas or _wrote.get():
+            return PRIMARY
+        self._refresh()
+        healthy = [alias for alias in self.replicas if self.healthy[alias]]
+        if not healthy:
+            return PRIMARY
+        return healthy[next(self._turn) % len(healthy)]
+
+    def db_for_write(self, model, **hints) -> str:
+        """Always ``default``; later reads in this request follow it there."""
+        pin_to_primary()
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        """Replicas hold the same data as ``default``, so any relation is allowed."""
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> bool:
+        """Migrate ``default`` only."""
+        return db == PRIMARY
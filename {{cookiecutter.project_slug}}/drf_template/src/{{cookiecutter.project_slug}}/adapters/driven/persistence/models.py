@@ -0,0 +1,54 @@
+"""
+Django ORM models for {{cookiecutter.project_name}}.
+"""
+import uuid
+
+from django.db import models
+
+
+class CompactUUIDField(models.UUIDField):
+    """UUID in a native ``uuid`` column where there is one, else in 16 bytes.
+
+    Django stores UUIDs on SQLite as 32 hex characters; a BLOB is half that,
+    and compares bytewise, so time-ordered ids stay ordered in the index.
+    """
+
+    def get_internal_type(self):
+        # Keeps the SQLite backend from parsing column values as hex text
+        return "CompactUUIDField"
+
+    def db_type(self, connection):
+        if connection.vendor == "sqlite":
+            return "blob"
+        return connection.data_types["UUIDField"]
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if connection.vendor != "sqlite" or value is None:
+            return super().get_db_prep_value(value, connection, prepared)
+        return self.to_python(value).bytes
+
+    def from_db_value(self, value, expression, connection):
+        return self.to_python(value)
+
+    def to_python(self, value):
+        if isinstance(value, (bytes, memoryview)) and len(value) == 16:
+            return uuid.UUID(bytes=bytes(value))
+        return super().to_python(value)
+
+
+class UserModel(models.Model):
+    """Database row backing the ``User`` domain entity."""
+
+    id = CompactUUIDField(primary_key=True)
+    email = models.EmailField(unique=True)
+    name = models.CharField(max_length=255)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        app_label = "{{cookiecutter.project_slug}}"
+        db_table = "users"
+
+    def __str__(self):
+        return self.email
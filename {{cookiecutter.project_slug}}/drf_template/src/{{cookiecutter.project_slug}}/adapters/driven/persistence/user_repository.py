@@ -1,11 +1,21 @@
 """
 User repository implementation for {{cookiecutter.project_name}}.
 """
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
 from uuid import UUID
 
+from asgiref.sync import sync_to_async
+from django.db import connections, router, transaction
+from django.db.models import Count, Max
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.models import UserModel  # type: ignore
 from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore
 
+# SQLite binds each id separately, and older builds allow 999 parameters per
+# statement, so ids are updated in chunks there
+SET_ACTIVE_CHUNK_SIZE = 500
+
 
 class UserRepository:
     """User repository interface."""
@@ -26,40 +36,133 @@ class UserRepository:
         """Get all users."""
         raise NotImplementedError
 
+    async def get_page(self, offset: int, limit: int) -> List[User]:
+        """Get at most ``limit`` users, skipping the first ``offset``, in listing order."""
+        raise NotImplementedError
+
+    async def get_updated_at(self, user_id: UUID) -> Optional[datetime]:
+        """Get when a user last changed, without loading it; None if it does not exist."""
+        raise NotImplementedError
+
+    async def get_all_updated_at(self) -> Tuple[int, Optional[datetime]]:
+        """Count users and get the latest change among them, without loading them."""
+        raise NotImplementedError
+
     async def delete(self, user_id: UUID) -> bool:
         """Delete user by ID."""
         raise NotImplementedError
 
+    async def set_active(
+        self, user_ids: Sequence[UUID], is_active: bool, updated_at: datetime
+    ) -> List[UUID]:
+        """Set ``is_active`` on many users at once; return the ids that changed."""
+        raise NotImplementedError
+
 
 class DjangoUserRepository(UserRepository):
     """Django implementation of user repository."""
 
-    def __init__(self):
-        """Initialize repository."""
-        # TODO: Initialize Django models
+    @staticmethod
+    def _to_entity(row: UserModel) -> User:
+        """Map an ORM row to a domain entity."""
+        return User(
+            id=row.id,
+            email=row.email,
+            name=row.name,
+            is_active=row.is_active,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
 
     async def save(self, user: User) -> User:
         """Save user to Django database."""
-        # TODO: Implement Django save logic
-        # For now, just return the user
+        await UserModel.objects.aupdate_or_create(
+            id=user.id,
+            defaults={
+                "email": user.email,
+                "name": user.name,
+                "is_active": user.is_active,
+                "created_at": user.created_at,
+                "updated_at": user.updated_at,
+            },
+        )
         return user
 
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
         """Get user by ID from Django database."""
-        # TODO: Implement Django get by ID logic
-        return None
+        row = await UserModel.objects.filter(id=user_id).afirst()
+        return self._to_entity(row) if row else None
 
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email from Django database."""
-        # TODO: Implement Django get by email logic
-        return None
+        row = await UserModel.objects.filter(email=email).afirst()
+        return self._to_entity(row) if row else None
 
     async def get_all(self) -> List[User]:
         """Get all users from Django database."""
-        # TODO: Implement Django get all logic
-        return []
+        return [self._to_entity(row) async for row in UserModel.objects.order_by("created_at")]
+
+    async def get_page(self, offset: int, limit: int) -> List[User]:
+        """Get one page of users with ``LIMIT``/``OFFSET``, in the order of ``get_all``."""
+        # Ids break ties, so rows created in the same instant keep their page
+        rows = UserModel.objects.order_by("created_at", "id")[offset:offset + limit]
+        return [self._to_entity(row) async for row in rows]
+
+    async def get_updated_at(self, user_id: UUID) -> Optional[datetime]:
+        """Get when a user last changed, reading only that column."""
+        updated_at = UserModel.objects.filter(id=user_id).values_list("updated_at", flat=True)
+        return await updated_at.afirst()
+
+    async def get_all_updated_at(self) -> Tuple[int, Optional[datetime]]:
+        """Count users and get the latest ``updated_at`` in one aggregate query."""
+        result = await UserModel.objects.aaggregate(count=Count("id"), updated_at=Max("updated_at"))
+        return result["count"], result["updated_at"]
 
     async def delete(self, user_id: UUID) -> bool:
         """Delete user by ID from Django database."""
-        # TODO: Implement Django delete logic
-        return False
+        deleted, _ = await UserModel.objects.filter(id=user_id).adelete()
+        return deleted > 0
+
+    async def set_active(
+        self, user_ids: Sequence[UUID], is_active: bool, updated_at: datetime
+    ) -> List[UUID]:
+        """Set ``is_active`` with one set-based ``UPDATE``; return the ids that changed.
+
+        Users already in the requested state, and unknown ids, are left out.
+        """
+        if not user_ids:
+            return []
+        return await sync_to_async(self._set_active)(user_ids, is_active, updated_at)
+
+    @staticmethod
+    def _set_active(
+        user_ids: Sequence[UUID], is_active: bool, updated_at: datetime
+    ) -> List[UUID]:
+        # The ORM cannot return the rows an UPDATE changed, so this is raw SQL;
+        # the fields still convert values to the backend's column formats
+        alias = router.db_for_write(UserModel)
+        connection = connections[alias]
+        meta = UserModel._meta
+        ids = [meta.pk.get_db_prep_value(user_id, connection) for user_id in user_ids]
+        updated_at = meta.get_field("updated_at").get_db_prep_value(updated_at, connection)
+
+        if connection.vendor == "postgresql":
+            # One statement for any number of ids, sent as a single array parameter
+            batches = [("= ANY(%s)", [ids])]
+        else:
+            batches = []
+            for start in range(0, len(ids), SET_ACTIVE_CHUNK_SIZE):
+                chunk = ids[start:start + SET_ACTIVE_CHUNK_SIZE]
+                batches.append((f"IN ({', '.join(['%s'] * len(chunk))})", chunk))
+
+        table = connection.ops.quote_name(meta.db_table)
+        changed = []
+        with transaction.atomic(using=alias), connection.cursor() as cursor:
+            for id_condition, id_params in batches:
+                cursor.execute(
+                    f"UPDATE {table} SET is_active = %s, updated_at = %s "
+                    f"WHERE id {id_condition} AND is_active <> %s RETURNING id",
+                    [is_active, updated_at, *id_params, is_active],
+                )
+                changed += [meta.pk.to_python(row[0]) for row in cursor.fetchall()]
+        return changed
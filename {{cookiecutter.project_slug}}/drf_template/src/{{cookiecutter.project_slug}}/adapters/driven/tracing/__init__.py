@@ -0,0 +1,3 @@
+"""
+Tracing adapters for {{cookiecutter.project_name}}.
+"""
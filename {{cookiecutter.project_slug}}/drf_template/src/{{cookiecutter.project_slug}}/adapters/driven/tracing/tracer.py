@@ -0,0 +1,187 @@
+"""
+Request tracing for {{cookiecutter.project_name}}.
+
+A trace is the tree of spans for one request: the route, the service calls it
+makes and the repository calls those make. The current span lives in a
+``ContextVar``, so it follows the request across awaits and into tasks and
+threads the request starts.
+
+Sampling is decided once, when the request starts (head-based): a sampled
+request records every span below it, an unsampled one records none. Incoming
+W3C ``traceparent`` headers keep the caller's trace id and decision.
+With a sample rate of 0 the container does not wrap anything, so tracing then
+costs nothing.
+"""
+import functools
+import inspect
+import logging
+import random
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# version-trace_id-parent_id-flags, e.g. 00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01
+TRACEPARENT = re.compile(r"00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})")
+
+
+@dataclass
+class Span:
+    """One timed operation within a trace."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_ns: int = 0
+    end_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    # "server" for the root span of a request, "internal" below it
+    kind: str = "internal"
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+            "kind": self.kind,
+        }
+
+
+# Span of the code running now; None outside a sampled request
+current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+class Tracer:
+    """Create spans and hand finished ones to ``exporter``."""
+
+    def __init__(self, exporter, sample_rate: float = 0.0):
+        """Sample ``sample_rate`` of requests (0 to 1) and export their spans."""
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0
+
+    def _finish(self, span: Span, token) -> None:
+        span.end_ns = time.time_ns()
+        current_span.reset(token)
+        try:
+            self.exporter.export([span])
+        except Exception:
+            logger.exception("Could not export span %s", span.name)
+
+    @contextmanager
+    def trace(self, name: str, traceparent: str = "", **attributes) -> Iterator[Optional[Span]]:
+        """Start a trace for a request; yields its root span, or None if not sampled."""
+        match = TRACEPARENT.fullmatch(traceparent)
+        if match:
+            trace_id, parent_id, flags = match.groups()
+            sampled = int(flags, 16) & 1
+        else:
+            trace_id, parent_id = _new_id(128), None
+            sampled = random.random() < self.sample_rate
+        if not sampled:
+            yield None
+            return
+        span = Span(
+            name,
+            trace_id,
+            _new_id(64),
+            parent_id,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+            kind="server",
+        )
+        token = current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.error = repr(exc)
+            raise
+        finally:
+            self._finish(span, token)
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Optional[Span]]:
+        """Time a block as a child of the current span; a no-op outside a sampled trace."""
+        parent = current_span.get()
+        if parent is None:
+            yield None
+            return
+        span = Span(
+            name,
+            parent.trace_id,
+            _new_id(64),
+            parent.span_id,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+        )
+        token = current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.error = repr(exc)
+            raise
+        finally:
+            self._finish(span, token)
+
+    def traced(self, name: str) -> Callable[[Callable], Callable]:
+        """Decorator running a coroutine function inside a span called ``name``."""
+
+        def decorate(func: Callable) -> Callable:
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                # Unsampled requests skip the context manager entirely
+                if current_span.get() is None:
+                    return await func(*args, **kwargs)
+                with self.span(name):
+                    return await func(*args, **kwargs)
+
+            return wrapper
+
+        return decorate
+
+    def instrument(self, target: Any, prefix: str) -> Any:
+        """Wrap ``target`` so each public coroutine method runs in a ``prefix.method`` span."""
+        return Instrumented(target, self, prefix)
+
+    def shutdown(self) -> None:
+        """Export spans still buffered by the exporter."""
+        self.exporter.shutdown()
+
+
+class Instrumented:
+    """Proxy for an object whose public coroutine methods are traced.
+
+    Other attributes are read from the wrapped object, so the proxy stands in
+    for it wherever it is used.
+    """
+
+    def __init__(self, target: Any, tracer: Tracer, prefix: str):
+        self._target = target
+        for name, method in inspect.getmembers(target, inspect.iscoroutinefunction):
+            if not name.startswith("_"):
+                setattr(self, name, tracer.traced(f"{prefix}.{name}")(method))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target, name)
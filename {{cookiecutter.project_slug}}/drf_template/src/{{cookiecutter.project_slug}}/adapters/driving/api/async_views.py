@@ -0,0 +1,101 @@
+"""
+Async-capable DRF views for {{cookiecutter.project_name}}.
+
+DRF's ``APIView`` only dispatches synchronously, so calling the async
+``UserService`` from it costs an ``async_to_sync`` bridge (a thread hop and an
+event loop) per call. ``AsyncAPIView`` dispatches on the event loop instead and
+awaits coroutine handlers directly when served through ``asgi.py``.
+
+``sync_facade`` turns such a view into a plain ``APIView`` for WSGI
+deployments, paying the bridge exactly once per request.
+"""
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import AsyncIterator, Iterator, TypeVar
+
+from asgiref.sync import async_to_sync, sync_to_async
+from rest_framework.views import APIView
+
+T = TypeVar("T")
+_DONE = object()
+
+
+async def iterate_in_thread(iterator: Iterator[T]) -> AsyncIterator[T]:
+    """Step a blocking iterator (e.g. one running queries) in a worker thread.
+
+    Lets ASGI stream it item by item; Django would otherwise collect every
+    item of a synchronous iterator before sending the first.
+    """
+    step = sync_to_async(next)
+    while (item := await step(iterator, _DONE)) is not _DONE:
+        yield item
+
+
+class AsyncAPIView(APIView):
+    """``APIView`` whose handlers are coroutines awaited on the event loop.
+
+    Authentication, permissions and throttling run inline when every
+    authenticator is marked ``stateless`` (no database access), and in a worker
+    thread otherwise, since session lookups cannot run on the event loop.
+    """
+
+    view_is_async = True
+
+    def _initial_is_stateless(self, request) -> bool:
+        return all(getattr(auth, "stateless", False) for auth in request.authenticators)
+
+    async def dispatch(self, request, *args, **kwargs):
+        """Async counterpart of ``APIView.dispatch``."""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            if self._initial_is_stateless(request):
+                self.initial(request, *args, **kwargs)
+            else:
+                await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if iscoroutinefunction(handler):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def options(self, request, *args, **kwargs):
+        """Async ``OPTIONS`` handler; Django requires all handlers to share a mode."""
+        return super().options(request, *args, **kwargs)
+
+
+def _bridge(handler):
+    @wraps(handler)
+    def sync_handler(self, request, *args, **kwargs):
+        return async_to_sync(handler)(self, request, *args, **kwargs)
+
+    return sync_handler
+
+
+def sync_facade(view_class):
+    """Build a synchronous ``APIView`` from an ``AsyncAPIView`` subclass."""
+    attrs = {
+        "__module__": view_class.__module__,
+        "__doc__": view_class.__doc__,
+        "view_is_async": False,
+        "dispatch": APIView.dispatch,
+        "options": APIView.options,
+    }
+    for method in view_class.http_method_names:
+        handler = getattr(view_class, method, None)
+        if method != "options" and iscoroutinefunction(handler):
+            attrs[method] = _bridge(handler)
+    return type(view_class.__name__, (view_class,), attrs)
@@ -0,0 +1,58 @@
+"""
+Conditional GET for {{cookiecutter.project_name}}.
+
+User responses carry an ``ETag`` and a ``Last-Modified`` header derived from
+``updated_at``: one user's, or for a list the number of users and the latest
+change among them. A client sending those back in ``If-None-Match`` or
+``If-Modified-Since`` gets ``304 Not Modified`` while nothing has changed.
+Views check preconditions against timestamps read on their own, so an
+unchanged user is neither loaded nor serialized.
+
+Django's ``condition`` decorator calls its functions synchronously, which
+async views cannot do with database queries, so views use the same
+``get_conditional_response`` it is built on.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# ``ETag`` and ``Last-Modified`` as a Unix timestamp, if known
+Validators = Tuple[str, Optional[int]]
+
+
+def validators(updated_at: Optional[datetime], count: Optional[int] = None) -> Validators:
+    """Validators for one user, or for a list of ``count`` users."""
+    if updated_at is None:
+        return quote_etag("0" if count is None else f"{count:x}-0"), None
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    micros = (updated_at - _EPOCH) // _MICROSECOND
+    tag = f"{micros:x}" if count is None else f"{count:x}-{micros:x}"
+    return quote_etag(tag), micros // 1_000_000
+
+
+def is_conditional(request) -> bool:
+    """Whether the request has a precondition that could make it a 304."""
+    return "HTTP_IF_NONE_MATCH" in request.META or "HTTP_IF_MODIFIED_SINCE" in request.META
+
+
+def set_validators(response: HttpResponseBase, validator_values: Validators) -> HttpResponseBase:
+    """Add ``ETag`` and ``Last-Modified`` headers to ``response``."""
+    etag, last_modified = validator_values
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+def not_modified(request, validator_values: Validators) -> Optional[HttpResponseBase]:
+    """A 304 response, with the validators, when the client's copy is current; else None."""
+    etag, last_modified = validator_values
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    return set_validators(response, validator_values) if response is not None else None
@@ -0,0 +1,103 @@
+"""
+API serializers for {{cookiecutter.project_name}}.
+
+Output goes through ``EntitySerializer``, which reads attributes straight off
+domain entities. DRF ``Serializer`` classes are only used where input has to be
+validated.
+"""
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Tuple
+from uuid import UUID
+
+from rest_framework import serializers
+
+
+def _no_fields(obj: Any) -> Tuple[()]:
+    return ()
+
+
+class EntitySerializer:
+    """Output-only serializer for domain entities.
+
+    Unlike ``ModelSerializer`` there is no field introspection and no per-field
+    ``to_representation`` call: a row is a single ``attrgetter`` call. Values are
+    left as UUID/datetime objects for ``ORJSONRenderer`` to encode natively.
+    """
+
+    fields: Tuple[str, ...] = ()
+    # The values of ``fields`` for one entity, in order
+    _getter = staticmethod(_no_fields)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if len(cls.fields) == 1:
+            getter = attrgetter(cls.fields[0])
+            cls._getter = staticmethod(lambda obj: (getter(obj),))
+        elif cls.fields:
+            cls._getter = staticmethod(attrgetter(*cls.fields))
+        else:
+            cls._getter = staticmethod(_no_fields)
+
+    def __init__(self, instance: Any = None, many: bool = False):
+        """Wrap a single entity or, with ``many=True``, an iterable of entities."""
+        self.instance = instance
+        self.many = many
+
+    def to_representation(self, instance: Any) -> Dict[str, Any]:
+        """Convert one entity into a dict of primitives."""
+        return dict(zip(self.fields, self._getter(instance)))
+
+    def to_representation_many(self, instances: Iterable[Any]) -> List[Dict[str, Any]]:
+        """Convert many entities into a list of dicts."""
+        fields = self.fields
+        getter = self._getter
+        return [dict(zip(fields, getter(instance))) for instance in instances]
+
+    @property
+    def data(self):
+        """Serialized output, mirroring ``Serializer.data``."""
+        if self.many:
+            return self.to_representation_many(self.instance)
+        return self.to_representation(self.instance)
+
+
+class UserSerializer(EntitySerializer):
+    """Serialize ``User`` domain entities."""
+
+    fields = ("id", "email", "name", "is_active", "created_at", "updated_at")
+
+
+class CreateUserSerializer(serializers.Serializer):
+    """Validate input for creating a user."""
+
+    email = serializers.EmailField()
+    name = serializers.CharField(max_length=255)
+
+
+class UpdateUserNameSerializer(serializers.Serializer):
+    """Validate input for renaming a user."""
+
+    name = serializers.CharField(max_length=255)
+
+
+class BinaryUUIDField(serializers.UUIDField):
+    """``UUIDField`` also accepting the 16 raw bytes MessagePack bodies carry ids as."""
+
+    def to_internal_value(self, data):
+        if isinstance(data, bytes) and len(data) == 16:
+            return UUID(bytes=data)
+        return super().to_internal_value(data)
+
+
+class UserIdsSerializer(serializers.Serializer):
+    """Validate the users a batch operation applies to."""
+
+    ids = serializers.ListField(
+        child=BinaryUUIDField(), allow_empty=False, max_length=100_000
+    )
+
+
+class UserExportSerializer(serializers.Serializer):
+    """Validate where a bulk export starts."""
+
+    after = serializers.UUIDField(required=False)
@@ -0,0 +1,12 @@
+"""
+Synchronous user API views for WSGI deployments of {{cookiecutter.project_name}}.
+"""
+from {{cookiecutter.project_slug}}.adapters.driving.api import views  # type: ignore
+from {{cookiecutter.project_slug}}.adapters.driving.api.async_views import sync_facade  # type: ignore # noqa: E501
+
+UserListView = sync_facade(views.UserListView)
+UserDetailView = sync_facade(views.UserDetailView)
+UserActivationView = sync_facade(views.UserActivationView)
+UserBatchActivationView = sync_facade(views.UserBatchActivationView)
+UserExportView = sync_facade(views.UserExportView)
+UserImportView = sync_facade(views.UserImportView)
@@ -1,9 +1,37 @@
 """
 API URL configuration for {{cookiecutter.project_name}}.
 """
+from django.conf import settings
+from django.urls import path
 
+from {{cookiecutter.project_slug}}.adapters.driving.api import sync_views, views  # type: ignore
+
+# asgi.py turns on API_ASYNC_VIEWS; WSGI deployments get the sync facade
+api_views = views if settings.API_ASYNC_VIEWS else sync_views
 
 urlpatterns = [
-    # Add your API endpoints here
-    # path('users/', include('{{cookiecutter.project_slug}}.adapters.driving.api.user_urls')),
+    path("users/", api_views.UserListView.as_view(), name="user-list"),
+    path("users/<uuid:user_id>/", api_views.UserDetailView.as_view(), name="user-detail"),
+    path(
+        "users/<uuid:user_id>/activate/",
+        api_views.UserActivationView.as_view(active=True),
+        name="user-activate",
+    ),
+    path(
+        "users/<uuid:user_id>/deactivate/",
+        api_views.UserActivationView.as_view(active=False),
+        name="user-deactivate",
+    ),
+    path(
+        "users/batch/activate/",
+        api_views.UserBatchActivationView.as_view(active=True),
+        name="user-batch-activate",
+    ),
+    path(
+        "users/batch/deactivate/",
+        api_views.UserBatchActivationView.as_view(active=False),
+        name="user-batch-deactivate",
+    ),
+    path("users/export/", api_views.UserExportView.as_view(), name="user-export"),
+    path("users/import/", api_views.UserImportView.as_view(), name="user-import"),
 ]
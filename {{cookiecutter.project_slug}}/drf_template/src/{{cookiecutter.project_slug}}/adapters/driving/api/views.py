@@ -0,0 +1,187 @@
+"""
+User API views for {{cookiecutter.project_name}}.
+
+These are native async views: under ASGI they await ``UserService`` on the
+event loop. ``sync_views`` exposes the same views for WSGI deployments.
+"""
+from uuid import UUID
+
+from asgiref.sync import sync_to_async
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.exceptions import NotFound, ParseError, UnsupportedMediaType, ValidationError
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_transfer import MEDIA_TYPES, header  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.api.async_views import AsyncAPIView, iterate_in_thread  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.api.conditional import is_conditional, not_modified, set_validators, validators  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.api.renderers import CSVRenderer, NDJSONRenderer  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.api.serializers import (  # type: ignore
+    CreateUserSerializer,
+    UpdateUserNameSerializer,
+    UserExportSerializer,
+    UserIdsSerializer,
+    UserSerializer,
+)
+from {{cookiecutter.project_slug}}.dependencies.container import get_container  # type: ignore # noqa: E501
+
+# Request bodies of bulk imports are read this many bytes at a time
+IMPORT_READ_SIZE = 64 * 1024
+
+
+class UserAPIView(AsyncAPIView):
+    """Base view with access to the user service."""
+
+    @property
+    def user_service(self):
+        return get_container().get_user_service()
+
+
+class UserListView(UserAPIView):
+    """List and create users; listings answer 304 when the client's copy is current."""
+
+    pagination_class = api_settings.DEFAULT_PAGINATION_CLASS
+
+    async def get(self, request):
+        # Validators cover the whole listing, from one aggregate query
+        count, updated_at = await self.user_service.get_all_users_updated_at()
+        current = validators(updated_at, count)
+        if is_conditional(request):
+            unchanged = not_modified(request, current)
+            if unchanged is not None:
+                return unchanged
+
+        # The paginator only needs the count to pick the page, so it paginates
+        # positions; the database then loads just the rows at those positions
+        paginator = self.pagination_class() if self.pagination_class else None
+        positions = paginator.paginate_queryset(range(count), request, view=self) if paginator else None
+        if positions is None:
+            users = await self.user_service.get_all_users()
+            return set_validators(Response(UserSerializer(users, many=True).data), current)
+
+        users = await self.user_service.get_users_page(positions[0], len(positions)) if positions else []
+        response = paginator.get_paginated_response(UserSerializer(users, many=True).data)
+        return set_validators(response, current)
+
+    async def post(self, request):
+        serializer = CreateUserSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            user = await self.user_service.create_user(**serializer.validated_data)
+        except ValueError as exc:
+            raise ValidationError({"email": [str(exc)]}) from exc
+        return Response(UserSerializer(user).data, status=status.HTTP_201_CREATED)
+
+
+class UserDetailView(UserAPIView):
+    """Retrieve and rename a user; retrieval answers 304 when the client's copy is current."""
+
+    async def get(self, request, user_id: UUID):
+        if is_conditional(request):
+            updated_at = await self.user_service.get_user_updated_at(user_id)
+            if updated_at is None:
+                raise NotFound()
+            unchanged = not_modified(request, validators(updated_at))
+            if unchanged is not None:
+                return unchanged
+
+        user = await self.user_service.get_user(user_id)
+        if user is None:
+            raise NotFound()
+        return set_validators(Response(UserSerializer(user).data), validators(user.updated_at))
+
+    async def patch(self, request, user_id: UUID):
+        serializer = UpdateUserNameSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        user = await self.user_service.update_user_name(
+            user_id, serializer.validated_data["name"]
+        )
+        if user is None:
+            raise NotFound()
+        return Response(UserSerializer(user).data)
+
+
+class UserActivationView(UserAPIView):
+    """Activate or deactivate a user."""
+
+    active = True
+
+    async def post(self, request, user_id: UUID):
+        if self.active:
+            user = await self.user_service.activate_user(user_id)
+        else:
+            user = await self.user_service.deactivate_user(user_id)
+        if user is None:
+            raise NotFound()
+        return Response(UserSerializer(user).data)
+
+
+class UserBatchActivationView(UserAPIView):
+    """Activate or deactivate many users in one statement."""
+
+    active = True
+
+    async def post(self, request):
+        serializer = UserIdsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data["ids"]
+        if self.active:
+            changed = await self.user_service.activate_users(ids)
+        else:
+            changed = await self.user_service.deactivate_users(ids)
+        return Response({"ids": changed, "count": len(changed)})
+
+
+class UserExportView(UserAPIView):
+    """Stream every user, or those with ids above ``after``, as CSV or NDJSON.
+
+    The format is negotiated: ``?format=ndjson`` or an ``Accept`` header; CSV
+    by default.
+    """
+
+    renderer_classes = [CSVRenderer, NDJSONRenderer]
+
+    async def get(self, request):
+        serializer = UserExportSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        after = serializer.validated_data.get("after")
+        fmt = request.accepted_renderer.format
+        transfer = get_container().get_user_transfer()
+
+        def content():
+            # A resumed export continues a file that already has its header
+            if after is None:
+                yield header(fmt)
+            for data, _, _ in transfer.export(fmt, after):
+                yield data
+
+        response = StreamingHttpResponse(
+            iterate_in_thread(content()) if self.view_is_async else content(),
+            content_type=MEDIA_TYPES[fmt],
+        )
+        response["Content-Disposition"] = f'attachment; filename="users.{fmt}"'
+        return response
+
+
+class UserImportView(UserAPIView):
+    """Insert or update users from a CSV or NDJSON body, read and written in batches.
+
+    Batches before an invalid record stay imported; importing them again is harmless.
+    """
+
+    formats = {media_type: fmt for fmt, media_type in MEDIA_TYPES.items()}
+
+    async def post(self, request):
+        # The body is streamed to the importer rather than parsed into request.data
+        fmt = self.formats.get(request.content_type.split(";")[0].strip())
+        if fmt is None:
+            raise UnsupportedMediaType(request.content_type)
+        stream = request.stream
+        chunks = iter(lambda: stream.read(IMPORT_READ_SIZE), b"") if stream else iter(())
+        transfer = get_container().get_user_transfer()
+        try:
+            imported = await sync_to_async(transfer.import_stream)(fmt, chunks)
+        except ValueError as exc:
+            raise ParseError(str(exc)) from exc
+        return Response({"imported": imported})
@@ -0,0 +1,3 @@
+"""
+Domain event subscribers for {{cookiecutter.project_name}}.
+"""
@@ -0,0 +1,28 @@
+"""
+Domain event subscribers of {{cookiecutter.project_name}}.
+
+Register subscribers here; the container calls ``register_subscribers`` once at
+startup. Fire-and-forget subscribers run on the event bus thread after the
+request that raised the events has returned, so slow side effects such as
+email stay off the write path.
+"""
+import asyncio
+from typing import List
+
+from {{cookiecutter.project_slug}}.adapters.driven.events.event_bus import InProcessEventBus  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.domain.events.user_events import UserCreated  # type: ignore # noqa: E501
+
+
+def register_subscribers(bus: InProcessEventBus, container) -> None:
+    """Subscribe every event handler to the bus."""
+
+    async def send_welcome_emails(events: List[UserCreated]) -> None:
+        """Send the welcome email to each new user."""
+        await asyncio.gather(
+            *(
+                container.email_adapter.send_welcome_email(event.email, event.name)
+                for event in events
+            )
+        )
+
+    bus.subscribe(UserCreated, send_welcome_emails)
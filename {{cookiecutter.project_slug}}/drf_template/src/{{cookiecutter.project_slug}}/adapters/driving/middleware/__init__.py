@@ -0,0 +1,3 @@
+"""
+HTTP middleware for {{cookiecutter.project_name}}.
+"""
@@ -0,0 +1,198 @@
+"""
+Admission control for {{cookiecutter.project_name}}.
+
+``AdmissionControlMiddleware`` caps the requests a worker handles at once.
+Requests over the cap wait in a short queue for a slot. When the queue is full,
+or a request has waited ``ADMISSION_QUEUE_TIMEOUT`` seconds, the request is shed
+at once with ``503 Service Unavailable`` and a ``Retry-After`` header. A request
+that cannot be served soon fails fast instead of piling onto an overloaded
+worker.
+
+``AdaptiveLimiter`` sets the cap from observed latency, gradient style. Paths in
+``ADMISSION_EXEMPT_PATHS`` bypass it, so health checks and metrics keep
+answering while the service sheds load. A slot is held until the view returns;
+a streamed body is sent after its slot is freed.
+"""
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from typing import Deque
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import JsonResponse
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that follows request latency.
+
+    A slow moving average of latency is the baseline and a fast one the current
+    state. While the current latency stays within ``tolerance`` times the
+    baseline, each sample grows the limit by about its square root. Beyond
+    that, the limit shrinks in proportion, by at most half. The limit only
+    changes while at least half of it is in use, so an idle worker neither
+    inflates it nor shrinks it over one slow request.
+
+    Not thread-safe; the middleware serializes access.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 50,
+        min_limit: int = 4,
+        max_limit: int = 500,
+        tolerance: float = 1.5,
+        smoothing: float = 0.2,
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.in_flight = 0
+        self._short = 0.0
+        self._long = 0.0
+
+    @property
+    def available(self) -> bool:
+        """Whether another request may start."""
+        return self.in_flight < int(self.limit)
+
+    def record(self, latency: float) -> None:
+        """Adapt the limit to the latency of one request, in seconds."""
+        if not self._long:
+            self._short = self._long = latency
+            return
+        self._short += (latency - self._short) * 0.1
+        self._long += (latency - self._long) / 600
+        if self._long > 2 * self._short:
+            # Latency dropped for good: let the baseline catch up faster
+            self._long *= 0.95
+        if self.in_flight < self.limit / 2:
+            return
+        gradient = max(0.5, min(1.0, self.tolerance * self._long / self._short))
+        target = self.limit * gradient + math.sqrt(self.limit)
+        limit = self.limit + (target - self.limit) * self.smoothing
+        self.limit = max(float(self.min_limit), min(float(self.max_limit), limit))
+
+
+class AdmissionControlMiddleware:
+    """Shed load past an adaptive limit; unused with ``ADMISSION_CONTROL`` off.
+
+    Under WSGI, request threads wait on a condition; under ASGI, requests wait
+    in order on the event loop, where all of this middleware runs.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.ADMISSION_CONTROL:
+            raise MiddlewareNotUsed
+        self.limiter = AdaptiveLimiter(
+            settings.ADMISSION_INITIAL_LIMIT,
+            settings.ADMISSION_MIN_LIMIT,
+            settings.ADMISSION_MAX_LIMIT,
+            tolerance=settings.ADMISSION_LATENCY_TOLERANCE,
+        )
+        self.queue_size = settings.ADMISSION_QUEUE_SIZE
+        self.queue_timeout = settings.ADMISSION_QUEUE_TIMEOUT
+        self.retry_after = settings.ADMISSION_RETRY_AFTER
+        self.exempt_paths = frozenset(settings.ADMISSION_EXEMPT_PATHS)
+        self._condition = threading.Condition()
+        self._queued = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if request.path in self.exempt_paths:
+            return self.get_response(request)
+        if not self.admit():
+            return self.overloaded()
+        start = time.perf_counter()
+        try:
+            return self.get_response(request)
+        finally:
+            with self._condition:
+                self.limiter.record(time.perf_counter() - start)
+                self.limiter.in_flight -= 1
+                self._condition.notify()
+
+    async def __acall__(self, request):
+        if request.path in self.exempt_paths:
+            return await self.get_response(request)
+        if not await self.aadmit():
+            return self.overloaded()
+        start = time.perf_counter()
+        try:
+            return await self.get_response(request)
+        finally:
+            self.limiter.record(time.perf_counter() - start)
+            self.arelease()
+
+    def overloaded(self) -> JsonResponse:
+        response = JsonResponse({"detail": "Service overloaded, retry later"}, status=503)
+        response["Retry-After"] = str(self.retry_after)
+        return response
+
+    def admit(self) -> bool:
+        """Take a slot, waiting for one if needed; False if the request is shed."""
+        with self._condition:
+            if not self.limiter.available:
+                if self._queued >= self.queue_size:
+                    return False
+                self._queued += 1
+                try:
+                    if not self._condition.wait_for(
+                        lambda: self.limiter.available, self.queue_timeout
+                    ):
+                        return False
+                finally:
+                    self._queued -= 1
+            self.limiter.in_flight += 1
+            return True
+
+    async def aadmit(self) -> bool:
+        """Take a slot, waiting in the queue if needed; False if the request is shed."""
+        if not self._waiters and self.limiter.available:
+            self.limiter.in_flight += 1
+            return True
+        if len(self._waiters) >= self.queue_size:
+            return False
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        timer = loop.call_later(self.queue_timeout, self._expire, waiter)
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            # The client went away: leave the queue, or hand back a slot given just before
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif waiter.done() and not waiter.cancelled() and waiter.result():
+                self.arelease()
+            raise
+        finally:
+            timer.cancel()
+
+    def arelease(self) -> None:
+        """Free a slot and give it to the longest waiting request."""
+        self.limiter.in_flight -= 1
+        while self._waiters and self.limiter.available:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.limiter.in_flight += 1
+                waiter.set_result(True)
+
+    def _expire(self, waiter: asyncio.Future) -> None:
+        if not waiter.done():
+            self._waiters.remove(waiter)
+            waiter.set_result(False)
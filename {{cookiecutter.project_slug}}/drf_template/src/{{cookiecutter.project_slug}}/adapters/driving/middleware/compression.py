@@ -0,0 +1,212 @@
+"""
+Response compression for {{cookiecutter.project_name}}.
+
+``CompressionMiddleware`` compresses responses with zstd, brotli or gzip,
+whichever of ``COMPRESSION_ENCODINGS`` the client's ``Accept-Encoding``
+weights highest. Bodies under ``COMPRESSION_MIN_SIZE`` bytes, responses that
+are already encoded (such as WhiteNoise's precompressed files) and
+already-compressed media types (images, archives...) are sent as they are.
+Streamed responses, such as user exports, are compressed chunk by chunk and
+each chunk is flushed, so clients can decode rows as they arrive.
+
+brotli and zstd are offered only when their packages are installed.
+"""
+import zlib
+from typing import AsyncIterator, Callable, Dict, Iterator, Optional, Sequence
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional
+    brotli = None
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional
+    zstandard = None
+
+# Compressing these again costs CPU and saves next to nothing
+COMPRESSED_TYPE_PREFIXES = ("image/", "video/", "audio/", "font/woff")
+UNCOMPRESSED_IMAGE_TYPES = frozenset({"image/svg+xml", "image/bmp"})
+COMPRESSED_TYPES = frozenset({
+    "application/gzip",
+    "application/pdf",
+    "application/vnd.rar",
+    "application/x-7z-compressed",
+    "application/x-bzip2",
+    "application/x-gzip",
+    "application/x-xz",
+    "application/zip",
+    "application/zstd",
+})
+
+
+class GzipEncoder:
+    """gzip; ``flush`` ends a deflate block so everything so far can be decoded."""
+
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder:
+    """brotli, from the ``brotli`` package."""
+
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder:
+    """zstd, from the ``zstandard`` package."""
+
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+# Content-Encoding token -> encoder, for the codings this install can produce
+ENCODERS: Dict[str, Callable[[int], object]] = {"gzip": GzipEncoder}
+if brotli is not None:
+    ENCODERS["br"] = BrotliEncoder
+if zstandard is not None:
+    ENCODERS["zstd"] = ZstdEncoder
+
+
+def choose_encoding(accept_encoding: str, offered: Sequence[str]) -> Optional[str]:
+    """The coding in ``offered`` the client weights highest, ties going to the earlier one."""
+    weights = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip()] = weight
+    best, best_weight = None, 0.0
+    for coding in offered:
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def is_compressed_type(content_type: str) -> bool:
+    """Whether ``content_type`` is a format that is compressed already."""
+    media_type = content_type.partition(";")[0].strip().lower()
+    if media_type in COMPRESSED_TYPES:
+        return True
+    return media_type.startswith(COMPRESSED_TYPE_PREFIXES) and (
+        media_type not in UNCOMPRESSED_IMAGE_TYPES
+    )
+
+
+def _compressible(response) -> bool:
+    return (
+        200 <= response.status_code
+        and response.status_code not in (204, 206, 304)
+        and not response.has_header("Content-Encoding")
+        and "no-transform" not in response.get("Cache-Control", "")
+        and not is_compressed_type(response.get("Content-Type", ""))
+    )
+
+
+class CompressionMiddleware:
+    """Compress responses as the client accepts; unused without ``COMPRESSION_ENCODINGS``."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.encodings = [
+            encoding for encoding in settings.COMPRESSION_ENCODINGS if encoding in ENCODERS
+        ]
+        if not self.encodings:
+            raise MiddlewareNotUsed
+        self.min_size = settings.COMPRESSION_MIN_SIZE
+        self.levels = settings.COMPRESSION_LEVELS
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.compress(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.compress(request, await self.get_response(request))
+
+    def compress(self, request, response):
+        """Compress ``response`` in place if the request accepts a coding we offer."""
+        if request.method == "HEAD" or not _compressible(response):
+            return response
+        # Whether the body is compressed depends on the request's Accept-Encoding
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = choose_encoding(request.headers.get("Accept-Encoding", ""), self.encodings)
+        if encoding is None:
+            return response
+        if not response.streaming and len(response.content) < self.min_size:
+            return response
+
+        encoder = ENCODERS[encoding](self.levels[encoding])
+        if response.streaming:
+            content = response.streaming_content
+            response.streaming_content = (
+                _compress_async(encoder, content)
+                if response.is_async
+                else _compress(encoder, content)
+            )
+            response.headers.pop("Content-Length", None)
+        else:
+            response.content = encoder.compress(response.content) + encoder.finish()
+            response["Content-Length"] = str(len(response.content))
+        response["Content-Encoding"] = encoding
+        # Same content, different bytes: the validator stays, but only as a weak one
+        etag = response.get("ETag")
+        if etag is not None and not etag.startswith("W/"):
+            response["ETag"] = f"W/{etag}"
+        return response
+
+
+def _compress(encoder, content: Iterator[bytes]) -> Iterator[bytes]:
+    for chunk in content:
+        yield encoder.compress(chunk) + encoder.flush()
+    yield encoder.finish()
+
+
+async def _compress_async(encoder, content: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    async for chunk in content:
+        yield encoder.compress(chunk) + encoder.flush()
+    yield encoder.finish()
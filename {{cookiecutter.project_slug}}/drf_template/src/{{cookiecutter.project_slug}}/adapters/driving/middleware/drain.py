@@ -0,0 +1,45 @@
+"""
+Requests in flight for graceful shutdown of {{cookiecutter.project_name}}.
+
+``DrainMiddleware`` counts the requests in flight, so that shutdown waits for
+them before stopping the event bus they raise events on. A request is counted
+until its view returns; a streamed body is sent after that.
+"""
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from {{cookiecutter.project_slug}}.dependencies.container import get_container  # type: ignore # noqa: E501
+
+
+class DrainMiddleware:
+    """Count requests in flight for the container's ``ShutdownCoordinator``."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.coordinator = get_container().shutdown_coordinator
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        self.coordinator.enter()
+        try:
+            return self.get_response(request)
+        finally:
+            self.coordinator.leave()
+
+    async def __acall__(self, request):
+        self.coordinator.enter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            self.coordinator.leave()
+        if self.coordinator.draining:
+            # The client reconnects, through the load balancer, to another worker.
+            # Only under ASGI: WSGI leaves connection headers to the server.
+            response["Connection"] = "close"
+        return response
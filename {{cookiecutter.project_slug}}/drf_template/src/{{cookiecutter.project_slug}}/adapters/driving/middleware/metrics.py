@@ -0,0 +1,75 @@
+"""
+Prometheus metrics for {{cookiecutter.project_name}}.
+
+``PrometheusMiddleware`` records a request counter and a latency histogram
+labelled by URL pattern, so ``api/users/<uuid:user_id>/`` is one series rather
+than one per user. Under gunicorn every worker writes its samples to
+``PROMETHEUS_MULTIPROC_DIR`` and ``metrics_view`` aggregates them, whichever
+worker answers the scrape.
+"""
+import os
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+REQUESTS = Counter(
+    "http_requests_total", "HTTP requests handled.", ["method", "route", "status"]
+)
+LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency.", ["method", "route"]
+)
+
+
+def metrics_view(request):
+    """Prometheus scrape endpoint."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
+
+
+class PrometheusMiddleware:
+    """Count requests and time them per URL pattern."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        start = time.perf_counter()
+        response = self.get_response(request)
+        self.observe(request, response, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request):
+        start = time.perf_counter()
+        response = await self.get_response(request)
+        self.observe(request, response, time.perf_counter() - start)
+        return response
+
+    def observe(self, request, response, duration: float) -> None:
+        """Record one finished request."""
+        match = request.resolver_match
+        # Unmatched paths share one label so scanners cannot explode the series count
+        route = match.route if match is not None else "unmatched"
+        LATENCY.labels(request.method, route).observe(duration)
+        REQUESTS.labels(request.method, route, str(response.status_code)).inc()
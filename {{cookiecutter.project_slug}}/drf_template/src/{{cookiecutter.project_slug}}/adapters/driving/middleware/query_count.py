@@ -0,0 +1,145 @@
+"""
+SQL query instrumentation for {{cookiecutter.project_name}}.
+
+``QueryCountMiddleware`` counts the queries each request runs on every
+configured database, together with their total execution time. Requests over
+``QUERY_COUNT_WARNING_THRESHOLD`` queries, or repeating the same statement more
+than ``QUERY_DUPLICATE_WARNING_THRESHOLD`` times (the usual N+1 signature), are
+logged. With ``DEBUG`` on, the numbers are also sent as response headers.
+"""
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Sequence, Tuple
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Query-Time-Ms"
+
+
+class QueryStats:
+    """Count, time and repetition of the SQL statements run in a block."""
+
+    def __init__(self, using: Optional[Sequence[str]] = None):
+        self.using = set(using) if using is not None else None
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+
+    def add(self, alias: str, sql: str, duration: float) -> None:
+        """Record one executed statement."""
+        if self.using is not None and alias not in self.using:
+            return
+        self.count += 1
+        self.duration += duration
+        self.statements[sql] += 1
+
+    @property
+    def duration_ms(self) -> float:
+        """Total database time in milliseconds."""
+        return self.duration * 1000
+
+    def most_repeated(self) -> tuple:
+        """Return ``(sql, times)`` for the most repeated statement."""
+        if not self.statements:
+            return ("", 0)
+        return self.statements.most_common(1)[0]
+
+
+# Stats collectors active in the current context. A context variable rather
+# than per-connection wrappers, because Django connections are thread-local and
+# async views run their queries in sync_to_async worker threads, which inherit
+# the context of the request.
+_active_stats: ContextVar[Tuple[QueryStats, ...]] = ContextVar("active_query_stats", default=())
+
+
+def _record_query(execute, sql, params, many, context):
+    active = _active_stats.get()
+    if not active:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - start
+        alias = context["connection"].alias
+        for stats in active:
+            stats.add(alias, sql, duration)
+
+
+def install_query_recorder(sender=None, connection=None, **kwargs) -> None:
+    """Attach the recorder to a connection; a no-op outside ``capture_queries``."""
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+connection_created.connect(install_query_recorder)
+
+
+@contextmanager
+def capture_queries(using: Optional[Sequence[str]] = None) -> Iterator[QueryStats]:
+    """Record queries run inside the block on the given database aliases (default: all)."""
+    for connection in connections.all():
+        install_query_recorder(connection=connection)
+
+    stats = QueryStats(using)
+    token = _active_stats.set(_active_stats.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active_stats.reset(token)
+
+
+class QueryCountMiddleware:
+    """Count SQL queries and database time per request."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.count_threshold = getattr(settings, "QUERY_COUNT_WARNING_THRESHOLD", 50)
+        self.duplicate_threshold = getattr(settings, "QUERY_DUPLICATE_WARNING_THRESHOLD", 5)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        with capture_queries() as stats:
+            response = self.get_response(request)
+        return self.process_stats(request, response, stats)
+
+    async def __acall__(self, request):
+        with capture_queries() as stats:
+            response = await self.get_response(request)
+        return self.process_stats(request, response, stats)
+
+    def process_stats(self, request, response, stats: QueryStats):
+        """Log slow or N+1 looking requests and add debug headers."""
+        sql, repeats = stats.most_repeated()
+        if stats.count > self.count_threshold or repeats > self.duplicate_threshold:
+            logger.warning(
+                "%s %s ran %d queries in %.1f ms; most repeated statement ran %d times: %s",
+                request.method,
+                request.path,
+                stats.count,
+                stats.duration_ms,
+                repeats,
+                sql,
+            )
+
+        if settings.DEBUG:
+            response[QUERY_COUNT_HEADER] = str(stats.count)
+            response[QUERY_TIME_HEADER] = f"{stats.duration_ms:.2f}"
+        return response
@@ -0,0 +1,35 @@
+"""
+Read routing for {{cookiecutter.project_name}}.
+
+``PrimaryPinningMiddleware`` starts every request with a clean read-your-writes
+state for ``PrimaryReplicaRouter``: GET, HEAD and OPTIONS requests read from
+replicas until they write, and any other request reads from ``default`` from
+the start.
+"""
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.db_router import start_request  # type: ignore # noqa: E501
+
+
+class PrimaryPinningMiddleware:
+    """Reset the router's per-request state before the view runs."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        start_request(request.method)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        # Set in this coroutine, so the view's sync_to_async threads inherit it
+        start_request(request.method)
+        return await self.get_response(request)
@@ -0,0 +1,53 @@
+"""
+Request id correlation for {{cookiecutter.project_name}}.
+
+``RequestIdMiddleware`` takes the id from the caller's ``X-Request-ID`` header,
+or makes a new one, stores it for the logging setup so every record logged
+while handling the request carries it, and returns it in the response.
+"""
+import re
+import uuid
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from {{cookiecutter.project_slug}}.config.logging_config import request_id  # type: ignore # noqa: E501
+
+REQUEST_ID_HEADER = "X-Request-ID"
+# Ids from callers are echoed into logs and headers, so only plain tokens are kept
+VALID_REQUEST_ID = re.compile(r"[A-Za-z0-9._-]{1,128}")
+
+
+def incoming_request_id(request) -> str:
+    """The caller's request id if it is a plain token, else a new one."""
+    value = request.headers.get(REQUEST_ID_HEADER, "")
+    return value if VALID_REQUEST_ID.fullmatch(value) else uuid.uuid4().hex
+
+
+class RequestIdMiddleware:
+    """Set the request id for the request's logs and echo it in the response."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        current = incoming_request_id(request)
+        request_id.set(current)
+        response = self.get_response(request)
+        response[REQUEST_ID_HEADER] = current
+        return response
+
+    async def __acall__(self, request):
+        # Set in this coroutine, so the view's sync_to_async threads inherit it
+        current = incoming_request_id(request)
+        request_id.set(current)
+        response = await self.get_response(request)
+        response[REQUEST_ID_HEADER] = current
+        return response
@@ -0,0 +1,61 @@
+"""
+Request tracing middleware for {{cookiecutter.project_name}}.
+
+``TracingMiddleware`` opens the root span of each sampled request. The span is
+named after the matched URL pattern, e.g. ``GET api/users/<uuid:user_id>/``,
+and the service and repository spans of the request nest under it. The
+request id is recorded on the span, so a trace can be found from its logs.
+"""
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.core.exceptions import MiddlewareNotUsed
+
+from {{cookiecutter.project_slug}}.config.logging_config import request_id  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.dependencies.container import get_container  # type: ignore # noqa: E501
+
+
+class TracingMiddleware:
+    """Trace each request with the container's tracer; unused when sampling is off."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.tracer = get_container().tracer
+        if not self.tracer.enabled:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        with self.trace(request) as span:
+            response = self.get_response(request)
+            if span is not None:
+                self.name(span, request, response)
+            return response
+
+    async def __acall__(self, request):
+        with self.trace(request) as span:
+            response = await self.get_response(request)
+            if span is not None:
+                self.name(span, request, response)
+            return response
+
+    def trace(self, request):
+        return self.tracer.trace(
+            request.method,
+            request.headers.get("traceparent", ""),
+            path=request.path,
+            request_id=request_id.get(),
+        )
+
+    @staticmethod
+    def name(span, request, response) -> None:
+        """Name the span after the URL pattern, now that the request is resolved."""
+        match = request.resolver_match
+        # Unmatched paths share one name so scanners cannot explode the span names
+        span.name = f"{request.method} {match.route if match is not None else 'unmatched'}"
+        span.attributes["status"] = response.status_code
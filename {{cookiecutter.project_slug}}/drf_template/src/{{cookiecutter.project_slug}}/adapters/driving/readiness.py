@@ -0,0 +1,127 @@
+"""
+Readiness for {{cookiecutter.project_name}}.
+
+``/health/`` only says the process is up; ``/ready/`` says whether it can serve.
+``ReadinessMonitor`` runs the probes every ``interval`` seconds in a background
+thread and ``/ready/`` returns the last result, so a probe costs the same
+however often the orchestrator asks. Only the server entry points start the
+thread (``wsgi.py`` and the ASGI lifespan); tests and management commands never
+probe. A result older than three intervals counts as not ready, in case a probe
+hangs. So is a worker that has begun to shut down. Probes:
+
+* database: ``SELECT 1`` on ``default``; fails if slower than ``max_latency``;
+* events: domain events waiting for delivery, and how long the oldest has waited.
+"""
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from django.db import connections
+
+from {{cookiecutter.project_slug}}.adapters.driven.events.event_bus import InProcessEventBus  # type: ignore # noqa: E501
+
+logger = logging.getLogger(__name__)
+
+# Whether the dependency is fit to serve, and what was measured
+Probe = Callable[[], Tuple[bool, Dict[str, Any]]]
+
+
+def database_probe(alias: str, max_latency: float) -> Probe:
+    """Ping the ``alias`` database; too slow a round trip fails."""
+
+    def probe():
+        start = time.perf_counter()
+        with connections[alias].cursor() as cursor:
+            cursor.execute("SELECT 1")
+        latency = time.perf_counter() - start
+        return latency <= max_latency, {"latency_ms": round(latency * 1000, 1)}
+
+    return probe
+
+
+def event_probe(event_bus: InProcessEventBus, max_queued: int, max_lag: float) -> Probe:
+    """Fail while domain event delivery is too far behind."""
+
+    def probe():
+        queued, lag = event_bus.queued, event_bus.lag()
+        detail = {"queued": queued, "lag_seconds": round(lag, 1), "dropped": event_bus.dropped}
+        return queued <= max_queued and lag <= max_lag, detail
+
+    return probe
+
+
+class ReadinessMonitor:
+    """Run readiness probes in a background thread and keep their last result."""
+
+    def __init__(self, probes: Dict[str, Probe], interval: float = 5.0):
+        """Check with ``probes`` by name; checks start with ``start_in_thread``."""
+        self.probes = probes
+        self.interval = interval
+        self.checks: Dict[str, Dict[str, Any]] = {}
+        self.checked_at: Optional[float] = None
+        # Set on shutdown: not ready whatever the probes say
+        self.draining = False
+        self._passed = False
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether the last check passed and is recent, and no shutdown has begun."""
+        return (
+            not self.draining
+            and self._passed
+            and self.checked_at is not None
+            and time.monotonic() - self.checked_at < 3 * self.interval
+        )
+
+    def status(self) -> Dict[str, Any]:
+        """The ``/ready/`` payload."""
+        if self.draining:
+            return {"status": "draining", "checks": self.checks}
+        return {"status": "ready" if self.ready else "not ready", "checks": self.checks}
+
+    def check(self) -> None:
+        """Run every probe once; log only changes."""
+        checks = {name: self._run(probe) for name, probe in self.probes.items()}
+        passed = all(result["ok"] for result in checks.values())
+        if not passed and (self._passed or self.checked_at is None):
+            failed = [name for name, result in checks.items() if not result["ok"]]
+            logger.warning("Not ready: %s", ", ".join(failed), extra={"checks": checks})
+        elif passed and not self._passed:
+            logger.info("Ready")
+        self.checks, self._passed, self.checked_at = checks, passed, time.monotonic()
+
+    @staticmethod
+    def _run(probe: Probe) -> Dict[str, Any]:
+        try:
+            ok, detail = probe()
+        except Exception as exc:
+            return {"ok": False, "error": str(exc) or type(exc).__name__}
+        return {"ok": ok, **detail}
+
+    def _check_forever(self) -> None:
+        while True:
+            try:
+                self.check()
+            finally:
+                # A connection per check: a broken one is never reused, none is held in between
+                connections.close_all()
+            if self._stopped.wait(self.interval):
+                return
+
+    def start_in_thread(self) -> None:
+        """Check now and then every ``interval`` seconds, in a daemon thread; once only."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._check_forever, name="readiness", daemon=True)
+        self._thread.start()
+
+    def stop_thread(self) -> None:
+        """Stop the background thread started by ``start_in_thread``."""
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
@@ -0,0 +1,144 @@
+"""
+Graceful shutdown for {{cookiecutter.project_name}}.
+
+On SIGTERM, ``ShutdownCoordinator`` drains the worker before it stops:
+
+1. ``/ready/`` fails at once;
+2. requests are still served for ``drain_delay`` seconds, while load balancers
+   take the worker out of rotation;
+3. the signal goes on to the server, which stops accepting requests and lets
+   those in flight finish;
+4. the container waits for what is still in flight, delivers queued events and
+   exports spans, each within what is left of ``timeout`` seconds.
+
+A second SIGTERM skips what is left of the drain delay. Other signals, such as
+Ctrl+C, are not delayed.
+
+``wsgi.py`` installs the SIGTERM handler when loaded; under ASGI, Django does
+not answer lifespan events, so ``asgi.py`` wraps the application in
+``Lifespan``, which installs it once the server has set its own handlers. Both
+also start the readiness probes, which only a serving worker needs.
+"""
+import logging
+import math
+import os
+import signal
+import threading
+import time
+from typing import Optional
+
+from {{cookiecutter.project_slug}}.adapters.driving.readiness import ReadinessMonitor  # type: ignore # noqa: E501
+
+logger = logging.getLogger(__name__)
+
+
+class ShutdownCoordinator:
+    """Drain the worker on SIGTERM, within one deadline for the whole shutdown."""
+
+    def __init__(
+        self, readiness: ReadinessMonitor, drain_delay: float = 5.0, timeout: float = 25.0
+    ):
+        self.readiness = readiness
+        self.drain_delay = drain_delay
+        self.timeout = timeout
+        self.in_flight = 0
+        self._idle = threading.Condition()
+        self._deadline: Optional[float] = None
+        self._previous = signal.SIG_DFL
+        self._drainer: Optional[threading.Thread] = None
+        self._handed_over = threading.Event()
+
+    @property
+    def draining(self) -> bool:
+        """Whether shutdown has begun."""
+        return self._deadline is not None
+
+    def drain(self) -> None:
+        """Fail readiness and start the shutdown deadline; later calls do nothing."""
+        if self.draining:
+            return
+        self._deadline = time.monotonic() + self.timeout
+        self.readiness.draining = True
+        logger.info("Draining: %d requests in flight", self.in_flight)
+
+    def remaining(self, limit: float = math.inf) -> float:
+        """Seconds left before the deadline, at most ``limit``."""
+        if self._deadline is None:
+            return limit
+        return max(0.0, min(limit, self._deadline - time.monotonic()))
+
+    def enter(self) -> None:
+        """Count a request in flight."""
+        with self._idle:
+            self.in_flight += 1
+
+    def leave(self) -> None:
+        """Count a request done."""
+        with self._idle:
+            self.in_flight -= 1
+            if not self.in_flight:
+                self._idle.notify_all()
+
+    def wait_for_requests(self) -> bool:
+        """Wait for requests in flight until the deadline; False if some are left."""
+        with self._idle:
+            if not self._idle.wait_for(lambda: not self.in_flight, self.remaining(self.timeout)):
+                logger.warning("%d requests still running at the deadline", self.in_flight)
+                return False
+        return True
+
+    def install(self) -> None:
+        """Drain on SIGTERM, then pass the signal on to the server's own handler.
+
+        Call once the server has set its signal handlers, from the main thread;
+        elsewhere, signals cannot be handled and this does nothing.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+        self._previous = signal.getsignal(signal.SIGTERM)
+        signal.signal(signal.SIGTERM, self._on_sigterm)
+
+    def _on_sigterm(self, signum, frame) -> None:
+        if self._drainer is None:
+            self._drainer = threading.Thread(
+                target=self._drain_then_stop, name="shutdown-drain", daemon=True
+            )
+            self._drainer.start()
+        else:
+            self._pass_on(signum, frame)
+
+    def _drain_then_stop(self) -> None:
+        self.drain()
+        if not self._handed_over.wait(self.remaining(self.drain_delay)):
+            # Back through _on_sigterm, which now hands the signal to the server
+            os.kill(os.getpid(), signal.SIGTERM)
+
+    def _pass_on(self, signum, frame) -> None:
+        self._handed_over.set()
+        if callable(self._previous):
+            self._previous(signum, frame)
+        else:
+            signal.signal(signum, self._previous)
+            signal.raise_signal(signum)
+
+
+class Lifespan:
+    """ASGI wrapper answering lifespan events; starts readiness probes and the drain on startup."""
+
+    def __init__(self, app, coordinator: ShutdownCoordinator):
+        self.app = app
+        self.coordinator = coordinator
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "lifespan":
+            await self.app(scope, receive, send)
+            return
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self.coordinator.readiness.start_in_thread()
+                self.coordinator.install()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
@@ -0,0 +1,27 @@
+"""
+ASGI config for {{cookiecutter.project_name}}.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+Under ASGI the API is served by native async views that await ``UserService``
+directly; see ``adapters/driving/api/async_views.py``.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/stable/howto/deployment/asgi/
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault(
+    "DJANGO_SETTINGS_MODULE", "{{cookiecutter.project_slug}}.config.settings"
+)
+os.environ.setdefault("API_ASYNC_VIEWS", "True")
+
+application = get_asgi_application()
+
+from {{cookiecutter.project_slug}}.adapters.driving.shutdown import Lifespan  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.dependencies.container import get_container  # type: ignore # noqa: E402,E501
+
+# At lifespan startup, once the server has set its signal handlers: probe readiness, drain on SIGTERM
+application = Lifespan(application, get_container().shutdown_coordinator)
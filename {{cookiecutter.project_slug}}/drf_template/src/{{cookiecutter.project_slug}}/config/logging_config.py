@@ -0,0 +1,240 @@
+"""
+Logging setup for {{cookiecutter.project_name}}.
+
+``configure_logging`` makes the root logger hand every record to an in-memory
+queue. A writer thread drains the queue, formats the records and writes them
+in batches, so a slow stdout, pipe or log collector never blocks a request,
+and the event loop never waits on log I/O:
+
+* records are written as one JSON object per line (``LOG_FORMAT=json``), with
+  the ``extra`` fields of the call and the id of the request that logged them;
+* ``request_id`` is set per request by the request id middleware and follows
+  the request into tasks and threads it starts;
+* DEBUG records are sampled (``LOG_DEBUG_SAMPLE_RATE``) before they are
+  queued, so verbose logging can stay on in production;
+* when ``LOG_QUEUE_SIZE`` records are waiting, new ones are dropped and
+  counted rather than waited on.
+
+Django installs this setup through ``LOGGING_CONFIG``. The django, uvicorn
+and gunicorn loggers are routed through the same queue.
+"""
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+import threading
+import time
+import traceback
+from contextvars import ContextVar
+from typing import List, Optional, TextIO
+
+# Id of the request being handled, attached to every record it logs
+request_id: ContextVar[str] = ContextVar("request_id", default="-")
+
+# Loggers that come with handlers of their own, which would write synchronously
+CAPTURED_LOGGERS = (
+    "django",
+    "django.server",
+    "gunicorn.access",
+    "gunicorn.error",
+    "uvicorn",
+    "uvicorn.access",
+    "uvicorn.error",
+)
+
+# Attributes every LogRecord has; anything else came from ``extra``
+_RECORD_ATTRS = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None))
+) | {"message", "request_id"}
+
+_writer: Optional["LogWriter"] = None
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a ``rate`` fraction of records at or below ``max_level``."""
+
+    def __init__(self, rate: float, max_level: int = logging.DEBUG):
+        super().__init__()
+        self.rate = rate
+        self.max_level = max_level
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > self.max_level or random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    """Format a record as one line of JSON."""
+
+    def __init__(self):
+        super().__init__()
+        self._second = -1
+        self._second_text = ""
+
+    def timestamp(self, created: float) -> str:
+        """ISO 8601 UTC time in milliseconds; the text up to the second is reused."""
+        second = int(created)
+        if second != self._second:
+            self._second = second
+            self._second_text = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        return f"{self._second_text}.{int((created - second) * 1000):03d}Z"
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.timestamp(record.created),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class NonBlockingQueueHandler(logging.Handler):
+    """Queue records without ever waiting; count the ones dropped when it is full."""
+
+    def __init__(self, log_queue: "queue.SimpleQueue[logging.LogRecord]", max_size: int):
+        super().__init__()
+        self.queue = log_queue
+        self.max_size = max_size
+        self.dropped = 0
+
+    def handle(self, record: logging.LogRecord):
+        # The queue is thread-safe, so records skip the per-handler lock
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.queue.qsize() >= self.max_size:
+            self.dropped += 1
+            return
+        try:
+            # Resolve the message now, before its arguments can change. The root
+            # handler runs last, so the record is updated in place, not copied.
+            record.msg = record.getMessage()
+            record.args = None
+        except Exception:
+            self.handleError(record)
+            return
+        record.request_id = request_id.get()
+        self.queue.put(record)
+
+
+class LogWriter(threading.Thread):
+    """Thread writing queued records to ``stream``, up to ``batch_size`` per write."""
+
+    def __init__(
+        self,
+        log_queue: "queue.SimpleQueue[logging.LogRecord]",
+        stream: TextIO,
+        formatter: logging.Formatter,
+        batch_size: int = 256,
+    ):
+        super().__init__(name="log-writer", daemon=True)
+        self.queue = log_queue
+        self.stream = stream
+        self.formatter = formatter
+        self.batch_size = batch_size
+        self._stop_marker = object()
+
+    def run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = batch[-1] is self._stop_marker
+            if stopping:
+                batch.pop()
+            self.write(batch)
+            if stopping:
+                return
+
+    def write(self, records: List[logging.LogRecord]) -> None:
+        """Format ``records`` and write them at once; errors go to stderr, not the app."""
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.formatter.format(record) + "\n")
+            except Exception:
+                traceback.print_exc(file=sys.stderr)
+        if not lines:
+            return
+        try:
+            self.stream.write("".join(lines))
+            self.stream.flush()
+        except Exception:
+            traceback.print_exc(file=sys.stderr)
+
+    def stop(self) -> None:
+        """Write every queued record, then end the thread."""
+        self.queue.put(self._stop_marker)
+        self.join()
+
+
+def configure_logging(
+    level: str = "INFO",
+    log_format: str = "json",
+    debug_sample_rate: float = 1.0,
+    queue_size: int = 10_000,
+    stream: Optional[TextIO] = None,
+) -> NonBlockingQueueHandler:
+    """Route all logging through a queue drained by a writer thread.
+
+    Records are written to ``stream`` (default: stdout). Replaces any earlier
+    configuration; returns the handler, whose ``dropped`` counts records lost
+    to a full queue.
+    """
+    stop_logging()
+    global _writer
+
+    if log_format == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s"
+        )
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    handler = NonBlockingQueueHandler(log_queue, queue_size)
+    if debug_sample_rate < 1:
+        handler.addFilter(SamplingFilter(debug_sample_rate))
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level.upper())
+    for name in CAPTURED_LOGGERS:
+        captured = logging.getLogger(name)
+        captured.handlers.clear()
+        captured.propagate = True
+
+    _writer = LogWriter(log_queue, stream or sys.stdout, formatter)
+    _writer.start()
+    return handler
+
+
+def configure_logging_from_settings(options: dict) -> None:
+    """``LOGGING_CONFIG`` entry point; Django passes the ``LOGGING`` setting."""
+    configure_logging(**options)
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """Write out every queued record and stop the writer thread."""
+    global _writer
+    if _writer is not None:
+        _writer.stop()
+        _writer = None
@@ -22,14 +22,21 @@ DEBUG = os.environ.get("DEBUG", "False").lower() == "true"
 ALLOWED_HOSTS = os.environ.get("ALLOWED_HOSTS", "localhost,127.0.0.1").split(",")
 
 # Application definition
+{% if cookiecutter.api_only == "y" -%}
+# API-only stack: admin, sessions, messages and static files are not installed.
+DJANGO_APPS = []
+{%- else -%}
 DJANGO_APPS = [
     "django.contrib.admin",
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
     "django.contrib.messages",
+    # Serve static files through WhiteNoise under runserver too
+    "whitenoise.runserver_nostatic",
     "django.contrib.staticfiles",
 ]
+{%- endif %}
 
 THIRD_PARTY_APPS = [
     "rest_framework",
@@ -41,8 +48,42 @@ LOCAL_APPS = [
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
+{% if cookiecutter.api_only == "y" -%}
+# Stateless requests need no session, CSRF, message or clickjacking handling.
 MIDDLEWARE = [
+    # Outermost, so shutdown waits for every request, queued ones too
+    "{{cookiecutter.project_slug}}.adapters.driving.middleware.drain.DrainMiddleware",
+    "{{cookiecutter.project_slug}}.adapters.driving.middleware.request_id.RequestIdMiddleware",
+    "{{cookiecutter.project_slug}}.adapters.driving.middleware.tracing.TracingMiddleware",
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+    "{{cookiecutter.project_slug}}.adapters.driving.middleware.metrics.PrometheusMiddleware",
+{%- endif %}
+    # Inside the metrics middleware, so shed requests are counted as 503s
+    "{{cookiecutter.project_slug}}.adapters.driving.middleware.admission.AdmissionControlMiddleware",
+    # Inside the metrics and tracing middleware, so their timings include compression
+    "{{cookiecutter.project_slug}}.adapters.driving.middleware.compression.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "{{cookiecutter.project_slug}}.adapters.driving.middleware.query_count.QueryCountMiddleware",
+    "{{cookiecutter.project_slug}}.adapters.driving.middleware.read_routing.PrimaryPinningMiddleware",
+    "django.middleware.common.CommonMiddleware",
+]
+{%- else -%}
+MIDDLEWARE = [
+    # Outermost, so shutdown waits for every request, queued ones too
+    "{{cookiecutter.project_slug}}.adapters.driving.middleware.drain.DrainMiddleware",
+    "{{cookiecutter.project_slug}}.adapters.driving.middleware.request_id.RequestIdMiddleware",
+    "{{cookiecutter.project_slug}}.adapters.driving.middleware.tracing.TracingMiddleware",
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+    "{{cookiecutter.project_slug}}.adapters.driving.middleware.metrics.PrometheusMiddleware",
+{%- endif %}
+    # Inside the metrics middleware, so shed requests are counted as 503s
+    "{{cookiecutter.project_slug}}.adapters.driving.middleware.admission.AdmissionControlMiddleware",
+    # Inside the metrics and tracing middleware, so their timings include compression
+    "{{cookiecutter.project_slug}}.adapters.driving.middleware.compression.CompressionMiddleware",
+    "django.middleware.security.SecurityMiddleware",
+    "{{cookiecutter.project_slug}}.adapters.driving.middleware.static.AsyncWhiteNoiseMiddleware",
+    "{{cookiecutter.project_slug}}.adapters.driving.middleware.query_count.QueryCountMiddleware",
+    "{{cookiecutter.project_slug}}.adapters.driving.middleware.read_routing.PrimaryPinningMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -50,6 +91,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
+{%- endif %}
 
 ROOT_URLCONF = "{{cookiecutter.project_slug}}.config.urls"
 
@@ -62,16 +104,39 @@ TEMPLATES = [
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
+{%- if cookiecutter.api_only != "y" %}
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
+{%- endif %}
             ],
         },
     },
 ]
 
 WSGI_APPLICATION = "{{cookiecutter.project_slug}}.wsgi.application"
+ASGI_APPLICATION = "{{cookiecutter.project_slug}}.asgi.application"
+
+# Serve the API with native async views (set by asgi.py) or the sync facade
+API_ASYNC_VIEWS = os.environ.get("API_ASYNC_VIEWS", "False").lower() == "true"
 
-# Database - Django always uses PostgreSQL
+# Database
+{% if cookiecutter.db_type == "sqlite" -%}
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.environ.get("DB_NAME", BASE_DIR / "{{cookiecutter.project_slug}}.db"),
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        # WAL lets readers proceed while a writer commits
+        "OPTIONS": {
+            "init_command": "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;",
+        },
+        # Keep connections open between requests
+        "CONN_MAX_AGE": int(os.environ.get("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
+{%- endif %}
+    }
+}
+{%- else -%}
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -80,9 +145,134 @@ DATABASES = {
         "PASSWORD": os.environ.get("DB_PASSWORD", "password"),
         "HOST": os.environ.get("DB_HOST", "localhost"),
         "PORT": os.environ.get("DB_PORT", "5432"),
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        # psycopg 3 connection pool; requests borrow a connection instead of
+        # connecting. CONN_MAX_AGE must stay 0 when pooling.
+        "OPTIONS": {
+            "pool": {
+                "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", "2")),
+                "max_size": int(os.environ.get("DB_POOL_MAX_SIZE", "10")),
+                "timeout": 10,
+            },
+        },
+{%- endif %}
+    }
+}
+{%- endif %}
+
+# Read replicas: reads go to a healthy replica, writes and the reads that follow
+# them in the same request to "default". Tests read through "default" instead.
+DATABASE_REPLICAS = []
+{%- if cookiecutter.db_type == "sqlite" %}
+# Comma-separated database files, e.g. a copy kept in sync with "default"
+for _index, _name in enumerate(filter(None, os.environ.get("DB_REPLICA_NAMES", "").split(","))):
+    DATABASES[f"replica_{_index + 1}"] = {
+        **DATABASES["default"],
+        "NAME": _name,
+        "TEST": {"MIRROR": "default"},
     }
+    DATABASE_REPLICAS.append(f"replica_{_index + 1}")
+{%- else %}
+# Comma-separated host[:port] of streaming replicas of "default"
+for _index, _host in enumerate(filter(None, os.environ.get("DB_REPLICA_HOSTS", "").split(","))):
+    _hostname, _, _port = _host.partition(":")
+    DATABASES[f"replica_{_index + 1}"] = {
+        **DATABASES["default"],
+        "HOST": _hostname,
+        "PORT": _port or DATABASES["default"]["PORT"],
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica_{_index + 1}")
+{%- endif %}
+DATABASE_ROUTERS = [
+    "{{cookiecutter.project_slug}}.adapters.driven.persistence.db_router.PrimaryReplicaRouter"
+]
+DB_REPLICA_MAX_LAG_SECONDS = float(os.environ.get("DB_REPLICA_MAX_LAG_SECONDS", "5"))
+DB_REPLICA_CHECK_INTERVAL = float(os.environ.get("DB_REPLICA_CHECK_INTERVAL", "5"))
+# Rows per batch (and per transaction) of bulk exports and imports
+TRANSFER_BATCH_SIZE = int(os.environ.get("TRANSFER_BATCH_SIZE", "10000"))
+
+# Readiness: probes run in a background thread; /ready/ serves their last result
+READY_CHECK_INTERVAL = float(os.environ.get("READY_CHECK_INTERVAL", "5"))
+READY_DB_MAX_LATENCY_MS = float(os.environ.get("READY_DB_MAX_LATENCY_MS", "500"))
+READY_EVENT_MAX_QUEUED = int(os.environ.get("READY_EVENT_MAX_QUEUED", "5000"))
+READY_EVENT_MAX_LAG_SECONDS = float(os.environ.get("READY_EVENT_MAX_LAG_SECONDS", "30"))
+
+# Shutdown on SIGTERM: /ready/ fails and requests are served this long while load
+# balancers catch up; the whole shutdown then has to fit in SHUTDOWN_TIMEOUT
+SHUTDOWN_DRAIN_DELAY = float(os.environ.get("SHUTDOWN_DRAIN_DELAY", "5"))
+SHUTDOWN_TIMEOUT = float(os.environ.get("SHUTDOWN_TIMEOUT", "25"))
+
+# Admission control: requests in flight per worker, the limit adapting to latency
+ADMISSION_CONTROL = os.environ.get("ADMISSION_CONTROL", "True").lower() == "true"
+ADMISSION_INITIAL_LIMIT = int(os.environ.get("ADMISSION_INITIAL_LIMIT", "50"))
+ADMISSION_MIN_LIMIT = int(os.environ.get("ADMISSION_MIN_LIMIT", "4"))
+ADMISSION_MAX_LIMIT = int(os.environ.get("ADMISSION_MAX_LIMIT", "500"))
+# Latency tolerated before the limit shrinks, as a multiple of its long-run average
+ADMISSION_LATENCY_TOLERANCE = float(os.environ.get("ADMISSION_LATENCY_TOLERANCE", "1.5"))
+# Requests over the limit wait this long, this many at a time, before a 503
+ADMISSION_QUEUE_SIZE = int(os.environ.get("ADMISSION_QUEUE_SIZE", "100"))
+ADMISSION_QUEUE_TIMEOUT = float(os.environ.get("ADMISSION_QUEUE_TIMEOUT", "1"))
+ADMISSION_RETRY_AFTER = int(os.environ.get("ADMISSION_RETRY_AFTER", "1"))
+# Always admitted, so probes answer while the service sheds load
+ADMISSION_EXEMPT_PATHS = list(
+    filter(None, os.environ.get("ADMISSION_EXEMPT_PATHS", "/health/,/ready/,/metrics").split(","))
+)
+
+# Response compression: codings offered, in order of preference; empty turns it off
+COMPRESSION_ENCODINGS = list(
+    filter(None, os.environ.get("COMPRESSION_ENCODINGS", "zstd,br,gzip").split(","))
+)
+# Smaller bodies are sent as they are; streamed bodies are always compressed
+COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", "1024"))
+# Levels tuned for latency rather than ratio
+COMPRESSION_LEVELS = {
+    "zstd": int(os.environ.get("COMPRESSION_ZSTD_LEVEL", "3")),
+    "br": int(os.environ.get("COMPRESSION_BROTLI_LEVEL", "4")),
+    "gzip": int(os.environ.get("COMPRESSION_GZIP_LEVEL", "5")),
 }
 
+{% if cookiecutter.performance_profile == "high_throughput" -%}
+# Cache in front of the user repository
+CACHE_TTL_SECONDS = float(os.environ.get("CACHE_TTL_SECONDS", "30"))
+CACHE_MAX_ENTRIES = int(os.environ.get("CACHE_MAX_ENTRIES", "10000"))
+# "memory": one cache per worker; "shared": one cache for all workers on the host
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "memory")
+# Shared cache file prefix; defaults to /dev/shm, keyed by the database
+CACHE_SHARED_PATH = os.environ.get("CACHE_SHARED_PATH", "")
+
+{% endif -%}
+# Query instrumentation: requests above these limits are logged as warnings
+QUERY_COUNT_WARNING_THRESHOLD = int(os.environ.get("QUERY_COUNT_WARNING_THRESHOLD", "50"))
+QUERY_DUPLICATE_WARNING_THRESHOLD = int(
+    os.environ.get("QUERY_DUPLICATE_WARNING_THRESHOLD", "5")
+)
+
+# Logging: written by a background thread, so requests never wait on log I/O
+LOGGING_CONFIG = "{{cookiecutter.project_slug}}.config.logging_config.configure_logging_from_settings"
+LOGGING = {
+    "level": os.environ.get("LOG_LEVEL", "INFO"),
+    # "json": one JSON object per line; "text": one readable line per record
+    "log_format": os.environ.get("LOG_FORMAT", "json"),
+    # Fraction of DEBUG records kept
+    "debug_sample_rate": float(os.environ.get("LOG_DEBUG_SAMPLE_RATE", "1")),
+    "queue_size": int(os.environ.get("LOG_QUEUE_SIZE", "10000")),
+}
+
+# Tracing: fraction of requests traced; 0 leaves views, services and repositories unwrapped
+TRACE_SAMPLE_RATE = float(os.environ.get("TRACE_SAMPLE_RATE", "0"))
+# "memory": kept in process; "file": JSON lines in TRACE_FILE; "otlp": TRACE_OTLP_ENDPOINT
+TRACE_EXPORTER = os.environ.get("TRACE_EXPORTER", "file")
+TRACE_FILE = os.environ.get("TRACE_FILE", "traces.jsonl")
+TRACE_OTLP_ENDPOINT = os.environ.get("TRACE_OTLP_ENDPOINT", "http://localhost:4318/v1/traces")
+
+# Domain events: fire-and-forget subscribers run on a background event loop
+EVENT_QUEUE_SIZE = int(os.environ.get("EVENT_QUEUE_SIZE", "10000"))
+EVENT_BATCH_SIZE = int(os.environ.get("EVENT_BATCH_SIZE", "100"))
+EVENT_SHUTDOWN_TIMEOUT = float(os.environ.get("EVENT_SHUTDOWN_TIMEOUT", "5"))
+
+{%- if cookiecutter.api_only != "y" %}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -99,6 +289,8 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+{%- endif %}
+
 # Internationalization
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "UTC"
@@ -123,6 +315,23 @@ STATICFILES_FINDERS = [
     "django.contrib.staticfiles.finders.FileSystemFinder",
     "django.contrib.staticfiles.finders.AppDirectoriesFinder",
 ]
+{%- if cookiecutter.api_only != "y" %}
+
+# collectstatic writes content-hashed file names plus gzip and brotli variants.
+# WhiteNoise serves them in-process with far-future, immutable
+# Cache-Control headers, so each client fetches an asset at most once.
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+
+# Cache lifetime for static files without a content hash in their name
+WHITENOISE_MAX_AGE = int(os.environ.get("WHITENOISE_MAX_AGE", "3600"))
+{%- endif %}
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
@@ -130,11 +339,37 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # Django REST Framework
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
+{%- if cookiecutter.api_only == "y" %}
+        "{{cookiecutter.project_slug}}.adapters.driving.api.authentication.SignedTokenAuthentication",
+{%- else %}
         "rest_framework.authentication.SessionAuthentication",
+{%- endif %}
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
+    "DEFAULT_RENDERER_CLASSES": [
+        "{{cookiecutter.project_slug}}.adapters.driving.api.renderers.ORJSONRenderer",
+        "{{cookiecutter.project_slug}}.adapters.driving.msgpack.renderers.MessagePackRenderer",
+{%- if cookiecutter.api_only != "y" %}
+        "rest_framework.renderers.BrowsableAPIRenderer",
+{%- endif %}
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "{{cookiecutter.project_slug}}.adapters.driving.api.renderers.ORJSONParser",
+        "{{cookiecutter.project_slug}}.adapters.driving.msgpack.renderers.MessagePackParser",
+{%- if cookiecutter.api_only != "y" %}
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+{%- endif %}
+    ],
+{%- if cookiecutter.api_only == "y" %}
+    # Without django.contrib.auth there is no AnonymousUser model to fall back to.
+    "UNAUTHENTICATED_USER": None,
+{%- endif %}
 }
+
+# Lifetime in seconds of tokens accepted by SignedTokenAuthentication
+API_TOKEN_MAX_AGE = int(os.environ.get("API_TOKEN_MAX_AGE", "3600"))
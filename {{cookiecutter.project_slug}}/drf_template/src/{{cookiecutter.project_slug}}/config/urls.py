@@ -1,10 +1,15 @@
 """
 URL configuration for {{cookiecutter.project_name}}.
 """
-
+{% if cookiecutter.api_only != "y" %}
 from django.contrib import admin
+{%- endif %}
 from django.http import JsonResponse
 from django.urls import include, path
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+from {{cookiecutter.project_slug}}.adapters.driving.middleware.metrics import metrics_view  # type: ignore
+{%- endif %}
+from {{cookiecutter.project_slug}}.dependencies.container import get_container  # type: ignore
 
 
 def health_check(request):
@@ -14,8 +19,20 @@ def health_check(request):
     )
 
 
+def readiness_check(request):
+    """Readiness endpoint: the last result of the background dependency probes."""
+    readiness = get_container().readiness
+    return JsonResponse(readiness.status(), status=200 if readiness.ready else 503)
+
+
 urlpatterns = [
+{%- if cookiecutter.api_only != "y" %}
     path("admin/", admin.site.urls),
+{%- endif %}
     path("health/", health_check, name="health"),
+    path("ready/", readiness_check, name="ready"),
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+    path("metrics", metrics_view, name="metrics"),
+{%- endif %}
     path("api/", include("{{cookiecutter.project_slug}}.adapters.driving.api.urls")),
 ]
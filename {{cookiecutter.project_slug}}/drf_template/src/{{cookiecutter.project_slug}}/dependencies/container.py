@@ -1,8 +1,25 @@
 """
 Dependency injection container for {{cookiecutter.project_name}}.
 """
+import atexit
+from functools import lru_cache
+
+from django.conf import settings
+{% if cookiecutter.performance_profile == "high_throughput" -%}
+from {{cookiecutter.project_slug}}.adapters.driven.cache.cached_user_repository import CachedUserRepository  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.cache.shared_cache import SharedMemoryCache, default_path  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.cache.ttl_cache import TTLCache  # type: ignore
+from {{cookiecutter.project_slug}}.adapters.driven.cache.user_codec import UserCacheCodec  # type: ignore
+{% endif -%}
+from {{cookiecutter.project_slug}}.adapters.driven.events.event_bus import InProcessEventBus  # type: ignore # noqa: E501
 from {{cookiecutter.project_slug}}.adapters.driven.external.email_adapter import EmailAdapter  # type: ignore
-from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_repository import DjangoUserRepository,  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_repository import DjangoUserRepository  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_transfer import UserTransfer  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.tracing.exporters import build_exporter  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.tracing.tracer import Tracer  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.events.subscribers import register_subscribers  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.readiness import ReadinessMonitor, database_probe, event_probe  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.shutdown import ShutdownCoordinator  # type: ignore # noqa: E501
 from {{cookiecutter.project_slug}}.domain.services.user_service import UserService  # type: ignore
 
 
@@ -11,19 +28,114 @@ class Container:
 
     def __init__(self):
         """Initialize container with dependencies."""
+        # Initialize tracing
+        self.tracer = Tracer(
+            build_exporter(
+                settings.TRACE_EXPORTER,
+                settings.TRACE_FILE,
+                settings.TRACE_OTLP_ENDPOINT,
+                "{{cookiecutter.project_name}}",
+            ),
+            settings.TRACE_SAMPLE_RATE,
+        )
+
         # Initialize repositories
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        ttl = getattr(settings, "CACHE_TTL_SECONDS", 30.0)
+        max_entries = getattr(settings, "CACHE_MAX_ENTRIES", 10_000)
+        backend = getattr(settings, "CACHE_BACKEND", "memory")
+        if backend == "shared":
+            database = settings.DATABASES["default"]
+            self.cache = SharedMemoryCache(
+                getattr(settings, "CACHE_SHARED_PATH", "")
+                or default_path(
+                    "{{cookiecutter.project_slug}}",
+                    f"{database.get('HOST', '')}:{database.get('PORT', '')}/{database['NAME']}",
+                ),
+                ttl,
+                max_entries,
+                codec=UserCacheCodec(),
+            )
+        elif backend == "memory":
+            self.cache = TTLCache(ttl, max_entries)
+        else:
+            raise ValueError(f"Unknown CACHE_BACKEND {backend!r}")
+        self.user_repository = CachedUserRepository(DjangoUserRepository(), self.cache)
+{%- else %}
         self.user_repository = DjangoUserRepository()
+{%- endif %}
+        if self.tracer.enabled:
+            self.user_repository = self.tracer.instrument(self.user_repository, "UserRepository")
+        self.user_transfer = UserTransfer(
+            settings.TRANSFER_BATCH_SIZE,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+            # Imported rows replace cached users wholesale
+            on_import=self.cache.clear,
+{%- endif %}
+        )
 
         # Initialize external services
         self.email_adapter = EmailAdapter()
 
+        # Initialize domain events
+        self.event_bus = InProcessEventBus(
+            max_queue_size=settings.EVENT_QUEUE_SIZE, batch_size=settings.EVENT_BATCH_SIZE
+        )
+        register_subscribers(self.event_bus, self)
+        self.event_bus.start_in_thread()
+
         # Initialize domain services
-        self.user_service = UserService(self.user_repository)
+        self.user_service = UserService(self.user_repository, self.event_bus)
+        if self.tracer.enabled:
+            self.user_service = self.tracer.instrument(self.user_service, "UserService")
+
+        # Initialize readiness probes
+        self.readiness = ReadinessMonitor(
+            {
+                "database": database_probe("default", settings.READY_DB_MAX_LATENCY_MS / 1000),
+                "events": event_probe(
+                    self.event_bus,
+                    settings.READY_EVENT_MAX_QUEUED,
+                    settings.READY_EVENT_MAX_LAG_SECONDS,
+                ),
+            },
+            interval=settings.READY_CHECK_INTERVAL,
+        )
+        self.shutdown_coordinator = ShutdownCoordinator(
+            self.readiness,
+            drain_delay=settings.SHUTDOWN_DRAIN_DELAY,
+            timeout=settings.SHUTDOWN_TIMEOUT,
+        )
+
+    def close(self) -> None:
+        """Wait for requests, stop probes, deliver queued events, stop the event bus, export spans.
+
+        Requests raise events, so they finish first. Each step gets what is left
+        of ``SHUTDOWN_TIMEOUT``.
+        """
+        coordinator = self.shutdown_coordinator
+        coordinator.drain()
+        coordinator.wait_for_requests()
+        self.readiness.stop_thread()
+        self.event_bus.stop_thread(coordinator.remaining(settings.EVENT_SHUTDOWN_TIMEOUT))
+        self.tracer.shutdown()
 
     def get_user_service(self) -> UserService:
         """Get user service instance."""
         return self.user_service
 
+    def get_user_transfer(self) -> UserTransfer:
+        """Get bulk user export/import instance."""
+        return self.user_transfer
+
     def get_email_adapter(self) -> EmailAdapter:
         """Get email adapter instance."""
         return self.email_adapter
+
+
+@lru_cache(maxsize=None)
+def get_container() -> Container:
+    """Get the process-wide container, created on first use."""
+    container = Container()
+    atexit.register(container.close)
+    return container
@@ -2,10 +2,19 @@
 User entity for {{cookiecutter.project_name}}.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
-from uuid import UUID, uuid4
+from typing import List, Optional
+from uuid import UUID
+
+from {{cookiecutter.project_slug}}.domain.entities.ids import uuid7  # type: ignore
+from {{cookiecutter.project_slug}}.domain.events.base import DomainEvent  # type: ignore
+from {{cookiecutter.project_slug}}.domain.events.user_events import (  # type: ignore
+    UserActivated,
+    UserCreated,
+    UserDeactivated,
+    UserRenamed,
+)
 
 
 @dataclass
@@ -18,6 +27,10 @@ class User:
     is_active: bool = True
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    # Recorded by state changes, published by the service once persisted
+    _events: List[DomainEvent] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Initialize default values after object creation."""
@@ -26,22 +39,37 @@ class User:
         if self.updated_at is None:
             self.updated_at = datetime.now(timezone.utc)
 
+    def record_event(self, event: DomainEvent) -> None:
+        """Record a domain event to publish after the next save."""
+        self._events.append(event)
+
+    def pull_events(self) -> List[DomainEvent]:
+        """Return the recorded events and forget them."""
+        events, self._events = self._events, []
+        return events
+
     def update_name(self, name: str) -> None:
         """Update user name."""
+        old_name = self.name
         self.name = name
         self.updated_at = datetime.now(timezone.utc)
+        self.record_event(UserRenamed(self.id, old_name, name, occurred_at=self.updated_at))
 
     def deactivate(self) -> None:
         """Deactivate user."""
         self.is_active = False
         self.updated_at = datetime.now(timezone.utc)
+        self.record_event(UserDeactivated(self.id, occurred_at=self.updated_at))
 
     def activate(self) -> None:
         """Activate user."""
         self.is_active = True
         self.updated_at = datetime.now(timezone.utc)
+        self.record_event(UserActivated(self.id, occurred_at=self.updated_at))
 
     @classmethod
     def create(cls, email: str, name: str) -> "User":
-        """Create a new user."""
-        return cls(id=uuid4(), email=email, name=name, is_active=True)
+        """Create a new user with a time-ordered id."""
+        user = cls(id=uuid7(), email=email, name=name, is_active=True)
+        user.record_event(UserCreated(user.id, email, name, occurred_at=user.created_at))
+        return user
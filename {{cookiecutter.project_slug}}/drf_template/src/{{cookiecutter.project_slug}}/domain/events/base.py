@@ -0,0 +1,23 @@
+"""
+Domain event primitives for {{cookiecutter.project_name}}.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Sequence
+
+
+@dataclass(frozen=True)
+class DomainEvent:
+    """Something that happened to an aggregate."""
+
+    occurred_at: datetime = field(
+        default_factory=lambda: datetime.now(timezone.utc), kw_only=True
+    )
+
+
+class EventPublisher:
+    """Event publisher interface."""
+
+    async def publish(self, events: Sequence[DomainEvent]) -> None:
+        """Publish the events recorded by one change, in order."""
+        raise NotImplementedError
@@ -1,18 +1,29 @@
 """
 User service for {{cookiecutter.project_name}}.
 """
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Tuple
 from uuid import UUID
 
 from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore
+from {{cookiecutter.project_slug}}.domain.events.base import EventPublisher  # type: ignore
+from {{cookiecutter.project_slug}}.domain.events.user_events import UserActivated, UserDeactivated  # type: ignore # noqa: E501
 
 
 class UserService:
     """User domain service."""
 
-    def __init__(self, user_repository):
-        """Initialize user service with repository."""
+    def __init__(self, user_repository, event_publisher: Optional[EventPublisher] = None):
+        """Initialize user service with repository and optional event publisher."""
         self.user_repository = user_repository
+        self.event_publisher = event_publisher
+
+    async def _save(self, user: User) -> None:
+        """Persist a user, then publish the events its changes recorded."""
+        await self.user_repository.save(user)
+        events = user.pull_events()
+        if events and self.event_publisher is not None:
+            await self.event_publisher.publish(events)
 
     async def create_user(self, email: str, name: str) -> User:
         """Create a new user."""
@@ -25,7 +36,7 @@ class UserService:
         user = User.create(email=email, name=name)
 
         # Save to repository
-        await self.user_repository.save(user)
+        await self._save(user)
 
         return user
 
@@ -41,6 +52,18 @@ class UserService:
         """Get all users."""
         return await self.user_repository.get_all()
 
+    async def get_users_page(self, offset: int, limit: int) -> List[User]:
+        """Get one page of users, loading only that page."""
+        return await self.user_repository.get_page(offset, limit)
+
+    async def get_user_updated_at(self, user_id: UUID) -> Optional[datetime]:
+        """Get when a user last changed, without loading it."""
+        return await self.user_repository.get_updated_at(user_id)
+
+    async def get_all_users_updated_at(self) -> Tuple[int, Optional[datetime]]:
+        """Count users and get the latest change among them, without loading them."""
+        return await self.user_repository.get_all_updated_at()
+
     async def update_user_name(self, user_id: UUID, name: str) -> Optional[User]:
         """Update user name."""
         user = await self.user_repository.get_by_id(user_id)
@@ -48,7 +71,7 @@ class UserService:
             return None
 
         user.update_name(name)
-        await self.user_repository.save(user)
+        await self._save(user)
 
         return user
 
@@ -59,7 +82,7 @@ class UserService:
             return None
 
         user.deactivate()
-        await self.user_repository.save(user)
+        await self._save(user)
 
         return user
 
@@ -70,6 +93,32 @@ class UserService:
             return None
 
         user.activate()
-        await self.user_repository.save(user)
+        await self._save(user)
 
         return user
+
+    async def _set_active(self, user_ids: Iterable[UUID], is_active: bool) -> List[UUID]:
+        """Switch many users in one set-based update and publish an event per change.
+
+        The users are never loaded, so the events are built here rather than
+        recorded by each entity.
+        """
+        now = datetime.now(timezone.utc)
+        # Repeated ids would only inflate the statement
+        changed = await self.user_repository.set_active(
+            list(dict.fromkeys(user_ids)), is_active, now
+        )
+        if changed and self.event_publisher is not None:
+            event_type = UserActivated if is_active else UserDeactivated
+            await self.event_publisher.publish(
+                [event_type(user_id, occurred_at=now) for user_id in changed]
+            )
+        return changed
+
+    async def activate_users(self, user_ids: Iterable[UUID]) -> List[UUID]:
+        """Activate many users; return the ids of those that were inactive."""
+        return await self._set_active(user_ids, True)
+
+    async def deactivate_users(self, user_ids: Iterable[UUID]) -> List[UUID]:
+        """Deactivate many users; return the ids of those that were active."""
+        return await self._set_active(user_ids, False)
@@ -13,6 +13,10 @@ from django.core.management.base import BaseCommand, CommandError
 from django.core.management import call_command
 from django.conf import settings
 
+from {{cookiecutter.project_slug}}.management import ddd_templates  # type: ignore
+
+LOCAL_APPS_LINE = "LOCAL_APPS = ["
+
 
 class Command(BaseCommand):
     help = 'Create a new Django app with DDD (Domain-Driven Design) structure'
@@ -66,11 +70,17 @@ class Command(BaseCommand):
         # Create application layer files
         self.create_application_layer(service_dir, app_name)
 
+        # Create infrastructure layer files
+        self.create_infrastructure_layer(service_dir, app_name)
+
         # Create presentation layer files
         self.create_presentation_layer(service_dir, app_name)
 
-        # Update Django settings
-        self.update_django_settings(app_name)
+        # Create test and benchmark modules
+        self.create_tests_and_benchmarks(service_dir, app_name)
+
+        # Register the app in Django settings
+        self.update_django_settings(service_dir, app_name)
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -79,10 +89,13 @@ class Command(BaseCommand):
         )
         self.stdout.write(f"Service structure created at: {service_dir}")
         self.stdout.write("\nNext steps:")
-        self.stdout.write(f"1. Run migrations: python manage.py makemigrations {app_name}")
-        self.stdout.write(f"2. Apply migrations: python manage.py migrate")
+        self.stdout.write(f"1. Apply migrations: python manage.py migrate {app_name}")
+        self.stdout.write(
+            f'2. Route the API: path("api/", include("{service_dir.name}.presentation.api.{app_name}_urls"))'
+        )
         self.stdout.write(f"3. Update your domain logic in {service_dir}/domain/")
         self.stdout.write(f"4. Update your application services in {service_dir}/application/")
+        self.stdout.write(f"5. Run the tests and benchmark: pytest tests/test_{app_name}.py, benchmarks/bench_{app_name}.py")
 
     def create_ddd_structure(self, service_dir, app_name):
         """Create the basic DDD directory structure."""
@@ -142,58 +155,118 @@ class Command(BaseCommand):
 
         self.stdout.write(f"Moved Django app to infrastructure layer")
 
+    def render(self, path, template, context):
+        """Write a file from one of the ``ddd_templates`` templates."""
+        path.write_text(template.substitute(context))
+
+    def template_context(self, service_dir, app_name):
+        """Names substituted into the scaffolding templates."""
+        return {
+            "app": app_name,
+            "cls": "".join(part.capitalize() for part in app_name.split("_")),
+            "service": service_dir.name,
+            # Index names are capped at 30 characters on some backends
+            "index": f"{app_name[:19]}_keyset_idx",
+        }
+
     def create_domain_layer(self, service_dir, app_name):
         """Create domain layer files."""
         domain_dir = service_dir / "domain"
+        context = self.template_context(service_dir, app_name)
 
-        # Create empty entity file
-        entity_file = domain_dir / "entities" / f"{app_name}.py"
-        entity_file.write_text("")
-
-        # Create empty repository file
-        repository_file = domain_dir / "repositories" / f"{app_name}_repository.py"
-        repository_file.write_text("")
-
-        # Create empty domain service file
-        service_file = domain_dir / "services" / f"{app_name}_service.py"
-        service_file.write_text("")
+        self.render(domain_dir / "entities" / f"{app_name}.py", ddd_templates.ENTITY, context)
+        self.render(
+            domain_dir / "repositories" / f"{app_name}_repository.py",
+            ddd_templates.REPOSITORY_PORT,
+            context,
+        )
+        self.render(
+            domain_dir / "services" / f"{app_name}_service.py",
+            ddd_templates.DOMAIN_SERVICE,
+            context,
+        )
 
         self.stdout.write(f"Created domain layer files for {app_name}")
 
     def create_application_layer(self, service_dir, app_name):
         """Create application layer files."""
         application_dir = service_dir / "application"
+        context = self.template_context(service_dir, app_name)
 
-        # Create empty DTO file
-        dto_file = application_dir / "dto" / f"{app_name}_dto.py"
-        dto_file.write_text("")
-
-        # Create empty application service file
-        app_service_file = application_dir / "services" / f"{app_name}_application_service.py"
-        app_service_file.write_text("")
+        self.render(application_dir / "dto" / f"{app_name}_dto.py", ddd_templates.DTO, context)
+        self.render(
+            application_dir / "services" / f"{app_name}_application_service.py",
+            ddd_templates.APPLICATION_SERVICE,
+            context,
+        )
+        self.render(service_dir / "dependencies.py", ddd_templates.DEPENDENCIES, context)
 
         self.stdout.write(f"Created application layer files for {app_name}")
 
+    def create_infrastructure_layer(self, service_dir, app_name):
+        """Create the Django model, its migration and the repository adapter."""
+        infrastructure_dir = service_dir / "infrastructure"
+        app_dir = infrastructure_dir / app_name
+        context = self.template_context(service_dir, app_name)
+
+        self.render(app_dir / "apps.py", ddd_templates.APP_CONFIG, context)
+        self.render(app_dir / "models.py", ddd_templates.MODEL, context)
+        self.render(app_dir / "migrations" / "0001_initial.py", ddd_templates.MIGRATION, context)
+        self.render(
+            infrastructure_dir / "repositories" / f"{app_name}_repository.py",
+            ddd_templates.REPOSITORY_ADAPTER,
+            context,
+        )
+
+        self.stdout.write(f"Created infrastructure layer files for {app_name}")
+
     def create_presentation_layer(self, service_dir, app_name):
         """Create presentation layer files."""
         presentation_dir = service_dir / "presentation"
+        context = self.template_context(service_dir, app_name)
 
-        # Create empty serializer file
-        serializer_file = presentation_dir / "serializers" / f"{app_name}_serializer.py"
-        serializer_file.write_text("")
-
-        # Create empty API views file
-        api_file = presentation_dir / "api" / f"{app_name}_views.py"
-        api_file.write_text("")
-
-        # Create empty URLs file
-        urls_file = presentation_dir / "api" / f"{app_name}_urls.py"
-        urls_file.write_text("")
+        self.render(
+            presentation_dir / "serializers" / f"{app_name}_serializer.py",
+            ddd_templates.SERIALIZERS,
+            context,
+        )
+        self.render(presentation_dir / "api" / f"{app_name}_views.py", ddd_templates.VIEWS, context)
+        self.render(presentation_dir / "api" / f"{app_name}_urls.py", ddd_templates.URLS, context)
 
         self.stdout.write(f"Created presentation layer files for {app_name}")
 
-    def update_django_settings(self, app_name):
-        """Add the new app to Django settings."""
-        # This would require modifying settings.py
-        # For now, just inform the user
-        self.stdout.write(f"Remember to add '{app_name}' to INSTALLED_APPS in settings.py")
+    def create_tests_and_benchmarks(self, service_dir, app_name):
+        """Create a query-budget test module and a benchmark for the new app."""
+        project_root = Path(settings.BASE_DIR)
+        context = self.template_context(service_dir, app_name)
+
+        for directory, name, template in (
+            (project_root / "tests", f"test_{app_name}.py", ddd_templates.TESTS),
+            (project_root / "benchmarks", f"bench_{app_name}.py", ddd_templates.BENCHMARK),
+        ):
+            path = directory / name
+            if path.exists():
+                self.stdout.write(self.style.WARNING(f"Skipped existing file: {path}"))
+                continue
+            directory.mkdir(exist_ok=True)
+            self.render(path, template, context)
+            self.stdout.write(f"Created {path}")
+
+    def update_django_settings(self, service_dir, app_name):
+        """Add the new app to ``LOCAL_APPS`` in settings.py."""
+        app_path = f"{service_dir.name}.infrastructure.{app_name}"
+        settings_file = Path(sys.modules[settings.SETTINGS_MODULE].__file__)
+        content = settings_file.read_text()
+
+        if f'"{app_path}"' in content:
+            return
+        if LOCAL_APPS_LINE not in content:
+            self.stdout.write(
+                self.style.WARNING(f"Remember to add '{app_path}' to INSTALLED_APPS in settings.py")
+            )
+            return
+
+        settings_file.write_text(
+            content.replace(LOCAL_APPS_LINE, f'{LOCAL_APPS_LINE}\n    "{app_path}",', 1)
+        )
+        self.stdout.write(f"Added '{app_path}' to LOCAL_APPS in {settings_file}")
@@ -0,0 +1,61 @@
+"""
+Management command to export every user to a CSV or NDJSON file.
+"""
+from pathlib import Path
+from uuid import UUID
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_transfer import FORMATS, UserTransfer, header  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.management.transfer import Progress, format_for, load_checkpoint, save_checkpoint  # type: ignore # noqa: E501
+
+
+class Command(BaseCommand):
+    help = 'Export users in batches to a CSV or NDJSON file, resumably with --checkpoint'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', type=Path, help='File to write')
+        parser.add_argument(
+            '--format',
+            choices=FORMATS,
+            help='File format (default: from the file extension, else csv)'
+        )
+        parser.add_argument(
+            '--checkpoint',
+            type=Path,
+            help='File recording progress; an interrupted export resumes from it'
+        )
+        parser.add_argument('--batch-size', type=int, default=settings.TRANSFER_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        path, checkpoint = options['path'], options['checkpoint']
+        fmt = format_for(path, options['format'])
+        state = load_checkpoint(checkpoint, 'export', path)
+        rows = state.get('rows', 0)
+        after = UUID(state['after']) if state else None
+        progress = Progress(self.stderr, 'Exported', rows)
+
+        with open(path, 'r+b' if state else 'wb') as output:
+            if state:
+                # Drop whatever the interrupted run wrote after its last checkpoint
+                output.truncate(state['bytes'])
+                output.seek(state['bytes'])
+            else:
+                output.write(header(fmt))
+            for data, last_id, batch_rows in UserTransfer(options['batch_size']).export(fmt, after):
+                output.write(data)
+                output.flush()
+                rows += batch_rows
+                save_checkpoint(checkpoint, {
+                    'command': 'export',
+                    'path': str(path),
+                    'after': str(last_id),
+                    'rows': rows,
+                    'bytes': output.tell(),
+                })
+                progress(rows)
+
+        progress(rows, final=True)
+        if checkpoint is not None:
+            checkpoint.unlink(missing_ok=True)
@@ -0,0 +1,61 @@
+"""
+Management command to insert or update users from a CSV or NDJSON export.
+"""
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_transfer import FORMATS, UserTransfer  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.management.transfer import Progress, format_for, load_checkpoint, save_checkpoint  # type: ignore # noqa: E501
+
+# Batches commit once complete, so small reads keep them near --batch-size
+READ_SIZE = 64 * 1024
+
+
+class Command(BaseCommand):
+    help = 'Import users in batches from a CSV or NDJSON file, resumably with --checkpoint'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', type=Path, help='File to read')
+        parser.add_argument(
+            '--format',
+            choices=FORMATS,
+            help='File format (default: from the file extension, else csv)'
+        )
+        parser.add_argument(
+            '--checkpoint',
+            type=Path,
+            help='File recording progress; an interrupted import resumes from it'
+        )
+        parser.add_argument('--batch-size', type=int, default=settings.TRANSFER_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        path, checkpoint = options['path'], options['checkpoint']
+        fmt = format_for(path, options['format'])
+        state = load_checkpoint(checkpoint, 'import', path)
+        start_offset = state.get('offset', 0)
+        start_rows = state.get('rows', 0)
+        progress = Progress(self.stderr, 'Imported', start_rows)
+
+        def committed(rows, offset):
+            save_checkpoint(checkpoint, {
+                'command': 'import',
+                'path': str(path),
+                'offset': start_offset + offset,
+                'rows': start_rows + rows,
+            })
+            progress(start_rows + rows)
+
+        with open(path, 'rb') as source:
+            source.seek(start_offset)
+            chunks = iter(lambda: source.read(READ_SIZE), b'')
+            try:
+                imported = UserTransfer(options['batch_size']).import_stream(fmt, chunks, committed)
+            except ValueError as exc:
+                # The checkpoint still points at the last committed batch
+                raise CommandError(f'Import failed: {exc}') from exc
+
+        progress(start_rows + imported, final=True)
+        if checkpoint is not None:
+            checkpoint.unlink(missing_ok=True)
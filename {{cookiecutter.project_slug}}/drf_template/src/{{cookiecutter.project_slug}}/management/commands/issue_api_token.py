@@ -0,0 +1,27 @@
+"""
+Management command to issue signed API tokens.
+"""
+
+from django.core.management.base import BaseCommand
+
+from {{cookiecutter.project_slug}}.adapters.driving.api.authentication import issue_token  # type: ignore
+
+
+class Command(BaseCommand):
+    help = 'Issue a signed bearer token for SignedTokenAuthentication'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'subject',
+            type=str,
+            help='Service or user identifier the token is issued to'
+        )
+        parser.add_argument(
+            '--scope',
+            action='append',
+            default=[],
+            help='Scope granted by the token (repeatable)'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(issue_token(options['subject'], options['scope']))
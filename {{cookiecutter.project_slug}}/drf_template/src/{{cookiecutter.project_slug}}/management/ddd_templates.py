@@ -0,0 +1,707 @@
+"""
+Source templates used by the ``create_ddd_app`` management command.
+
+Each template is a ``string.Template`` filled with:
+
+- ``app``: the Django app name (``product``)
+- ``cls``: the entity class name (``Product``)
+- ``service``: the service package (``product_management_service``)
+- ``index``: the name of the keyset pagination index
+
+The stubs are working code: the repository batches reads and writes and pages
+with a keyset cursor instead of ``OFFSET``, so new bounded contexts do not
+start out with N+1 queries or unbounded lists.
+"""
+from string import Template
+
+ENTITY = Template('''"""
+$cls entity.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID, uuid4
+
+
+@dataclass
+class $cls:
+    """$cls domain entity."""
+
+    id: UUID
+    name: str
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        """Initialize default values after object creation."""
+        if self.created_at is None:
+            self.created_at = datetime.now(timezone.utc)
+        if self.updated_at is None:
+            self.updated_at = self.created_at
+
+    def rename(self, name: str) -> None:
+        """Rename the $app."""
+        self.name = name
+        self.updated_at = datetime.now(timezone.utc)
+
+    @classmethod
+    def create(cls, name: str) -> "$cls":
+        """Create a new $app."""
+        return cls(id=uuid4(), name=name)
+''')
+
+REPOSITORY_PORT = Template('''"""
+$cls repository interface.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from $service.domain.entities.$app import $cls  # type: ignore
+
+# Keyset position: the ``(created_at, id)`` of the last row on a page
+Cursor = Tuple[datetime, UUID]
+
+
+@dataclass
+class ${cls}Page:
+    """One page of a keyset-paginated listing."""
+
+    items: List[$cls]
+    next_cursor: Optional[Cursor] = None
+
+
+class ${cls}Repository:
+    """$cls repository interface.
+
+    Implementations must answer ``get_many`` and ``save_many`` with a bounded
+    number of queries, and ``iter_page`` with exactly one.
+    """
+
+    async def get(self, ${app}_id: UUID) -> Optional[$cls]:
+        """Get one $app by ID."""
+        raise NotImplementedError
+
+    async def get_many(self, ids: Iterable[UUID]) -> Dict[UUID, $cls]:
+        """Get many ${app}s by ID, keyed by ID; missing IDs are left out."""
+        raise NotImplementedError
+
+    async def save(self, $app: $cls) -> $cls:
+        """Insert or update one $app."""
+        raise NotImplementedError
+
+    async def save_many(self, ${app}s: List[$cls]) -> List[$cls]:
+        """Insert or update many ${app}s in batches."""
+        raise NotImplementedError
+
+    async def iter_page(self, after: Optional[Cursor] = None, limit: int = 50) -> ${cls}Page:
+        """Return up to ``limit`` ${app}s ordered by ``(created_at, id)`` after ``after``."""
+        raise NotImplementedError
+''')
+
+DOMAIN_SERVICE = Template('''"""
+$cls domain service.
+"""
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from $service.domain.entities.$app import $cls  # type: ignore
+from $service.domain.repositories.${app}_repository import (  # type: ignore
+    Cursor,
+    ${cls}Page,
+    ${cls}Repository,
+)
+
+
+class ${cls}Service:
+    """$cls domain service."""
+
+    def __init__(self, repository: ${cls}Repository):
+        """Initialize the service with its repository."""
+        self.repository = repository
+
+    async def create(self, name: str) -> $cls:
+        """Create and store a new $app."""
+        return await self.repository.save($cls.create(name=name))
+
+    async def create_many(self, names: Iterable[str]) -> List[$cls]:
+        """Create and store many ${app}s in one batch."""
+        return await self.repository.save_many([$cls.create(name=name) for name in names])
+
+    async def get(self, ${app}_id: UUID) -> Optional[$cls]:
+        """Get a $app by ID."""
+        return await self.repository.get(${app}_id)
+
+    async def get_many(self, ids: Iterable[UUID]) -> Dict[UUID, $cls]:
+        """Get many ${app}s by ID."""
+        return await self.repository.get_many(ids)
+
+    async def rename(self, ${app}_id: UUID, name: str) -> Optional[$cls]:
+        """Rename a $app."""
+        $app = await self.repository.get(${app}_id)
+        if $app is None:
+            return None
+        $app.rename(name)
+        return await self.repository.save($app)
+
+    async def list_page(self, after: Optional[Cursor] = None, limit: int = 50) -> ${cls}Page:
+        """List one page of ${app}s."""
+        return await self.repository.iter_page(after=after, limit=limit)
+''')
+
+DTO = Template('''"""
+$cls data transfer objects.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from $service.domain.entities.$app import $cls  # type: ignore
+
+
+@dataclass(frozen=True)
+class ${cls}DTO:
+    """$cls as exposed to the presentation layer."""
+
+    id: UUID
+    name: str
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_entity(cls, $app: $cls) -> "${cls}DTO":
+        """Build a DTO from a domain entity."""
+        return cls(
+            id=$app.id,
+            name=$app.name,
+            created_at=$app.created_at,
+            updated_at=$app.updated_at,
+        )
+''')
+
+APPLICATION_SERVICE = Template('''"""
+$cls application service.
+"""
+import base64
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from $service.application.dto.${app}_dto import ${cls}DTO  # type: ignore
+from $service.domain.repositories.${app}_repository import Cursor  # type: ignore
+from $service.domain.services.${app}_service import ${cls}Service  # type: ignore
+
+
+def encode_cursor(cursor: Optional[Cursor]) -> Optional[str]:
+    """Encode a keyset position as an opaque, URL-safe token."""
+    if cursor is None:
+        return None
+    created_at, ${app}_id = cursor
+    raw = f"{created_at.isoformat()}|{${app}_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(token: Optional[str]) -> Optional[Cursor]:
+    """Decode a token from ``encode_cursor``; raise ``ValueError`` if malformed."""
+    if not token:
+        return None
+    try:
+        created_at, ${app}_id = base64.urlsafe_b64decode(token.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(${app}_id)
+    except (TypeError, ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor.") from exc
+
+
+class ${cls}ApplicationService:
+    """Use cases for ${app}s, returning DTOs."""
+
+    def __init__(self, ${app}_service: ${cls}Service):
+        """Initialize with the domain service."""
+        self.${app}_service = ${app}_service
+
+    async def create(self, name: str) -> ${cls}DTO:
+        """Create a $app."""
+        return ${cls}DTO.from_entity(await self.${app}_service.create(name))
+
+    async def create_many(self, names: List[str]) -> List[${cls}DTO]:
+        """Create many ${app}s in one batch."""
+        return [${cls}DTO.from_entity(item) for item in await self.${app}_service.create_many(names)]
+
+    async def get(self, ${app}_id: UUID) -> Optional[${cls}DTO]:
+        """Get a $app by ID."""
+        $app = await self.${app}_service.get(${app}_id)
+        return ${cls}DTO.from_entity($app) if $app else None
+
+    async def rename(self, ${app}_id: UUID, name: str) -> Optional[${cls}DTO]:
+        """Rename a $app."""
+        $app = await self.${app}_service.rename(${app}_id, name)
+        return ${cls}DTO.from_entity($app) if $app else None
+
+    async def list_page(
+        self, cursor: Optional[str] = None, limit: int = 50
+    ) -> Tuple[List[${cls}DTO], Optional[str]]:
+        """List one page of ${app}s and the cursor of the next page."""
+        page = await self.${app}_service.list_page(after=decode_cursor(cursor), limit=limit)
+        return [${cls}DTO.from_entity(item) for item in page.items], encode_cursor(page.next_cursor)
+''')
+
+APP_CONFIG = Template('''from django.apps import AppConfig
+
+
+class ${cls}Config(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "$service.infrastructure.$app"
+    label = "$app"
+''')
+
+MODEL = Template('''"""
+Django ORM models for the $app app.
+"""
+from django.db import models
+
+
+class ${cls}Model(models.Model):
+    """Database row backing the ``$cls`` domain entity."""
+
+    id = models.UUIDField(primary_key=True)
+    name = models.CharField(max_length=255)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "$app"
+        # Serves keyset pagination: WHERE (created_at, id) > cursor ORDER BY created_at, id
+        indexes = [models.Index(fields=["created_at", "id"], name="$index")]
+
+    def __str__(self):
+        return self.name
+''')
+
+MIGRATION = Template('''from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="${cls}Model",
+            fields=[
+                ("id", models.UUIDField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=255)),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "$app",
+                "indexes": [
+                    models.Index(fields=["created_at", "id"], name="$index")
+                ],
+            },
+        ),
+    ]
+''')
+
+REPOSITORY_ADAPTER = Template('''"""
+Django implementation of the $app repository.
+"""
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from django.db.models import Q
+
+from $service.domain.entities.$app import $cls  # type: ignore
+from $service.domain.repositories.${app}_repository import (  # type: ignore
+    Cursor,
+    ${cls}Page,
+    ${cls}Repository,
+)
+from $service.infrastructure.$app.models import ${cls}Model  # type: ignore
+
+# Rows per INSERT / IN (...) clause; keeps statements under backend parameter limits
+BATCH_SIZE = 500
+
+
+class Django${cls}Repository(${cls}Repository):
+    """Django implementation of the $app repository."""
+
+    @staticmethod
+    def _to_entity(row: ${cls}Model) -> $cls:
+        """Map an ORM row to a domain entity."""
+        return $cls(id=row.id, name=row.name, created_at=row.created_at, updated_at=row.updated_at)
+
+    @staticmethod
+    def _to_row($app: $cls) -> ${cls}Model:
+        """Map a domain entity to an unsaved ORM row."""
+        return ${cls}Model(
+            id=$app.id,
+            name=$app.name,
+            created_at=$app.created_at,
+            updated_at=$app.updated_at,
+        )
+
+    async def get(self, ${app}_id: UUID) -> Optional[$cls]:
+        """Get one $app by ID."""
+        row = await ${cls}Model.objects.filter(id=${app}_id).afirst()
+        return self._to_entity(row) if row else None
+
+    async def get_many(self, ids: Iterable[UUID]) -> Dict[UUID, $cls]:
+        """Get many ${app}s with one query per ``BATCH_SIZE`` IDs."""
+        ids = list(ids)
+        found: Dict[UUID, $cls] = {}
+        for start in range(0, len(ids), BATCH_SIZE):
+            batch = ids[start : start + BATCH_SIZE]
+            async for row in ${cls}Model.objects.filter(id__in=batch):
+                found[row.id] = self._to_entity(row)
+        return found
+
+    async def save(self, $app: $cls) -> $cls:
+        """Insert or update one $app."""
+        await self.save_many([$app])
+        return $app
+
+    async def save_many(self, ${app}s: List[$cls]) -> List[$cls]:
+        """Upsert many ${app}s with one statement per ``BATCH_SIZE`` rows."""
+        await ${cls}Model.objects.abulk_create(
+            [self._to_row($app) for $app in ${app}s],
+            batch_size=BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["id"],
+            update_fields=["name", "updated_at"],
+        )
+        return ${app}s
+
+    async def iter_page(self, after: Optional[Cursor] = None, limit: int = 50) -> ${cls}Page:
+        """Return one keyset page in a single query, however deep the page is."""
+        queryset = ${cls}Model.objects.order_by("created_at", "id")
+        if after is not None:
+            created_at, ${app}_id = after
+            # The leading range on created_at lets the (created_at, id) index seek
+            queryset = queryset.filter(
+                Q(created_at__gt=created_at) | Q(id__gt=${app}_id), created_at__gte=created_at
+            )
+
+        # Fetch one extra row to learn whether another page exists
+        items = [self._to_entity(row) async for row in queryset[: limit + 1]]
+        if len(items) <= limit:
+            return ${cls}Page(items=items)
+        items = items[:limit]
+        return ${cls}Page(items=items, next_cursor=(items[-1].created_at, items[-1].id))
+''')
+
+DEPENDENCIES = Template('''"""
+Dependency wiring for the $app service.
+"""
+from functools import lru_cache
+
+from $service.application.services.${app}_application_service import ${cls}ApplicationService  # type: ignore # noqa: E501
+from $service.domain.services.${app}_service import ${cls}Service  # type: ignore
+from $service.infrastructure.repositories.${app}_repository import Django${cls}Repository  # type: ignore # noqa: E501
+
+
+@lru_cache(maxsize=None)
+def get_${app}_service() -> ${cls}ApplicationService:
+    """Get the process-wide $app application service, created on first use."""
+    return ${cls}ApplicationService(${cls}Service(Django${cls}Repository()))
+''')
+
+SERIALIZERS = Template('''"""
+$cls serializers.
+"""
+from rest_framework import serializers
+
+from {{cookiecutter.project_slug}}.adapters.driving.api.serializers import EntitySerializer  # type: ignore # noqa: E501
+
+
+class ${cls}Serializer(EntitySerializer):
+    """Serialize ``${cls}DTO`` objects."""
+
+    fields = ("id", "name", "created_at", "updated_at")
+
+
+class Create${cls}Serializer(serializers.Serializer):
+    """Validate input for creating a $app."""
+
+    name = serializers.CharField(max_length=255)
+''')
+
+VIEWS = Template('''"""
+$cls API views.
+
+Listings are keyset-paginated: ``?cursor=`` carries the position of the last
+row served, so every page costs one indexed query regardless of its depth.
+POSTing a list creates all items in one batch.
+"""
+from uuid import UUID
+
+from rest_framework import status
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from {{cookiecutter.project_slug}}.adapters.driving.api.async_views import AsyncAPIView  # type: ignore # noqa: E501
+from $service.dependencies import get_${app}_service  # type: ignore
+from $service.presentation.serializers.${app}_serializer import (  # type: ignore
+    Create${cls}Serializer,
+    ${cls}Serializer,
+)
+
+MAX_PAGE_SIZE = 500
+
+
+class ${cls}APIView(AsyncAPIView):
+    """Base view with access to the $app service."""
+
+    @property
+    def ${app}_service(self):
+        return get_${app}_service()
+
+
+class ${cls}ListView(${cls}APIView):
+    """List ${app}s page by page and create them singly or in bulk."""
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+
+    def get_page_size(self, request) -> int:
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, 0))
+        except ValueError:
+            size = 0
+        return min(size or api_settings.PAGE_SIZE or 50, MAX_PAGE_SIZE)
+
+    async def get(self, request):
+        try:
+            items, next_cursor = await self.${app}_service.list_page(
+                cursor=request.query_params.get(self.cursor_query_param),
+                limit=self.get_page_size(request),
+            )
+        except ValueError as exc:
+            raise ValidationError({self.cursor_query_param: [str(exc)]}) from exc
+
+        url = request.build_absolute_uri()
+        next_url = (
+            replace_query_param(url, self.cursor_query_param, next_cursor)
+            if next_cursor
+            else None
+        )
+        return Response(
+            {
+                "next": next_url,
+                "first": remove_query_param(url, self.cursor_query_param),
+                "results": ${cls}Serializer(items, many=True).data,
+            }
+        )
+
+    async def post(self, request):
+        many = isinstance(request.data, list)
+        serializer = Create${cls}Serializer(data=request.data, many=many)
+        serializer.is_valid(raise_exception=True)
+        if many:
+            names = [item["name"] for item in serializer.validated_data]
+            created = await self.${app}_service.create_many(names)
+        else:
+            created = await self.${app}_service.create(serializer.validated_data["name"])
+        return Response(
+            ${cls}Serializer(created, many=many).data, status=status.HTTP_201_CREATED
+        )
+
+
+class ${cls}DetailView(${cls}APIView):
+    """Retrieve and rename a $app."""
+
+    async def get(self, request, ${app}_id: UUID):
+        $app = await self.${app}_service.get(${app}_id)
+        if $app is None:
+            raise NotFound()
+        return Response(${cls}Serializer($app).data)
+
+    async def patch(self, request, ${app}_id: UUID):
+        serializer = Create${cls}Serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        $app = await self.${app}_service.rename(${app}_id, serializer.validated_data["name"])
+        if $app is None:
+            raise NotFound()
+        return Response(${cls}Serializer($app).data)
+''')
+
+URLS = Template('''"""
+$cls API URL configuration.
+
+Include it from the project URLconf::
+
+    path("api/", include("$service.presentation.api.${app}_urls")),
+"""
+from django.conf import settings
+from django.urls import path
+
+from {{cookiecutter.project_slug}}.adapters.driving.api.async_views import sync_facade  # type: ignore # noqa: E501
+from $service.presentation.api.${app}_views import ${cls}DetailView, ${cls}ListView  # type: ignore # noqa: E501
+
+
+def _as_view(view_class):
+    # asgi.py turns on API_ASYNC_VIEWS; WSGI deployments get the sync facade
+    if not settings.API_ASYNC_VIEWS:
+        view_class = sync_facade(view_class)
+    return view_class.as_view()
+
+
+urlpatterns = [
+    path("${app}s/", _as_view(${cls}ListView), name="${app}-list"),
+    path("${app}s/<uuid:${app}_id>/", _as_view(${cls}DetailView), name="${app}-detail"),
+]
+''')
+
+TESTS = Template('''"""
+Query budgets and pagination tests for the $app repository.
+"""
+import pytest
+from asgiref.sync import async_to_sync
+
+from $service.domain.entities.$app import $cls  # type: ignore
+from $service.infrastructure.repositories.${app}_repository import Django${cls}Repository  # type: ignore # noqa: E501
+
+
+@pytest.fixture
+def repository():
+    return Django${cls}Repository()
+
+
+@pytest.fixture
+def ${app}s(db, repository):
+    created = [$cls.create(name=f"$cls {i}") for i in range(25)]
+    async_to_sync(repository.save_many)(created)
+    return created
+
+
+def test_save_many_runs_one_query(db, repository, assert_max_queries):
+    batch = [$cls.create(name=f"$cls {i}") for i in range(100)]
+    with assert_max_queries(1):
+        async_to_sync(repository.save_many)(batch)
+
+
+def test_save_many_updates_existing_rows(repository, ${app}s):
+    ${app}s[0].rename("Renamed")
+    async_to_sync(repository.save_many)(${app}s[:1])
+    assert async_to_sync(repository.get)(${app}s[0].id).name == "Renamed"
+
+
+def test_get_many_runs_one_query(repository, ${app}s, assert_max_queries):
+    with assert_max_queries(1):
+        found = async_to_sync(repository.get_many)([item.id for item in ${app}s])
+    assert set(found) == {item.id for item in ${app}s}
+
+
+def test_iter_page_walks_every_row_once(repository, ${app}s, assert_max_queries):
+    seen = []
+    cursor = None
+    while True:
+        with assert_max_queries(1):
+            page = async_to_sync(repository.iter_page)(after=cursor, limit=10)
+        seen.extend(item.id for item in page.items)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    expected = sorted(${app}s, key=lambda item: (item.created_at, item.id))
+    assert seen == [item.id for item in expected]
+''')
+
+BENCHMARK = Template('''"""
+$cls repository access patterns: per-row versus batched writes and reads,
+and OFFSET versus keyset pagination deep into the table.
+
+Run with::
+
+    uv run python benchmarks/bench_${app}.py [--rows 100000]
+"""
+
+import argparse
+
+import django
+from django.conf import settings
+
+settings.configure(
+    INSTALLED_APPS=["$service.infrastructure.$app"],
+    DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+    USE_TZ=True,
+)
+django.setup()
+
+from asgiref.sync import async_to_sync  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.db.models import Q  # noqa: E402
+from timing import measure, report  # noqa: E402
+
+from $service.domain.entities.$app import $cls  # type: ignore # noqa: E402
+from $service.infrastructure.$app.models import ${cls}Model  # type: ignore # noqa: E402
+from $service.infrastructure.repositories.${app}_repository import Django${cls}Repository  # type: ignore # noqa: E402,E501
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    with connection.schema_editor() as editor:
+        editor.create_model(${cls}Model)
+
+    repository = Django${cls}Repository()
+    save = async_to_sync(repository.save)
+    save_many = async_to_sync(repository.save_many)
+    get = async_to_sync(repository.get)
+    get_many = async_to_sync(repository.get_many)
+
+    rows = [$cls.create(name=f"$cls {i}") for i in range(args.rows)]
+    save_many(rows)
+    batch = rows[: args.batch]
+    ids = [item.id for item in batch]
+
+    def save_each():
+        for item in batch:
+            save(item)
+
+    def get_each():
+        for item_id in ids:
+            get(item_id)
+
+    report(
+        f"Writing and reading {args.batch} rows ({args.iterations} iterations)",
+        {
+            "save() per row": measure(save_each, args.iterations, warmup=2),
+            "save_many()": measure(lambda: save_many(batch), args.iterations, warmup=2),
+            "get() per row": measure(get_each, args.iterations, warmup=2),
+            "get_many()": measure(lambda: get_many(ids), args.iterations, warmup=2),
+        },
+    )
+
+    # Same query shape on both sides; only the way the start row is found differs
+    depth = args.rows - args.batch
+    anchor = sorted(rows, key=lambda item: (item.created_at, item.id))[depth - 1]
+    ordered = ${cls}Model.objects.order_by("created_at", "id")
+    after_anchor = ordered.filter(
+        Q(created_at__gt=anchor.created_at) | Q(id__gt=anchor.id), created_at__gte=anchor.created_at
+    )
+    report(
+        f"Fetching a page of {args.batch} at row {depth} ({args.iterations} iterations)",
+        {
+            "OFFSET page": measure(
+                lambda: list(ordered[depth : depth + args.batch]), args.iterations, warmup=2
+            ),
+            "keyset page": measure(
+                lambda: list(after_anchor[: args.batch]), args.iterations, warmup=2
+            ),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
+''')
@@ -0,0 +1,59 @@
+"""
+Checkpoints and progress reports shared by the ``export_users`` and
+``import_users`` management commands.
+
+A checkpoint is a small JSON file naming the command, the data file and the
+position reached. It is replaced after every batch and removed once the
+transfer completes, so running the same command again after an interruption
+continues where the last run stopped.
+"""
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, TextIO
+
+from django.core.management.base import CommandError
+
+
+def format_for(path: Path, fmt: Optional[str]) -> str:
+    """``fmt`` if given, else NDJSON for ``.ndjson``/``.jsonl`` files and CSV otherwise."""
+    return fmt or ("ndjson" if path.suffix in (".ndjson", ".jsonl") else "csv")
+
+
+def load_checkpoint(path: Optional[Path], command: str, data_path: Path) -> Dict[str, Any]:
+    """State saved by an interrupted run of the same command, or an empty dict."""
+    if path is None or not path.exists():
+        return {}
+    state = json.loads(path.read_text())
+    if state.get("command") != command or state.get("path") != str(data_path):
+        raise CommandError(f"{path} belongs to '{state.get('command')} {state.get('path')}'")
+    return state
+
+
+def save_checkpoint(path: Optional[Path], state: Dict[str, Any]) -> None:
+    """Replace the checkpoint atomically, so a crash never leaves half a file."""
+    if path is None:
+        return
+    partial = path.with_name(path.name + ".tmp")
+    partial.write_text(json.dumps(state))
+    os.replace(partial, path)
+
+
+class Progress:
+    """Write the rows transferred and the rate to ``stream``, at most once a second."""
+
+    def __init__(self, stream: TextIO, verb: str, rows: int = 0):
+        self.stream = stream
+        self.verb = verb
+        self.start_rows = rows
+        self.started = time.perf_counter()
+        self._reported = 0.0
+
+    def __call__(self, rows: int, final: bool = False) -> None:
+        now = time.perf_counter()
+        if not final and now - self._reported < 1:
+            return
+        self._reported = now
+        rate = (rows - self.start_rows) / max(now - self.started, 1e-9)
+        self.stream.write(f"{self.verb} {rows:,} users ({rate:,.0f}/s)")
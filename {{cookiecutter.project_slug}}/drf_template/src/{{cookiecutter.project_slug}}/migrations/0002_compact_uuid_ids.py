@@ -0,0 +1,45 @@
+import uuid
+
+from django.db import migrations
+
+import {{cookiecutter.project_slug}}.adapters.driven.persistence.models
+
+
+def ids_to_bytes(apps, schema_editor):
+    """Convert ids SQLite kept as 32 hex characters to 16-byte BLOBs."""
+    connection = schema_editor.connection
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT id FROM users WHERE typeof(id) = 'text'")
+        cursor.executemany(
+            "UPDATE users SET id = %s WHERE id = %s",
+            [(uuid.UUID(hex=user_id).bytes, user_id) for (user_id,) in cursor.fetchall()],
+        )
+
+
+def ids_to_hex(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("UPDATE users SET id = lower(hex(id)) WHERE typeof(id) = 'blob'")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("{{cookiecutter.project_slug}}", "0001_initial"),
+    ]
+
+    operations = [
+        # Only SQLite changes column type; PostgreSQL already has native uuid
+        migrations.AlterField(
+            model_name="usermodel",
+            name="id",
+            field={{cookiecutter.project_slug}}.adapters.driven.persistence.models.CompactUUIDField(
+                primary_key=True, serialize=False
+            ),
+        ),
+        migrations.RunPython(ids_to_bytes, ids_to_hex),
+    ]
@@ -0,0 +1,7 @@
+"""
+Model registry for {{cookiecutter.project_name}}.
+
+Models live in the persistence adapters; they are imported here so Django
+discovers them for the project app.
+"""
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.models import UserModel  # type: ignore # noqa: F401
@@ -0,0 +1,30 @@
+"""
+Test helpers for {{cookiecutter.project_name}}.
+"""
+from contextlib import contextmanager
+from typing import Iterator, Optional, Sequence
+
+from {{cookiecutter.project_slug}}.adapters.driving.middleware.query_count import QueryStats, capture_queries  # type: ignore # noqa: E501
+
+
+@contextmanager
+def assert_max_queries(
+    max_queries: int, using: Optional[Sequence[str]] = None
+) -> Iterator[QueryStats]:
+    """Fail if the block runs more than ``max_queries`` SQL queries.
+
+    Usage::
+
+        with assert_max_queries(2):
+            await repository.get_all()
+    """
+    with capture_queries(using) as stats:
+        yield stats
+
+    if stats.count > max_queries:
+        statements = "\n".join(
+            f"  {times}x {sql}" for sql, times in stats.statements.most_common()
+        )
+        raise AssertionError(
+            f"Expected at most {max_queries} queries, {stats.count} were run:\n{statements}"
+        )
@@ -16,3 +16,11 @@ os.environ.setdefault(
 )
 
 application = get_wsgi_application()
+
+from {{cookiecutter.project_slug}}.dependencies.container import get_container  # type: ignore # noqa: E402,E501
+
+# Loaded by the worker once the server has set its signal handlers: probe
+# readiness and drain on SIGTERM. Tests and management commands never load it.
+container = get_container()
+container.readiness.start_in_thread()
+container.shutdown_coordinator.install()
@@ -0,0 +1,45 @@
+"""
+Shared pytest fixtures for {{cookiecutter.project_name}}.
+"""
+import pytest
+from django.db import router
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.db_router import PrimaryReplicaRouter  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.dependencies.container import get_container  # type: ignore
+from {{cookiecutter.project_slug}}.testing import assert_max_queries as _assert_max_queries  # type: ignore
+
+
+@pytest.fixture
+def assert_max_queries(db):
+    """Hold a block of code to a query budget.
+
+    Usage::
+
+        def test_list_users(assert_max_queries):
+            with assert_max_queries(1):
+                ...
+    """
+    return _assert_max_queries
+
+
+def close_container():
+    """Stop the cached container's event bus and forget the container."""
+    if get_container.cache_info().currsize:
+        get_container().close()
+    get_container.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def fresh_container():
+    """Give every test its own container, so cached entities never outlive a test's rollback."""
+    close_container()
+    yield
+    close_container()
+
+
+@pytest.fixture(autouse=True)
+def reads_on_primary(monkeypatch):
+    """Route every read to "default", the only database tests may query; replicas mirror it."""
+    for database_router in router.routers:
+        if isinstance(database_router, PrimaryReplicaRouter):
+            monkeypatch.setattr(database_router, "replicas", [])
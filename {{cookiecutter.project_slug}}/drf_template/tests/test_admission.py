@@ -0,0 +1,83 @@
+"""
+Admission control tests for {{cookiecutter.project_name}}.
+"""
+import asyncio
+import threading
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from {{cookiecutter.project_slug}}.adapters.driving.middleware.admission import AdaptiveLimiter, AdmissionControlMiddleware  # type: ignore # noqa: E501
+
+
+@pytest.fixture
+def one_slot(settings):
+    settings.ADMISSION_INITIAL_LIMIT = 1
+    settings.ADMISSION_MIN_LIMIT = 1
+    settings.ADMISSION_QUEUE_SIZE = 1
+    settings.ADMISSION_QUEUE_TIMEOUT = 0.2
+
+
+def test_limit_follows_latency():
+    limiter = AdaptiveLimiter(initial_limit=20, min_limit=4, max_limit=30)
+    limiter.in_flight = 20
+    for _ in range(200):
+        limiter.record(0.01)
+    # Grew while busy and fast, up to the maximum
+    assert limiter.limit == 30
+
+    limiter.in_flight = 30
+    for _ in range(50):
+        limiter.record(0.1)
+    assert limiter.min_limit <= limiter.limit < 10
+
+    # A mostly idle worker leaves the limit alone
+    shrunk = limiter.limit
+    limiter.in_flight = 1
+    limiter.record(5.0)
+    assert limiter.limit == shrunk
+
+
+def test_requests_over_the_limit_are_shed_but_health_answers(one_slot):
+    release = threading.Event()
+
+    def view(request):
+        if request.path == "/api/users/":
+            release.wait(5)
+        return HttpResponse("ok")
+
+    middleware = AdmissionControlMiddleware(view)
+    factory = RequestFactory()
+    running = threading.Thread(target=middleware, args=(factory.get("/api/users/"),))
+    running.start()
+    try:
+        while middleware.limiter.in_flight == 0:
+            pass
+        # The queue holds one request: it waits, then gives up
+        response = middleware(factory.get("/api/users/"))
+        assert response.status_code == 503
+        assert response["Retry-After"] == "1"
+        assert middleware(factory.get("/health/")).status_code == 200
+    finally:
+        release.set()
+        running.join()
+    assert middleware.limiter.in_flight == 0
+    assert middleware(factory.get("/api/users/")).status_code == 200
+
+
+def test_queued_requests_are_served_in_turn(one_slot):
+    async def view(request):
+        await asyncio.sleep(0.05)
+        return HttpResponse("ok")
+
+    middleware = AdmissionControlMiddleware(view)
+    factory = RequestFactory()
+
+    async def burst():
+        return await asyncio.gather(*(middleware(factory.get("/api/users/")) for _ in range(3)))
+
+    # One runs, one waits for its slot, one finds the queue full
+    statuses = sorted(response.status_code for response in asyncio.run(burst()))
+    assert statuses == [200, 200, 503]
+    assert middleware.limiter.in_flight == 0
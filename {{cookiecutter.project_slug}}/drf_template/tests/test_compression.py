@@ -0,0 +1,95 @@
+"""
+Response compression tests for {{cookiecutter.project_name}}.
+"""
+import gzip
+import zlib
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+
+from {{cookiecutter.project_slug}}.adapters.driving.api.authentication import TokenUser  # type: ignore
+from {{cookiecutter.project_slug}}.adapters.driving.middleware.compression import CompressionMiddleware, choose_encoding  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.dependencies.container import get_container  # type: ignore
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    client.force_authenticate(TokenUser(id="tests"))
+    return client
+
+
+@pytest.fixture
+def users(api_client):
+    for i in range(50):
+        api_client.post(
+            "/api/users/", {"email": f"user{i}@example.com", "name": f"User {i}"}, format="json"
+        )
+
+
+def test_choose_encoding_follows_weights_then_preference():
+    offered = ["zstd", "br", "gzip"]
+    assert choose_encoding("gzip, deflate, br", offered) == "br"
+    assert choose_encoding("gzip;q=1.0, br;q=0.5", offered) == "gzip"
+    assert choose_encoding("*", offered) == "zstd"
+    assert choose_encoding("*;q=0.1, gzip", offered) == "gzip"
+    assert choose_encoding("gzip;q=0, identity", offered) is None
+    assert choose_encoding("", offered) is None
+
+
+@pytest.mark.django_db
+def test_large_response_is_compressed(api_client, users):
+    plain = api_client.get("/api/users/")
+    assert "Content-Encoding" not in plain
+    assert "Accept-Encoding" in plain["Vary"]
+
+    response = api_client.get("/api/users/", HTTP_ACCEPT_ENCODING="gzip")
+    assert response["Content-Encoding"] == "gzip"
+    assert int(response["Content-Length"]) == len(response.content) < len(plain.content)
+    assert gzip.decompress(response.content) == plain.content
+    # A weak validator, still good for conditional requests
+    assert response["ETag"] == f"W/{plain['ETag']}"
+    assert api_client.get(
+        "/api/users/", HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=response["ETag"]
+    ).status_code == 304
+
+
+@pytest.mark.django_db
+def test_small_response_is_sent_as_is(api_client):
+    response = api_client.get("/api/users/", HTTP_ACCEPT_ENCODING="gzip")
+    assert "Content-Encoding" not in response
+    assert "Accept-Encoding" in response["Vary"]
+
+
+@pytest.mark.django_db
+def test_streamed_export_is_compressed_chunk_by_chunk(api_client, users, monkeypatch):
+    monkeypatch.setattr(get_container().get_user_transfer(), "batch_size", 10)
+    response = api_client.get("/api/users/export/?format=csv", HTTP_ACCEPT_ENCODING="gzip")
+    assert response["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response
+
+    decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+    chunks = [decompressor.decompress(chunk) for chunk in response.streaming_content]
+    # The header, five batches and the end of the stream, each decoded as it arrives
+    assert len(chunks) == 7
+    assert all(chunk.endswith(b"\n") for chunk in chunks[:-1])
+    assert b"".join(chunks).count(b"\n") == 51
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"content_type": "image/png"},
+        {"content_type": "application/zip"},
+        {"headers": {"Content-Encoding": "br"}},
+        {"headers": {"Cache-Control": "no-transform"}},
+    ],
+)
+def test_compressed_or_untransformable_responses_are_skipped(headers):
+    body = b"x" * 10_000
+    middleware = CompressionMiddleware(lambda request: HttpResponse(body, **headers))
+    response = middleware(RequestFactory().get("/", HTTP_ACCEPT_ENCODING="gzip"))
+    assert response.content == body
+    assert response.get("Content-Encoding") == headers.get("headers", {}).get("Content-Encoding")
@@ -0,0 +1,66 @@
+"""
+Conditional GET tests for {{cookiecutter.project_name}}.
+"""
+import pytest
+from rest_framework.test import APIClient
+
+from {{cookiecutter.project_slug}}.adapters.driving.api.authentication import TokenUser  # type: ignore
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    client.force_authenticate(TokenUser(id="tests"))
+    return client
+
+
+@pytest.fixture
+def user(api_client):
+    return api_client.post(
+        "/api/users/", {"email": "ada@example.com", "name": "Ada"}, format="json"
+    ).json()
+
+
+@pytest.mark.django_db
+def test_unchanged_user_is_not_modified(api_client, user, assert_max_queries):
+    url = f"/api/users/{user['id']}/"
+    response = api_client.get(url)
+    etag, last_modified = response["ETag"], response["Last-Modified"]
+
+    with assert_max_queries(1) as stats:
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+    # Only the timestamp was read, not the user
+    assert all("email" not in sql for sql in stats.statements)
+
+    response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_changed_user_is_sent_again(api_client, user):
+    url = f"/api/users/{user['id']}/"
+    etag = api_client.get(url)["ETag"]
+    api_client.patch(url, {"name": "Ada Lovelace"}, format="json")
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+    assert response.json()["name"] == "Ada Lovelace"
+
+    response = api_client.get(
+        "/api/users/00000000-0000-0000-0000-000000000000/", HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_list_is_not_modified_until_a_user_changes(api_client, user):
+    etag = api_client.get("/api/users/")["ETag"]
+    assert api_client.get("/api/users/", HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    api_client.post(f"/api/users/{user['id']}/deactivate/")
+    response = api_client.get("/api/users/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
@@ -0,0 +1,96 @@
+"""
+Primary/replica routing tests for {{cookiecutter.project_name}}.
+"""
+import pytest
+from django.db import OperationalError
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.db_router import (  # type: ignore
+    PrimaryReplicaRouter,
+    start_request,
+)
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.models import UserModel  # type: ignore # noqa: E501
+
+
+class FakeReplicas:
+    """Health check returning a configurable lag, or failing, per alias."""
+
+    def __init__(self):
+        self.lag = {}
+        self.down = set()
+        self.checks = 0
+
+    def __call__(self, alias):
+        self.checks += 1
+        if alias in self.down:
+            raise OperationalError("connection refused")
+        return self.lag.get(alias, 0.0)
+
+
+@pytest.fixture(autouse=True)
+def fresh_request():
+    start_request()
+    yield
+    start_request()
+
+
+@pytest.fixture
+def replicas():
+    return FakeReplicas()
+
+
+@pytest.fixture
+def router(replicas):
+    return PrimaryReplicaRouter(
+        ["replica_1", "replica_2"], max_lag=5, check_interval=0, check=replicas
+    )
+
+
+def test_reads_rotate_over_replicas(router):
+    reads = [router.db_for_read(UserModel) for _ in range(4)]
+    assert reads == ["replica_1", "replica_2", "replica_1", "replica_2"]
+
+
+def test_reads_after_a_write_stay_on_primary(router):
+    assert router.db_for_write(UserModel) == "default"
+    assert router.db_for_read(UserModel) == "default"
+
+    start_request()
+    assert router.db_for_read(UserModel) != "default"
+
+
+def test_requests_that_may_write_start_on_primary(router):
+    start_request("PATCH")
+    assert router.db_for_read(UserModel) == "default"
+
+    start_request("GET")
+    assert router.db_for_read(UserModel) != "default"
+
+
+def test_lagging_and_failing_replicas_get_no_reads(router, replicas):
+    replicas.lag["replica_1"] = 30
+    assert {router.db_for_read(UserModel) for _ in range(4)} == {"replica_2"}
+
+    replicas.down.add("replica_2")
+    assert router.db_for_read(UserModel) == "default"
+
+    replicas.lag.clear()
+    replicas.down.clear()
+    assert {router.db_for_read(UserModel) for _ in range(4)} == {"replica_1", "replica_2"}
+
+
+def test_health_is_checked_once_per_interval(replicas):
+    router = PrimaryReplicaRouter(["replica_1"], check_interval=60, check=replicas)
+    for _ in range(10):
+        router.db_for_read(UserModel)
+    assert replicas.checks == 1
+
+
+def test_without_replicas_everything_uses_primary(replicas):
+    router = PrimaryReplicaRouter([], check=replicas)
+    assert router.db_for_read(UserModel) == "default"
+    assert replicas.checks == 0
+
+
+def test_only_primary_is_migrated(router):
+    assert router.allow_migrate("default", "{{cookiecutter.project_slug}}")
+    assert not router.allow_migrate("replica_1", "{{cookiecutter.project_slug}}")
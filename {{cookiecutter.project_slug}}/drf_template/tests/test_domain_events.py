@@ -0,0 +1,158 @@
+"""
+Domain event tests for {{cookiecutter.project_name}}: events recorded by the
+User entity, published by the service and delivered by the in-process bus.
+"""
+import asyncio
+
+import pytest
+
+from {{cookiecutter.project_slug}}.adapters.driven.events.event_bus import InProcessEventBus  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore
+from {{cookiecutter.project_slug}}.domain.events.base import DomainEvent  # type: ignore
+from {{cookiecutter.project_slug}}.domain.events.user_events import (  # type: ignore
+    UserCreated,
+    UserDeactivated,
+    UserRenamed,
+)
+from {{cookiecutter.project_slug}}.domain.services.user_service import UserService  # type: ignore
+
+
+class InMemoryUserRepository:
+    def __init__(self):
+        self.users = {}
+
+    async def save(self, user):
+        self.users[user.id] = user
+        return user
+
+    async def get_by_id(self, user_id):
+        return self.users.get(user_id)
+
+    async def get_by_email(self, email):
+        return next((user for user in self.users.values() if user.email == email), None)
+
+
+class Recorder:
+    """Subscriber that records every batch it receives."""
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    async def __call__(self, events):
+        self.batches.append(list(events))
+        if self.fail:
+            raise RuntimeError("subscriber failed")
+
+
+def test_user_records_events_until_pulled():
+    user = User.create(email="ada@example.com", name="Ada")
+    user.update_name("Ada Lovelace")
+    user.deactivate()
+
+    events = user.pull_events()
+    assert [type(event) for event in events] == [UserCreated, UserRenamed, UserDeactivated]
+    assert events[1] == UserRenamed(
+        user_id=user.id,
+        old_name="Ada",
+        new_name="Ada Lovelace",
+        occurred_at=events[1].occurred_at,
+    )
+    assert user.pull_events() == []
+
+
+def test_service_publishes_after_save():
+    async def scenario():
+        repository = InMemoryUserRepository()
+        bus = InProcessEventBus()
+        seen = []
+
+        async def check_saved(events):
+            for event in events:
+                seen.append(await repository.get_by_id(event.user_id) is not None)
+
+        bus.subscribe(UserCreated, check_saved, awaited=True)
+        await UserService(repository, bus).create_user("ada@example.com", "Ada")
+        return seen
+
+    assert asyncio.run(scenario()) == [True]
+
+
+def test_fire_and_forget_is_batched():
+    async def scenario():
+        bus = InProcessEventBus(batch_size=3)
+        recorder = Recorder()
+        bus.subscribe(DomainEvent, recorder)
+        await bus.start()
+        # Published from one task without yielding, so the dispatcher sees all of them
+        for _ in range(7):
+            await bus.publish([DomainEvent()])
+        assert recorder.batches == []
+        await bus.stop()
+        return recorder.batches
+
+    assert [len(batch) for batch in asyncio.run(scenario())] == [3, 3, 1]
+
+
+def test_awaited_subscriber_runs_before_publish_returns():
+    async def scenario():
+        bus = InProcessEventBus()
+        recorder = Recorder()
+        bus.subscribe(UserCreated, recorder, awaited=True)
+        user = User.create(email="ada@example.com", name="Ada")
+        await bus.publish(user.pull_events())
+        return recorder.batches
+
+    [[event]] = asyncio.run(scenario())
+    assert event.email == "ada@example.com"
+
+
+def test_awaited_subscriber_errors_reach_the_caller():
+    async def scenario():
+        bus = InProcessEventBus()
+        bus.subscribe(DomainEvent, Recorder(fail=True), awaited=True)
+        await bus.publish([DomainEvent()])
+
+    with pytest.raises(RuntimeError, match="subscriber failed"):
+        asyncio.run(scenario())
+
+
+def test_fire_and_forget_errors_are_logged(caplog):
+    async def scenario():
+        bus = InProcessEventBus()
+        failing, recorder = Recorder(fail=True), Recorder()
+        bus.subscribe(DomainEvent, failing)
+        bus.subscribe(DomainEvent, recorder)
+        await bus.start()
+        await bus.publish([DomainEvent()])
+        await bus.stop()
+        return recorder.batches
+
+    assert len(asyncio.run(scenario())) == 1
+    assert "Event subscriber" in caplog.text
+
+
+def test_full_queue_drops_events():
+    async def scenario():
+        bus = InProcessEventBus(max_queue_size=2)
+        recorder = Recorder()
+        bus.subscribe(DomainEvent, recorder)
+        await bus.start()
+        await bus.publish([DomainEvent() for _ in range(5)])
+        await bus.stop()
+        return bus.dropped, recorder.batches
+
+    dropped, batches = asyncio.run(scenario())
+    assert dropped == 3
+    assert sum(len(batch) for batch in batches) == 2
+
+
+def test_background_thread_delivers_sync_publishes():
+    bus = InProcessEventBus()
+    recorder = Recorder()
+    bus.subscribe(DomainEvent, recorder)
+    bus.start_in_thread()
+    asyncio.run(bus.publish([DomainEvent(), DomainEvent()]))
+    bus.stop_thread()
+
+    assert [len(batch) for batch in recorder.batches] == [2]
@@ -0,0 +1,74 @@
+"""
+Logging pipeline tests for {{cookiecutter.project_name}}.
+"""
+import io
+import json
+import logging
+
+import pytest
+
+from {{cookiecutter.project_slug}}.config.logging_config import (  # type: ignore
+    configure_logging,
+    request_id,
+    stop_logging,
+)
+
+logger = logging.getLogger("test_logging")
+
+
+@pytest.fixture
+def stream():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield io.StringIO()
+    stop_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def lines(stream):
+    """This module's records; background threads may log to the root logger too."""
+    stop_logging()
+    entries = [json.loads(line) for line in stream.getvalue().splitlines()]
+    return [entry for entry in entries if entry["logger"] == logger.name]
+
+
+def test_records_are_written_as_json_with_extra_fields(stream):
+    configure_logging(stream=stream)
+    token = request_id.set("abc123")
+    try:
+        logger.info("Sent %s", "email", extra={"email": "a@example.com"})
+    finally:
+        request_id.reset(token)
+
+    [entry] = lines(stream)
+    assert entry["message"] == "Sent email"
+    assert entry["level"] == "INFO"
+    assert entry["request_id"] == "abc123"
+    assert entry["email"] == "a@example.com"
+
+
+def test_debug_records_are_sampled(stream):
+    configure_logging(level="DEBUG", debug_sample_rate=0, stream=stream)
+    logger.debug("Dropped")
+    logger.info("Kept")
+
+    assert [entry["message"] for entry in lines(stream)] == ["Kept"]
+
+
+def test_full_queue_drops_records_instead_of_waiting(stream):
+    handler = configure_logging(queue_size=0, stream=stream)
+    logger.info("Dropped")
+
+    assert handler.dropped == 1
+    assert lines(stream) == []
+
+
+def test_request_id_is_echoed(client):
+    response = client.get("/health/", HTTP_X_REQUEST_ID="req-42")
+    assert response["X-Request-ID"] == "req-42"
+
+
+def test_invalid_request_id_is_replaced(client):
+    response = client.get("/health/", HTTP_X_REQUEST_ID="bad id\n")
+    assert response["X-Request-ID"] not in ("", "bad id\n")
@@ -0,0 +1,71 @@
+"""
+MessagePack content negotiation tests for {{cookiecutter.project_name}}.
+"""
+from datetime import datetime
+from uuid import UUID
+
+import msgpack
+import pytest
+from rest_framework.test import APIClient
+
+from {{cookiecutter.project_slug}}.adapters.driving.api.authentication import TokenUser  # type: ignore
+from {{cookiecutter.project_slug}}.adapters.driving.msgpack.renderers import MessagePackRenderer  # type: ignore # noqa: E501
+
+MSGPACK = "application/msgpack"
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    client.force_authenticate(TokenUser(id="tests"))
+    return client
+
+
+def post(client, url, data):
+    return client.post(url, msgpack.packb(data), content_type=MSGPACK, HTTP_ACCEPT=MSGPACK)
+
+
+def unpack(response):
+    assert response["Content-Type"] == MSGPACK
+    return msgpack.unpackb(response.content, timestamp=3)
+
+
+@pytest.mark.django_db
+def test_users_round_trip_in_msgpack(api_client):
+    created = unpack(post(api_client, "/api/users/", {"email": "ada@example.com", "name": "Ada"}))
+    user_id = UUID(bytes=created["id"])
+    assert created["email"] == "ada@example.com"
+    assert isinstance(created["created_at"], datetime)
+
+    url = f"/api/users/{user_id}/"
+    response = api_client.get(url, HTTP_ACCEPT=MSGPACK)
+    assert "Accept" in response["Vary"]
+    fetched = unpack(response)
+    as_json = api_client.get(url).json()
+    assert fetched["id"] == created["id"] and as_json["id"] == str(user_id)
+    assert fetched["updated_at"] == datetime.fromisoformat(as_json["updated_at"])
+    assert len(response.content) < len(api_client.get(url).content)
+
+    # Ids are 16 raw bytes in request bodies too
+    changed = unpack(post(api_client, "/api/users/batch/deactivate/", {"ids": [user_id.bytes]}))
+    assert changed == {"ids": [user_id.bytes], "count": 1}
+    listed = unpack(api_client.get("/api/users/", HTTP_ACCEPT=MSGPACK))
+    assert [user["is_active"] for user in listed["results"]] == [False]
+
+
+@pytest.mark.django_db
+def test_msgpack_errors(api_client):
+    response = post(api_client, "/api/users/", {"email": "not an email"})
+    assert response.status_code == 400
+    assert set(unpack(response)) == {"email", "name"}
+
+    response = api_client.post(
+        "/api/users/", b"\xc1", content_type=MSGPACK, HTTP_ACCEPT=MSGPACK
+    )
+    assert response.status_code == 400
+    assert unpack(response) == {"detail": "MessagePack parse error"}
+
+
+def test_unknown_types_are_not_packed_as_lists():
+    with pytest.raises(TypeError):
+        MessagePackRenderer().render({"letters": iter("ab")})
@@ -0,0 +1,47 @@
+"""
+Query budgets for the persistence adapters of {{cookiecutter.project_name}}.
+"""
+import pytest
+from asgiref.sync import async_to_sync
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_repository import DjangoUserRepository  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.middleware.query_count import QUERY_COUNT_HEADER  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore
+
+
+@pytest.fixture
+def repository():
+    return DjangoUserRepository()
+
+
+@pytest.fixture
+def users(db, repository):
+    created = [User.create(email=f"user{i}@example.com", name=f"User {i}") for i in range(10)]
+    for user in created:
+        async_to_sync(repository.save)(user)
+    return created
+
+
+def test_get_all_runs_one_query(repository, users, assert_max_queries):
+    with assert_max_queries(1):
+        result = async_to_sync(repository.get_all)()
+    assert len(result) == len(users)
+
+
+def test_get_by_id_runs_one_query(repository, users, assert_max_queries):
+    with assert_max_queries(1):
+        result = async_to_sync(repository.get_by_id)(users[0].id)
+    assert result == users[0]
+
+
+def test_budget_violation_is_reported(repository, users, assert_max_queries):
+    with pytest.raises(AssertionError, match="Expected at most 1 queries"):
+        with assert_max_queries(1):
+            for user in users[:3]:
+                async_to_sync(repository.get_by_id)(user.id)
+
+
+def test_query_count_header_in_debug(client, settings, db):
+    settings.DEBUG = True
+    response = client.get("/health/")
+    assert response[QUERY_COUNT_HEADER] == "0"
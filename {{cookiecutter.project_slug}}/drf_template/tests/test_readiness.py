@@ -0,0 +1,80 @@
+"""
+Readiness endpoint tests for {{cookiecutter.project_name}}.
+"""
+import threading
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import Client
+
+from {{cookiecutter.project_slug}}.adapters.driving.readiness import ReadinessMonitor, database_probe  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.shutdown import Lifespan  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.dependencies.container import get_container  # type: ignore
+
+
+def failing_probe():
+    raise ConnectionError("unreachable")
+
+
+def test_failing_or_stale_checks_are_not_ready():
+    monitor = ReadinessMonitor(
+        {"fine": lambda: (True, {}), "slow": lambda: (False, {"latency_ms": 900})}
+    )
+    assert not monitor.ready
+
+    monitor.check()
+    assert not monitor.ready
+    assert monitor.status()["checks"]["slow"] == {"ok": False, "latency_ms": 900}
+
+    monitor.probes = {"fine": lambda: (True, {}), "broken": failing_probe}
+    monitor.check()
+    assert monitor.status()["checks"]["broken"] == {"ok": False, "error": "unreachable"}
+
+    monitor.probes = {"fine": lambda: (True, {})}
+    monitor.check()
+    assert monitor.ready
+    # A result nobody refreshed for three intervals no longer counts
+    monitor.checked_at -= 3 * monitor.interval
+    assert not monitor.ready
+
+
+@pytest.mark.django_db
+def test_ready_serves_the_last_check(monkeypatch):
+    monitor = ReadinessMonitor({"database": database_probe("default", max_latency=5.0)})
+    monkeypatch.setattr(get_container(), "readiness", monitor)
+    client = Client()
+
+    response = client.get("/ready/")
+    assert response.status_code == 503
+    assert response.json() == {"status": "not ready", "checks": {}}
+
+    monitor.check()
+    response = client.get("/ready/")
+    assert response.status_code == 200
+    assert response.json()["checks"]["database"]["ok"] is True
+
+
+def probing():
+    return any(thread.name == "readiness" for thread in threading.enumerate())
+
+
+def test_probes_start_with_the_server_not_the_container():
+    container = get_container()
+    # Tests and management commands build the container too; they never probe
+    assert not probing()
+
+    messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message["type"])
+
+    async_to_sync(Lifespan(None, container.shutdown_coordinator))({"type": "lifespan"}, receive, send)
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert probing()
+
+    container.readiness.stop_thread()
+    assert not probing()
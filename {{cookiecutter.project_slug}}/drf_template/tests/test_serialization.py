@@ -0,0 +1,60 @@
+"""
+orjson renderer and entity serializer tests for {{cookiecutter.project_name}}.
+"""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+
+from {{cookiecutter.project_slug}}.adapters.driving.api.renderers import ORJSONRenderer  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.api.serializers import EntitySerializer, UserSerializer  # type: ignore # noqa: E501
+
+USER = SimpleNamespace(
+    id=UUID("0192f1c4-0000-7000-8000-000000000001"),
+    email="ada@example.com",
+    name="Ada",
+    is_active=True,
+    created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    updated_at=datetime(2024, 1, 2, tzinfo=timezone.utc),
+)
+
+
+def test_entities_are_serialized_field_by_field():
+    assert UserSerializer(USER).data["id"] == USER.id
+    assert [row["name"] for row in UserSerializer([USER, USER], many=True).data] == ["Ada"] * 2
+
+    class NameSerializer(EntitySerializer):
+        fields = ("name",)
+
+    class NothingSerializer(EntitySerializer):
+        pass
+
+    assert NameSerializer(USER).data == {"name": "Ada"}
+    assert NothingSerializer(USER).data == {}
+    assert NothingSerializer([USER], many=True).data == [{}]
+
+
+@pytest.mark.parametrize(
+    "media_type, context, indented",
+    [
+        ("application/json", {}, False),
+        ("application/json; indent=4", {}, True),
+        ("application/json; indent=0", {"indent": 4}, False),
+        ("application/json; indent=wide", {}, False),
+        # Only an indent parameter counts, not the word anywhere in the header
+        ("application/json; profile=indent", {}, False),
+        ("application/json", {"indent": 4}, True),
+    ],
+)
+def test_indent_is_read_from_the_media_type_parameter(media_type, context, indented):
+    rendered = ORJSONRenderer().render({"id": USER.id}, media_type, context)
+    assert (b"\n" in rendered) is indented
+    assert rendered.replace(b"\n", b"").replace(b" ", b"") == (
+        b'{"id":"0192f1c4-0000-7000-8000-000000000001"}'
+    )
+
+
+def test_unknown_types_are_not_rendered_as_lists():
+    with pytest.raises(TypeError):
+        ORJSONRenderer().render({"letters": iter("ab")})
@@ -0,0 +1,138 @@
+"""
+Shared cache tests for {{cookiecutter.project_name}}: the binary user encoding
+and the cross-process ``SharedMemoryCache``.
+"""
+import multiprocessing
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from {{cookiecutter.project_slug}}.adapters.driven.cache.shared_cache import SharedMemoryCache  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.cache.user_codec import (  # type: ignore
+    UserCacheCodec,
+    decode_user,
+    encode_user,
+)
+from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "cache")
+
+
+def make_user(**fields):
+    defaults = {"id": uuid4(), "email": "ada@example.com", "name": "Ada Lovelace"}
+    return User(**{**defaults, **fields})
+
+
+def test_user_round_trips():
+    user = make_user(is_active=False, name="Ada Lovelace ✓")
+    data = encode_user(user)
+
+    assert len(data) < 80
+    decoded = decode_user(data)
+    assert decoded == user
+    assert decoded.created_at.tzinfo is not None
+
+
+def test_naive_timestamps_stay_naive():
+    user = make_user(
+        created_at=datetime(2024, 5, 1, 12, 30, 0, 123456), updated_at=datetime(2024, 5, 2)
+    )
+    assert decode_user(encode_user(user)) == user
+
+
+def test_codec_round_trips_users_and_ids():
+    codec = UserCacheCodec()
+    user = make_user()
+
+    assert codec.loads(codec.dumps(user)) == user
+    assert codec.loads(codec.dumps(user.id)) == user.id
+    assert codec.key(("user", user.id)) == b"user:" + user.id.bytes
+    assert codec.key(("user-email", user.email)) == b"user-email:ada@example.com"
+
+
+def test_entries_are_shared_between_handles(path):
+    writer = SharedMemoryCache(path, ttl=30, codec=UserCacheCodec())
+    reader = SharedMemoryCache(path, ttl=30, codec=UserCacheCodec())
+    user = make_user()
+
+    writer.set(("user", user.id), user)
+    assert reader.get(("user", user.id)) == user
+
+    writer.delete(("user", user.id))
+    assert reader.get(("user", user.id)) is None
+    assert (reader.hits, reader.misses) == (1, 1)
+
+
+def test_entries_expire(path):
+    clock = FakeClock()
+    cache = SharedMemoryCache(path, ttl=10, clock=clock)
+    cache.set(b"key", b"value")
+
+    clock.now += 9
+    assert cache.get(b"key") == b"value"
+    clock.now += 2
+    assert cache.get(b"key") is None
+
+
+def test_full_bucket_evicts_least_recently_used(path):
+    clock = FakeClock()
+    cache = SharedMemoryCache(path, ttl=60, max_entries=4, ways=4, clock=clock)
+    for i in range(4):
+        clock.now += 1
+        cache.set(b"key%d" % i, b"%d" % i)
+    clock.now += 1
+    cache.get(b"key0")
+
+    clock.now += 1
+    cache.set(b"key4", b"4")
+
+    assert len(cache) == 4
+    assert cache.get(b"key1") is None
+    assert [cache.get(b"key%d" % i) for i in (0, 2, 3, 4)] == [b"0", b"2", b"3", b"4"]
+
+
+def test_oversized_values_are_not_cached(path):
+    cache = SharedMemoryCache(path, ttl=60, slot_size=64)
+    cache.set(b"key", b"small")
+    cache.set(b"key", b"x" * 100)
+
+    assert cache.get(b"key") is None
+
+
+def test_layout_is_part_of_the_file_name(path):
+    small = SharedMemoryCache(path, ttl=60, max_entries=8)
+    large = SharedMemoryCache(path, ttl=60, max_entries=800)
+    small.set(b"key", b"value")
+
+    assert small.path != large.path
+    assert large.get(b"key") is None
+
+
+def _write_from_child(path, count):
+    cache = SharedMemoryCache(path, ttl=60)
+    for i in range(count):
+        cache.set(b"key%d" % i, b"value%d" % i)
+    cache.close()
+
+
+def test_writes_are_visible_across_processes(path):
+    cache = SharedMemoryCache(path, ttl=60)
+    context = multiprocessing.get_context("spawn")
+    child = context.Process(target=_write_from_child, args=(path, 50))
+    child.start()
+    child.join(30)
+
+    assert child.exitcode == 0
+    assert all(cache.get(b"key%d" % i) == b"value%d" % i for i in range(50))
@@ -0,0 +1,92 @@
+"""
+Graceful shutdown tests for {{cookiecutter.project_name}}.
+"""
+import os
+import signal
+import threading
+import time
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from {{cookiecutter.project_slug}}.adapters.driving.middleware.drain import DrainMiddleware  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.dependencies.container import get_container  # type: ignore
+
+
+@pytest.fixture
+def server_stops(settings):
+    """Stand in for the server's SIGTERM handler; record when it is called."""
+    settings.SHUTDOWN_DRAIN_DELAY = 0.3
+    settings.SHUTDOWN_TIMEOUT = 5
+    stops = []
+    original = signal.signal(signal.SIGTERM, lambda signum, frame: stops.append(signum))
+    yield stops
+    signal.signal(signal.SIGTERM, original)
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_sigterm_during_load_drains_before_the_server_stops(server_stops):
+    release = threading.Event()
+
+    def view(request):
+        if request.path == "/api/users/":
+            release.wait(5)
+        return HttpResponse("ok")
+
+    coordinator = get_container().shutdown_coordinator
+    coordinator.install()
+    middleware = DrainMiddleware(view)
+    factory = RequestFactory()
+    responses = []
+    load = [
+        threading.Thread(target=lambda: responses.append(middleware(factory.get("/api/users/"))))
+        for _ in range(4)
+    ]
+    for thread in load:
+        thread.start()
+    wait_until(lambda: coordinator.in_flight == 4)
+
+    os.kill(os.getpid(), signal.SIGTERM)
+    wait_until(lambda: coordinator.draining)
+    assert get_container().readiness.status()["status"] == "draining"
+    # Load balancers have not caught up yet: new requests are still served
+    assert middleware(factory.get("/health/")).status_code == 200
+    assert server_stops == []
+
+    # After the drain delay the server stops, and requests in flight carry on
+    wait_until(lambda: server_stops)
+    assert server_stops == [signal.SIGTERM]
+    assert coordinator.in_flight == 4
+
+    release.set()
+    assert coordinator.wait_for_requests()
+    for thread in load:
+        thread.join()
+    assert [response.status_code for response in responses] == [200] * 4
+
+
+def test_second_sigterm_and_deadline_cut_the_drain_short(server_stops, settings):
+    settings.SHUTDOWN_DRAIN_DELAY = 60
+    settings.SHUTDOWN_TIMEOUT = 0.5
+    coordinator = get_container().shutdown_coordinator
+    coordinator.install()
+
+    os.kill(os.getpid(), signal.SIGTERM)
+    wait_until(lambda: coordinator.draining)
+    os.kill(os.getpid(), signal.SIGTERM)
+    assert server_stops == [signal.SIGTERM]
+
+    # A request that outlives the deadline is not waited for
+    coordinator.enter()
+    assert not coordinator.wait_for_requests()
+    coordinator.leave()
+    # The server already has the signal; it is not sent twice
+    time.sleep(0.1)
+    assert server_stops == [signal.SIGTERM]
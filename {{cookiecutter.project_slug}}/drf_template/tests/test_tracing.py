@@ -0,0 +1,121 @@
+"""
+Tracing tests for {{cookiecutter.project_name}}.
+"""
+import pytest
+from asgiref.sync import async_to_sync
+from rest_framework.test import APIClient
+
+from {{cookiecutter.project_slug}}.adapters.driven.tracing.exporters import InMemoryExporter  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.tracing.tracer import Tracer  # type: ignore
+from {{cookiecutter.project_slug}}.adapters.driving.api.authentication import TokenUser  # type: ignore
+from {{cookiecutter.project_slug}}.dependencies.container import get_container  # type: ignore
+from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore
+from {{cookiecutter.project_slug}}.domain.services.user_service import UserService  # type: ignore
+
+TRACEPARENT = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-{flags}"
+
+
+class InMemoryUserRepository:
+    def __init__(self):
+        self.users = {}
+
+    async def save(self, user):
+        self.users[user.id] = user
+        return user
+
+    async def get_by_id(self, user_id):
+        return self.users.get(user_id)
+
+
+@pytest.fixture
+def exporter():
+    return InMemoryExporter()
+
+
+@pytest.fixture
+def tracer(exporter):
+    return Tracer(exporter, sample_rate=1.0)
+
+
+@pytest.fixture
+def service(tracer):
+    repository = tracer.instrument(InMemoryUserRepository(), "UserRepository")
+    return tracer.instrument(UserService(repository), "UserService")
+
+
+def get_user(tracer, service, user_id, traceparent=""):
+    async def request():
+        with tracer.trace("GET", traceparent):
+            return await service.get_user(user_id)
+
+    return async_to_sync(request)()
+
+
+def test_spans_nest_from_request_to_repository(tracer, exporter, service):
+    user = User.create(email="ada@example.com", name="Ada")
+    async_to_sync(service.user_repository.save)(user)
+
+    assert get_user(tracer, service, user.id) == user
+    repository_span, service_span, request_span = exporter.spans
+    assert [span.name for span in exporter.spans] == [
+        "UserRepository.get_by_id",
+        "UserService.get_user",
+        "GET",
+    ]
+    assert repository_span.parent_id == service_span.span_id
+    assert service_span.parent_id == request_span.span_id
+    assert request_span.parent_id is None
+    assert len({span.trace_id for span in exporter.spans}) == 1
+
+
+def test_unsampled_requests_record_nothing(exporter, service):
+    tracer = Tracer(exporter, sample_rate=0.0)
+    get_user(tracer, service, User.create(email="ada@example.com", name="Ada").id)
+    assert exporter.spans == []
+
+
+def test_incoming_traceparent_decides_sampling(tracer, exporter, service):
+    user_id = User.create(email="ada@example.com", name="Ada").id
+
+    get_user(tracer, service, user_id, TRACEPARENT.format(flags="00"))
+    assert exporter.spans == []
+
+    get_user(tracer, service, user_id, TRACEPARENT.format(flags="01"))
+    request_span = exporter.spans[-1]
+    assert request_span.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+    assert request_span.parent_id == "00f067aa0ba902b7"
+
+
+def test_errors_are_recorded(tracer, exporter):
+    with pytest.raises(ValueError):
+        with tracer.trace("GET"):
+            with tracer.span("failing"):
+                raise ValueError("boom")
+    assert all("boom" in span.error for span in exporter.spans)
+
+
+def test_sampling_off_leaves_services_unwrapped():
+    assert isinstance(get_container().user_service, UserService)
+
+
+@pytest.mark.django_db
+def test_api_requests_are_traced(settings):
+    settings.TRACE_SAMPLE_RATE = 1.0
+    settings.TRACE_EXPORTER = "memory"
+    client = APIClient()
+    client.force_authenticate(TokenUser(id="tests"))
+
+    response = client.post(
+        "/api/users/", {"email": "ada@example.com", "name": "Ada"}, format="json"
+    )
+    assert response.status_code == 201
+
+    spans = get_container().tracer.exporter.spans
+    assert [span.name for span in spans] == [
+        "UserRepository.get_by_email",
+        "UserRepository.save",
+        "UserService.create_user",
+        "POST api/users/",
+    ]
+    assert spans[-1].attributes["status"] == 201
+    assert spans[-1].attributes["request_id"] == response["X-Request-ID"]
@@ -0,0 +1,118 @@
+"""
+User API tests for {{cookiecutter.project_name}}, covering the async views and
+their sync facade.
+"""
+import pytest
+from asgiref.sync import async_to_sync
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence import user_repository  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.api import views  # type: ignore
+from {{cookiecutter.project_slug}}.adapters.driving.api.authentication import TokenUser  # type: ignore
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    client.force_authenticate(TokenUser(id="tests"))
+    return client
+
+
+@pytest.mark.django_db
+def test_create_and_list_users(api_client):
+    response = api_client.post(
+        "/api/users/", {"email": "ada@example.com", "name": "Ada"}, format="json"
+    )
+    assert response.status_code == 201
+
+    response = api_client.get("/api/users/")
+    assert response.status_code == 200
+    assert [user["email"] for user in response.json()["results"]] == ["ada@example.com"]
+
+
+@pytest.mark.django_db
+def test_listing_loads_only_the_requested_page(api_client, monkeypatch, assert_max_queries):
+    emails = [f"user{index}@example.com" for index in range(5)]
+    for email in emails:
+        api_client.post("/api/users/", {"email": email, "name": "User"}, format="json")
+    monkeypatch.setattr(views.UserListView.pagination_class, "page_size", 2)
+
+    # One aggregate for the validators, one LIMIT/OFFSET query for the page
+    with assert_max_queries(2) as stats:
+        response = api_client.get("/api/users/", {"page": 2})
+    assert [user["email"] for user in response.json()["results"]] == emails[2:4]
+    assert response.json()["count"] == 5
+    assert response.json()["next"].endswith("page=3")
+    assert any("LIMIT" in sql for sql in stats.statements)
+
+    response = api_client.get("/api/users/", {"page": "last"})
+    assert [user["email"] for user in response.json()["results"]] == emails[4:]
+    assert api_client.get("/api/users/", {"page": 4}).status_code == 404
+
+
+@pytest.mark.django_db
+def test_duplicate_email_is_rejected(api_client):
+    payload = {"email": "ada@example.com", "name": "Ada"}
+    api_client.post("/api/users/", payload, format="json")
+    response = api_client.post("/api/users/", payload, format="json")
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_deactivate_user(api_client):
+    user = api_client.post(
+        "/api/users/", {"email": "ada@example.com", "name": "Ada"}, format="json"
+    ).json()
+    response = api_client.post(f"/api/users/{user['id']}/deactivate/")
+    assert response.status_code == 200
+    assert response.json()["is_active"] is False
+
+
+@pytest.mark.django_db
+def test_batch_deactivate_returns_changed_users(api_client, monkeypatch):
+    # Small chunks, so the SQLite path splits the ids across statements
+    monkeypatch.setattr(user_repository, "SET_ACTIVE_CHUNK_SIZE", 2)
+    ids = [
+        api_client.post(
+            "/api/users/", {"email": f"user{index}@example.com", "name": "User"}, format="json"
+        ).json()["id"]
+        for index in range(5)
+    ]
+    api_client.post(f"/api/users/{ids[0]}/deactivate/")
+
+    unknown = "00000000-0000-0000-0000-000000000000"
+    response = api_client.post(
+        "/api/users/batch/deactivate/", {"ids": ids + [ids[1], unknown]}, format="json"
+    )
+    assert response.status_code == 200
+    assert sorted(response.json()["ids"]) == sorted(ids[1:])
+    assert response.json()["count"] == 4
+
+    users = api_client.get("/api/users/").json()["results"]
+    assert not any(user["is_active"] for user in users)
+
+    response = api_client.post("/api/users/batch/activate/", {"ids": ids[:2]}, format="json")
+    assert sorted(response.json()["ids"]) == sorted(ids[:2])
+
+
+@pytest.mark.django_db
+def test_batch_needs_ids(api_client):
+    response = api_client.post("/api/users/batch/activate/", {"ids": []}, format="json")
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_async_view_awaits_service():
+    factory = APIRequestFactory()
+    create = factory.post("/api/users/", {"email": "ada@example.com", "name": "Ada"}, format="json")
+    force_authenticate(create, TokenUser(id="tests"))
+    response = async_to_sync(views.UserListView.as_view())(create)
+    assert response.status_code == 201
+
+    detail = factory.get(f"/api/users/{response.data['id']}/")
+    force_authenticate(detail, TokenUser(id="tests"))
+    response = async_to_sync(views.UserDetailView.as_view())(
+        detail, user_id=response.data["id"]
+    )
+    assert response.status_code == 200
+    assert response.data["name"] == "Ada"
@@ -0,0 +1,35 @@
+"""
+Time-ordered user ids and their storage for {{cookiecutter.project_name}}.
+"""
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.models import UserModel  # type: ignore
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_repository import DjangoUserRepository  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.domain.entities.ids import uuid7  # type: ignore
+from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore
+
+
+def test_uuid7_ids_are_ordered_by_creation():
+    ids = [uuid7() for _ in range(10_000)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    assert {(user_id.version, user_id.variant) for user_id in ids} == {(7, "specified in RFC 4122")}
+
+
+@pytest.mark.django_db
+def test_ids_round_trip_through_compact_storage():
+    repository = DjangoUserRepository()
+    users = [User.create(email=f"user{i}@example.com", name=f"User {i}") for i in range(3)]
+    for user in users:
+        async_to_sync(repository.save)(user)
+
+    assert async_to_sync(repository.get_by_id)(users[1].id) == users[1]
+    assert list(UserModel.objects.order_by("id").values_list("id", flat=True)) == [
+        user.id for user in users
+    ]
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT DISTINCT typeof(id), length(id) FROM users")
+            assert cursor.fetchall() == [("blob", 16)]
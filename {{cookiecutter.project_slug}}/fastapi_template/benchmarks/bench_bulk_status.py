@@ -0,0 +1,77 @@
+"""
+Deactivating many users: one ``deactivate_user`` call per id versus one
+``deactivate_users`` call for all of them.
+
+The per-user loop reads and writes every user (two statements each); the bulk
+call runs one set-based ``UPDATE ... RETURNING id``, in chunks on SQLite.
+Both go through ``UserService`` and the SQL repository against ``DATABASE_URL``;
+the benchmark's users are deleted afterwards.
+
+Run with::
+
+    uv run python benchmarks/bench_bulk_status.py [--users 2000]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.database import Database  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.replicas import ReplicaRouter  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_repository import UPSERT, SQLUserRepository, create_schema  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.config.settings import settings  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.domain.services.user_service import UserService  # type: ignore # noqa: E402,E501
+
+
+async def run(users: int, database_url: str) -> None:
+    database = Database(database_url)
+    await database.connect()
+    await create_schema(database)
+    service = UserService(SQLUserRepository(ReplicaRouter(database, [])))
+
+    now = datetime.now(timezone.utc)
+    rows = [
+        (uuid4(), f"bench-{index}@example.com", "Bench", True, now, now) for index in range(users)
+    ]
+    await database.executemany(UPSERT, rows)
+    ids = [row[0] for row in rows]
+
+    try:
+        start = time.perf_counter()
+        for user_id in ids:
+            await service.deactivate_user(user_id)
+        loop_seconds = time.perf_counter() - start
+
+        await service.activate_users(ids)
+
+        start = time.perf_counter()
+        changed = await service.deactivate_users(ids)
+        bulk_seconds = time.perf_counter() - start
+        assert len(changed) == users
+    finally:
+        await database.execute("DELETE FROM users WHERE email LIKE 'bench-%@example.com'")
+        await database.close()
+
+    print(f"\nDeactivating {users} users")
+    print(f"{'case':<12}{'seconds':>10}{'users/s':>12}")
+    for case, seconds in (("per-user", loop_seconds), ("bulk", bulk_seconds)):
+        print(f"{case:<12}{seconds:>10.3f}{users / seconds:>12.0f}")
+    print(f"bulk is {loop_seconds / bulk_seconds:.0f}x faster")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=2_000)
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    args = parser.parse_args()
+    asyncio.run(run(args.users, args.database_url))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Small in-process load test for {{cookiecutter.project_name}}.
+
+Concurrent clients send requests to the ASGI app through httpx's
+``ASGITransport``, so the numbers cover the application stack (routing,
+validation, serialization, persistence, caching) without socket noise. The
+database is a fresh SQLite file unless ``DATABASE_URL`` is set.
+
+Cases:
+
+* health: ``GET /health``, no I/O;
+* user: ``GET /api/v1/users/<id>``, a repository read.
+
+Run with::
+
+    uv run python benchmarks/bench_load.py [--requests 2000] [--concurrency 32] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+_db_dir = tempfile.TemporaryDirectory()
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{Path(_db_dir.name) / 'bench.db'}")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import httpx  # noqa: E402
+
+from {{cookiecutter.project_slug}}.main import app  # type: ignore # noqa: E402
+
+
+async def run_case(client: httpx.AsyncClient, url: str, requests: int, concurrency: int) -> Dict[str, float]:
+    """Send ``requests`` GETs from ``concurrency`` clients; return throughput and latency."""
+    samples: List[float] = []
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await client.get(url)
+            samples.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    samples.sort()
+    return {
+        "requests_per_s": requests / elapsed,
+        "mean_ms": statistics.fmean(samples),
+        "p99_ms": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+    }
+
+
+async def bench(requests: int, concurrency: int) -> Dict[str, Dict[str, float]]:
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            response = await client.post(
+                "/api/v1/users/", json={"email": "bench@example.com", "name": "Bench"}
+            )
+            response.raise_for_status()
+            user_id = response.json()["id"]
+
+            cases = {"health": "/health", "user": f"/api/v1/users/{user_id}"}
+            results = {}
+            for name, url in cases.items():
+                # Warm up connections, caches and lazily built serializers
+                await run_case(client, url, min(requests, 200), concurrency)
+                results[name] = await run_case(client, url, requests, concurrency)
+            return results
+
+
+def run(coroutine):
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+    # The same event loop uvicorn runs this profile on
+    import uvloop
+
+    return uvloop.run(coroutine)
+{%- else %}
+    return asyncio.run(coroutine)
+{%- endif %}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = run(bench(args.requests, args.concurrency))
+    if args.json:
+        print(json.dumps(results))
+        return
+
+    print(f"\nLoad ({args.requests} requests, concurrency {args.concurrency})")
+    print(f"{'case':<12}{'req/s':>12}{'mean ms':>12}{'p99 ms':>12}")
+    for name, stats in results.items():
+        print(
+            f"{name:<12}{stats['requests_per_s']:>12.0f}{stats['mean_ms']:>12.2f}{stats['p99_ms']:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Payload size and encode/decode time of user lists in JSON versus MessagePack.
+
+Encodes ``GET /users`` bodies of ``--users`` users as the JSON route does,
+through its pydantic response model, and as the MessagePack route does,
+packing the entities directly. Decoding is timed as a calling service would
+do it, up to validated ``UserListResponse`` models, so both formats end with
+the same ``UUID`` and ``datetime`` objects.
+
+Run with::
+
+    uv run python benchmarks/bench_msgpack.py [--users 1 100 1000 10000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from {{cookiecutter.project_slug}}.adapters.driving.api.schemas import UserListResponse, UserResponse  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.adapters.driving.msgpack.codec import packb, unpackb, user_fields  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore # noqa: E402,E501
+
+
+def make_users(count: int):
+    return [User.create(email=f"user{i}@example.com", name=f"User {i}") for i in range(count)]
+
+
+def per_call(func: Callable[[], object], seconds: float) -> float:
+    """Call ``func`` for about ``seconds``; return microseconds per call."""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds and calls >= 3:
+            return elapsed / calls * 1_000_000
+
+
+def encode_json(users) -> bytes:
+    return UserListResponse(
+        users=[UserResponse.model_validate(user) for user in users], count=len(users)
+    ).model_dump_json().encode()
+
+
+def encode_msgpack(users) -> bytes:
+    return packb({"users": [user_fields(user) for user in users], "count": len(users)})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, nargs="+", default=[1, 100, 1000, 10000])
+    parser.add_argument("--seconds", type=float, default=0.5, help="time per case")
+    args = parser.parse_args()
+
+    cases = {
+        "json": (encode_json, UserListResponse.model_validate_json),
+        "msgpack": (encode_msgpack, lambda body: UserListResponse.model_validate(unpackb(body))),
+    }
+    print(f"{'users':>8}  {'format':<10}{'bytes':>12}{'encode us':>12}{'decode us':>12}")
+    for count in args.users:
+        users = make_users(count)
+        for name, (encode, decode) in cases.items():
+            body = encode(users)
+            assert decode(body).count == count
+            encode_us = per_call(lambda: encode(users), args.seconds)
+            decode_us = per_call(lambda: decode(body), args.seconds)
+            print(f"{count:>8}  {name:<10}{len(body):>12}{encode_us:>12.1f}{decode_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
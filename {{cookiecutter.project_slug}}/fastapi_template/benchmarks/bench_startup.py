@@ -0,0 +1,89 @@
+"""
+Time to first request of {{cookiecutter.project_name}} container images.
+
+Starts each image ``--runs`` times in a fresh container and times from
+``docker run`` to the first ``200`` from the health endpoint, which is what a
+new replica costs during a deploy or a scale-out. Each container starts with
+an empty writable layer, so bytecode not shipped in the image is compiled on
+every start. Reports the image size too, which bounds the pull time.
+
+Build the images to compare first, e.g. the Dockerfile before and after a
+change::
+
+    git show HEAD~1:Dockerfile | docker build -t {{cookiecutter.project_slug}}:before -f - .
+    docker build -t {{cookiecutter.project_slug}}:after .
+
+Run with::
+
+    uv run python benchmarks/bench_startup.py {{cookiecutter.project_slug}}:before {{cookiecutter.project_slug}}:after [--runs 5]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import time
+import urllib.error
+import urllib.request
+from typing import List
+
+
+def image_size(image: str) -> int:
+    """Uncompressed size of ``image`` in bytes."""
+    output = subprocess.run(
+        ["docker", "image", "inspect", image], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)[0]["Size"]
+
+
+def time_to_first_request(image: str, path: str, env: List[str], timeout: float) -> float:
+    """Start ``image`` and return seconds until ``path`` first answers 200."""
+    options = [arg for pair in env for arg in ("-e", pair)]
+    start = time.perf_counter()
+    container = subprocess.run(
+        ["docker", "run", "-d", "--rm", "-p", "127.0.0.1::8000", *options, image],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+    try:
+        port = subprocess.run(
+            ["docker", "port", container, "8000"], check=True, capture_output=True, text=True
+        ).stdout.split()[0].rsplit(":", 1)[1]
+        url = f"http://127.0.0.1:{port}{path}"
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError):
+                pass
+            time.sleep(0.01)
+        raise TimeoutError(f"{image} did not answer {path} within {timeout}s")
+    finally:
+        subprocess.run(["docker", "rm", "-f", container], capture_output=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("images", nargs="+")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--path", default="/health")
+    parser.add_argument("--env", action="append", default=[], help="KEY=VALUE for the containers")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    print(f"{'image':<40}{'MB':>8}{'median s':>10}{'min s':>8}{'max s':>8}")
+    for image in args.images:
+        samples = [
+            time_to_first_request(image, args.path, args.env, args.timeout)
+            for _ in range(args.runs)
+        ]
+        print(
+            f"{image:<40}{image_size(image) / 1e6:>8.0f}{statistics.median(samples):>10.2f}"
+            f"{min(samples):>8.2f}{max(samples):>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Bulk export and import throughput of ``UserTransfer``.
+
+Seeds ``--users`` users into a scratch database, exports them to CSV and
+NDJSON files, then imports each file into an empty database. Memory stays flat
+because only ``--batch-size`` rows are held at a time.
+
+Run with::
+
+    uv run python benchmarks/bench_transfer.py [--users 1000000] [--batch-size 10000]
+
+``--database-url`` points the source at another database (for example
+PostgreSQL, where COPY does the work); it must not hold the users table already.
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.database import Database  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.replicas import ReplicaRouter  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_repository import UPSERT, create_schema  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_transfer import FORMATS, UserTransfer, header  # type: ignore # noqa: E402,E501
+
+
+async def open_transfer(url: str, batch_size: int):
+    database = Database(url, min_size=1, max_size=2)
+    await database.connect()
+    await create_schema(database)
+    return database, UserTransfer(ReplicaRouter(database), batch_size)
+
+
+async def read_chunks(path: Path):
+    with open(path, "rb") as source:
+        while chunk := source.read(64 * 1024):
+            yield chunk
+
+
+async def run(users: int, batch_size: int, source_url: str, workdir: Path) -> None:
+    database, transfer = await open_transfer(source_url, batch_size)
+    now = datetime.now(timezone.utc)
+    for start in range(0, users, 50_000):
+        await database.executemany(
+            UPSERT,
+            [
+                (uuid4(), f"bench-{index}@example.com", f"Bench {index}", True, now, now)
+                for index in range(start, min(start + 50_000, users))
+            ],
+        )
+
+    results = []
+    for fmt in FORMATS:
+        path = workdir / f"users.{fmt}"
+        started = time.perf_counter()
+        with open(path, "wb") as output:
+            output.write(header(fmt))
+            async for data, _, _ in transfer.export(fmt):
+                output.write(data)
+        results.append((f"export {fmt}", time.perf_counter() - started))
+    await database.close()
+
+    for fmt in FORMATS:
+        target, transfer = await open_transfer(f"sqlite:///{workdir}/import_{fmt}.db", batch_size)
+        started = time.perf_counter()
+        imported = await transfer.import_stream(fmt, read_chunks(workdir / f"users.{fmt}"))
+        results.append((f"import {fmt}", time.perf_counter() - started))
+        await target.close()
+        assert imported == users
+
+    print(f"\nTransferring {users:,} users in batches of {batch_size:,}")
+    print(f"{'case':<16}{'seconds':>10}{'rows/s':>12}{'rows/min':>14}")
+    for case, seconds in results:
+        print(f"{case:<16}{seconds:>10.2f}{users / seconds:>12,.0f}{users / seconds * 60:>14,.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--database-url", default="")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as workdir:
+        source_url = args.database_url or f"sqlite:///{workdir}/source.db"
+        asyncio.run(run(args.users, args.batch_size, source_url, Path(workdir)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Primary key locality of random (version 4) versus time-ordered (version 7) ids.
+
+Inserts ``--rows`` users in batches through the repository's upsert, with ids
+from ``uuid4`` or the entity's ``uuid7``, then reports insert throughput and
+the size of the primary key index. Random ids land on random index pages: once
+the index outgrows the cache, every batch reads pages from all over it and
+leaves them half full after splitting. Time-ordered ids append to the last page.
+
+Run with::
+
+{%- if cookiecutter.db_type == "postgresql" %}
+
+    uv run python benchmarks/bench_uuid.py --database-url postgresql://... [--rows 10000000]
+
+The database should be a scratch one: its users table is dropped and recreated
+for each case.
+{%- else %}
+
+    uv run python benchmarks/bench_uuid.py [--rows 10000000] [--batch-size 10000]
+
+Each case writes a scratch SQLite file.
+{%- endif %}
+"""
+
+import argparse
+import asyncio
+import sys
+{%- if cookiecutter.db_type != "postgresql" %}
+import tempfile
+{%- endif %}
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.database import Database  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_repository import UPSERT, create_schema  # type: ignore # noqa: E402,E501
+from {{cookiecutter.project_slug}}.domain.entities.ids import uuid7  # type: ignore # noqa: E402,E501
+
+GENERATORS = {"uuid4": uuid4, "uuid7": uuid7}
+{% if cookiecutter.db_type == "postgresql" %}
+INDEX_SIZE = "SELECT pg_relation_size('users_pkey') AS size"
+{%- else %}
+# dbstat reports every page of the implicit index behind the primary key
+INDEX_SIZE = "SELECT sum(pgsize) AS size FROM dbstat WHERE name = 'sqlite_autoindex_users_1'"
+{%- endif %}
+
+
+async def insert_users(url: str, generate, rows: int, batch_size: int):
+    """Insert ``rows`` users with ids from ``generate``.
+
+    Returns the seconds spent inserting, the rows per second of the last batch
+    and the size of the primary key index in bytes.
+    """
+    database = Database(url, min_size=1, max_size=2)
+    await database.connect()
+    await database.execute("DROP TABLE IF EXISTS users")
+    await create_schema(database)
+    now = datetime.now(timezone.utc)
+    seconds = last_rate = 0.0
+    for start in range(0, rows, batch_size):
+        batch = [
+            (generate(), f"bench-{index}@example.com", "Bench", True, now, now)
+            for index in range(start, min(start + batch_size, rows))
+        ]
+        started = time.perf_counter()
+        await database.executemany(UPSERT, batch)
+        elapsed = time.perf_counter() - started
+        seconds += elapsed
+        last_rate = len(batch) / elapsed
+    index_size = (await database.fetchrow(INDEX_SIZE))["size"]
+    await database.close()
+    return seconds, last_rate, index_size
+
+
+async def run(rows: int, batch_size: int, target: str) -> None:
+    """Run every case on ``target``: the database URL, or a directory for SQLite files."""
+    results = []
+    for name, generate in GENERATORS.items():
+{%- if cookiecutter.db_type == "postgresql" %}
+        url = target
+{%- else %}
+        url = f"sqlite:///{target}/{name}.db"
+{%- endif %}
+        results.append((name, *await insert_users(url, generate, rows, batch_size)))
+
+    print(f"\nInserting {rows:,} users in batches of {batch_size:,}")
+    print(
+        f"{'ids':<8}{'seconds':>10}{'rows/s':>12}{'last batch/s':>14}{'index MB':>10}{'B/row':>7}"
+    )
+    for name, seconds, last_rate, index_size in results:
+        print(
+            f"{name:<8}{seconds:>10.1f}{rows / seconds:>12,.0f}{last_rate:>14,.0f}"
+            f"{index_size / 2**20:>10.1f}{index_size / rows:>7.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+{%- if cookiecutter.db_type == "postgresql" %}
+    parser.add_argument("--database-url", required=True)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.batch_size, args.database_url))
+{%- else %}
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as workdir:
+        asyncio.run(run(args.rows, args.batch_size, workdir))
+{%- endif %}
+
+
+if __name__ == "__main__":
+    main()
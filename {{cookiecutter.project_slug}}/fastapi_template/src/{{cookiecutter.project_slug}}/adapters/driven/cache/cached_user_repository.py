@@ -0,0 +1,99 @@
+"""
+Read-through caching decorator for the user repository of {{cookiecutter.project_name}}.
+"""
+from dataclasses import replace
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple, Union
+from uuid import UUID
+
+from {{cookiecutter.project_slug}}.adapters.driven.cache.shared_cache import SharedMemoryCache  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.cache.ttl_cache import TTLCache  # type: ignore
+from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore
+
+
+class CachedUserRepository:
+    """Serve ``get_by_id`` and ``get_by_email`` from a cache.
+
+    Writes go to the wrapped repository first and then refresh the cache, so
+    this process never reads its own stale writes. With a per-process
+    ``TTLCache`` other processes may serve an entry for up to the cache TTL
+    after it changes; with a ``SharedMemoryCache`` every worker on the host
+    sees the refresh at once. Callers get copies, so mutating a returned entity
+    never changes the cached one.
+    """
+
+    def __init__(self, repository, cache: Union[TTLCache, SharedMemoryCache]):
+        """Wrap ``repository`` with ``cache``."""
+        self.repository = repository
+        self.cache = cache
+
+    def _remember(self, user: User) -> None:
+        self.cache.set(("user", user.id), replace(user))
+        self.cache.set(("user-email", user.email), user.id)
+
+    def _cached(self, user_id: UUID) -> Optional[User]:
+        user = self.cache.get(("user", user_id))
+        return replace(user) if user is not None else None
+
+    async def save(self, user: User) -> User:
+        """Save through to the repository and refresh the cache."""
+        previous = self._cached(user.id)
+        saved = await self.repository.save(user)
+        if previous is not None and previous.email != saved.email:
+            self.cache.delete(("user-email", previous.email))
+        self._remember(saved)
+        return saved
+
+    async def get_by_id(self, user_id: UUID) -> Optional[User]:
+        """Get a user, from the cache when possible."""
+        user = self._cached(user_id)
+        if user is None:
+            user = await self.repository.get_by_id(user_id)
+            if user is not None:
+                self._remember(user)
+        return user
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get a user by email, from the cache when possible."""
+        user_id = self.cache.get(("user-email", email))
+        if user_id is not None:
+            user = await self.get_by_id(user_id)
+            if user is not None and user.email == email:
+                return user
+        user = await self.repository.get_by_email(email)
+        if user is not None:
+            self._remember(user)
+        return user
+
+    async def get_all(self) -> List[User]:
+        """List users; listings are not cached."""
+        return await self.repository.get_all()
+
+    async def get_updated_at(self, user_id: UUID) -> Optional[datetime]:
+        """Get when a user last changed, from the cached user when there is one."""
+        user = self.cache.get(("user", user_id))
+        if user is not None:
+            return user.updated_at
+        return await self.repository.get_updated_at(user_id)
+
+    async def get_all_updated_at(self) -> Tuple[int, Optional[datetime]]:
+        """Count users and get their latest change; listings are not cached."""
+        return await self.repository.get_all_updated_at()
+
+    async def delete(self, user_id: UUID) -> bool:
+        """Delete through to the repository and evict the user."""
+        user = self._cached(user_id)
+        deleted = await self.repository.delete(user_id)
+        self.cache.delete(("user", user_id))
+        if user is not None:
+            self.cache.delete(("user-email", user.email))
+        return deleted
+
+    async def set_active(
+        self, user_ids: Sequence[UUID], is_active: bool, updated_at: datetime
+    ) -> List[UUID]:
+        """Update through to the repository and evict the users that changed."""
+        changed = await self.repository.set_active(user_ids, is_active, updated_at)
+        for user_id in changed:
+            self.cache.delete(("user", user_id))
+        return changed
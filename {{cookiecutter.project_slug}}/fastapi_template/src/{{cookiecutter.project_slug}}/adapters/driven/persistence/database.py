@@ -0,0 +1,382 @@
+"""
+Database access for {{cookiecutter.project_name}}.
+
+SQL is written with ``?`` placeholders and translated to the driver's style.
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+Connections come from a pool opened at startup, so queries never pay for
+connecting and the event loop is never blocked by the driver.
+{%- else %}
+Each call opens a short-lived connection in a worker thread. Generate the
+project with ``performance_profile=high_throughput`` for a pooled async driver.
+{%- endif %}
+"""
+{%- if cookiecutter.performance_profile == "high_throughput" and cookiecutter.db_type == "postgresql" %}
+import io
+from functools import lru_cache
+from typing import Any, Iterable, List, Mapping, Optional, Sequence
+
+import asyncpg
+
+
+@lru_cache(maxsize=256)
+def _numbered(sql: str) -> str:
+    """Rewrite ``?`` placeholders as asyncpg's ``$1``, ``$2``..."""
+    parts = sql.split("?")
+    return parts[0] + "".join(f"${index}{part}" for index, part in enumerate(parts[1:], 1))
+
+
+class Database:
+    """asyncpg connection pool."""
+
+    def __init__(self, url: str, min_size: int = 2, max_size: int = 10):
+        """Configure the pool; nothing connects until ``connect``."""
+        self.url = url
+        self.min_size = min_size
+        self.max_size = max_size
+        self._pool: Optional[asyncpg.Pool] = None
+
+    async def connect(self) -> None:
+        """Open the pool."""
+        self._pool = await asyncpg.create_pool(
+            self.url, min_size=self.min_size, max_size=self.max_size
+        )
+
+    async def close(self) -> None:
+        """Close every pooled connection."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    async def execute(self, sql: str, *args: Any) -> int:
+        """Run a statement and return the number of affected rows."""
+        status = await self._pool.execute(_numbered(sql), *args)
+        # asyncpg returns the command tag, e.g. "DELETE 1"
+        count = status.rsplit(" ", 1)[-1]
+        return int(count) if count.isdigit() else 0
+
+    async def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> None:
+        """Run a statement once per parameter row, in one round trip."""
+        await self._pool.executemany(_numbered(sql), rows)
+
+    async def fetch(self, sql: str, *args: Any) -> List[Mapping[str, Any]]:
+        """Return all rows of a query."""
+        return await self._pool.fetch(_numbered(sql), *args)
+
+    async def fetchrow(self, sql: str, *args: Any) -> Optional[Mapping[str, Any]]:
+        """Return the first row of a query, or ``None``."""
+        return await self._pool.fetchrow(_numbered(sql), *args)
+
+    async def copy_out(self, sql: str, *args: Any) -> bytes:
+        """Return the rows of a query as CSV, read with ``COPY ... TO STDOUT``."""
+        output = io.BytesIO()
+        await self._pool.copy_from_query(_numbered(sql), *args, output=output, format="csv")
+        return output.getvalue()
+
+    async def copy_in(
+        self,
+        table: str,
+        columns: Sequence[str],
+        records: Iterable[Sequence[Any]],
+        before: Sequence[str] = (),
+        after: Sequence[str] = (),
+    ) -> None:
+        """Load ``records`` into ``table`` with ``COPY ... FROM STDIN``.
+
+        The ``before`` and ``after`` statements run in the same transaction, e.g.
+        to create a staging table and merge it into the real one.
+        """
+        async with self._pool.acquire() as connection, connection.transaction():
+            for statement in before:
+                await connection.execute(statement)
+            await connection.copy_records_to_table(table, records=records, columns=columns)
+            for statement in after:
+                await connection.execute(statement)
+{%- elif cookiecutter.performance_profile == "high_throughput" %}
+import asyncio
+import sqlite3
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterable, List, Mapping, Optional, Sequence
+from uuid import UUID
+
+import aiosqlite
+
+# UUIDs are stored as 16-byte BLOBs rather than 36 characters of text; BLOBs
+# compare bytewise, so ids keep their UUID order in the primary key index
+sqlite3.register_adapter(UUID, lambda value: value.bytes)
+sqlite3.register_adapter(datetime, datetime.isoformat)
+
+
+def sqlite_path(url: str) -> str:
+    """Extract the file path from a ``sqlite:///`` URL."""
+    return url.removeprefix("sqlite:///")
+
+
+class Database:
+    """Pool of aiosqlite connections in WAL mode.
+
+    WAL lets readers proceed while a writer commits, so a small pool serves
+    concurrent requests instead of queueing them on one connection.
+    """
+
+    def __init__(self, url: str, min_size: int = 2, max_size: int = 10):
+        """Configure the pool; nothing connects until ``connect``."""
+        self.path = sqlite_path(url)
+        self.min_size = min_size
+        self.max_size = max_size
+        self._connections: List[aiosqlite.Connection] = []
+        self._idle: "asyncio.Queue[aiosqlite.Connection]" = asyncio.Queue()
+
+    async def connect(self) -> None:
+        """Open ``max_size`` connections."""
+        for _ in range(self.max_size):
+            connection = await aiosqlite.connect(self.path)
+            connection.row_factory = aiosqlite.Row
+            await connection.execute("PRAGMA journal_mode=WAL")
+            await connection.execute("PRAGMA synchronous=NORMAL")
+            self._connections.append(connection)
+            self._idle.put_nowait(connection)
+
+    async def close(self) -> None:
+        """Close every pooled connection."""
+        for connection in self._connections:
+            await connection.close()
+        self._connections.clear()
+        self._idle = asyncio.Queue()
+
+    @asynccontextmanager
+    async def _acquire(self) -> AsyncIterator[aiosqlite.Connection]:
+        connection = await self._idle.get()
+        try:
+            yield connection
+        finally:
+            self._idle.put_nowait(connection)
+
+    async def execute(self, sql: str, *args: Any) -> int:
+        """Run a statement, commit it and return the number of affected rows."""
+        async with self._acquire() as connection:
+            cursor = await connection.execute(sql, args)
+            await connection.commit()
+            return cursor.rowcount
+
+    async def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> None:
+        """Run a statement once per parameter row in one transaction."""
+        async with self._acquire() as connection:
+            await connection.executemany(sql, rows)
+            await connection.commit()
+
+    async def fetch(self, sql: str, *args: Any) -> List[Mapping[str, Any]]:
+        """Return all rows of a query, committing writes such as ``RETURNING``."""
+        async with self._acquire() as connection:
+            async with connection.execute(sql, args) as cursor:
+                rows = list(await cursor.fetchall())
+            if connection.in_transaction:
+                await connection.commit()
+            return rows
+
+    async def fetchrow(self, sql: str, *args: Any) -> Optional[Mapping[str, Any]]:
+        """Return the first row of a query, or ``None``."""
+        rows = await self.fetch(sql, *args)
+        return rows[0] if rows else None
+{%- elif cookiecutter.db_type == "postgresql" %}
+import asyncio
+import csv
+import io
+from typing import Any, Iterable, List, Mapping, Optional, Sequence
+
+import psycopg2
+from psycopg2.extras import RealDictCursor, register_uuid
+
+register_uuid()
+
+
+class CSVStream:
+    """Read-only file of ``rows`` as quoted CSV, encoded as ``COPY`` reads it.
+
+    Only about one ``read`` worth of text is held at a time, so a load never
+    holds the whole CSV as well as its records.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]]):
+        self._rows = iter(rows)
+        self._buffer = io.StringIO()
+        # Quoting every value keeps empty strings apart from NULL
+        self._writer = csv.writer(self._buffer, quoting=csv.QUOTE_ALL)
+
+    def read(self, size: int = -1) -> str:
+        """Return up to ``size`` characters, or all that are left if ``size`` is negative."""
+        while size < 0 or self._buffer.tell() < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._writer.writerow(row)
+        data, rest = self._buffer.getvalue(), ""
+        if 0 <= size < len(data):
+            data, rest = data[:size], data[size:]
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._buffer.write(rest)
+        return data
+
+
+class Database:
+    """psycopg2 access with one connection per call."""
+
+    def __init__(self, url: str, min_size: int = 2, max_size: int = 10):
+        """Store the connection URL; pool sizes are unused in this profile."""
+        self.url = url
+
+    async def connect(self) -> None:
+        """Nothing to open; connections are made per call."""
+
+    async def close(self) -> None:
+        """Nothing to close; connections are made per call."""
+
+    def _run(self, sql: str, args: Sequence[Any], many: bool = False, fetch: Optional[str] = None):
+        connection = psycopg2.connect(self.url)
+        try:
+            with connection, connection.cursor(cursor_factory=RealDictCursor) as cursor:
+                sql = sql.replace("?", "%s")
+                if many:
+                    cursor.executemany(sql, args)
+                else:
+                    cursor.execute(sql, args)
+                if fetch == "all":
+                    return cursor.fetchall()
+                if fetch == "one":
+                    return cursor.fetchone()
+                return cursor.rowcount
+        finally:
+            connection.close()
+
+    def _copy_out(self, sql: str, args: Sequence[Any]) -> bytes:
+        connection = psycopg2.connect(self.url)
+        try:
+            with connection, connection.cursor() as cursor:
+                query = cursor.mogrify(sql.replace("?", "%s"), args).decode()
+                output = io.BytesIO()
+                cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT csv)", output)
+                return output.getvalue()
+        finally:
+            connection.close()
+
+    def _copy_in(
+        self,
+        table: str,
+        columns: Sequence[str],
+        records: Iterable[Sequence[Any]],
+        before: Sequence[str],
+        after: Sequence[str],
+    ) -> None:
+        connection = psycopg2.connect(self.url)
+        try:
+            with connection, connection.cursor() as cursor:
+                for statement in before:
+                    cursor.execute(statement)
+                cursor.copy_expert(
+                    f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                    CSVStream(records),
+                )
+                for statement in after:
+                    cursor.execute(statement)
+        finally:
+            connection.close()
+
+    async def execute(self, sql: str, *args: Any) -> int:
+        """Run a statement, commit it and return the number of affected rows."""
+        return await asyncio.to_thread(self._run, sql, args)
+
+    async def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> None:
+        """Run a statement once per parameter row in one transaction."""
+        await asyncio.to_thread(self._run, sql, list(rows), True)
+
+    async def fetch(self, sql: str, *args: Any) -> List[Mapping[str, Any]]:
+        """Return all rows of a query."""
+        return await asyncio.to_thread(self._run, sql, args, False, "all")
+
+    async def fetchrow(self, sql: str, *args: Any) -> Optional[Mapping[str, Any]]:
+        """Return the first row of a query, or ``None``."""
+        return await asyncio.to_thread(self._run, sql, args, False, "one")
+
+    async def copy_out(self, sql: str, *args: Any) -> bytes:
+        """Return the rows of a query as CSV, read with ``COPY ... TO STDOUT``."""
+        return await asyncio.to_thread(self._copy_out, sql, args)
+
+    async def copy_in(
+        self,
+        table: str,
+        columns: Sequence[str],
+        records: Iterable[Sequence[Any]],
+        before: Sequence[str] = (),
+        after: Sequence[str] = (),
+    ) -> None:
+        """Load ``records`` into ``table`` with ``COPY ... FROM STDIN``.
+
+        The ``before`` and ``after`` statements run in the same transaction, e.g.
+        to create a staging table and merge it into the real one.
+        """
+        await asyncio.to_thread(self._copy_in, table, columns, records, before, after)
+{%- else %}
+import asyncio
+import sqlite3
+from datetime import datetime
+from typing import Any, Iterable, List, Mapping, Optional, Sequence
+from uuid import UUID
+
+# UUIDs are stored as 16-byte BLOBs rather than 36 characters of text; BLOBs
+# compare bytewise, so ids keep their UUID order in the primary key index
+sqlite3.register_adapter(UUID, lambda value: value.bytes)
+sqlite3.register_adapter(datetime, datetime.isoformat)
+
+
+def sqlite_path(url: str) -> str:
+    """Extract the file path from a ``sqlite:///`` URL."""
+    return url.removeprefix("sqlite:///")
+
+
+class Database:
+    """sqlite3 access with one connection per call."""
+
+    def __init__(self, url: str, min_size: int = 2, max_size: int = 10):
+        """Store the database path; pool sizes are unused in this profile."""
+        self.path = sqlite_path(url)
+
+    async def connect(self) -> None:
+        """Nothing to open; connections are made per call."""
+
+    async def close(self) -> None:
+        """Nothing to close; connections are made per call."""
+
+    def _run(self, sql: str, args: Sequence[Any], many: bool = False, fetch: Optional[str] = None):
+        connection = sqlite3.connect(self.path)
+        connection.row_factory = sqlite3.Row
+        try:
+            with connection:
+                if many:
+                    cursor = connection.executemany(sql, args)
+                else:
+                    cursor = connection.execute(sql, args)
+                if fetch == "all":
+                    return cursor.fetchall()
+                if fetch == "one":
+                    return cursor.fetchone()
+                return cursor.rowcount
+        finally:
+            connection.close()
+
+    async def execute(self, sql: str, *args: Any) -> int:
+        """Run a statement, commit it and return the number of affected rows."""
+        return await asyncio.to_thread(self._run, sql, args)
+
+    async def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> None:
+        """Run a statement once per parameter row in one transaction."""
+        await asyncio.to_thread(self._run, sql, list(rows), True)
+
+    async def fetch(self, sql: str, *args: Any) -> List[Mapping[str, Any]]:
+        """Return all rows of a query."""
+        return await asyncio.to_thread(self._run, sql, args, False, "all")
+
+    async def fetchrow(self, sql: str, *args: Any) -> Optional[Mapping[str, Any]]:
+        """Return the first row of a query, or ``None``."""
+        return await asyncio.to_thread(self._run, sql, args, False, "one")
+{%- endif %}
@@ -0,0 +1,181 @@
+"""
+Durable job table for {{cookiecutter.project_name}}.
+
+Jobs are claimed with a lease: a claimed row is ``running`` until
+``locked_until``, after which any process may claim it again. A worker that
+dies mid-job therefore delays the job by at most one lease instead of losing it,
+and several processes can share one table without a broker.
+"""
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Tuple
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.database import Database  # type: ignore # noqa: E501
+{% if cookiecutter.db_type == "postgresql" %}
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS jobs (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        status TEXT NOT NULL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        run_at DOUBLE PRECISION NOT NULL,
+        locked_until DOUBLE PRECISION,
+        last_error TEXT,
+        created_at DOUBLE PRECISION NOT NULL,
+        updated_at DOUBLE PRECISION NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS jobs_due_idx ON jobs (name, status, run_at)",
+]
+
+# SKIP LOCKED lets concurrent pollers claim disjoint rows without waiting
+CLAIM_LOCK = "FOR UPDATE SKIP LOCKED"
+{%- else %}
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS jobs (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        status TEXT NOT NULL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        run_at REAL NOT NULL,
+        locked_until REAL,
+        last_error TEXT,
+        created_at REAL NOT NULL,
+        updated_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS jobs_due_idx ON jobs (name, status, run_at)",
+]
+
+# SQLite runs one writer at a time, so the claiming UPDATE is already exclusive
+CLAIM_LOCK = ""
+{%- endif %}
+
+CLAIM = f"""
+    UPDATE jobs
+    SET status = 'running', attempts = attempts + 1, locked_until = ?, updated_at = ?
+    WHERE id IN (
+        SELECT id FROM jobs
+        WHERE name = ?
+          AND ((status = 'queued' AND run_at <= ?) OR (status = 'running' AND locked_until < ?))
+        ORDER BY run_at
+        LIMIT ?
+        {CLAIM_LOCK}
+    )
+    RETURNING id, payload, attempts
+"""
+
+
+@dataclass
+class StoredJob:
+    """A claimed job row."""
+
+    id: str
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    attempts: int
+
+
+async def create_job_schema(database: Database) -> None:
+    """Create the jobs table if it does not exist."""
+    for statement in SCHEMA:
+        await database.execute(statement)
+
+
+class JobStore:
+    """Job rows in the application database; arguments are stored as JSON."""
+
+    def __init__(self, database: Database, lease_seconds: float = 300.0):
+        """Initialize the store with a database handle and claim lease."""
+        self.database = database
+        self.lease_seconds = lease_seconds
+
+    async def add(
+        self, job_id: str, name: str, args: Iterable[Any], kwargs: Dict[str, Any], run_at: float
+    ) -> None:
+        """Queue a job to run at ``run_at`` (epoch seconds)."""
+        now = time.time()
+        payload = json.dumps({"args": list(args), "kwargs": kwargs})
+        await self.database.execute(
+            "INSERT INTO jobs (id, name, payload, status, run_at, created_at, updated_at)"
+            " VALUES (?, ?, ?, 'queued', ?, ?, ?)",
+            job_id,
+            name,
+            payload,
+            run_at,
+            now,
+            now,
+        )
+
+    async def claim(self, name: str, limit: int) -> List[StoredJob]:
+        """Lease up to ``limit`` due jobs of one type to this process."""
+        now = time.time()
+        rows = await self.database.fetch(
+            CLAIM, now + self.lease_seconds, now, name, now, now, limit
+        )
+        jobs = []
+        for row in rows:
+            payload = json.loads(row["payload"])
+            jobs.append(
+                StoredJob(row["id"], tuple(payload["args"]), payload["kwargs"], row["attempts"])
+            )
+        return jobs
+
+    async def complete(self, job_id: str) -> None:
+        """Mark a job done."""
+        await self.database.execute(
+            "UPDATE jobs SET status = 'done', locked_until = NULL, updated_at = ? WHERE id = ?",
+            time.time(),
+            job_id,
+        )
+
+    async def retry(self, job_id: str, error: str, run_at: float) -> None:
+        """Put a failed job back in the queue to run again at ``run_at``."""
+        await self.database.execute(
+            "UPDATE jobs SET status = 'queued', locked_until = NULL, last_error = ?,"
+            " run_at = ?, updated_at = ? WHERE id = ?",
+            error,
+            run_at,
+            time.time(),
+            job_id,
+        )
+
+    async def fail(self, job_id: str, error: str) -> None:
+        """Mark a job failed for good."""
+        await self.database.execute(
+            "UPDATE jobs SET status = 'failed', locked_until = NULL, last_error = ?,"
+            " updated_at = ? WHERE id = ?",
+            error,
+            time.time(),
+            job_id,
+        )
+
+    async def release(self, job_id: str) -> None:
+        """Return a claimed job that never started, without counting an attempt."""
+        await self.database.execute(
+            "UPDATE jobs SET status = 'queued', locked_until = NULL, attempts = attempts - 1,"
+            " updated_at = ? WHERE id = ? AND status = 'running'",
+            time.time(),
+            job_id,
+        )
+
+    async def backlog(self) -> Tuple[int, float]:
+        """Due jobs waiting to be claimed, and seconds since the oldest fell due."""
+        now = time.time()
+        row = await self.database.fetchrow(
+            "SELECT count(*) AS due, min(run_at) AS oldest FROM jobs"
+            " WHERE status = 'queued' AND run_at <= ?",
+            now,
+        )
+        return row["due"], now - row["oldest"] if row["oldest"] is not None else 0.0
+
+    async def purge(self, finished_before: float) -> int:
+        """Delete done jobs last updated before ``finished_before``; return the count."""
+        return await self.database.execute(
+            "DELETE FROM jobs WHERE status = 'done' AND updated_at < ?", finished_before
+        )
@@ -0,0 +1,194 @@
+"""
+Primary/replica routing for {{cookiecutter.project_name}}.
+
+``ReplicaRouter`` has the ``Database`` interface. ``execute`` and
+``executemany`` run on the primary, and ``fetch`` and ``fetchrow`` run on a
+healthy replica, round-robin:
+
+* read-your-writes: once a request has written, its later reads go to the
+  primary, so it never reads a replica that has not caught up with it.
+  ``PinWritesMiddleware`` goes further: requests with a method other than
+  GET, HEAD or OPTIONS use the primary from the start, so the reads behind a
+  write (a uniqueness check, the row being updated) are never stale;
+* a background task checks every replica each ``check_interval`` seconds. One
+  that fails the check, or lags more than ``max_lag`` seconds, gets no reads
+  until it passes again;
+* a read that fails on a replica is retried on the primary.
+
+Writes that return rows (``UPDATE ... RETURNING``) must use ``primary``
+directly. With no replicas, every call goes to the primary.
+"""
+import asyncio
+import itertools
+import logging
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Mapping, Optional, Sequence
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.database import Database  # type: ignore # noqa: E501
+
+logger = logging.getLogger(__name__)
+{% if cookiecutter.db_type == "postgresql" %}
+# Seconds since the replica last replayed a transaction; 0 on a primary
+LAG_QUERY = """
+    SELECT CASE WHEN pg_is_in_recovery()
+        THEN COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+        ELSE 0 END AS lag
+"""
+{%- else %}
+# SQLite has no replication to measure; a replica is healthy when its schema reads
+LAG_QUERY = "SELECT count(*) * 0 AS lag FROM sqlite_master"
+{%- endif %}
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Set for the rest of a request (one asyncio task) once it writes
+_wrote: ContextVar[bool] = ContextVar("wrote_to_primary", default=False)
+
+
+def pin_to_primary() -> None:
+    """Send the rest of the current request's reads to the primary."""
+    _wrote.set(True)
+
+
+class PinWritesMiddleware:
+    """Pure ASGI middleware pinning requests that may write to the primary."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] not in SAFE_METHODS:
+            pin_to_primary()
+        await self.app(scope, receive, send)
+
+
+@dataclass
+class Replica:
+    """A read replica and the result of its last health check."""
+
+    database: Database
+    healthy: bool = True
+    lag: float = 0.0
+
+
+class ReplicaRouter:
+    """Send writes to the primary and reads to healthy replicas."""
+
+    def __init__(
+        self,
+        primary: Database,
+        replicas: Sequence[Database] = (),
+        max_lag: float = 5.0,
+        check_interval: float = 5.0,
+    ):
+        """Route between ``primary`` and ``replicas``; checks start with ``connect``."""
+        self.primary = primary
+        self.replicas = [Replica(database) for database in replicas]
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._turn = itertools.count()
+        self._checker: Optional[asyncio.Task] = None
+
+    async def connect(self) -> None:
+        """Open the replicas and start health checks; the primary is opened separately."""
+        for replica in self.replicas:
+            await replica.database.connect()
+        if self.replicas:
+            await self.check()
+            self._checker = asyncio.create_task(self._check_forever())
+
+    async def close(self) -> None:
+        """Stop health checks and close the replicas."""
+        if self._checker is not None:
+            self._checker.cancel()
+            await asyncio.gather(self._checker, return_exceptions=True)
+            self._checker = None
+        for replica in self.replicas:
+            await replica.database.close()
+
+    async def check(self) -> None:
+        """Measure every replica's health and lag once; log only changes."""
+        for index, replica in enumerate(self.replicas):
+            try:
+                row = await replica.database.fetchrow(LAG_QUERY)
+                replica.lag = float(row["lag"])
+            except Exception:
+                if replica.healthy:
+                    logger.warning("Replica %d failed its health check", index, exc_info=True)
+                replica.healthy = False
+                continue
+            healthy = replica.lag <= self.max_lag
+            if healthy != replica.healthy:
+                logger.warning(
+                    "Replica %d is now %s (lag %.1fs)",
+                    index,
+                    "healthy" if healthy else "lagging",
+                    replica.lag,
+                )
+            replica.healthy = healthy
+
+    async def _check_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            await self.check()
+
+    def _reader(self) -> Optional[Replica]:
+        """The replica for the next read, or ``None`` for the primary."""
+        if _wrote.get():
+            return None
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._turn) % len(healthy)]
+
+    async def _read(self, method: str, sql: str, args: Sequence[Any]) -> Any:
+        replica = self._reader()
+        if replica is not None:
+            try:
+                return await getattr(replica.database, method)(sql, *args)
+            except Exception:
+                logger.warning("Read failed on a replica; retrying on the primary", exc_info=True)
+                replica.healthy = False
+        return await getattr(self.primary, method)(sql, *args)
+
+    async def execute(self, sql: str, *args: Any) -> int:
+        """Run a statement on the primary."""
+        pin_to_primary()
+        return await self.primary.execute(sql, *args)
+
+    async def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> None:
+        """Run a statement once per parameter row on the primary."""
+        pin_to_primary()
+        await self.primary.executemany(sql, rows)
+
+    async def execute_returning(self, sql: str, *args: Any) -> List[Mapping[str, Any]]:
+        """Run a statement on the primary and return its rows, e.g. ``UPDATE ... RETURNING``."""
+        pin_to_primary()
+        return await self.primary.fetch(sql, *args)
+
+    async def fetch(self, sql: str, *args: Any) -> List[Mapping[str, Any]]:
+        """Return all rows of a read-only query."""
+        return await self._read("fetch", sql, args)
+
+    async def fetchrow(self, sql: str, *args: Any) -> Optional[Mapping[str, Any]]:
+        """Return the first row of a read-only query, or ``None``."""
+        return await self._read("fetchrow", sql, args)
+{%- if cookiecutter.db_type == "postgresql" %}
+
+    async def copy_out(self, sql: str, *args: Any) -> bytes:
+        """Return the rows of a read-only query as CSV, read with ``COPY``."""
+        return await self._read("copy_out", sql, args)
+
+    async def copy_in(
+        self,
+        table: str,
+        columns: Sequence[str],
+        records: Iterable[Sequence[Any]],
+        before: Sequence[str] = (),
+        after: Sequence[str] = (),
+    ) -> None:
+        """Load ``records`` into ``table`` on the primary; see ``Database.copy_in``."""
+        pin_to_primary()
+        await self.primary.copy_in(table, columns, records, before, after)
+{%- endif %}
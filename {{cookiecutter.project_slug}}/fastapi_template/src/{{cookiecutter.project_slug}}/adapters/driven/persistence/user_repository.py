@@ -1,10 +1,78 @@
 """
 User repository implementation for {{cookiecutter.project_name}}.
 """
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, List, Mapping, Optional, Sequence, Tuple
 from uuid import UUID
 
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.database import Database  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.replicas import ReplicaRouter  # type: ignore # noqa: E501
 from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore
+{% if cookiecutter.db_type == "postgresql" %}
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id UUID PRIMARY KEY,
+        email TEXT NOT NULL UNIQUE,
+        name TEXT NOT NULL,
+        is_active BOOLEAN NOT NULL,
+        created_at TIMESTAMPTZ NOT NULL,
+        updated_at TIMESTAMPTZ NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS users_created_at_idx ON users (created_at)",
+]
+{%- else %}
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id BLOB PRIMARY KEY,
+        email TEXT NOT NULL UNIQUE,
+        name TEXT NOT NULL,
+        is_active INTEGER NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS users_created_at_idx ON users (created_at)",
+]
+{%- endif %}
+
+COLUMNS = "id, email, name, is_active, created_at, updated_at"
+
+# Shared by single-row saves and bulk imports
+ON_CONFLICT_UPDATE = """
+    ON CONFLICT (id) DO UPDATE SET
+        email = excluded.email,
+        name = excluded.name,
+        is_active = excluded.is_active,
+        updated_at = excluded.updated_at
+"""
+
+UPSERT = f"INSERT INTO users ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?) {ON_CONFLICT_UPDATE}"
+{% if cookiecutter.db_type == "postgresql" %}
+# One statement for any number of ids; they travel as a single array parameter
+SET_ACTIVE = """
+    UPDATE users SET is_active = ?, updated_at = ?
+    WHERE id = ANY(?) AND is_active <> ?
+    RETURNING id
+"""
+{%- else %}
+# SQLite binds each id separately, and older builds allow 999 parameters per
+# statement, so ids are updated in chunks
+SET_ACTIVE_CHUNK_SIZE = 500
+SET_ACTIVE = """
+    UPDATE users SET is_active = ?, updated_at = ?
+    WHERE id IN ({ids}) AND is_active <> ?
+    RETURNING id
+"""
+{%- endif %}
+
+
+async def create_schema(database: Database) -> None:
+    """Create the users table if it does not exist."""
+    for statement in SCHEMA:
+        await database.execute(statement)
 
 
 class UserRepository:
@@ -26,41 +94,125 @@ class UserRepository:
         """Get all users."""
         raise NotImplementedError
 
+    async def get_updated_at(self, user_id: UUID) -> Optional[datetime]:
+        """Get when a user last changed, without loading it; None if it does not exist."""
+        raise NotImplementedError
+
+    async def get_all_updated_at(self) -> Tuple[int, Optional[datetime]]:
+        """Count users and get the latest change among them, without loading them."""
+        raise NotImplementedError
+
     async def delete(self, user_id: UUID) -> bool:
         """Delete user by ID."""
         raise NotImplementedError
 
+    async def set_active(
+        self, user_ids: Sequence[UUID], is_active: bool, updated_at: datetime
+    ) -> List[UUID]:
+        """Set ``is_active`` on many users at once; return the ids that changed."""
+        raise NotImplementedError
+
+
+def _as_datetime(value: Any) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+def as_uuid(value: Any) -> UUID:
+    """Read an id column: a native ``uuid``, 16 bytes, or text from older SQLite tables."""
+    if isinstance(value, UUID):
+        return value
+    return UUID(bytes=value) if isinstance(value, bytes) else UUID(value)
 
-class SQLiteUserRepository(UserRepository):
-    """SQLite implementation of user repository."""
 
-    def __init__(self, database_url: str):
-        """Initialize repository with database URL."""
-        self.database_url = database_url
-        # TODO: Initialize database connection
+class SQLUserRepository(UserRepository):
+    """SQL implementation of user repository."""
+
+    def __init__(self, database: ReplicaRouter):
+        """Initialize repository with the primary/replica database router."""
+        self.database = database
+
+    @staticmethod
+    def _to_entity(row: Mapping[str, Any]) -> User:
+        """Map a database row to a domain entity."""
+        return User(
+            id=as_uuid(row["id"]),
+            email=row["email"],
+            name=row["name"],
+            is_active=bool(row["is_active"]),
+            created_at=_as_datetime(row["created_at"]),
+            updated_at=_as_datetime(row["updated_at"]),
+        )
 
     async def save(self, user: User) -> User:
-        """Save user to SQLite database."""
-        # TODO: Implement SQLite save logic
-        # For now, just return the user
+        """Insert or update a user."""
+        await self.database.execute(
+            UPSERT,
+            user.id,
+            user.email,
+            user.name,
+            user.is_active,
+            user.created_at,
+            user.updated_at,
+        )
         return user
 
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
-        """Get user by ID from SQLite database."""
-        # TODO: Implement SQLite get by ID logic
-        return None
+        """Get user by ID."""
+        row = await self.database.fetchrow(f"SELECT {COLUMNS} FROM users WHERE id = ?", user_id)
+        return self._to_entity(row) if row else None
 
     async def get_by_email(self, email: str) -> Optional[User]:
-        """Get user by email from SQLite database."""
-        # TODO: Implement SQLite get by email logic
-        return None
+        """Get user by email."""
+        row = await self.database.fetchrow(
+            f"SELECT {COLUMNS} FROM users WHERE email = ?", email
+        )
+        return self._to_entity(row) if row else None
 
     async def get_all(self) -> List[User]:
-        """Get all users from SQLite database."""
-        # TODO: Implement SQLite get all logic
-        return []
+        """Get all users, oldest first."""
+        rows = await self.database.fetch(f"SELECT {COLUMNS} FROM users ORDER BY created_at")
+        return [self._to_entity(row) for row in rows]
+
+    async def get_updated_at(self, user_id: UUID) -> Optional[datetime]:
+        """Get when a user last changed, reading only that column."""
+        row = await self.database.fetchrow("SELECT updated_at FROM users WHERE id = ?", user_id)
+        return _as_datetime(row["updated_at"]) if row else None
+
+    async def get_all_updated_at(self) -> Tuple[int, Optional[datetime]]:
+        """Count users and get the latest ``updated_at`` in one aggregate query."""
+        row = await self.database.fetchrow(
+            "SELECT count(*) AS count, max(updated_at) AS updated_at FROM users"
+        )
+        updated_at = row["updated_at"]
+        return row["count"], _as_datetime(updated_at) if updated_at is not None else None
 
     async def delete(self, user_id: UUID) -> bool:
-        """Delete user by ID from SQLite database."""
-        # TODO: Implement SQLite delete logic
-        return False
+        """Delete user by ID."""
+        return await self.database.execute("DELETE FROM users WHERE id = ?", user_id) > 0
+
+    async def set_active(
+        self, user_ids: Sequence[UUID], is_active: bool, updated_at: datetime
+    ) -> List[UUID]:
+        """Set ``is_active`` with one set-based ``UPDATE``; return the ids that changed.
+
+        Users already in the requested state, and unknown ids, are left out.
+        """
+        if not user_ids:
+            return []
+{%- if cookiecutter.db_type == "postgresql" %}
+        rows = await self.database.execute_returning(
+            SET_ACTIVE, is_active, updated_at, list(user_ids), is_active
+        )
+{%- else %}
+        rows = []
+        for start in range(0, len(user_ids), SET_ACTIVE_CHUNK_SIZE):
+            chunk = user_ids[start:start + SET_ACTIVE_CHUNK_SIZE]
+            rows += await self.database.execute_returning(
+                SET_ACTIVE.format(ids=", ".join(["?"] * len(chunk))),
+                is_active,
+                updated_at,
+                *chunk,
+                is_active,
+            )
+{%- endif %}
+        return [as_uuid(row["id"]) for row in rows]
@@ -0,0 +1,285 @@
+"""
+Bulk export and import of users for {{cookiecutter.project_name}}.
+
+Users move in batches of ``batch_size`` rows, so memory stays flat however
+many there are:
+
+* exports walk the table in primary key order (keyset pagination): every
+  batch is one index range scan, and an interrupted export resumes after the
+  last id it wrote. An export is not a snapshot; users changed while it runs
+  may appear in their old or new state;
+* imports insert or update each batch in one transaction, so importing a
+  batch twice is harmless and an interrupted import resumes at the input
+  offset of the last batch it committed.
+{%- if cookiecutter.db_type == "postgresql" %}
+
+Both directions use ``COPY``: exports stream CSV straight from the server, and
+imports load a temporary staging table that one ``INSERT ... ON CONFLICT``
+merges into ``users``.
+{%- else %}
+
+Each exported batch is one query, and each imported batch one ``executemany``
+of the repository's upsert.
+{%- endif %}
+
+Files are CSV with a header row, or NDJSON with one JSON object per line, with
+the columns of ``FIELDS``. Timestamps are ISO 8601.
+"""
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from typing import Any, AsyncIterable, AsyncIterator, Callable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.replicas import ReplicaRouter  # type: ignore # noqa: E501
+{%- if cookiecutter.db_type == "postgresql" %}
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_repository import COLUMNS, ON_CONFLICT_UPDATE  # type: ignore # noqa: E501
+{%- else %}
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_repository import COLUMNS, UPSERT, as_uuid  # type: ignore # noqa: E501
+{%- endif %}
+
+FORMATS = ("csv", "ndjson")
+MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+FIELDS = COLUMNS.split(", ")
+
+# id, email, name, is_active, created_at, updated_at
+Record = Tuple[UUID, str, str, bool, datetime, datetime]
+
+TRUE_VALUES = frozenset({"true", "t", "1", "yes"})
+FALSE_VALUES = frozenset({"false", "f", "0", "no"})
+{% if cookiecutter.db_type == "postgresql" %}
+# Last id and row count of the batch following ``{after}``
+BATCH_BOUND = """
+    SELECT id, count(*) OVER () AS batch_rows FROM (
+        SELECT id FROM users WHERE {after} ORDER BY id LIMIT ?
+    ) AS batch
+    ORDER BY id DESC LIMIT 1
+"""
+
+# Booleans and timestamps formatted as SQLite projects export them
+EXPORT = """
+    SELECT id, email, name, is_active::text,
+        to_char(created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"'),
+        to_char(updated_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"')
+    FROM users WHERE {after} AND id <= ? ORDER BY id
+"""
+
+STAGING_TABLE = "users_import"
+CREATE_STAGING = f"CREATE TEMP TABLE {STAGING_TABLE} (LIKE users) ON COMMIT DROP"
+
+# ON CONFLICT cannot update a row twice, so the last copy of a repeated id wins
+MERGE_STAGING = f"""
+    INSERT INTO users ({COLUMNS})
+    SELECT DISTINCT ON (id) {COLUMNS} FROM {STAGING_TABLE} ORDER BY id, ctid DESC
+    {ON_CONFLICT_UPDATE}
+"""
+{%- else %}
+# Ids are never empty, so b"" starts from the first user
+EXPORT = f"SELECT {COLUMNS} FROM users WHERE id > ? ORDER BY id LIMIT ?"
+{%- endif %}
+
+
+def header(fmt: str) -> bytes:
+    """First line of an export in ``fmt``; NDJSON has none."""
+    return (",".join(FIELDS) + "\n").encode() if fmt == "csv" else b""
+
+
+def encode(fmt: str, rows: Sequence[Sequence[Any]]) -> bytes:
+    """Serialize rows of ``FIELDS`` values, with ids and timestamps as strings."""
+    if fmt == "ndjson":
+        return "".join(
+            json.dumps(dict(zip(FIELDS, row)), ensure_ascii=False) + "\n" for row in rows
+        ).encode()
+    output = io.StringIO()
+    csv.writer(output, lineterminator="\n").writerows(
+        (*row[:3], "true" if row[3] else "false", *row[4:]) for row in rows
+    )
+    return output.getvalue().encode()
+
+
+def _parse_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES:
+        return False
+    raise ValueError(f"invalid boolean {value!r}")
+
+
+def _parse_time(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    # Timestamps without an offset are UTC, like the ones the domain creates
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def to_record(values: Sequence[Any]) -> Record:
+    """Validate and convert one row of ``FIELDS`` values."""
+    user_id, email, name, is_active, created_at, updated_at = values
+    return (
+        UUID(str(user_id)),
+        email,
+        name,
+        _parse_bool(is_active),
+        _parse_time(created_at),
+        _parse_time(updated_at),
+    )
+
+
+class RecordReader:
+    """Parse an export fed in chunks of any size back into records.
+
+    ``offset`` counts the input bytes consumed as whole records; feeding the
+    input again from there picks up where the reader stopped.
+    """
+
+    def __init__(self, fmt: str):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format {fmt!r}")
+        self.fmt = fmt
+        self.offset = 0
+        self.count = 0
+        self._buffer = b""
+
+    def feed(self, data: bytes) -> List[Record]:
+        """Add ``data`` and return the records it completed."""
+        self._buffer += data
+        end = self._buffer.rfind(b"\n") + 1
+        if self.fmt == "csv":
+            # A newline inside a quoted field does not end the record. Quotes
+            # before a newline pair up when it is outside one ("" escapes too).
+            while end and self._buffer.count(b'"', 0, end) % 2:
+                end = self._buffer.rfind(b"\n", 0, end - 1) + 1
+        return self._parse(end)
+
+    def close(self) -> List[Record]:
+        """Return the final record when the input does not end with a newline."""
+        return self._parse(len(self._buffer))
+
+    def _parse(self, end: int) -> List[Record]:
+        text = self._buffer[:end].decode("utf-8")
+        self._buffer = self._buffer[end:]
+        first = self.offset == 0
+        self.offset += end
+        if self.fmt == "csv":
+            rows: List[Any] = [row for row in csv.reader(io.StringIO(text)) if row]
+            if first and rows and rows[0] == FIELDS:
+                rows = rows[1:]
+        else:
+            rows = [line for line in text.split("\n") if line.strip()]
+
+        records = []
+        for row in rows:
+            self.count += 1
+            try:
+                if self.fmt == "ndjson":
+                    item = json.loads(row)
+                    row = [item[field] for field in FIELDS]
+                records.append(to_record(row))
+            except KeyError as exc:
+                raise ValueError(f"Record {self.count}: missing field {exc}") from exc
+            except (TypeError, ValueError) as exc:
+                raise ValueError(f"Record {self.count}: {exc}") from exc
+        return records
+
+
+class UserTransfer:
+    """Export and import users in batches of ``batch_size``."""
+
+    def __init__(
+        self,
+        database: ReplicaRouter,
+        batch_size: int = 10_000,
+        on_import: Optional[Callable[[], None]] = None,
+    ):
+        """Transfer users through ``database``; ``on_import`` runs after each imported batch."""
+        self.database = database
+        self.batch_size = batch_size
+        self.on_import = on_import
+
+    async def export(
+        self, fmt: str, after: Optional[UUID] = None
+    ) -> AsyncIterator[Tuple[bytes, UUID, int]]:
+        """Yield the users with ids above ``after`` as ``(data, last_id, rows)`` batches.
+
+        ``data`` holds whole records in ``fmt``, without the ``header`` line.
+        """
+        while True:
+            batch = await self._export_batch(fmt, after)
+            if batch is None:
+                return
+            yield batch
+            after = batch[1]
+
+    async def _export_batch(
+        self, fmt: str, after: Optional[UUID]
+    ) -> Optional[Tuple[bytes, UUID, int]]:
+{%- if cookiecutter.db_type == "postgresql" %}
+        condition, args = ("id > ?", [after]) if after else ("TRUE", [])
+        bound = await self.database.fetchrow(
+            BATCH_BOUND.format(after=condition), *args, self.batch_size
+        )
+        if bound is None:
+            return None
+        data = await self.database.copy_out(EXPORT.format(after=condition), *args, bound["id"])
+        if fmt == "ndjson":
+            rows = csv.reader(io.StringIO(data.decode()))
+            data = encode(fmt, [(*row[:3], row[3] == "true", *row[4:]) for row in rows])
+        return data, bound["id"], bound["batch_rows"]
+{%- else %}
+        rows = await self.database.fetch(EXPORT, after or b"", self.batch_size)
+        if not rows:
+            return None
+        ids = [as_uuid(row[0]) for row in rows]
+        data = encode(
+            fmt,
+            [(str(user_id), *row[1:3], bool(row[3]), *row[4:]) for user_id, row in zip(ids, rows)],
+        )
+        return data, ids[-1], len(rows)
+{%- endif %}
+
+    async def import_records(self, records: Sequence[Record]) -> None:
+        """Insert or update ``records`` in one transaction."""
+{%- if cookiecutter.db_type == "postgresql" %}
+        await self.database.copy_in(
+            STAGING_TABLE, FIELDS, records, before=[CREATE_STAGING], after=[MERGE_STAGING]
+        )
+{%- else %}
+        await self.database.executemany(UPSERT, records)
+{%- endif %}
+        if self.on_import is not None:
+            self.on_import()
+
+    async def import_stream(
+        self,
+        fmt: str,
+        chunks: AsyncIterable[bytes],
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """Import the records of an export read in ``chunks``; return how many there were.
+
+        Records are written in transactions of at least ``batch_size``. After
+        each, ``progress(rows, offset)`` receives the records imported so far and
+        the input bytes they were read from.
+        """
+        reader = RecordReader(fmt)
+        imported = 0
+        pending: List[Record] = []
+        async for chunk in chunks:
+            pending += reader.feed(chunk)
+            if len(pending) < self.batch_size:
+                continue
+            await self.import_records(pending)
+            imported += len(pending)
+            pending = []
+            if progress is not None:
+                progress(imported, reader.offset)
+        pending += reader.close()
+        if pending:
+            await self.import_records(pending)
+            imported += len(pending)
+        if progress is not None:
+            progress(imported, reader.offset)
+        return imported
@@ -0,0 +1,171 @@
+"""
+Span exporters for {{cookiecutter.project_name}}.
+
+* ``InMemoryExporter`` keeps the latest spans in a list, for tests and local use;
+* ``FileExporter`` appends spans to a file, one JSON object per line;
+* ``OTLPExporter`` posts spans to an OpenTelemetry collector over OTLP/HTTP
+  (JSON encoding), with no extra dependency.
+
+The file and OTLP exporters do I/O, so ``build_exporter`` puts them behind a
+``BatchExporter``: finishing a span only queues it, and a background thread
+exports the queue in batches.
+"""
+import json
+import logging
+import queue
+import threading
+import urllib.request
+from collections import deque
+from typing import Any, Dict, List, Sequence
+
+from {{cookiecutter.project_slug}}.adapters.driven.tracing.tracer import Span  # type: ignore # noqa: E501
+
+logger = logging.getLogger(__name__)
+
+# SpanKind values of the OTLP protocol
+OTLP_SPAN_KINDS = {"internal": 1, "server": 2}
+
+
+class InMemoryExporter:
+    """Keep the last ``max_spans`` finished spans."""
+
+    def __init__(self, max_spans: int = 10_000):
+        self._spans: deque = deque(maxlen=max_spans)
+
+    @property
+    def spans(self) -> List[Span]:
+        return list(self._spans)
+
+    def export(self, spans: Sequence[Span]) -> None:
+        self._spans.extend(spans)
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+    def shutdown(self) -> None:
+        pass
+
+
+class FileExporter:
+    """Append spans to ``path`` as JSON lines."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans))
+
+    def shutdown(self) -> None:
+        pass
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": {"stringValue": str(value)}} for key, value in attributes.items()]
+
+
+class OTLPExporter:
+    """Post spans to an OTLP/HTTP endpoint, e.g. ``http://localhost:4318/v1/traces``."""
+
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 5.0):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+
+    def encode(self, spans: Sequence[Span]) -> bytes:
+        """Build an ``ExportTraceServiceRequest`` in the OTLP JSON encoding."""
+        otlp_spans = []
+        for span in spans:
+            otlp_span = {
+                "traceId": span.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": OTLP_SPAN_KINDS[span.kind],
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns),
+                "attributes": _otlp_attributes(span.attributes),
+                "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+            }
+            if span.parent_id:
+                otlp_span["parentSpanId"] = span.parent_id
+            otlp_spans.append(otlp_span)
+        resource = {"attributes": _otlp_attributes({"service.name": self.service_name})}
+        scope_spans = [{"scope": {"name": "{{cookiecutter.project_slug}}"}, "spans": otlp_spans}]
+        return json.dumps(
+            {"resourceSpans": [{"resource": resource, "scopeSpans": scope_spans}]}
+        ).encode()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        request = urllib.request.Request(
+            self.endpoint,
+            data=self.encode(spans),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+    def shutdown(self) -> None:
+        pass
+
+
+class BatchExporter:
+    """Queue spans and export them from a background thread, up to ``batch_size`` at once.
+
+    When ``max_queue_size`` spans are waiting, new ones are dropped and counted
+    in ``dropped`` rather than waited on.
+    """
+
+    def __init__(self, exporter, max_queue_size: int = 10_000, batch_size: int = 512):
+        self.exporter = exporter
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.dropped = 0
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._stop_marker = object()
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        for span in spans:
+            if self._queue.qsize() >= self.max_queue_size:
+                self.dropped += 1
+            else:
+                self._queue.put(span)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = batch[-1] is self._stop_marker
+            if stopping:
+                batch.pop()
+            if batch:
+                try:
+                    self.exporter.export(batch)
+                except Exception:
+                    logger.exception("Could not export %d spans", len(batch))
+            if stopping:
+                return
+
+    def shutdown(self) -> None:
+        """Export every queued span, then stop the thread."""
+        if self._thread.is_alive():
+            self._queue.put(self._stop_marker)
+            self._thread.join()
+        self.exporter.shutdown()
+
+
+def build_exporter(kind: str, path: str, endpoint: str, service_name: str):
+    """Exporter for ``kind``: "memory", "file" (to ``path``) or "otlp" (to ``endpoint``)."""
+    if kind == "memory":
+        return InMemoryExporter()
+    if kind == "file":
+        return BatchExporter(FileExporter(path))
+    if kind == "otlp":
+        return BatchExporter(OTLPExporter(endpoint, service_name))
+    raise ValueError(f"Unknown TRACE_EXPORTER {kind!r}")
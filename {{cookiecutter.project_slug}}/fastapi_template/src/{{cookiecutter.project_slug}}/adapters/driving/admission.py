@@ -0,0 +1,159 @@
+"""
+Admission control for {{cookiecutter.project_name}}.
+
+``AdmissionControlMiddleware`` caps the requests a worker handles at once.
+Requests over the cap wait in a short queue for a slot. When the queue is full,
+or a request has waited ``queue_timeout`` seconds, the request is shed at once
+with ``503 Service Unavailable`` and a ``Retry-After`` header. A request that
+cannot be served soon fails fast instead of piling onto an overloaded worker.
+
+``AdaptiveLimiter`` sets the cap from observed latency, gradient style. Paths in
+``exempt_paths`` bypass it, so health checks and metrics keep answering while
+the service sheds load.
+"""
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Deque, Sequence
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that follows request latency.
+
+    A slow moving average of latency is the baseline and a fast one the current
+    state. While the current latency stays within ``tolerance`` times the
+    baseline, each sample grows the limit by about its square root. Beyond
+    that, the limit shrinks in proportion, by at most half. The limit only
+    changes while at least half of it is in use, so an idle worker neither
+    inflates it nor shrinks it over one slow request.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 50,
+        min_limit: int = 4,
+        max_limit: int = 500,
+        tolerance: float = 1.5,
+        smoothing: float = 0.2,
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.in_flight = 0
+        self._short = 0.0
+        self._long = 0.0
+
+    @property
+    def available(self) -> bool:
+        """Whether another request may start."""
+        return self.in_flight < int(self.limit)
+
+    def record(self, latency: float) -> None:
+        """Adapt the limit to the latency of one request, in seconds."""
+        if not self._long:
+            self._short = self._long = latency
+            return
+        self._short += (latency - self._short) * 0.1
+        self._long += (latency - self._long) / 600
+        if self._long > 2 * self._short:
+            # Latency dropped for good: let the baseline catch up faster
+            self._long *= 0.95
+        if self.in_flight < self.limit / 2:
+            return
+        gradient = max(0.5, min(1.0, self.tolerance * self._long / self._short))
+        target = self.limit * gradient + math.sqrt(self.limit)
+        limit = self.limit + (target - self.limit) * self.smoothing
+        self.limit = max(float(self.min_limit), min(float(self.max_limit), limit))
+
+
+class AdmissionControlMiddleware:
+    """Pure ASGI middleware; the limiter and queue are per worker."""
+
+    def __init__(
+        self,
+        app,
+        limiter: AdaptiveLimiter,
+        queue_size: int = 100,
+        queue_timeout: float = 1.0,
+        retry_after: int = 1,
+        exempt_paths: Sequence[str] = ("/health",),
+    ):
+        self.app = app
+        self.limiter = limiter
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.exempt_paths = frozenset(exempt_paths)
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+        if not await self.admit():
+            response = JSONResponse(
+                {"detail": "Service overloaded, retry later"},
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": str(self.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        recorded = False
+
+        async def send_timed(message):
+            nonlocal recorded
+            # Time to the response start, so a long streamed body is not mistaken for overload
+            if message["type"] == "http.response.start" and not recorded:
+                recorded = True
+                self.limiter.record(time.perf_counter() - start)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_timed)
+        finally:
+            self.release()
+
+    async def admit(self) -> bool:
+        """Take a slot, waiting in the queue if needed; False if the request is shed."""
+        if not self._waiters and self.limiter.available:
+            self.limiter.in_flight += 1
+            return True
+        if len(self._waiters) >= self.queue_size:
+            return False
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        timer = loop.call_later(self.queue_timeout, self._expire, waiter)
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            # The client went away: leave the queue, or hand back a slot given just before
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif waiter.done() and not waiter.cancelled() and waiter.result():
+                self.release()
+            raise
+        finally:
+            timer.cancel()
+
+    def release(self) -> None:
+        """Free a slot and give it to the longest waiting request."""
+        self.limiter.in_flight -= 1
+        while self._waiters and self.limiter.available:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.limiter.in_flight += 1
+                waiter.set_result(True)
+
+    def _expire(self, waiter: asyncio.Future) -> None:
+        if not waiter.done():
+            self._waiters.remove(waiter)
+            waiter.set_result(False)
@@ -0,0 +1,66 @@
+"""
+Conditional GET for {{cookiecutter.project_name}}.
+
+User responses carry an ``ETag`` and a ``Last-Modified`` header derived from
+``updated_at``: one user's, or for a list the number of users and the latest
+change among them. A client sending those back in ``If-None-Match`` or
+``If-Modified-Since`` gets ``304 Not Modified`` while nothing has changed.
+Routes check preconditions against timestamps read on their own, so an
+unchanged user is neither loaded nor serialized.
+"""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Request, Response, status
+
+# OpenAPI entry for routes that may answer 304
+NOT_MODIFIED = {status.HTTP_304_NOT_MODIFIED: {"description": "Not modified"}}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def validators(updated_at: Optional[datetime], count: Optional[int] = None) -> Dict[str, str]:
+    """``ETag`` and ``Last-Modified`` headers for one user, or for a list of ``count`` users."""
+    micros = 0 if updated_at is None else (_as_utc(updated_at) - _EPOCH) // _MICROSECOND
+    tag = f"{micros:x}" if count is None else f"{count:x}-{micros:x}"
+    headers = {"ETag": f'"{tag}"'}
+    if updated_at is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(updated_at), usegmt=True)
+    return headers
+
+
+def is_conditional(request: Request) -> bool:
+    """Whether the request has a precondition that could make it a 304."""
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def not_modified(request: Request, headers: Dict[str, str]) -> Optional[Response]:
+    """A 304 response when the client's copy matches ``headers``, else None.
+
+    ``If-None-Match`` takes precedence; ``If-Modified-Since`` is only checked
+    without it, at the one-second resolution of HTTP dates.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison: W/"x" matches "x"
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        matched = "*" in tags or headers["ETag"] in tags
+    else:
+        matched = _not_modified_since(request.headers.get("if-modified-since"), headers)
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers) if matched else None
+
+
+def _not_modified_since(since: Optional[str], headers: Dict[str, str]) -> bool:
+    if since is None or "Last-Modified" not in headers:
+        return False
+    try:
+        return parsedate_to_datetime(headers["Last-Modified"]) <= parsedate_to_datetime(since)
+    except (TypeError, ValueError):
+        # An invalid date is ignored, as if the header were absent
+        return False
@@ -3,17 +3,32 @@ FastAPI routes for {{cookiecutter.project_name}}.
 """
 
 from fastapi import APIRouter
+from {{cookiecutter.project_slug}}.adapters.driving.api.schemas import APIInfoResponse  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.api.user_routes import router as user_router  # type: ignore # noqa: E501
 
 # Create API router
 api_router = APIRouter(prefix="/api/v1")
 
 
 @api_router.get("/")
-async def api_root():
+async def api_root() -> APIInfoResponse:
     """API root endpoint."""
-    return {"message": "{{cookiecutter.project_name}} API", "version": "1.0.0"}
+    return APIInfoResponse(message="{{cookiecutter.project_name}} API", version="1.0.0")
 
 
 # Add your API routes here
-# from .user_routes import router as user_router
-# api_router.include_router(user_router, prefix="/users", tags=["users"])
+api_router.include_router(user_router, prefix="/users", tags=["users"])
+
+
+def route_template(scope) -> str:
+    """Rebuild the matched route template, e.g. ``/api/v1/users/{user_id}``.
+
+    Unmatched paths share one name, so scanners cannot explode the number of
+    metric series or span names.
+    """
+    if scope.get("route") is None:
+        return "unmatched"
+    path = scope["path"]
+    for name, value in scope.get("path_params", {}).items():
+        path = path.replace(str(value), "{" + name + "}", 1)
+    return path
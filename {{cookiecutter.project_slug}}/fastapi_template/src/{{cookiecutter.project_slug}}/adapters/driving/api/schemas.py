@@ -0,0 +1,92 @@
+"""
+Request and response schemas for {{cookiecutter.project_name}}.
+
+Routes declare these as response models, so FastAPI validates and serializes
+responses with pydantic's compiled serializer instead of ``jsonable_encoder``.
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# File formats of bulk user exports and imports
+TransferFormat = Literal["csv", "ndjson"]
+
+
+class MessageResponse(BaseModel):
+    """Plain status message."""
+
+    message: str
+
+
+class HealthResponse(BaseModel):
+    """Health check payload."""
+
+    status: str
+
+
+class ReadinessResponse(BaseModel):
+    """Readiness payload: the overall status and each probe's last result."""
+
+    status: str
+    checks: Dict[str, Dict[str, Any]]
+
+
+class APIInfoResponse(BaseModel):
+    """API root payload."""
+
+    message: str
+    version: str
+
+
+class CreateUserRequest(BaseModel):
+    """Payload for creating a user."""
+
+    email: str
+    name: str
+
+
+class UpdateUserNameRequest(BaseModel):
+    """Payload for renaming a user."""
+
+    name: str
+
+
+class UserIdsRequest(BaseModel):
+    """Payload naming the users a batch operation applies to."""
+
+    ids: List[UUID] = Field(min_length=1, max_length=100_000)
+
+
+class UserResponse(BaseModel):
+    """User representation."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    email: str
+    name: str
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class UserListResponse(BaseModel):
+    """List of users."""
+
+    users: List[UserResponse]
+    count: int
+
+
+class UserIdsResponse(BaseModel):
+    """Users a batch operation changed."""
+
+    ids: List[UUID]
+    count: int
+
+
+class UserImportResponse(BaseModel):
+    """Outcome of a bulk import."""
+
+    imported: int
@@ -0,0 +1,176 @@
+"""
+User routes for {{cookiecutter.project_name}}.
+"""
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_transfer import MEDIA_TYPES, UserTransfer, header  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.api.conditional import NOT_MODIFIED, is_conditional, not_modified, validators  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.api.schemas import (  # type: ignore # noqa: E501
+    CreateUserRequest,
+    TransferFormat,
+    UpdateUserNameRequest,
+    UserIdsRequest,
+    UserIdsResponse,
+    UserImportResponse,
+    UserListResponse,
+    UserResponse,
+)
+from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.domain.services.user_service import UserService  # type: ignore # noqa: E501
+
+router = APIRouter()
+
+
+def get_user_service(request: Request) -> UserService:
+    """Resolve the user service from the application container."""
+    return request.app.state.container.get_user_service()
+
+
+def get_user_transfer(request: Request) -> UserTransfer:
+    """Resolve the bulk export/import adapter from the application container."""
+    return request.app.state.container.get_user_transfer()
+
+
+def found(user: User | None) -> UserResponse:
+    """Serialize a user or raise 404."""
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return UserResponse.model_validate(user)
+
+
+@router.post("/", status_code=status.HTTP_201_CREATED)
+async def create_user(
+    payload: CreateUserRequest,
+    service: UserService = Depends(get_user_service),
+) -> UserResponse:
+    """Create a user; the welcome email is sent in the background."""
+    try:
+        user = await service.create_user(email=payload.email, name=payload.name)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return UserResponse.model_validate(user)
+
+
+@router.get("/", response_model=UserListResponse, responses=NOT_MODIFIED)
+async def list_users(
+    request: Request, response: Response, service: UserService = Depends(get_user_service)
+) -> UserListResponse | Response:
+    """List all users; 304 when the client's copy is current."""
+    if is_conditional(request):
+        count, updated_at = await service.get_all_users_updated_at()
+        unchanged = not_modified(request, validators(updated_at, count))
+        if unchanged is not None:
+            return unchanged
+    users = await service.get_all_users()
+    latest = max((user.updated_at for user in users), default=None)
+    response.headers.update(validators(latest, len(users)))
+    return UserListResponse(
+        users=[UserResponse.model_validate(user) for user in users], count=len(users)
+    )
+
+
+# Declared before the ``/{user_id}`` routes, which would otherwise match their paths
+@router.get("/export")
+async def export_users(
+    fmt: TransferFormat = Query("csv", alias="format"),
+    after: Optional[UUID] = None,
+    transfer: UserTransfer = Depends(get_user_transfer),
+) -> StreamingResponse:
+    """Stream every user, or those with ids above ``after``, as CSV or NDJSON."""
+
+    async def content():
+        # A resumed export continues a file that already has its header
+        if after is None:
+            yield header(fmt)
+        async for data, _, _ in transfer.export(fmt, after):
+            yield data
+
+    return StreamingResponse(
+        content(),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="users.{fmt}"'},
+    )
+
+
+@router.post("/import")
+async def import_users(
+    request: Request,
+    fmt: TransferFormat = Query("csv", alias="format"),
+    transfer: UserTransfer = Depends(get_user_transfer),
+) -> UserImportResponse:
+    """Insert or update users from a CSV or NDJSON body, read and written in batches.
+
+    Batches before an invalid record stay imported; importing them again is harmless.
+    """
+    try:
+        imported = await transfer.import_stream(fmt, request.stream())
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return UserImportResponse(imported=imported)
+
+
+@router.post("/batch/activate")
+async def activate_users(
+    payload: UserIdsRequest, service: UserService = Depends(get_user_service)
+) -> UserIdsResponse:
+    """Activate many users in one statement; returns those that were inactive."""
+    ids = await service.activate_users(payload.ids)
+    return UserIdsResponse(ids=ids, count=len(ids))
+
+
+@router.post("/batch/deactivate")
+async def deactivate_users(
+    payload: UserIdsRequest, service: UserService = Depends(get_user_service)
+) -> UserIdsResponse:
+    """Deactivate many users in one statement; returns those that were active."""
+    ids = await service.deactivate_users(payload.ids)
+    return UserIdsResponse(ids=ids, count=len(ids))
+
+
+@router.get("/{user_id}", response_model=UserResponse, responses=NOT_MODIFIED)
+async def get_user(
+    user_id: UUID,
+    request: Request,
+    response: Response,
+    service: UserService = Depends(get_user_service),
+) -> UserResponse | Response:
+    """Get a user by ID; 304 when the client's copy is current."""
+    if is_conditional(request):
+        updated_at = await service.get_user_updated_at(user_id)
+        if updated_at is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        unchanged = not_modified(request, validators(updated_at))
+        if unchanged is not None:
+            return unchanged
+    user = found(await service.get_user(user_id))
+    response.headers.update(validators(user.updated_at))
+    return user
+
+
+@router.patch("/{user_id}")
+async def update_user_name(
+    user_id: UUID,
+    payload: UpdateUserNameRequest,
+    service: UserService = Depends(get_user_service),
+) -> UserResponse:
+    """Rename a user."""
+    return found(await service.update_user_name(user_id, payload.name))
+
+
+@router.post("/{user_id}/activate")
+async def activate_user(
+    user_id: UUID, service: UserService = Depends(get_user_service)
+) -> UserResponse:
+    """Activate a user."""
+    return found(await service.activate_user(user_id))
+
+
+@router.post("/{user_id}/deactivate")
+async def deactivate_user(
+    user_id: UUID, service: UserService = Depends(get_user_service)
+) -> UserResponse:
+    """Deactivate a user."""
+    return found(await service.deactivate_user(user_id))
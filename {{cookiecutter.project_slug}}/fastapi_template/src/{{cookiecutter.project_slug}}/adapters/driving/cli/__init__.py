@@ -0,0 +1,3 @@
+"""
+Command line adapters for {{cookiecutter.project_name}}.
+"""
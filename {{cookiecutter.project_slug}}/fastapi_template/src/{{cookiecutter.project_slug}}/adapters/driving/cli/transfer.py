@@ -0,0 +1,175 @@
+"""
+Bulk export and import of users from the command line for {{cookiecutter.project_name}}.
+
+Run with::
+
+    uv run transfer-users export users.csv --checkpoint users.checkpoint
+    uv run transfer-users import users.ndjson
+
+The format follows the file extension (``.ndjson`` or ``.jsonl``, else CSV)
+unless ``--format`` is given. Progress is reported on stderr.
+
+With ``--checkpoint``, the position reached is saved after every batch and the
+same command continues from it after an interruption. The checkpoint file is
+removed once the transfer completes.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, BinaryIO, Dict, Optional
+from uuid import UUID
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.database import Database  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.replicas import ReplicaRouter  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_repository import create_schema  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_transfer import FORMATS, UserTransfer, header  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.config.settings import settings  # type: ignore # noqa: E501
+
+# Imports commit once a batch is complete, so small reads keep batches near --batch-size
+READ_SIZE = 64 * 1024
+
+
+def load_checkpoint(path: Optional[Path], command: str, data_path: Path) -> Dict[str, Any]:
+    """State saved by an interrupted run of the same command, or an empty dict."""
+    if path is None or not path.exists():
+        return {}
+    state = json.loads(path.read_text())
+    if state.get("command") != command or state.get("path") != str(data_path):
+        raise SystemExit(f"{path} belongs to '{state.get('command')} {state.get('path')}'")
+    return state
+
+
+def save_checkpoint(path: Optional[Path], state: Dict[str, Any]) -> None:
+    """Replace the checkpoint atomically, so a crash never leaves half a file."""
+    if path is None:
+        return
+    partial = path.with_name(path.name + ".tmp")
+    partial.write_text(json.dumps(state))
+    os.replace(partial, path)
+
+
+class Progress:
+    """Print the rows transferred and the rate on stderr, at most once a second."""
+
+    def __init__(self, verb: str, rows: int = 0):
+        self.verb = verb
+        self.start_rows = rows
+        self.started = time.perf_counter()
+        self._reported = 0.0
+
+    def __call__(self, rows: int, final: bool = False) -> None:
+        now = time.perf_counter()
+        if not final and now - self._reported < 1:
+            return
+        self._reported = now
+        rate = (rows - self.start_rows) / max(now - self.started, 1e-9)
+        print(f"{self.verb} {rows:,} users ({rate:,.0f}/s)", file=sys.stderr)
+
+
+async def export_users(
+    transfer: UserTransfer, path: Path, fmt: str, checkpoint: Optional[Path]
+) -> int:
+    """Write every user to ``path``; return the number written."""
+    state = load_checkpoint(checkpoint, "export", path)
+    rows = state.get("rows", 0)
+    after = UUID(state["after"]) if state else None
+    progress = Progress("Exported", rows)
+    with open(path, "r+b" if state else "wb") as output:
+        if state:
+            # Drop whatever the interrupted run wrote after its last checkpoint
+            output.truncate(state["bytes"])
+            output.seek(state["bytes"])
+        else:
+            output.write(header(fmt))
+        async for data, last_id, batch_rows in transfer.export(fmt, after):
+            output.write(data)
+            output.flush()
+            rows += batch_rows
+            save_checkpoint(
+                checkpoint,
+                {
+                    "command": "export",
+                    "path": str(path),
+                    "after": str(last_id),
+                    "rows": rows,
+                    "bytes": output.tell(),
+                },
+            )
+            progress(rows)
+    progress(rows, final=True)
+    return rows
+
+
+async def _read_chunks(source: BinaryIO) -> AsyncIterator[bytes]:
+    while chunk := source.read(READ_SIZE):
+        yield chunk
+
+
+async def import_users(
+    transfer: UserTransfer, path: Path, fmt: str, checkpoint: Optional[Path]
+) -> int:
+    """Insert or update every user in ``path``; return the number imported."""
+    state = load_checkpoint(checkpoint, "import", path)
+    start_offset = state.get("offset", 0)
+    start_rows = state.get("rows", 0)
+    progress = Progress("Imported", start_rows)
+
+    def committed(rows: int, offset: int) -> None:
+        save_checkpoint(
+            checkpoint,
+            {
+                "command": "import",
+                "path": str(path),
+                "offset": start_offset + offset,
+                "rows": start_rows + rows,
+            },
+        )
+        progress(start_rows + rows)
+
+    with open(path, "rb") as source:
+        source.seek(start_offset)
+        rows = start_rows + await transfer.import_stream(fmt, _read_chunks(source), committed)
+    progress(rows, final=True)
+    return rows
+
+
+async def run(args: argparse.Namespace, fmt: str) -> None:
+    database = Database(args.database_url, min_size=1, max_size=2)
+    await database.connect()
+    try:
+        await create_schema(database)
+        transfer = UserTransfer(ReplicaRouter(database), args.batch_size)
+        if args.command == "export":
+            await export_users(transfer, args.path, fmt, args.checkpoint)
+        else:
+            await import_users(transfer, args.path, fmt, args.checkpoint)
+    finally:
+        await database.close()
+    if args.checkpoint is not None:
+        args.checkpoint.unlink(missing_ok=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export or import users in bulk.")
+    parser.add_argument("command", choices=["export", "import"])
+    parser.add_argument("path", type=Path, help="CSV or NDJSON file")
+    parser.add_argument("--format", choices=FORMATS, help="default: from the file extension")
+    parser.add_argument("--checkpoint", type=Path, help="file recording progress, to resume")
+    parser.add_argument("--batch-size", type=int, default=settings.TRANSFER_BATCH_SIZE)
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    args = parser.parse_args()
+
+    fmt = args.format or ("ndjson" if args.path.suffix in (".ndjson", ".jsonl") else "csv")
+    try:
+        asyncio.run(run(args, fmt))
+    except ValueError as exc:
+        # The checkpoint still points at the last committed batch
+        raise SystemExit(f"{args.command.capitalize()} failed: {exc}") from exc
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""
+Domain event subscribers of {{cookiecutter.project_name}}.
+
+Register subscribers here; the container calls ``register_subscribers`` once at
+startup. Fire-and-forget subscribers run after the request that raised the
+events has returned, so they should only hand work off (enqueue a job, update a
+projection) rather than block on slow I/O.
+"""
+from typing import List
+
+from {{cookiecutter.project_slug}}.adapters.driven.events.event_bus import InProcessEventBus  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.jobs.tasks import SEND_WELCOME_EMAIL  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.domain.events.user_events import UserCreated  # type: ignore # noqa: E501
+
+
+def register_subscribers(bus: InProcessEventBus, container) -> None:
+    """Subscribe every event handler to the bus."""
+
+    async def send_welcome_emails(events: List[UserCreated]) -> None:
+        """Queue a durable welcome email job for each new user."""
+        for event in events:
+            await container.jobs.enqueue(SEND_WELCOME_EMAIL, event.email, event.name)
+
+    bus.subscribe(UserCreated, send_welcome_emails)
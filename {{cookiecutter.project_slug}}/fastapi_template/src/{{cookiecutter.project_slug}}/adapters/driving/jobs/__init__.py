@@ -0,0 +1,3 @@
+"""
+Background job adapters for {{cookiecutter.project_name}}.
+"""
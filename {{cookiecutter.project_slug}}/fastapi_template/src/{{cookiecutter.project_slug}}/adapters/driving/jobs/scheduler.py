@@ -0,0 +1,343 @@
+"""
+In-process background job scheduler for {{cookiecutter.project_name}}.
+
+``JobScheduler`` runs registered job types off the request path:
+
+* coroutine functions on the event loop, blocking functions in a thread pool
+  and CPU-bound functions (``executor="process"``) in a process pool;
+* each job type has its own queue and ``max_concurrency`` workers, and all
+  types share ``max_workers`` execution slots;
+* failures are retried with jittered exponential backoff;
+* ``every`` enqueues a job periodically;
+* job types registered with ``durable=True`` are written to the job table
+  (``JobStore``) and claimed from it by a poller, so they survive restarts.
+
+Usage::
+
+    scheduler.register("send_welcome_email", email_adapter.send_welcome_email, durable=True)
+    scheduler.register("rebuild_report", build_report, executor="process")
+    await scheduler.enqueue("send_welcome_email", user.email, user.name)
+
+Process jobs must be module-level functions with picklable arguments, and
+durable jobs need JSON-serializable arguments. Periodic schedules run in every
+process that starts the scheduler.
+"""
+import asyncio
+import logging
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from inspect import iscoroutinefunction
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from uuid import uuid4
+
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.job_store import JobStore  # type: ignore # noqa: E501
+
+logger = logging.getLogger(__name__)
+
+EXECUTORS = ("async", "thread", "process")
+
+
+@dataclass(frozen=True)
+class JobType:
+    """How a registered job type runs."""
+
+    name: str
+    func: Callable[..., Any]
+    executor: str
+    max_concurrency: int
+    max_retries: int
+    backoff: float
+    max_backoff: float
+    durable: bool
+
+    def retry_delay(self, attempts: int) -> float:
+        """Jittered exponential backoff after ``attempts`` failed runs."""
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+
+@dataclass
+class Job:
+    """One queued run of a job type."""
+
+    id: str
+    name: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    # Runs started so far, including the current one
+    attempts: int = 0
+
+
+class JobScheduler:
+    """Queue, run, retry and schedule background jobs inside the application process."""
+
+    def __init__(
+        self,
+        store: Optional[JobStore] = None,
+        max_workers: int = 10,
+        thread_workers: int = 4,
+        process_workers: Optional[int] = None,
+        poll_interval: float = 1.0,
+    ):
+        """Configure the scheduler; nothing runs until ``start``."""
+        self.store = store
+        self.max_workers = max_workers
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers
+        self.poll_interval = poll_interval
+        self._types: Dict[str, JobType] = {}
+        self._queues: Dict[str, "asyncio.Queue[Job]"] = {}
+        self._claimed: Dict[str, int] = {}
+        self._periodic: List[Tuple[float, str, Tuple[Any, ...], Dict[str, Any]]] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._workers: Set[asyncio.Task] = set()
+        self._idle: Set[asyncio.Task] = set()
+        self._timers: Set[asyncio.TimerHandle] = set()
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._running = False
+        self._stopping = False
+
+    def register(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *,
+        executor: Optional[str] = None,
+        max_concurrency: int = 1,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        durable: bool = False,
+    ) -> JobType:
+        """Register a job type.
+
+        ``executor`` defaults to ``"async"`` for coroutine functions and
+        ``"thread"`` otherwise.
+        """
+        if name in self._types:
+            raise ValueError(f"Job type {name!r} is already registered")
+        if executor is None:
+            executor = "async" if iscoroutinefunction(func) else "thread"
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor {executor!r}; expected one of {EXECUTORS}")
+        if durable and self.store is None:
+            raise ValueError(f"Durable job type {name!r} needs a job store")
+
+        job_type = JobType(
+            name, func, executor, max_concurrency, max_retries, backoff, max_backoff, durable
+        )
+        self._types[name] = job_type
+        if self._running:
+            self._start_workers(job_type)
+        return job_type
+
+    def every(self, interval: float, name: str, *args: Any, **kwargs: Any) -> None:
+        """Enqueue job ``name`` every ``interval`` seconds while the scheduler runs."""
+        self._periodic.append((interval, name, args, kwargs))
+        if self._running:
+            self._spawn(self._run_periodic(interval, name, args, kwargs))
+
+    async def enqueue(self, name: str, *args: Any, delay: float = 0.0, **kwargs: Any) -> str:
+        """Queue a run of job ``name`` after ``delay`` seconds and return its id."""
+        job_type = self._types.get(name)
+        if job_type is None:
+            raise ValueError(f"Unknown job type {name!r}")
+        if self._stopping:
+            raise RuntimeError("The job scheduler is shutting down")
+
+        job = Job(str(uuid4()), name, args, kwargs)
+        if job_type.durable:
+            await self.store.add(job.id, name, args, kwargs, run_at=time.time() + delay)
+            if self._wake is not None:
+                self._wake.set()
+        else:
+            self._put_later(job, delay)
+        return job.id
+
+    async def start(self) -> None:
+        """Start workers, the durable job poller and periodic schedules."""
+        self._slots = asyncio.Semaphore(self.max_workers)
+        self._wake = asyncio.Event()
+        self._running = True
+        for job_type in self._types.values():
+            self._start_workers(job_type)
+        if self.store is not None:
+            self._spawn(self._poll())
+        for interval, name, args, kwargs in self._periodic:
+            self._spawn(self._run_periodic(interval, name, args, kwargs))
+
+    async def shutdown(self, timeout: float = 10.0) -> None:
+        """Stop taking work and give running jobs ``timeout`` seconds to finish.
+
+        Queued in-memory jobs are dropped; claimed durable jobs that never
+        started are returned to the job table.
+        """
+        if not self._running:
+            return
+        self._stopping = True
+        for timer in self._timers:
+            timer.cancel()
+        self._timers.clear()
+        for task in self._tasks | self._idle:
+            task.cancel()
+
+        busy = self._workers - self._idle
+        if busy:
+            _, pending = await asyncio.wait(busy, timeout=timeout)
+            for task in pending:
+                logger.warning("Cancelling job worker still running after %.1fs", timeout)
+                task.cancel()
+        await asyncio.gather(*self._tasks, *self._workers, return_exceptions=True)
+
+        dropped = 0
+        for name, queue in self._queues.items():
+            while not queue.empty():
+                job = queue.get_nowait()
+                if self._types[name].durable:
+                    await self.store.release(job.id)
+                else:
+                    dropped += 1
+        if dropped:
+            logger.warning("Dropped %d queued in-memory jobs on shutdown", dropped)
+
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._thread_pool = self._process_pool = None
+        self._running = False
+
+    def _spawn(self, coroutine) -> asyncio.Task:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _start_workers(self, job_type: JobType) -> None:
+        self._queues[job_type.name] = asyncio.Queue()
+        self._claimed[job_type.name] = 0
+        for _ in range(job_type.max_concurrency):
+            task = asyncio.create_task(self._worker(job_type))
+            self._workers.add(task)
+            task.add_done_callback(self._workers.discard)
+
+    def _put_later(self, job: Job, delay: float) -> None:
+        queue = self._queues[job.name]
+        if delay <= 0:
+            queue.put_nowait(job)
+            return
+
+        def fire() -> None:
+            self._timers.discard(handle)
+            queue.put_nowait(job)
+
+        handle = asyncio.get_running_loop().call_later(delay, fire)
+        self._timers.add(handle)
+
+    async def _worker(self, job_type: JobType) -> None:
+        task = asyncio.current_task()
+        queue = self._queues[job_type.name]
+        while not self._stopping:
+            self._idle.add(task)
+            try:
+                job = await queue.get()
+            finally:
+                self._idle.discard(task)
+            async with self._slots:
+                try:
+                    await self._execute(job_type, job)
+                except Exception:
+                    # Only job table updates can fail here; the lease recovers the job
+                    logger.exception("Recording the outcome of job %s %s failed", job.name, job.id)
+
+    async def _execute(self, job_type: JobType, job: Job) -> None:
+        if not job_type.durable:
+            job.attempts += 1
+        try:
+            await self._call(job_type, job)
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            if job.attempts <= job_type.max_retries:
+                delay = job_type.retry_delay(job.attempts)
+                logger.warning(
+                    "Job %s %s failed (attempt %d), retrying in %.1fs: %s",
+                    job.name, job.id, job.attempts, delay, error,
+                )
+                if job_type.durable:
+                    await self.store.retry(job.id, error, time.time() + delay)
+                else:
+                    self._put_later(job, delay)
+            else:
+                logger.error(
+                    "Job %s %s failed after %d attempts: %s",
+                    job.name, job.id, job.attempts, error,
+                    exc_info=exc,
+                )
+                if job_type.durable:
+                    await self.store.fail(job.id, error)
+        else:
+            if job_type.durable:
+                await self.store.complete(job.id)
+        finally:
+            if job_type.durable:
+                self._claimed[job.name] -= 1
+
+    async def _call(self, job_type: JobType, job: Job) -> Any:
+        if job_type.executor == "async":
+            return await job_type.func(*job.args, **job.kwargs)
+        loop = asyncio.get_running_loop()
+        call = partial(job_type.func, *job.args, **job.kwargs)
+        return await loop.run_in_executor(self._executor(job_type.executor), call)
+
+    def _executor(self, kind: str) -> Executor:
+        if kind == "thread":
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    self.thread_workers, thread_name_prefix="job"
+                )
+            return self._thread_pool
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(self.process_workers)
+        return self._process_pool
+
+    async def _poll(self) -> None:
+        """Claim due durable jobs for every type with idle workers."""
+        while True:
+            try:
+                for job_type in self._types.values():
+                    if not job_type.durable:
+                        continue
+                    free = job_type.max_concurrency - self._claimed[job_type.name]
+                    if free <= 0:
+                        continue
+                    for stored in await self.store.claim(job_type.name, free):
+                        self._claimed[job_type.name] += 1
+                        job = Job(
+                            stored.id, job_type.name, stored.args, stored.kwargs, stored.attempts
+                        )
+                        self._queues[job_type.name].put_nowait(job)
+            except Exception:
+                logger.exception("Polling the job table failed")
+
+            # Sleep until the next poll, or until a durable job is enqueued here
+            timer = asyncio.get_running_loop().call_later(self.poll_interval, self._wake.set)
+            try:
+                await self._wake.wait()
+            finally:
+                timer.cancel()
+            self._wake.clear()
+
+    async def _run_periodic(
+        self, interval: float, name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.enqueue(name, *args, **kwargs)
+            except Exception:
+                logger.exception("Scheduling periodic job %s failed", name)
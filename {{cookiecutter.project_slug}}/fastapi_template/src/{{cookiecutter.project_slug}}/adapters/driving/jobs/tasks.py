@@ -0,0 +1,32 @@
+"""
+Background jobs of {{cookiecutter.project_name}}.
+
+Register job types here; the container calls ``register_jobs`` once at
+startup. Handlers enqueue work with ``container.jobs.enqueue(name, ...)``.
+"""
+import time
+
+from {{cookiecutter.project_slug}}.adapters.driving.jobs.scheduler import JobScheduler  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.config.settings import settings  # type: ignore # noqa: E501
+
+SEND_WELCOME_EMAIL = "send_welcome_email"
+PURGE_FINISHED_JOBS = "purge_finished_jobs"
+
+
+def register_jobs(scheduler: JobScheduler, container) -> None:
+    """Register every job type and periodic schedule."""
+    scheduler.register(
+        SEND_WELCOME_EMAIL,
+        container.email_adapter.send_welcome_email,
+        max_concurrency=4,
+        max_retries=5,
+        backoff=2.0,
+        durable=True,
+    )
+
+    async def purge_finished_jobs() -> int:
+        """Delete finished jobs older than ``JOB_RETENTION_SECONDS``."""
+        return await container.job_store.purge(time.time() - settings.JOB_RETENTION_SECONDS)
+
+    scheduler.register(PURGE_FINISHED_JOBS, purge_finished_jobs)
+    scheduler.every(3600, PURGE_FINISHED_JOBS)
@@ -0,0 +1,69 @@
+"""
+Prometheus metrics for {{cookiecutter.project_name}}.
+
+``PrometheusMiddleware`` records a request counter and a latency histogram
+labelled by route template, so ``/users/{user_id}`` is one series rather than
+one per user. Under gunicorn every worker writes its samples to
+``PROMETHEUS_MULTIPROC_DIR`` and ``/metrics`` aggregates them, whichever worker
+answers the scrape.
+"""
+import os
+import time
+from typing import Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from {{cookiecutter.project_slug}}.adapters.driving.api.routes import route_template  # type: ignore # noqa: E501
+
+REQUESTS = Counter(
+    "http_requests_total", "HTTP requests handled.", ["method", "route", "status"]
+)
+LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency.", ["method", "route"]
+)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Return the exposition payload and its content type."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+class PrometheusMiddleware:
+    """Pure ASGI middleware; unlike ``BaseHTTPMiddleware`` it adds no task per request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = route_template(scope)
+            method = scope["method"]
+            LATENCY.labels(method, route).observe(time.perf_counter() - start)
+            REQUESTS.labels(method, route, str(status_code)).inc()
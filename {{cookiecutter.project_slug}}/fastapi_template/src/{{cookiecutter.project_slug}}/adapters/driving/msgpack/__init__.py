@@ -0,0 +1,3 @@
+"""
+MessagePack adapters for {{cookiecutter.project_name}}.
+"""
@@ -0,0 +1,54 @@
+"""
+MessagePack encoding for {{cookiecutter.project_name}}.
+
+Users keep the field names of their JSON representation, but ids are sent as
+16 raw bytes and timestamps as MessagePack timestamps, instead of 36 and 32
+characters of text. Domain entities are packed directly, with no pydantic
+model or JSON text in between. Decoded timestamps are timezone-aware (UTC);
+decoded ids are bytes, which pydantic accepts for ``UUID`` fields.
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict
+from uuid import UUID
+
+import msgpack
+from fastapi import Response
+from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore # noqa: E501
+
+MEDIA_TYPE = "application/msgpack"
+
+USER_FIELDS = ("id", "email", "name", "is_active", "created_at", "updated_at")
+
+
+def _default(obj):
+    """Encode the types msgpack does not handle natively."""
+    if isinstance(obj, UUID):
+        return obj.bytes
+    if isinstance(obj, datetime):
+        # Aware datetimes are packed natively; naive ones are stored as UTC
+        return msgpack.Timestamp.from_datetime(obj.replace(tzinfo=timezone.utc))
+    raise TypeError(f"Type is not MessagePack serializable: {type(obj).__name__}")
+
+
+def packb(data: Any) -> bytes:
+    """Encode ``data`` to MessagePack bytes."""
+    return msgpack.packb(data, default=_default, datetime=True)
+
+
+def unpackb(data: bytes) -> Any:
+    """Decode MessagePack bytes; raises ``ValueError`` on invalid input."""
+    return msgpack.unpackb(data, timestamp=3)
+
+
+def user_fields(user: User) -> Dict[str, Any]:
+    """The fields of a user's representation."""
+    return {name: getattr(user, name) for name in USER_FIELDS}
+
+
+class MessagePackResponse(Response):
+    """Response with a MessagePack body."""
+
+    media_type = MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return packb(content)
@@ -0,0 +1,172 @@
+"""
+MessagePack user routes for {{cookiecutter.project_name}}.
+
+The operations of the JSON user routes, under ``/internal/v1/users``, for
+other services: request and response bodies are MessagePack, errors
+included, with the same fields and status codes as their JSON counterparts.
+"""
+from typing import Type, TypeVar
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ValidationError
+from {{cookiecutter.project_slug}}.adapters.driving.api.conditional import NOT_MODIFIED, is_conditional, not_modified, validators  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.api.schemas import CreateUserRequest, UpdateUserNameRequest, UserIdsRequest  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.api.user_routes import get_user_service  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.msgpack.codec import MEDIA_TYPE, MessagePackResponse, unpackb, user_fields  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.domain.services.user_service import UserService  # type: ignore # noqa: E501
+
+Payload = TypeVar("Payload", bound=BaseModel)
+
+
+class MessagePackRoute(APIRoute):
+    """Route sending its errors as MessagePack, so callers decode a single format."""
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            try:
+                return await handler(request)
+            except HTTPException as exc:
+                return MessagePackResponse(
+                    {"detail": exc.detail}, status_code=exc.status_code, headers=exc.headers
+                )
+            except RequestValidationError as exc:
+                # The rejected input and error context may not be encodable
+                errors = [
+                    {"type": error["type"], "loc": error["loc"], "msg": error["msg"]}
+                    for error in exc.errors()
+                ]
+                return MessagePackResponse(
+                    {"detail": errors}, status_code=status.HTTP_422_UNPROCESSABLE_CONTENT
+                )
+
+        return route_handler
+
+
+router = APIRouter(route_class=MessagePackRoute, default_response_class=MessagePackResponse)
+
+
+async def read(request: Request, model: Type[Payload]) -> Payload:
+    """Decode a MessagePack request body and validate it against ``model``."""
+    if request.headers.get("content-type", "").partition(";")[0].strip() != MEDIA_TYPE:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=f"Expected {MEDIA_TYPE}"
+        )
+    try:
+        payload = unpackb(await request.body())
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid MessagePack body"
+        ) from exc
+    try:
+        return model.model_validate(payload)
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors()]
+        ) from exc
+
+
+def found(user: User | None) -> MessagePackResponse:
+    """Encode a user or raise 404."""
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return MessagePackResponse(user_fields(user))
+
+
+@router.post("/", status_code=status.HTTP_201_CREATED)
+async def create_user(
+    request: Request, service: UserService = Depends(get_user_service)
+) -> MessagePackResponse:
+    """Create a user; the welcome email is sent in the background."""
+    payload = await read(request, CreateUserRequest)
+    try:
+        user = await service.create_user(email=payload.email, name=payload.name)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return MessagePackResponse(user_fields(user), status_code=status.HTTP_201_CREATED)
+
+
+@router.get("/", responses=NOT_MODIFIED)
+async def list_users(
+    request: Request, service: UserService = Depends(get_user_service)
+) -> Response:
+    """List all users; 304 when the client's copy is current."""
+    if is_conditional(request):
+        count, updated_at = await service.get_all_users_updated_at()
+        unchanged = not_modified(request, validators(updated_at, count))
+        if unchanged is not None:
+            return unchanged
+    users = await service.get_all_users()
+    latest = max((user.updated_at for user in users), default=None)
+    return MessagePackResponse(
+        {"users": [user_fields(user) for user in users], "count": len(users)},
+        headers=validators(latest, len(users)),
+    )
+
+
+@router.post("/batch/activate")
+async def activate_users(
+    request: Request, service: UserService = Depends(get_user_service)
+) -> MessagePackResponse:
+    """Activate many users in one statement; returns those that were inactive."""
+    payload = await read(request, UserIdsRequest)
+    ids = await service.activate_users(payload.ids)
+    return MessagePackResponse({"ids": ids, "count": len(ids)})
+
+
+@router.post("/batch/deactivate")
+async def deactivate_users(
+    request: Request, service: UserService = Depends(get_user_service)
+) -> MessagePackResponse:
+    """Deactivate many users in one statement; returns those that were active."""
+    payload = await read(request, UserIdsRequest)
+    ids = await service.deactivate_users(payload.ids)
+    return MessagePackResponse({"ids": ids, "count": len(ids)})
+
+
+@router.get("/{user_id}", responses=NOT_MODIFIED)
+async def get_user(
+    user_id: UUID, request: Request, service: UserService = Depends(get_user_service)
+) -> Response:
+    """Get a user by ID; 304 when the client's copy is current."""
+    if is_conditional(request):
+        updated_at = await service.get_user_updated_at(user_id)
+        if updated_at is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        unchanged = not_modified(request, validators(updated_at))
+        if unchanged is not None:
+            return unchanged
+    user = await service.get_user(user_id)
+    response = found(user)
+    response.headers.update(validators(user.updated_at))
+    return response
+
+
+@router.patch("/{user_id}")
+async def update_user_name(
+    user_id: UUID, request: Request, service: UserService = Depends(get_user_service)
+) -> MessagePackResponse:
+    """Rename a user."""
+    payload = await read(request, UpdateUserNameRequest)
+    return found(await service.update_user_name(user_id, payload.name))
+
+
+@router.post("/{user_id}/activate")
+async def activate_user(
+    user_id: UUID, service: UserService = Depends(get_user_service)
+) -> MessagePackResponse:
+    """Activate a user."""
+    return found(await service.activate_user(user_id))
+
+
+@router.post("/{user_id}/deactivate")
+async def deactivate_user(
+    user_id: UUID, service: UserService = Depends(get_user_service)
+) -> MessagePackResponse:
+    """Deactivate a user."""
+    return found(await service.deactivate_user(user_id))
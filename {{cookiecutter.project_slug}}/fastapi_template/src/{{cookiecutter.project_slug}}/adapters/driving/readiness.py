@@ -0,0 +1,129 @@
+"""
+Readiness for {{cookiecutter.project_name}}.
+
+``/health`` only says the process is up; ``/ready`` says whether it can serve.
+``ReadinessMonitor`` runs the probes every ``interval`` seconds in the
+background and ``/ready`` returns the last result, so a probe costs the same
+however often the orchestrator asks. A result older than three intervals counts
+as not ready, in case the monitor itself stalls. So is a worker that has
+begun to shut down. Probes:
+
+* database: ``SELECT 1`` on the primary; fails if slower than ``max_latency``;
+* events: domain events waiting for delivery, and how long the oldest has waited;
+* jobs: due jobs not yet claimed, and how long the oldest has been due.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from {{cookiecutter.project_slug}}.adapters.driven.events.event_bus import InProcessEventBus  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.database import Database  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.job_store import JobStore  # type: ignore # noqa: E501
+
+logger = logging.getLogger(__name__)
+
+# Whether the dependency is fit to serve, and what was measured
+Probe = Callable[[], Awaitable[Tuple[bool, Dict[str, Any]]]]
+
+
+def database_probe(database: Database, max_latency: float) -> Probe:
+    """Ping ``database``; too slow a round trip fails."""
+
+    async def probe():
+        start = time.perf_counter()
+        await database.fetchrow("SELECT 1 AS ok")
+        latency = time.perf_counter() - start
+        return latency <= max_latency, {"latency_ms": round(latency * 1000, 1)}
+
+    return probe
+
+
+def event_probe(event_bus: InProcessEventBus, max_queued: int, max_lag: float) -> Probe:
+    """Fail while domain event delivery is too far behind."""
+
+    async def probe():
+        queued, lag = event_bus.queued, event_bus.lag()
+        detail = {"queued": queued, "lag_seconds": round(lag, 1), "dropped": event_bus.dropped}
+        return queued <= max_queued and lag <= max_lag, detail
+
+    return probe
+
+
+def job_probe(job_store: JobStore, max_due: int, max_lag: float) -> Probe:
+    """Fail while due jobs wait too long, or too many of them, to be claimed."""
+
+    async def probe():
+        due, lag = await job_store.backlog()
+        return due <= max_due and lag <= max_lag, {"due": due, "lag_seconds": round(lag, 1)}
+
+    return probe
+
+
+class ReadinessMonitor:
+    """Run readiness probes in the background and keep their last result."""
+
+    def __init__(self, probes: Dict[str, Probe], interval: float = 5.0, timeout: float = 2.0):
+        """Check with ``probes`` by name; checks start with ``start``."""
+        self.probes = probes
+        self.interval = interval
+        self.timeout = timeout
+        self.checks: Dict[str, Dict[str, Any]] = {}
+        self.checked_at: Optional[float] = None
+        # Set on shutdown: not ready whatever the probes say
+        self.draining = False
+        self._passed = False
+        self._checker: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether the last check passed and is recent, and no shutdown has begun."""
+        return (
+            not self.draining
+            and self._passed
+            and self.checked_at is not None
+            and time.monotonic() - self.checked_at < 3 * self.interval
+        )
+
+    def status(self) -> Dict[str, Any]:
+        """The ``/ready`` payload."""
+        if self.draining:
+            return {"status": "draining", "checks": self.checks}
+        return {"status": "ready" if self.ready else "not ready", "checks": self.checks}
+
+    async def check(self) -> None:
+        """Run every probe once, concurrently; log only changes."""
+        results = await asyncio.gather(*(self._run(probe) for probe in self.probes.values()))
+        checks = dict(zip(self.probes, results))
+        passed = all(result["ok"] for result in checks.values())
+        if not passed and (self._passed or self.checked_at is None):
+            failed = [name for name, result in checks.items() if not result["ok"]]
+            logger.warning("Not ready: %s", ", ".join(failed), extra={"checks": checks})
+        elif passed and not self._passed:
+            logger.info("Ready")
+        self.checks, self._passed, self.checked_at = checks, passed, time.monotonic()
+
+    async def _run(self, probe: Probe) -> Dict[str, Any]:
+        try:
+            async with asyncio.timeout(self.timeout):
+                ok, detail = await probe()
+        except Exception as exc:
+            return {"ok": False, "error": str(exc) or type(exc).__name__}
+        return {"ok": ok, **detail}
+
+    async def start(self) -> None:
+        """Check once, then every ``interval`` seconds in a background task."""
+        await self.check()
+        self._checker = asyncio.create_task(self._check_forever())
+
+    async def stop(self) -> None:
+        """Stop the background checks."""
+        if self._checker is not None:
+            self._checker.cancel()
+            await asyncio.gather(self._checker, return_exceptions=True)
+            self._checker = None
+
+    async def _check_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.check()
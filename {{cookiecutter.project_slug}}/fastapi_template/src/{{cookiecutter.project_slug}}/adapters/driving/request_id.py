@@ -0,0 +1,48 @@
+"""
+Request id correlation for {{cookiecutter.project_name}}.
+
+``RequestIdMiddleware`` takes the id from the caller's ``X-Request-ID`` header,
+or makes a new one, stores it for the logging setup so every record logged
+while handling the request carries it, and returns it in the response.
+"""
+import re
+import uuid
+
+from {{cookiecutter.project_slug}}.config.logging_config import request_id  # type: ignore # noqa: E501
+
+REQUEST_ID_HEADER = b"x-request-id"
+# Ids from callers are echoed into logs and headers, so only plain tokens are kept
+VALID_REQUEST_ID = re.compile(rb"[A-Za-z0-9._-]{1,128}")
+
+
+def incoming_request_id(headers) -> str:
+    """The caller's request id if it is a plain token, else a new one."""
+    for name, value in headers:
+        if name == REQUEST_ID_HEADER and VALID_REQUEST_ID.fullmatch(value):
+            return value.decode()
+    return uuid.uuid4().hex
+
+
+class RequestIdMiddleware:
+    """Pure ASGI middleware; the id also follows the request into tasks it starts."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        current = incoming_request_id(scope["headers"])
+        request_id.set(current)
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (REQUEST_ID_HEADER, current.encode()),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
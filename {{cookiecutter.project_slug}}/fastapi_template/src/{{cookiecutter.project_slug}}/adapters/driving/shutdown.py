@@ -0,0 +1,143 @@
+"""
+Graceful shutdown for {{cookiecutter.project_name}}.
+
+On SIGTERM, ``ShutdownCoordinator`` drains the worker before it stops:
+
+1. ``/ready`` fails at once, and responses ask clients to close their
+   keep-alive connections;
+2. requests are still served for ``drain_delay`` seconds, while load balancers
+   take the worker out of rotation;
+3. the signal goes on to the server, which stops accepting connections;
+   requests in flight are cancelled if still running at the deadline;
+4. the container delivers queued events, lets running jobs finish and closes
+   the connection pools, each within what is left of ``timeout`` seconds.
+
+A second SIGTERM skips what is left of the drain delay. Other signals, such as
+Ctrl+C, are not delayed.
+"""
+import asyncio
+import contextvars
+import logging
+import math
+import os
+import signal
+import threading
+import time
+from typing import Optional, Set
+
+from {{cookiecutter.project_slug}}.adapters.driving.readiness import ReadinessMonitor  # type: ignore # noqa: E501
+
+logger = logging.getLogger(__name__)
+
+
+class ShutdownCoordinator:
+    """Drain the worker on SIGTERM, within one deadline for the whole shutdown."""
+
+    def __init__(
+        self, readiness: ReadinessMonitor, drain_delay: float = 5.0, timeout: float = 25.0
+    ):
+        self.readiness = readiness
+        self.drain_delay = drain_delay
+        self.timeout = timeout
+        self.requests: Set[asyncio.Task] = set()
+        self._deadline: Optional[float] = None
+        self._previous = signal.SIG_DFL
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._drainer: Optional[asyncio.Task] = None
+        self._handed_over = asyncio.Event()
+
+    @property
+    def draining(self) -> bool:
+        """Whether shutdown has begun."""
+        return self._deadline is not None
+
+    def drain(self) -> None:
+        """Fail readiness and start the shutdown deadline; later calls do nothing."""
+        if self.draining:
+            return
+        self._deadline = time.monotonic() + self.timeout
+        self.readiness.draining = True
+        logger.info("Draining: %d requests in flight", len(self.requests))
+
+    def remaining(self, limit: float = math.inf) -> float:
+        """Seconds left before the deadline, at most ``limit``."""
+        if self._deadline is None:
+            return limit
+        return max(0.0, min(limit, self._deadline - time.monotonic()))
+
+    async def wait_for_requests(self) -> None:
+        """Wait for requests in flight until the deadline, then cancel them."""
+        if not self.requests:
+            return
+        _, pending = await asyncio.wait(set(self.requests), timeout=self.remaining(self.timeout))
+        if pending:
+            logger.warning("Cancelling %d requests still running at the deadline", len(pending))
+            for task in pending:
+                task.cancel()
+
+    def install(self) -> None:
+        """Drain on SIGTERM, then pass the signal on to the server's own handler.
+
+        Call once the server has set its signal handlers, from the main thread;
+        elsewhere, signals cannot be handled and this does nothing.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._previous = signal.getsignal(signal.SIGTERM)
+        signal.signal(signal.SIGTERM, self._on_sigterm)
+
+    def _on_sigterm(self, signum, frame) -> None:
+        if self._drainer is None:
+            # Not in the context of whichever request the signal interrupted
+            self._loop.call_soon_threadsafe(self._start_draining, context=contextvars.Context())
+        else:
+            self._pass_on(signum, frame)
+
+    def _start_draining(self) -> None:
+        if self._drainer is None:
+            self._drainer = asyncio.create_task(self._drain_then_stop())
+
+    async def _drain_then_stop(self) -> None:
+        self.drain()
+        try:
+            async with asyncio.timeout(self.remaining(self.drain_delay)):
+                await self._handed_over.wait()
+        except TimeoutError:
+            # Back through _on_sigterm, which now hands the signal to the server
+            os.kill(os.getpid(), signal.SIGTERM)
+        await self.wait_for_requests()
+
+    def _pass_on(self, signum, frame) -> None:
+        self._loop.call_soon_threadsafe(self._handed_over.set)
+        if callable(self._previous):
+            self._previous(signum, frame)
+        else:
+            signal.signal(signum, self._previous)
+            signal.raise_signal(signum)
+
+
+class DrainMiddleware:
+    """Pure ASGI middleware; tracks requests in flight for ``ShutdownCoordinator``."""
+
+    def __init__(self, app, coordinator: ShutdownCoordinator):
+        self.app = app
+        self.coordinator = coordinator
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_closing(message):
+            if message["type"] == "http.response.start" and self.coordinator.draining:
+                # The client reconnects, through the load balancer, to another worker
+                message["headers"] = [*message.get("headers", ()), (b"connection", b"close")]
+            await send(message)
+
+        task = asyncio.current_task()
+        self.coordinator.requests.add(task)
+        try:
+            await self.app(scope, receive, send_closing)
+        finally:
+            self.coordinator.requests.discard(task)
@@ -0,0 +1,51 @@
+"""
+Request tracing middleware for {{cookiecutter.project_name}}.
+
+``TracingMiddleware`` opens the root span of each sampled request. The span is
+named after the matched route template, e.g. ``GET /api/v1/users/{user_id}``,
+and the service and repository spans of the request nest under it. The
+request id is recorded on the span, so a trace can be found from its logs.
+"""
+from {{cookiecutter.project_slug}}.adapters.driven.tracing.tracer import Tracer  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.api.routes import route_template  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.config.logging_config import request_id  # type: ignore # noqa: E501
+
+
+class TracingMiddleware:
+    """Pure ASGI middleware tracing each HTTP request with ``tracer``."""
+
+    def __init__(self, app, tracer: Tracer):
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = ""
+        for name, value in scope["headers"]:
+            if name == b"traceparent":
+                traceparent = value.decode("latin-1")
+                break
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        method = scope["method"]
+        with self.tracer.trace(
+            method, traceparent, path=scope["path"], request_id=request_id.get()
+        ) as span:
+            if span is None:
+                await self.app(scope, receive, send)
+                return
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                span.name = f"{method} {route_template(scope)}"
+                span.attributes["status"] = status_code
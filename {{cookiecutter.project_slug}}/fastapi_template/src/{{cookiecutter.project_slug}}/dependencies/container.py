@@ -1,8 +1,26 @@
 """
 Dependency injection container for {{cookiecutter.project_name}}.
 """
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+from {{cookiecutter.project_slug}}.adapters.driven.cache.cached_user_repository import CachedUserRepository  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.cache.shared_cache import SharedMemoryCache, default_path  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.cache.ttl_cache import TTLCache  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.cache.user_codec import UserCacheCodec  # type: ignore # noqa: E501
+{%- endif %}
+from {{cookiecutter.project_slug}}.adapters.driven.events.event_bus import InProcessEventBus  # type: ignore # noqa: E501
 from {{cookiecutter.project_slug}}.adapters.driven.external.email_adapter import EmailAdapter  # type: ignore # noqa: E501
-from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_repository import SQLiteUserRepository  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.database import Database  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.job_store import JobStore, create_job_schema  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.replicas import ReplicaRouter  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_repository import SQLUserRepository, create_schema  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_transfer import UserTransfer  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.tracing.exporters import build_exporter  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.tracing.tracer import Tracer  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.events.subscribers import register_subscribers  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.jobs.scheduler import JobScheduler  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.jobs.tasks import register_jobs  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.readiness import ReadinessMonitor, database_probe, event_probe, job_probe  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.shutdown import ShutdownCoordinator  # type: ignore # noqa: E501
 from {{cookiecutter.project_slug}}.config.settings import settings  # type: ignore # noqa: E501
 from {{cookiecutter.project_slug}}.domain.services.user_service import UserService  # type: ignore # noqa: E501
 
@@ -12,19 +30,153 @@ class Container:
 
     def __init__(self):
         """Initialize container with dependencies."""
+        # Initialize tracing
+        self.tracer = Tracer(
+            build_exporter(
+                settings.TRACE_EXPORTER,
+                settings.TRACE_FILE,
+                settings.TRACE_OTLP_ENDPOINT,
+                settings.PROJECT_NAME,
+            ),
+            settings.TRACE_SAMPLE_RATE,
+        )
+
+        # Initialize persistence
+        self.database = Database(
+            settings.DATABASE_URL,
+            min_size=settings.DB_POOL_MIN_SIZE,
+            max_size=settings.DB_POOL_MAX_SIZE,
+        )
+        # User reads go to healthy replicas; jobs and schema stay on the primary
+        replicas = [
+            Database(url, min_size=settings.DB_POOL_MIN_SIZE, max_size=settings.DB_POOL_MAX_SIZE)
+            for url in settings.DATABASE_REPLICA_URLS
+        ]
+        self.db_router = ReplicaRouter(
+            self.database,
+            replicas,
+            max_lag=settings.DB_REPLICA_MAX_LAG_SECONDS,
+            check_interval=settings.DB_REPLICA_CHECK_INTERVAL,
+        )
+
         # Initialize repositories
-        self.user_repository = SQLiteUserRepository(settings.DATABASE_URL)
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        if settings.CACHE_BACKEND == "shared":
+            self.cache = SharedMemoryCache(
+                settings.CACHE_SHARED_PATH
+                or default_path("{{cookiecutter.project_slug}}", settings.DATABASE_URL),
+                settings.CACHE_TTL_SECONDS,
+                settings.CACHE_MAX_ENTRIES,
+                codec=UserCacheCodec(),
+            )
+        elif settings.CACHE_BACKEND == "memory":
+            self.cache = TTLCache(settings.CACHE_TTL_SECONDS, settings.CACHE_MAX_ENTRIES)
+        else:
+            raise ValueError(f"Unknown CACHE_BACKEND {settings.CACHE_BACKEND!r}")
+        self.user_repository = CachedUserRepository(SQLUserRepository(self.db_router), self.cache)
+{%- else %}
+        self.user_repository = SQLUserRepository(self.db_router)
+{%- endif %}
+        if self.tracer.enabled:
+            self.user_repository = self.tracer.instrument(self.user_repository, "UserRepository")
+        self.user_transfer = UserTransfer(
+            self.db_router,
+            settings.TRANSFER_BATCH_SIZE,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+            # Imported rows replace cached users wholesale
+            on_import=self.cache.clear,
+{%- endif %}
+        )
 
         # Initialize external services
         self.email_adapter = EmailAdapter()
 
+        # Initialize domain events
+        self.event_bus = InProcessEventBus(
+            max_queue_size=settings.EVENT_QUEUE_SIZE, batch_size=settings.EVENT_BATCH_SIZE
+        )
+
         # Initialize domain services
-        self.user_service = UserService(self.user_repository)
+        self.user_service = UserService(self.user_repository, self.event_bus)
+        if self.tracer.enabled:
+            self.user_service = self.tracer.instrument(self.user_service, "UserService")
+
+        # Initialize background jobs
+        self.job_store = JobStore(self.database, lease_seconds=settings.JOB_LEASE_SECONDS)
+        self.jobs = JobScheduler(
+            self.job_store,
+            max_workers=settings.JOB_MAX_WORKERS,
+            thread_workers=settings.JOB_THREAD_WORKERS,
+            process_workers=settings.JOB_PROCESS_WORKERS,
+            poll_interval=settings.JOB_POLL_INTERVAL,
+        )
+        register_jobs(self.jobs, self)
+        register_subscribers(self.event_bus, self)
+
+        # Initialize readiness probes
+        self.readiness = ReadinessMonitor(
+            {
+                "database": database_probe(self.database, settings.READY_DB_MAX_LATENCY_MS / 1000),
+                "events": event_probe(
+                    self.event_bus,
+                    settings.READY_EVENT_MAX_QUEUED,
+                    settings.READY_EVENT_MAX_LAG_SECONDS,
+                ),
+                "jobs": job_probe(
+                    self.job_store, settings.READY_JOB_MAX_DUE, settings.READY_JOB_MAX_LAG_SECONDS
+                ),
+            },
+            interval=settings.READY_CHECK_INTERVAL,
+            timeout=settings.READY_CHECK_TIMEOUT,
+        )
+        self.shutdown_coordinator = ShutdownCoordinator(
+            self.readiness,
+            drain_delay=settings.SHUTDOWN_DRAIN_DELAY,
+            timeout=settings.SHUTDOWN_TIMEOUT,
+        )
+
+    async def startup(self) -> None:
+        """Connect to the database, create missing tables, start jobs, events and probes.
+
+        Drains on SIGTERM from then on, so call it once the server handles signals.
+        """
+        await self.database.connect()
+        await self.db_router.connect()
+        await create_schema(self.database)
+        await create_job_schema(self.database)
+        await self.jobs.start()
+        await self.event_bus.start()
+        await self.readiness.start()
+        self.shutdown_coordinator.install()
+
+    async def shutdown(self) -> None:
+        """Stop probes, deliver queued events, let running jobs finish, release connections.
+
+        Producers stop before what they feed: requests raise events, and event
+        subscribers enqueue jobs. Each step gets what is left of ``SHUTDOWN_TIMEOUT``.
+        """
+        coordinator = self.shutdown_coordinator
+        coordinator.drain()
+        await self.readiness.stop()
+        await coordinator.wait_for_requests()
+        await self.event_bus.stop(coordinator.remaining(settings.EVENT_SHUTDOWN_TIMEOUT))
+        await self.jobs.shutdown(coordinator.remaining(settings.JOB_SHUTDOWN_TIMEOUT))
+        await self.db_router.close()
+        await self.database.close()
+        self.tracer.shutdown()
 
     def get_user_service(self) -> UserService:
         """Get user service instance."""
         return self.user_service
 
+    def get_user_transfer(self) -> UserTransfer:
+        """Get bulk user export/import instance."""
+        return self.user_transfer
+
     def get_email_adapter(self) -> EmailAdapter:
         """Get email adapter instance."""
         return self.email_adapter
+
+    def get_job_scheduler(self) -> JobScheduler:
+        """Get background job scheduler instance."""
+        return self.jobs
@@ -0,0 +1,39 @@
+"""
+User domain events for {{cookiecutter.project_name}}.
+"""
+from dataclasses import dataclass
+from uuid import UUID
+
+from {{cookiecutter.project_slug}}.domain.events.base import DomainEvent  # type: ignore
+
+
+@dataclass(frozen=True)
+class UserCreated(DomainEvent):
+    """A user was created."""
+
+    user_id: UUID
+    email: str
+    name: str
+
+
+@dataclass(frozen=True)
+class UserRenamed(DomainEvent):
+    """A user changed name."""
+
+    user_id: UUID
+    old_name: str
+    new_name: str
+
+
+@dataclass(frozen=True)
+class UserActivated(DomainEvent):
+    """A user was activated."""
+
+    user_id: UUID
+
+
+@dataclass(frozen=True)
+class UserDeactivated(DomainEvent):
+    """A user was deactivated."""
+
+    user_id: UUID
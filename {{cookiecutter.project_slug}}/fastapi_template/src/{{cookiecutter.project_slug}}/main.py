@@ -1,12 +1,48 @@
 """
 FastAPI application entry point for {{cookiecutter.project_name}}.
 """
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.replicas import PinWritesMiddleware  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.admission import AdaptiveLimiter, AdmissionControlMiddleware  # type: ignore # noqa: E501
 from {{cookiecutter.project_slug}}.adapters.driving.api.routes import api_router  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.api.schemas import HealthResponse, MessageResponse, ReadinessResponse  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.compression import CompressionMiddleware  # type: ignore # noqa: E501
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+from {{cookiecutter.project_slug}}.adapters.driving.metrics import PrometheusMiddleware, render_metrics  # type: ignore # noqa: E501
+{%- endif %}
+from {{cookiecutter.project_slug}}.adapters.driving.msgpack.user_routes import router as msgpack_user_router  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.request_id import RequestIdMiddleware  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.shutdown import DrainMiddleware  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.tracing import TracingMiddleware  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.config.logging_config import configure_logging, stop_logging  # type: ignore # noqa: E501
 from {{cookiecutter.project_slug}}.config.settings import settings  # type: ignore # noqa: E501
 from {{cookiecutter.project_slug}}.dependencies.container import Container  # type: ignore # noqa: E501
 
+# Initialize dependency injection container
+container = Container()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start logging and open database connections; release both on shutdown."""
+    configure_logging(
+        settings.LOG_LEVEL,
+        settings.LOG_FORMAT,
+        debug_sample_rate=settings.LOG_DEBUG_SAMPLE_RATE,
+        queue_size=settings.LOG_QUEUE_SIZE,
+    )
+    app.state.container = container
+    await container.startup()
+    try:
+        yield
+    finally:
+        await container.shutdown()
+        stop_logging()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="{{cookiecutter.project_name}}",
@@ -14,6 +50,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -25,27 +62,98 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize dependency injection container
-container = Container()
+if settings.COMPRESSION_ENCODINGS:
+    # Inside the metrics and tracing middleware, so their timings include compression
+    app.add_middleware(
+        CompressionMiddleware,
+        encodings=settings.COMPRESSION_ENCODINGS,
+        min_size=settings.COMPRESSION_MIN_SIZE,
+        levels={
+            "zstd": settings.COMPRESSION_ZSTD_LEVEL,
+            "br": settings.COMPRESSION_BROTLI_LEVEL,
+            "gzip": settings.COMPRESSION_GZIP_LEVEL,
+        },
+    )
+
+# Requests that may write read from the primary database, never a lagging replica
+app.add_middleware(PinWritesMiddleware)
+
+if settings.ADMISSION_CONTROL:
+    # Inside the metrics middleware, so shed requests are counted as 503s
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        limiter=AdaptiveLimiter(
+            settings.ADMISSION_INITIAL_LIMIT,
+            settings.ADMISSION_MIN_LIMIT,
+            settings.ADMISSION_MAX_LIMIT,
+            tolerance=settings.ADMISSION_LATENCY_TOLERANCE,
+        ),
+        queue_size=settings.ADMISSION_QUEUE_SIZE,
+        queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT,
+        retry_after=settings.ADMISSION_RETRY_AFTER,
+        exempt_paths=settings.ADMISSION_EXEMPT_PATHS,
+    )
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+# Request count and latency per route
+app.add_middleware(PrometheusMiddleware)
+{%- endif %}
+
+if container.tracer.enabled:
+    # Root span of each sampled request; services and repositories add child spans
+    app.add_middleware(TracingMiddleware, tracer=container.tracer)
+
+# Outside admission control, so shutdown also waits for queued requests
+app.add_middleware(DrainMiddleware, coordinator=container.shutdown_coordinator)
+
+# Outermost, so everything logged while handling a request carries its id
+app.add_middleware(RequestIdMiddleware)
 
 # Include API routes
 app.include_router(api_router)
 
+# The user operations in MessagePack, for other services
+app.include_router(msgpack_user_router, prefix="/internal/v1/users", tags=["internal"])
+
 @app.get("/")
-async def root():
+async def root() -> MessageResponse:
     """Health check endpoint."""
-    return {"message": "{{cookiecutter.project_name}} is running"}
+    return MessageResponse(message="{{cookiecutter.project_name}} is running")
 
 @app.get("/health")
-async def health():
+async def health() -> HealthResponse:
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return HealthResponse(status="healthy")
+
+@app.get(
+    "/ready",
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessResponse}},
+)
+async def ready(response: Response) -> ReadinessResponse:
+    """Readiness endpoint: the last result of the background dependency probes."""
+    if not container.readiness.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return ReadinessResponse(**container.readiness.status())
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """Prometheus scrape endpoint."""
+    payload, content_type = render_metrics()
+    return Response(payload, media_type=content_type)
+{%- endif %}
 
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
         "src.{{cookiecutter.project_slug}}.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=settings.DEBUG
+        host=settings.HOST,
+        port=settings.PORT,
+        reload=settings.DEBUG,
+        timeout_graceful_shutdown=settings.SHUTDOWN_TIMEOUT,
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        workers=None if settings.DEBUG else settings.WORKERS,
+        loop="uvloop",
+        http="httptools",
+{%- endif %}
     )
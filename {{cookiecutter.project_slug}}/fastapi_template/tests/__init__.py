@@ -0,0 +1 @@
+# Tests package for {{cookiecutter.project_name}}
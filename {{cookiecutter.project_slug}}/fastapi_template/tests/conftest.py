@@ -0,0 +1,71 @@
+"""
+Shared pytest fixtures for {{cookiecutter.project_name}}.
+
+Every test gets its own application: ``main`` is reloaded once the settings are
+patched, so the container, its database and the middleware stack are new.
+"""
+import importlib
+{%- if cookiecutter.db_type == "postgresql" %}
+import os
+{%- endif %}
+
+import pytest
+from fastapi.testclient import TestClient
+from {{cookiecutter.project_slug}}.config.settings import settings  # type: ignore # noqa: E501
+
+
+@pytest.fixture
+def app_settings(tmp_path):
+    """The application settings; changes made by a test are undone after it."""
+    saved = settings.model_dump()
+{%- if cookiecutter.db_type == "postgresql" %}
+    # A scratch database: its users and jobs are deleted before each test
+    settings.DATABASE_URL = os.environ.get(
+        "TEST_DATABASE_URL", f"{settings.DATABASE_URL}_test"
+    )
+{%- else %}
+    settings.DATABASE_URL = f"sqlite:///{tmp_path / 'test.db'}"
+{%- endif %}
+    settings.TRACE_FILE = str(tmp_path / "traces.jsonl")
+    yield settings
+    for name, value in saved.items():
+        setattr(settings, name, value)
+
+
+@pytest.fixture
+def build_app(app_settings):
+    """Build a new application, not started, after applying setting overrides."""
+
+    def build(**overrides):
+        for name, value in overrides.items():
+            setattr(app_settings, name, value)
+        from {{cookiecutter.project_slug}} import main  # type: ignore # noqa: E501
+
+        return importlib.reload(main).app
+
+    return build
+
+
+@pytest.fixture
+def app(build_app):
+    """A new application built from the test settings; not started."""
+    return build_app()
+
+
+@pytest.fixture
+def container(app):
+    """The application's dependency container."""
+    from {{cookiecutter.project_slug}} import main  # type: ignore # noqa: E501
+
+    return main.container
+
+
+@pytest.fixture
+def client(app, container):
+    """A client for the started application; shut down after the test."""
+    with TestClient(app) as client:
+{%- if cookiecutter.db_type == "postgresql" %}
+        for table in ("users", "jobs"):
+            client.portal.call(container.database.execute, f"DELETE FROM {table}")
+{%- endif %}
+        yield client
@@ -0,0 +1,96 @@
+"""
+Admission control tests for {{cookiecutter.project_name}}.
+"""
+import asyncio
+
+import pytest
+from starlette.responses import PlainTextResponse
+from {{cookiecutter.project_slug}}.adapters.driving.admission import AdaptiveLimiter, AdmissionControlMiddleware  # type: ignore # noqa: E501
+
+
+def one_slot(app):
+    return AdmissionControlMiddleware(
+        app,
+        AdaptiveLimiter(initial_limit=1, min_limit=1),
+        queue_size=1,
+        queue_timeout=0.2,
+        exempt_paths=["/health"],
+    )
+
+
+async def get(app, path):
+    """Send a GET through ``app``; return its status code and headers."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    await app({"type": "http", "method": "GET", "path": path, "headers": []}, receive, send)
+    return messages[0]["status"], dict(messages[0]["headers"])
+
+
+def test_limit_follows_latency():
+    limiter = AdaptiveLimiter(initial_limit=20, min_limit=4, max_limit=30)
+    limiter.in_flight = 20
+    for _ in range(200):
+        limiter.record(0.01)
+    # Grew while busy and fast, up to the maximum
+    assert limiter.limit == 30
+
+    limiter.in_flight = 30
+    for _ in range(50):
+        limiter.record(0.1)
+    assert limiter.min_limit <= limiter.limit < 10
+
+    # A mostly idle worker leaves the limit alone
+    shrunk = limiter.limit
+    limiter.in_flight = 1
+    limiter.record(5.0)
+    assert limiter.limit == shrunk
+
+
+@pytest.mark.asyncio
+async def test_requests_over_the_limit_are_shed_but_health_answers():
+    release = asyncio.Event()
+
+    async def app(scope, receive, send):
+        if scope["path"] == "/api/v1/users/":
+            await release.wait()
+        await PlainTextResponse("ok")(scope, receive, send)
+
+    middleware = one_slot(app)
+    running = asyncio.create_task(get(middleware, "/api/v1/users/"))
+    while middleware.limiter.in_flight == 0:
+        await asyncio.sleep(0)
+    # The queue holds one request: it waits, then gives up
+    status_code, headers = await get(middleware, "/api/v1/users/")
+    assert status_code == 503
+    assert headers[b"retry-after"] == b"1"
+    assert (await get(middleware, "/health"))[0] == 200
+
+    release.set()
+    assert (await running)[0] == 200
+    assert middleware.limiter.in_flight == 0
+    assert (await get(middleware, "/api/v1/users/"))[0] == 200
+
+
+@pytest.mark.asyncio
+async def test_queued_requests_are_served_in_turn():
+    async def app(scope, receive, send):
+        await asyncio.sleep(0.05)
+        await PlainTextResponse("ok")(scope, receive, send)
+
+    middleware = one_slot(app)
+    # One runs, one waits for its slot, one finds the queue full
+    responses = await asyncio.gather(*(get(middleware, "/api/v1/users/") for _ in range(3)))
+    assert sorted(status_code for status_code, _ in responses) == [200, 200, 503]
+    assert middleware.limiter.in_flight == 0
+
+
+def test_settings_turn_admission_control_off(build_app):
+    assert AdmissionControlMiddleware in [m.cls for m in build_app().user_middleware]
+    app = build_app(ADMISSION_CONTROL=False)
+    assert AdmissionControlMiddleware not in [m.cls for m in app.user_middleware]
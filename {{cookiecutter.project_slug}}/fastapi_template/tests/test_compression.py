@@ -0,0 +1,118 @@
+"""
+Response compression tests for {{cookiecutter.project_name}}.
+"""
+import asyncio
+import gzip
+import zlib
+
+import pytest
+from starlette.responses import Response, StreamingResponse
+from {{cookiecutter.project_slug}}.adapters.driving.compression import CompressionMiddleware, choose_encoding  # type: ignore # noqa: E501
+
+
+@pytest.fixture
+def users(client):
+    for i in range(50):
+        client.post("/api/v1/users/", json={"email": f"user{i}@example.com", "name": f"User {i}"})
+
+
+def get_raw(client, url, **headers):
+    """The response and its body as sent, without the client decoding it."""
+    with client.stream("GET", url, headers=headers) as response:
+        return response, b"".join(response.iter_raw())
+
+
+async def call(app, accept_encoding="gzip"):
+    """The ASGI messages ``app`` sends for a GET."""
+    messages = []
+
+    async def receive():
+        # The client stays connected until the response is complete
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+    }
+    await app(scope, receive, send)
+    return messages
+
+
+def test_choose_encoding_follows_weights_then_preference():
+    offered = ["zstd", "br", "gzip"]
+    assert choose_encoding("gzip, deflate, br", offered) == "br"
+    assert choose_encoding("gzip;q=1.0, br;q=0.5", offered) == "gzip"
+    assert choose_encoding("*", offered) == "zstd"
+    assert choose_encoding("*;q=0.1, gzip", offered) == "gzip"
+    assert choose_encoding("gzip;q=0, identity", offered) is None
+    assert choose_encoding("", offered) is None
+
+
+def test_large_response_is_compressed(client, users):
+    plain = client.get("/api/v1/users/", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in plain.headers
+    assert "Accept-Encoding" in plain.headers["Vary"]
+
+    response, body = get_raw(client, "/api/v1/users/", **{"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert int(response.headers["Content-Length"]) == len(body) < len(plain.content)
+    assert gzip.decompress(body) == plain.content
+    # A weak validator, still good for conditional requests
+    assert response.headers["ETag"] == f"W/{plain.headers['ETag']}"
+    assert client.get(
+        "/api/v1/users/",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["ETag"]},
+    ).status_code == 304
+
+
+def test_small_response_is_sent_as_is(client):
+    response, _ = get_raw(client, "/api/v1/users/", **{"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+    assert "Accept-Encoding" in response.headers["Vary"]
+
+
+def test_streamed_export_is_compressed(client, container, users):
+    container.user_transfer.batch_size = 10
+    response, body = get_raw(client, "/api/v1/users/export?format=csv", **{"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert gzip.decompress(body).count(b"\n") == 51
+
+
+@pytest.mark.asyncio
+async def test_streamed_response_is_compressed_chunk_by_chunk():
+    chunks = [b"id,name\n", b"1,Ada\n" * 300, b"2,Grace\n" * 300]
+
+    async def content():
+        for chunk in chunks:
+            yield chunk
+
+    messages = await call(CompressionMiddleware(StreamingResponse(content())))
+    decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+    decoded = [decompressor.decompress(message.get("body", b"")) for message in messages[1:]]
+    # Each chunk decodes as it arrives; the last message ends the stream
+    assert decoded[:3] == chunks
+    assert b"".join(decoded[3:]) == b""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"media_type": "image/png"},
+        {"media_type": "application/zip"},
+        {"headers": {"Content-Encoding": "br"}},
+        {"headers": {"Cache-Control": "no-transform"}},
+    ],
+)
+async def test_compressed_or_untransformable_responses_are_skipped(options):
+    body = b"x" * 10_000
+    start, sent = await call(CompressionMiddleware(Response(body, **options)))
+    content_encoding = dict(start["headers"]).get(b"content-encoding", b"").decode()
+    assert sent["body"] == body
+    assert content_encoding == options.get("headers", {}).get("Content-Encoding", "")
@@ -0,0 +1,54 @@
+"""
+Conditional GET tests for {{cookiecutter.project_name}}.
+"""
+import pytest
+
+
+@pytest.fixture
+def user(client):
+    return client.post("/api/v1/users/", json={"email": "ada@example.com", "name": "Ada"}).json()
+
+
+def test_unchanged_user_is_not_modified(client, container, user, monkeypatch):
+    url = f"/api/v1/users/{user['id']}"
+    response = client.get(url)
+    etag, last_modified = response.headers["ETag"], response.headers["Last-Modified"]
+
+    async def get_user(user_id):
+        raise AssertionError("the user was loaded")
+
+    # Only the timestamp is read, not the user
+    monkeypatch.setattr(container.user_service, "get_user", get_user)
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+    response = client.get(url, headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+
+def test_changed_user_is_sent_again(client, user):
+    url = f"/api/v1/users/{user['id']}"
+    etag = client.get(url).headers["ETag"]
+    client.patch(url, json={"name": "Ada Lovelace"})
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["name"] == "Ada Lovelace"
+
+    response = client.get(
+        "/api/v1/users/00000000-0000-0000-0000-000000000000", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 404
+
+
+def test_list_is_not_modified_until_a_user_changes(client, user):
+    etag = client.get("/api/v1/users/").headers["ETag"]
+    assert client.get("/api/v1/users/", headers={"If-None-Match": etag}).status_code == 304
+
+    client.post(f"/api/v1/users/{user['id']}/deactivate")
+    response = client.get("/api/v1/users/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
@@ -0,0 +1,140 @@
+"""
+Domain event tests for {{cookiecutter.project_name}}: events recorded by the
+User entity, published by the service and delivered by the in-process bus.
+"""
+import asyncio
+import time
+
+import pytest
+from {{cookiecutter.project_slug}}.adapters.driven.events.event_bus import InProcessEventBus  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.domain.events.base import DomainEvent  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.domain.events.user_events import UserCreated, UserDeactivated, UserRenamed  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.domain.services.user_service import UserService  # type: ignore # noqa: E501
+
+
+class InMemoryUserRepository:
+    def __init__(self):
+        self.users = {}
+
+    async def save(self, user):
+        self.users[user.id] = user
+        return user
+
+    async def get_by_id(self, user_id):
+        return self.users.get(user_id)
+
+    async def get_by_email(self, email):
+        return next((user for user in self.users.values() if user.email == email), None)
+
+
+class Recorder:
+    """Subscriber that records every batch it receives, and the loop it ran on."""
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.loops = set()
+        self.fail = fail
+
+    async def __call__(self, events):
+        self.batches.append(list(events))
+        self.loops.add(asyncio.get_running_loop())
+        if self.fail:
+            raise RuntimeError("subscriber failed")
+
+
+def test_user_records_events_until_pulled():
+    user = User.create(email="ada@example.com", name="Ada")
+    user.update_name("Ada Lovelace")
+    user.deactivate()
+
+    events = user.pull_events()
+    assert [type(event) for event in events] == [UserCreated, UserRenamed, UserDeactivated]
+    assert events[1] == UserRenamed(
+        user_id=user.id,
+        old_name="Ada",
+        new_name="Ada Lovelace",
+        occurred_at=events[1].occurred_at,
+    )
+    assert user.pull_events() == []
+
+
+@pytest.mark.asyncio
+async def test_service_publishes_after_save():
+    repository = InMemoryUserRepository()
+    bus = InProcessEventBus()
+    seen = []
+
+    async def check_saved(events):
+        for event in events:
+            seen.append(await repository.get_by_id(event.user_id) is not None)
+
+    bus.subscribe(UserCreated, check_saved, awaited=True)
+    await UserService(repository, bus).create_user("ada@example.com", "Ada")
+    assert seen == [True]
+
+
+@pytest.mark.asyncio
+async def test_fire_and_forget_is_batched():
+    bus = InProcessEventBus(batch_size=3)
+    recorder = Recorder()
+    bus.subscribe(DomainEvent, recorder)
+    await bus.start()
+    # Published from one task without yielding, so the dispatcher sees all of them
+    for _ in range(7):
+        await bus.publish([DomainEvent()])
+    assert recorder.batches == []
+    await bus.stop()
+
+    assert [len(batch) for batch in recorder.batches] == [3, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_awaited_subscriber_errors_reach_the_caller():
+    bus = InProcessEventBus()
+    bus.subscribe(DomainEvent, Recorder(fail=True), awaited=True)
+    with pytest.raises(RuntimeError, match="subscriber failed"):
+        await bus.publish([DomainEvent()])
+
+
+@pytest.mark.asyncio
+async def test_fire_and_forget_errors_are_logged(caplog):
+    bus = InProcessEventBus()
+    failing, recorder = Recorder(fail=True), Recorder()
+    bus.subscribe(DomainEvent, failing)
+    bus.subscribe(DomainEvent, recorder)
+    await bus.start()
+    await bus.publish([DomainEvent()])
+    await bus.stop()
+
+    assert len(recorder.batches) == 1
+    assert "Event subscriber" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_events():
+    bus = InProcessEventBus(max_queue_size=2)
+    recorder = Recorder()
+    bus.subscribe(DomainEvent, recorder)
+    await bus.start()
+    await bus.publish([DomainEvent() for _ in range(5)])
+    await bus.stop()
+
+    assert bus.dropped == 3
+    assert sum(len(batch) for batch in recorder.batches) == 2
+
+
+def test_api_events_are_delivered_on_the_app_loop(client, container):
+    recorder = Recorder()
+    client.portal.call(lambda: container.event_bus.subscribe(UserCreated, recorder))
+
+    response = client.post("/api/v1/users/", json={"email": "ada@example.com", "name": "Ada"})
+    assert response.status_code == 201
+
+    deadline = time.monotonic() + 5
+    while not recorder.batches:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    [[event]] = recorder.batches
+    assert str(event.user_id) == response.json()["id"]
+    assert recorder.loops == {client.portal.call(asyncio.get_running_loop)}
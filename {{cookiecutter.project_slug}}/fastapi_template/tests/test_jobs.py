@@ -0,0 +1,182 @@
+"""
+Background job scheduler tests for {{cookiecutter.project_name}}.
+"""
+import asyncio
+import time
+
+import pytest
+from {{cookiecutter.project_slug}}.adapters.driving.jobs.scheduler import JobScheduler  # type: ignore # noqa: E501
+
+
+@pytest.fixture
+def app(build_app):
+    """Poll the job table often, so durable jobs start without waiting."""
+    return build_app(JOB_POLL_INTERVAL=0.05)
+
+
+async def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_failed_jobs_are_retried_with_backoff():
+    scheduler = JobScheduler()
+    calls = []
+
+    async def flaky():
+        calls.append(time.monotonic())
+        if len(calls) < 3:
+            raise RuntimeError("transient")
+
+    async def broken():
+        calls.append(None)
+        raise RuntimeError("permanent")
+
+    scheduler.register("flaky", flaky, backoff=0.05)
+    scheduler.register("broken", broken, max_retries=1, backoff=0.01)
+    await scheduler.start()
+    try:
+        await scheduler.enqueue("flaky")
+        await wait_for(lambda: len(calls) == 3)
+        # Jittered between half and all of 0.05s, then of 0.1s
+        assert calls[1] - calls[0] >= 0.025
+        assert calls[2] - calls[1] >= 0.05
+
+        calls.clear()
+        await scheduler.enqueue("broken")
+        await wait_for(lambda: len(calls) == 2)
+        await asyncio.sleep(0.1)
+        # One run and one retry, then the job is given up
+        assert len(calls) == 2
+    finally:
+        await scheduler.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_job_types_run_at_most_max_concurrency_at_once():
+    scheduler = JobScheduler(max_workers=3)
+    running = {"limited": 0, "other": 0}
+    peaks = {"limited": 0, "other": 0, "total": 0}
+    done = []
+
+    def job(name):
+        async def run():
+            running[name] += 1
+            peaks[name] = max(peaks[name], running[name])
+            peaks["total"] = max(peaks["total"], sum(running.values()))
+            await asyncio.sleep(0.05)
+            running[name] -= 1
+            done.append(name)
+
+        return run
+
+    scheduler.register("limited", job("limited"), max_concurrency=2)
+    scheduler.register("other", job("other"), max_concurrency=3)
+    await scheduler.start()
+    try:
+        for _ in range(6):
+            await scheduler.enqueue("limited")
+            await scheduler.enqueue("other")
+        await wait_for(lambda: len(done) == 12)
+    finally:
+        await scheduler.shutdown()
+
+    assert peaks["limited"] == 2
+    # Both types share max_workers slots
+    assert peaks["total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_shutdown_waits_for_running_jobs():
+    scheduler = JobScheduler()
+    started, finished = [], []
+
+    async def slow(index):
+        started.append(index)
+        await asyncio.sleep(0.2)
+        finished.append(index)
+
+    scheduler.register("slow", slow)
+    await scheduler.start()
+    for index in range(3):
+        await scheduler.enqueue("slow", index)
+    await wait_for(lambda: started)
+
+    await scheduler.shutdown(timeout=5)
+    # The running job finished; the queued ones were dropped
+    assert finished == [0]
+    with pytest.raises(RuntimeError):
+        await scheduler.enqueue("slow", 3)
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_jobs_past_the_timeout():
+    scheduler = JobScheduler()
+    cancelled = []
+
+    async def stuck():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    scheduler.register("stuck", stuck)
+    await scheduler.start()
+    await scheduler.enqueue("stuck")
+    await asyncio.sleep(0.05)
+
+    await scheduler.shutdown(timeout=0.1)
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_periodic_jobs_are_enqueued_while_running():
+    scheduler = JobScheduler()
+    ticks = []
+
+    async def tick(label):
+        ticks.append(label)
+
+    scheduler.register("tick", tick)
+    scheduler.every(0.05, "tick", "report")
+    await scheduler.start()
+    await wait_for(lambda: len(ticks) >= 3)
+    await scheduler.shutdown()
+
+    count = len(ticks)
+    await asyncio.sleep(0.15)
+    assert len(ticks) == count
+    assert set(ticks) == {"report"}
+
+
+def test_durable_jobs_are_claimed_from_the_job_table(client, container):
+    calls = []
+
+    async def flaky(email):
+        calls.append(email)
+        if len(calls) < 3:
+            raise RuntimeError("transient")
+
+    client.portal.call(
+        lambda: container.jobs.register("flaky", flaky, durable=True, backoff=0.01)
+    )
+    job_id = client.portal.call(container.jobs.enqueue, "flaky", "ada@example.com")
+
+    def stored():
+        return client.portal.call(
+            container.database.fetchrow,
+            "SELECT status, attempts, last_error FROM jobs WHERE id = ?",
+            job_id,
+        )
+
+    deadline = time.monotonic() + 5
+    while stored()["status"] != "done":
+        assert time.monotonic() < deadline
+        time.sleep(0.02)
+    assert calls == ["ada@example.com"] * 3
+    assert stored()["attempts"] == 3
+    assert stored()["last_error"] == "RuntimeError: transient"
@@ -0,0 +1,97 @@
+"""
+Logging pipeline tests for {{cookiecutter.project_name}}.
+"""
+import io
+import json
+import logging
+
+import pytest
+from {{cookiecutter.project_slug}}.adapters.driving.request_id import RequestIdMiddleware  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.config.logging_config import NonBlockingQueueHandler, configure_logging, request_id, stop_logging  # type: ignore # noqa: E501
+
+logger = logging.getLogger("test_logging")
+
+
+@pytest.fixture
+def stream():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield io.StringIO()
+    stop_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def lines(stream):
+    """This module's records; background tasks may log to the root logger too."""
+    stop_logging()
+    entries = [json.loads(line) for line in stream.getvalue().splitlines()]
+    return [entry for entry in entries if entry["logger"] == logger.name]
+
+
+def test_records_are_written_as_json_with_extra_fields(stream):
+    configure_logging(stream=stream)
+    token = request_id.set("abc123")
+    try:
+        logger.info("Sent %s", "email", extra={"email": "a@example.com"})
+    finally:
+        request_id.reset(token)
+
+    [entry] = lines(stream)
+    assert entry["message"] == "Sent email"
+    assert entry["level"] == "INFO"
+    assert entry["request_id"] == "abc123"
+    assert entry["email"] == "a@example.com"
+
+
+def test_debug_records_are_sampled(stream):
+    configure_logging(level="DEBUG", debug_sample_rate=0, stream=stream)
+    logger.debug("Dropped")
+    logger.info("Kept")
+
+    assert [entry["message"] for entry in lines(stream)] == ["Kept"]
+
+
+def test_full_queue_drops_records_instead_of_waiting(stream):
+    handler = configure_logging(queue_size=0, stream=stream)
+    logger.info("Dropped")
+
+    assert handler.dropped == 1
+    assert lines(stream) == []
+
+
+@pytest.mark.asyncio
+async def test_records_logged_during_a_request_carry_its_id(stream):
+    configure_logging(stream=stream)
+
+    async def app(scope, receive, send):
+        logger.info("Handling %s", scope["path"])
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    async def send(message):
+        pass
+
+    headers = [(b"x-request-id", b"req-42")]
+    scope = {"type": "http", "method": "GET", "path": "/users", "headers": headers}
+    await RequestIdMiddleware(app)(scope, None, send)
+
+    [entry] = lines(stream)
+    assert entry["message"] == "Handling /users"
+    assert entry["request_id"] == "req-42"
+
+
+def test_app_logs_through_the_queue(client):
+    assert any(
+        isinstance(handler, NonBlockingQueueHandler)
+        for handler in logging.getLogger().handlers
+    )
+
+
+def test_request_id_is_echoed(client):
+    response = client.get("/health", headers={"X-Request-ID": "req-42"})
+    assert response.headers["X-Request-ID"] == "req-42"
+
+
+def test_invalid_request_id_is_replaced(client):
+    response = client.get("/health", headers={"X-Request-ID": "bad id"})
+    assert response.headers["X-Request-ID"] not in ("", "bad id")
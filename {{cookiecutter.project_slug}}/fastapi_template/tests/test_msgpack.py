@@ -0,0 +1,63 @@
+"""
+MessagePack user route tests for {{cookiecutter.project_name}}.
+"""
+from datetime import datetime
+from uuid import UUID
+
+import msgpack
+
+MSGPACK = "application/msgpack"
+URL = "/internal/v1/users"
+
+
+def post(client, url, data):
+    return client.post(url, content=msgpack.packb(data), headers={"Content-Type": MSGPACK})
+
+
+def unpack(response):
+    assert response.headers["Content-Type"] == MSGPACK
+    return msgpack.unpackb(response.content, timestamp=3)
+
+
+def test_users_round_trip_in_msgpack(client):
+    response = post(client, f"{URL}/", {"email": "ada@example.com", "name": "Ada"})
+    assert response.status_code == 201
+    created = unpack(response)
+    user_id = UUID(bytes=created["id"])
+    assert created["email"] == "ada@example.com"
+    assert isinstance(created["created_at"], datetime)
+
+    response = client.get(f"{URL}/{user_id}")
+    fetched = unpack(response)
+    as_json = client.get(f"/api/v1/users/{user_id}")
+    assert fetched["id"] == created["id"] and as_json.json()["id"] == str(user_id)
+    assert fetched["updated_at"] == datetime.fromisoformat(as_json.json()["updated_at"])
+    assert len(response.content) < len(as_json.content)
+    # Same validators as the JSON route
+    assert response.headers["ETag"] == as_json.headers["ETag"]
+    unchanged = client.get(f"{URL}/{user_id}", headers={"If-None-Match": response.headers["ETag"]})
+    assert unchanged.status_code == 304
+
+    # Ids are 16 raw bytes in request bodies too
+    changed = unpack(post(client, f"{URL}/batch/deactivate", {"ids": [user_id.bytes]}))
+    assert changed == {"ids": [user_id.bytes], "count": 1}
+    listed = unpack(client.get(f"{URL}/"))
+    assert [user["is_active"] for user in listed["users"]] == [False]
+    assert listed["count"] == 1
+
+
+def test_msgpack_errors(client):
+    response = post(client, f"{URL}/", {"email": "ada@example.com"})
+    assert response.status_code == 422
+    assert [error["loc"] for error in unpack(response)["detail"]] == [["body", "name"]]
+
+    response = client.post(f"{URL}/", content=b"\xc1", headers={"Content-Type": MSGPACK})
+    assert response.status_code == 400
+    assert unpack(response) == {"detail": "Invalid MessagePack body"}
+
+    response = client.post(f"{URL}/", json={"email": "ada@example.com", "name": "Ada"})
+    assert response.status_code == 415
+
+    response = client.get(f"{URL}/00000000-0000-0000-0000-000000000000")
+    assert response.status_code == 404
+    assert unpack(response) == {"detail": "User not found"}
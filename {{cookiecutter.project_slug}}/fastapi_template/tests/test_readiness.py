@@ -0,0 +1,64 @@
+"""
+Readiness endpoint tests for {{cookiecutter.project_name}}.
+"""
+import asyncio
+
+import pytest
+from {{cookiecutter.project_slug}}.adapters.driving.readiness import ReadinessMonitor  # type: ignore # noqa: E501
+
+
+async def fine():
+    return True, {}
+
+
+async def slow():
+    return False, {"latency_ms": 900}
+
+
+async def failing():
+    raise ConnectionError("unreachable")
+
+
+async def hanging():
+    await asyncio.sleep(10)
+    return True, {}
+
+
+@pytest.mark.asyncio
+async def test_failing_or_stale_checks_are_not_ready():
+    monitor = ReadinessMonitor({"fine": fine, "slow": slow}, timeout=0.1)
+    assert not monitor.ready
+
+    await monitor.check()
+    assert not monitor.ready
+    assert monitor.status()["checks"]["slow"] == {"ok": False, "latency_ms": 900}
+
+    monitor.probes = {"fine": fine, "broken": failing, "hanging": hanging}
+    await monitor.check()
+    assert monitor.status()["checks"]["broken"] == {"ok": False, "error": "unreachable"}
+    assert monitor.status()["checks"]["hanging"] == {"ok": False, "error": "TimeoutError"}
+
+    monitor.probes = {"fine": fine}
+    await monitor.check()
+    assert monitor.ready
+    # A result nobody refreshed for three intervals no longer counts
+    monitor.checked_at -= 3 * monitor.interval
+    assert not monitor.ready
+
+
+def test_ready_serves_the_last_check(client, container):
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+    assert set(response.json()["checks"]) == {"database", "events", "jobs"}
+    assert response.json()["checks"]["database"]["ok"] is True
+
+    container.readiness.probes["database"] = failing
+    # Served from the last check until the next one runs
+    assert client.get("/ready").status_code == 200
+    client.portal.call(container.readiness.check)
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "not ready"
+    assert response.json()["checks"]["database"] == {"ok": False, "error": "unreachable"}
+    assert client.get("/health").status_code == 200
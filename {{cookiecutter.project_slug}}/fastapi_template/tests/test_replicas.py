@@ -0,0 +1,161 @@
+"""
+Primary/replica routing tests for {{cookiecutter.project_name}}.
+"""
+import asyncio
+
+import pytest
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.replicas import LAG_QUERY, PinWritesMiddleware, ReplicaRouter  # type: ignore # noqa: E501
+
+
+class FakeDatabase:
+    """Answers every read with its own name; lag and failures are configurable."""
+
+    def __init__(self, name):
+        self.name = name
+        self.lag = 0.0
+        self.down = False
+        self.reads = 0
+        self.checks = 0
+
+    async def connect(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def execute(self, sql, *args):
+        return 1
+
+    async def fetchrow(self, sql, *args):
+        if self.down:
+            raise ConnectionError("connection refused")
+        if sql == LAG_QUERY:
+            self.checks += 1
+            return {"lag": self.lag}
+        self.reads += 1
+        return {"name": self.name}
+
+    async def fetch(self, sql, *args):
+        return [await self.fetchrow(sql, *args)]
+
+
+@pytest.fixture
+def primary():
+    return FakeDatabase("primary")
+
+
+@pytest.fixture
+def replicas():
+    return [FakeDatabase("replica_1"), FakeDatabase("replica_2")]
+
+
+@pytest.fixture
+def router(primary, replicas):
+    return ReplicaRouter(primary, replicas, max_lag=5)
+
+
+async def read(router):
+    return (await router.fetchrow("SELECT 1"))["name"]
+
+
+@pytest.mark.asyncio
+async def test_reads_rotate_over_replicas(router):
+    reads = [await read(router) for _ in range(4)]
+    assert reads == ["replica_1", "replica_2", "replica_1", "replica_2"]
+
+
+@pytest.mark.asyncio
+async def test_reads_after_a_write_stay_on_primary(router):
+    async def request():
+        await router.execute("UPDATE users SET name = ?", "Ada")
+        return await read(router)
+
+    # Each request is its own task, so the pin ends with it
+    assert await asyncio.create_task(request()) == "primary"
+    assert await asyncio.create_task(read(router)) != "primary"
+
+
+@pytest.mark.asyncio
+async def test_requests_that_may_write_start_on_primary(router):
+    async def app(scope, receive, send):
+        await send({"name": await read(router)})
+
+    async def request(method):
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {"type": "http", "method": method, "path": "/"}
+        await asyncio.create_task(PinWritesMiddleware(app)(scope, None, send))
+        return messages[0]["name"]
+
+    assert await request("PATCH") == "primary"
+    assert await request("GET") != "primary"
+
+
+@pytest.mark.asyncio
+async def test_lagging_and_failing_replicas_get_no_reads(router, replicas):
+    replicas[0].lag = 30
+    await router.check()
+    assert {await read(router) for _ in range(4)} == {"replica_2"}
+
+    # A failed read falls back to the primary and takes the replica out
+    replicas[1].down = True
+    assert await read(router) == "primary"
+    assert await read(router) == "primary"
+
+    replicas[0].lag = 0
+    replicas[1].down = False
+    await router.check()
+    assert {await read(router) for _ in range(4)} == {"replica_1", "replica_2"}
+
+
+@pytest.mark.asyncio
+async def test_health_is_checked_every_interval(primary, replicas):
+    router = ReplicaRouter(primary, replicas[:1], check_interval=0.05)
+    await router.connect()
+    await asyncio.sleep(0.2)
+    await router.close()
+
+    checks = replicas[0].checks
+    assert checks >= 3
+    await asyncio.sleep(0.1)
+    assert replicas[0].checks == checks
+
+
+@pytest.mark.asyncio
+async def test_without_replicas_everything_uses_primary(primary):
+    router = ReplicaRouter(primary)
+    await router.connect()
+    assert await read(router) == "primary"
+    await router.close()
+
+
+@pytest.fixture
+def app(build_app, app_settings):
+    """The primary doubles as the replica, so reads succeed wherever they go."""
+    return build_app(DATABASE_REPLICA_URLS=[app_settings.DATABASE_URL])
+
+
+def test_api_reads_use_the_replica_and_writes_the_primary(client, container, monkeypatch):
+    replica = container.db_router.replicas[0].database
+    reads = []
+    for method in ("fetch", "fetchrow"):
+        original = getattr(replica, method)
+
+        async def spy(sql, *args, original=original):
+            if sql != LAG_QUERY:
+                reads.append(sql)
+            return await original(sql, *args)
+
+        monkeypatch.setattr(replica, method, spy)
+
+    response = client.post("/api/v1/users/", json={"email": "ada@example.com", "name": "Ada"})
+    assert response.status_code == 201
+    # The uniqueness check behind the write ran on the primary
+    assert reads == []
+
+    response = client.get("/api/v1/users/")
+    assert [user["email"] for user in response.json()["users"]] == ["ada@example.com"]
+    assert reads
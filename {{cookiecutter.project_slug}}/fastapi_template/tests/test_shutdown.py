@@ -0,0 +1,165 @@
+"""
+Graceful shutdown tests for {{cookiecutter.project_name}}.
+
+The server is started as it is deployed, in a subprocess, so SIGTERM reaches
+the same signal handlers as in production.
+"""
+import asyncio
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+
+import httpx
+import pytest
+from {{cookiecutter.project_slug}}.adapters.driving.readiness import ReadinessMonitor  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driving.shutdown import ShutdownCoordinator  # type: ignore # noqa: E501
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DRAIN_DELAY = 1.0
+# Start-up imports the whole app; on a loaded machine that takes a while
+STARTUP_TIMEOUT = 120.0
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until(condition, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+
+
+@pytest.fixture
+def server(app_settings, tmp_path):
+    """The base URL and process of a server started with the project's own command."""
+    port = free_port()
+    env = {
+        **os.environ,
+        # As deployed: no reloader process between the signal and the server
+        "DEBUG": "false",
+        "DATABASE_URL": app_settings.DATABASE_URL,
+        "TRACE_FILE": app_settings.TRACE_FILE,
+        "SHUTDOWN_DRAIN_DELAY": str(DRAIN_DELAY),
+        "SHUTDOWN_TIMEOUT": "10",
+{%- if cookiecutter.performance_profile == "high_throughput" %}
+        "BIND": f"127.0.0.1:{port}",
+        # One worker, so /ready is answered by the worker that is draining
+        "WEB_CONCURRENCY": "1",
+        "PROMETHEUS_MULTIPROC_DIR": str(tmp_path / "metrics"),
+    }
+    command = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py"]
+{%- else %}
+        "HOST": "127.0.0.1",
+        "PORT": str(port),
+    }
+    command = [sys.executable, "-m", "src.{{cookiecutter.project_slug}}.main"]
+{%- endif %}
+    log_path = tmp_path / "server.log"
+    log = open(log_path, "wb")
+    process = subprocess.Popen(command, cwd=PROJECT_ROOT, env=env, stdout=log, stderr=log)
+    base_url = f"http://127.0.0.1:{port}"
+
+    def server_log():
+        return log_path.read_text(errors="replace")
+
+    def ready():
+        assert process.poll() is None, f"server exited:\n{server_log()}"
+        try:
+            return httpx.get(f"{base_url}/ready").status_code == 200
+        except httpx.TransportError:
+            return False
+
+    try:
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while not ready():
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"server not ready after {STARTUP_TIMEOUT}s:\n{server_log()}")
+            time.sleep(0.1)
+        yield base_url, process
+    finally:
+        if process.poll() is None:
+            process.kill()
+        process.wait()
+        sys.stderr.write(server_log())
+        log.close()
+
+
+def slow_import(base_url, records, started):
+    """Import ``records`` users, sending one every 0.2 seconds; return the response."""
+
+    def body():
+        for index in range(records):
+            if index == 1:
+                started.release()
+            record = {
+                "id": str(uuid.uuid4()),
+                "email": f"{uuid.uuid4().hex}@example.com",
+                "name": "Ada",
+                "is_active": True,
+                "created_at": "2024-01-01T00:00:00+00:00",
+                "updated_at": "2024-01-01T00:00:00+00:00",
+            }
+            yield (json.dumps(record) + "\n").encode()
+            time.sleep(0.2)
+
+    return httpx.post(
+        f"{base_url}/api/v1/users/import", params={"format": "ndjson"}, content=body(), timeout=30
+    )
+
+
+def test_sigterm_under_load_fails_readiness_and_finishes_requests(server):
+    base_url, process = server
+    records = 15
+    started = threading.Semaphore(0)
+    responses = []
+    load = [
+        threading.Thread(target=lambda: responses.append(slow_import(base_url, records, started)))
+        for _ in range(3)
+    ]
+    for thread in load:
+        thread.start()
+    for _ in load:
+        assert started.acquire(timeout=10)
+
+    process.send_signal(signal.SIGTERM)
+    # Load balancers have not caught up yet: new requests are still served, but
+    # /ready tells them to stop sending more
+    drain_started = time.monotonic()
+    wait_until(lambda: httpx.get(f"{base_url}/ready").status_code == 503, timeout=DRAIN_DELAY)
+    response = httpx.get(f"{base_url}/ready")
+    assert response.json()["status"] == "draining"
+    assert response.headers["connection"] == "close"
+    assert httpx.get(f"{base_url}/health").status_code == 200
+
+    # The imports outlast the drain delay; the server lets them finish
+    for thread in load:
+        thread.join(timeout=30)
+    assert time.monotonic() - drain_started > DRAIN_DELAY
+    assert [response.status_code for response in responses] == [200] * 3
+    assert [response.json() for response in responses] == [{"imported": records}] * 3
+    process.wait(timeout=20)
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_requests_still_running():
+    coordinator = ShutdownCoordinator(ReadinessMonitor({}), drain_delay=0, timeout=0.2)
+    request = asyncio.create_task(asyncio.sleep(10))
+    coordinator.requests.add(request)
+
+    coordinator.drain()
+    assert coordinator.readiness.status()["status"] == "draining"
+    await coordinator.wait_for_requests()
+    await asyncio.gather(request, return_exceptions=True)
+    assert request.cancelled()
+    assert coordinator.remaining() == 0
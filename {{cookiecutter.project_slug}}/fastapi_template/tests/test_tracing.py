@@ -0,0 +1,110 @@
+"""
+Tracing tests for {{cookiecutter.project_name}}.
+"""
+import pytest
+from fastapi.testclient import TestClient
+from {{cookiecutter.project_slug}}.adapters.driven.tracing.exporters import InMemoryExporter  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.adapters.driven.tracing.tracer import Tracer  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.domain.services.user_service import UserService  # type: ignore # noqa: E501
+
+TRACEPARENT = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-{flags}"
+
+
+class InMemoryUserRepository:
+    def __init__(self):
+        self.users = {}
+
+    async def save(self, user):
+        self.users[user.id] = user
+        return user
+
+    async def get_by_id(self, user_id):
+        return self.users.get(user_id)
+
+
+@pytest.fixture
+def exporter():
+    return InMemoryExporter()
+
+
+@pytest.fixture
+def tracer(exporter):
+    return Tracer(exporter, sample_rate=1.0)
+
+
+@pytest.fixture
+def service(tracer):
+    repository = tracer.instrument(InMemoryUserRepository(), "UserRepository")
+    return tracer.instrument(UserService(repository), "UserService")
+
+
+async def get_user(tracer, service, user_id, traceparent=""):
+    with tracer.trace("GET", traceparent):
+        return await service.get_user(user_id)
+
+
+@pytest.mark.asyncio
+async def test_spans_nest_from_request_to_repository(tracer, exporter, service):
+    user = User.create(email="ada@example.com", name="Ada")
+    await service.user_repository.save(user)
+
+    assert await get_user(tracer, service, user.id) == user
+    repository_span, service_span, request_span = exporter.spans
+    assert [span.name for span in exporter.spans] == [
+        "UserRepository.get_by_id",
+        "UserService.get_user",
+        "GET",
+    ]
+    assert repository_span.parent_id == service_span.span_id
+    assert service_span.parent_id == request_span.span_id
+    assert request_span.parent_id is None
+    assert len({span.trace_id for span in exporter.spans}) == 1
+
+
+@pytest.mark.asyncio
+async def test_unsampled_requests_record_nothing(exporter, service):
+    tracer = Tracer(exporter, sample_rate=0.0)
+    await get_user(tracer, service, User.create(email="ada@example.com", name="Ada").id)
+    assert exporter.spans == []
+
+
+@pytest.mark.asyncio
+async def test_incoming_traceparent_decides_sampling(tracer, exporter, service):
+    user_id = User.create(email="ada@example.com", name="Ada").id
+
+    await get_user(tracer, service, user_id, TRACEPARENT.format(flags="00"))
+    assert exporter.spans == []
+
+    await get_user(tracer, service, user_id, TRACEPARENT.format(flags="01"))
+    request_span = exporter.spans[-1]
+    assert request_span.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+    assert request_span.parent_id == "00f067aa0ba902b7"
+
+
+def test_errors_are_recorded(tracer, exporter):
+    with pytest.raises(ValueError):
+        with tracer.trace("GET"):
+            with tracer.span("failing"):
+                raise ValueError("boom")
+    assert all("boom" in span.error for span in exporter.spans)
+
+
+def test_sampling_off_leaves_services_unwrapped(container):
+    assert isinstance(container.user_service, UserService)
+
+
+def test_api_requests_are_traced(build_app):
+    app = build_app(TRACE_SAMPLE_RATE=1.0, TRACE_EXPORTER="memory")
+    with TestClient(app) as client:
+        response = client.post("/api/v1/users/", json={"email": "ada@example.com", "name": "Ada"})
+        spans = app.state.container.tracer.exporter.spans
+    assert response.status_code == 201
+    assert [span.name for span in spans] == [
+        "UserRepository.get_by_email",
+        "UserRepository.save",
+        "UserService.create_user",
+        "POST /api/v1/users/",
+    ]
+    assert spans[-1].attributes["status"] == 201
+    assert spans[-1].attributes["request_id"] == response.headers["X-Request-ID"]
@@ -0,0 +1,62 @@
+"""
+User API tests for {{cookiecutter.project_name}}.
+"""
+{%- if cookiecutter.db_type != "postgresql" %}
+from {{cookiecutter.project_slug}}.adapters.driven.persistence import user_repository  # type: ignore # noqa: E501
+{%- endif %}
+
+
+def create_user(client, email, name="Ada"):
+    response = client.post("/api/v1/users/", json={"email": email, "name": name})
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_create_and_list_users(client):
+    create_user(client, "ada@example.com")
+
+    response = client.get("/api/v1/users/")
+    assert response.status_code == 200
+    assert [user["email"] for user in response.json()["users"]] == ["ada@example.com"]
+
+
+def test_duplicate_email_is_rejected(client):
+    create_user(client, "ada@example.com")
+    response = client.post("/api/v1/users/", json={"email": "ada@example.com", "name": "Ada"})
+    assert response.status_code == 400
+
+
+def test_deactivate_user(client):
+    user = create_user(client, "ada@example.com")
+    response = client.post(f"/api/v1/users/{user['id']}/deactivate")
+    assert response.status_code == 200
+    assert response.json()["is_active"] is False
+
+
+def test_batch_deactivate_returns_changed_users(client{% if cookiecutter.db_type != "postgresql" %}, monkeypatch{% endif %}):
+{%- if cookiecutter.db_type != "postgresql" %}
+    # Small chunks, so the ids are split across statements
+    monkeypatch.setattr(user_repository, "SET_ACTIVE_CHUNK_SIZE", 2)
+{%- endif %}
+    ids = [create_user(client, f"user{index}@example.com", "User")["id"] for index in range(5)]
+    client.post(f"/api/v1/users/{ids[0]}/deactivate")
+
+    unknown = "00000000-0000-0000-0000-000000000000"
+    response = client.post(
+        "/api/v1/users/batch/deactivate", json={"ids": ids + [ids[1], unknown]}
+    )
+    assert response.status_code == 200
+    assert sorted(response.json()["ids"]) == sorted(ids[1:])
+    assert response.json()["count"] == 4
+
+    users = client.get("/api/v1/users/").json()["users"]
+    assert not any(user["is_active"] for user in users)
+
+    response = client.post("/api/v1/users/batch/activate", json={"ids": ids[:2]})
+    assert sorted(response.json()["ids"]) == sorted(ids[:2])
+    assert client.get(f"/api/v1/users/{ids[0]}").json()["is_active"] is True
+
+
+def test_batch_needs_ids(client):
+    response = client.post("/api/v1/users/batch/activate", json={"ids": []})
+    assert response.status_code == 422
@@ -0,0 +1,30 @@
+"""
+Time-ordered user ids and their storage for {{cookiecutter.project_name}}.
+"""
+from {{cookiecutter.project_slug}}.adapters.driven.persistence.user_repository import SQLUserRepository, as_uuid  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.domain.entities.ids import uuid7  # type: ignore # noqa: E501
+from {{cookiecutter.project_slug}}.domain.entities.user import User  # type: ignore # noqa: E501
+
+
+def test_uuid7_ids_are_ordered_by_creation():
+    ids = [uuid7() for _ in range(10_000)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    assert {(user_id.version, user_id.variant) for user_id in ids} == {(7, "specified in RFC 4122")}
+
+
+def test_ids_round_trip_through_compact_storage(client, container):
+    repository = SQLUserRepository(container.db_router)
+    users = [User.create(email=f"user{i}@example.com", name=f"User {i}") for i in range(3)]
+    for user in users:
+        client.portal.call(repository.save, user)
+
+    assert client.portal.call(repository.get_by_id, users[1].id) == users[1]
+    rows = client.portal.call(container.database.fetch, "SELECT id FROM users ORDER BY id")
+    assert [as_uuid(row["id"]) for row in rows] == [user.id for user in users]
+{%- if cookiecutter.db_type == "sqlite" %}
+    rows = client.portal.call(
+        container.database.fetch, "SELECT DISTINCT typeof(id) AS type, length(id) AS size FROM users"
+    )
+    assert [(row["type"], row["size"]) for row in rows] == [("blob", 16)]
+{%- endif %}